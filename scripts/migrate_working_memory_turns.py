@@ -0,0 +1,38 @@
+"""One-time migration of working-memory turns from hash fields to Redis lists.
+
+Conversations also migrate on first access, so running this is optional;
+it clears out legacy data up front. Safe to run while the API is serving.
+
+Usage:
+    python -m scripts.migrate_working_memory_turns
+"""
+
+import asyncio
+import sys
+
+from src.cache.client import RedisManager
+from src.cache.working_memory import WorkingMemoryCache
+from src.settings import load_settings
+
+
+async def main() -> int:
+    """Migrate every hash-backed conversation and report the count."""
+    settings = load_settings()
+    if not settings.redis_url:
+        print("REDIS_URL is not configured; nothing to migrate.")
+        return 1
+
+    manager = RedisManager(redis_url=settings.redis_url, key_prefix=settings.redis_key_prefix)
+    try:
+        if await manager.get_client() is None:
+            print("Redis is unavailable.")
+            return 1
+        migrated = await WorkingMemoryCache(manager).migrate_legacy_turns()
+        print(f"Migrated {migrated} conversation(s).")
+        return 0
+    finally:
+        await manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,7 +1,12 @@
 """Main skill-based agent implementation with progressive disclosure."""
 
+import hashlib
+import json
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union
+from uuid import UUID
 
 from pydantic import BaseModel
 from pydantic_ai import Agent, RunContext
@@ -12,6 +17,7 @@ from pydantic_ai.providers.openrouter import OpenRouterProvider
 
 from src.dependencies import AgentDependencies
 from src.http_tools import http_get, http_post
+from src.memory.types import RetrievalResult, RetrievalStats
 from src.prompts import MAIN_SYSTEM_PROMPT
 from src.providers import get_llm_model
 from src.settings import Settings, load_settings
@@ -25,6 +31,11 @@ logger = logging.getLogger(__name__)
 _skill_agent: Optional[Agent[AgentDependencies, str]] = None
 _logfire_configured: bool = False
 
+# DNA-configured agents kept for reuse across requests, keyed by
+# (agent id, DNA fingerprint, model name)
+_AGENT_CACHE_SIZE: int = 128
+_agent_cache: OrderedDict[tuple[UUID, str, str], Agent[AgentDependencies, str]] = OrderedDict()
+
 
 class AgentState(BaseModel):
     """Minimal shared state for the skill agent."""
@@ -176,42 +187,96 @@ class _LazySkillAgentProxy:
 skill_agent = _LazySkillAgentProxy()
 
 
+@lru_cache(maxsize=8)
+def _get_openrouter_provider(
+    api_key: str, app_url: Optional[str], app_title: Optional[str]
+) -> OpenRouterProvider:
+    """Return a shared OpenRouter provider (and its API client)."""
+    return OpenRouterProvider(api_key=api_key, app_url=app_url, app_title=app_title)
+
+
+@lru_cache(maxsize=8)
+def _get_openai_provider(api_key: str, base_url: Optional[str] = None) -> OpenAIProvider:
+    """Return a shared OpenAI-compatible provider (and its API client)."""
+    return OpenAIProvider(base_url=base_url, api_key=api_key)
+
+
 def _create_model_for_provider(
     settings: Settings,
     model_name: str,
 ) -> Union[OpenAIChatModel, OpenRouterModel]:
-    """Create a model instance based on provider settings and model name."""
+    """Create a model instance based on provider settings and model name.
+
+    Providers are shared across models with the same settings, so cached
+    agents reuse one API client and connection pool.
+    """
     provider = settings.llm_provider
     if provider == "openrouter":
-        openrouter = OpenRouterProvider(
-            api_key=settings.llm_api_key,
-            app_url=settings.openrouter_app_url,
-            app_title=settings.openrouter_app_title,
+        openrouter = _get_openrouter_provider(
+            settings.llm_api_key,
+            settings.openrouter_app_url,
+            settings.openrouter_app_title,
         )
         return OpenRouterModel(model_name, provider=openrouter)
     if provider == "openai":
-        openai_provider = OpenAIProvider(api_key=settings.llm_api_key)
+        openai_provider = _get_openai_provider(settings.llm_api_key)
         return OpenAIChatModel(model_name, provider=openai_provider)
     if provider == "ollama":
-        ollama_provider = OpenAIProvider(
-            base_url=settings.llm_base_url or "http://localhost:11434/v1",
-            api_key="ollama",
+        ollama_provider = _get_openai_provider(
+            "ollama", settings.llm_base_url or "http://localhost:11434/v1"
         )
         return OpenAIChatModel(model_name, provider=ollama_provider)
     raise ValueError(f"Unsupported provider: {provider}")
 
 
+def _dna_fingerprint(agent_dna: "AgentDNA") -> str:
+    """Hash the full DNA so any edit produces a new agent cache key.
+
+    Args:
+        agent_dna: Agent configuration.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form of the DNA.
+    """
+    canonical = json.dumps(agent_dna.model_dump(mode="json"), sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def invalidate_agent_cache(agent_id: UUID) -> int:
+    """Drop cached agent instances for an agent (e.g. after it is updated).
+
+    Stale entries would never be hit again since the DNA fingerprint
+    changes on edit; this frees them immediately.
+
+    Args:
+        agent_id: Agent whose cached instances should be removed.
+
+    Returns:
+        Number of cached instances removed.
+    """
+    stale = [key for key in _agent_cache if key[0] == agent_id]
+    for key in stale:
+        del _agent_cache[key]
+    if stale:
+        logger.info(f"agent_cache_invalidated: agent_id={agent_id}, removed={len(stale)}")
+    return len(stale)
+
+
 def create_skill_agent(agent_dna: Optional["AgentDNA"] = None) -> Agent[AgentDependencies, str]:
     """
     Factory function to create skill-based agents with optional DNA configuration.
 
     When called without arguments, returns the default singleton skill_agent.
-    When called with AgentDNA, creates a NEW Agent instance with:
+    When called with AgentDNA, returns an Agent instance with:
     - Model from agent_dna.model.model_name
     - Memory-aware system prompt when memory services available
     - Effective skills computed from DNA
     - Same toolset as singleton (skill_tools + http tools)
 
+    DNA-configured agents are cached (LRU) by agent id, DNA fingerprint and
+    model name, so repeat requests for an unchanged agent reuse the built
+    Agent and its provider client. Editing the agent changes the key.
+
     Args:
         agent_dna: Optional AgentDNA configuration for personalized agent
 
@@ -230,6 +295,12 @@ def create_skill_agent(agent_dna: Optional["AgentDNA"] = None) -> Agent[AgentDep
     if agent_dna is None:
         return get_skill_agent()
 
+    cache_key = (agent_dna.id, _dna_fingerprint(agent_dna), agent_dna.model.model_name)
+    cached_agent = _agent_cache.get(cache_key)
+    if cached_agent is not None:
+        _agent_cache.move_to_end(cache_key)
+        return cached_agent
+
     # Create new Agent with DNA configuration
     settings = load_settings()
     _configure_logfire(settings)
@@ -245,61 +316,103 @@ def create_skill_agent(agent_dna: Optional["AgentDNA"] = None) -> Agent[AgentDep
         toolsets=[skill_tools],
     )
 
-    # Register memory-aware system prompt
+    def _effective_skill_metadata(ctx: RunContext[AgentDependencies]) -> str:
+        """Build Level-1 metadata for the DNA's effective skills.
+
+        Skills are sorted so the prompt prefix is byte-stable across turns
+        (provider prompt caching).
+        """
+        if not ctx.deps.skill_loader:
+            return ""
+
+        # Filter to only effective skills from DNA
+        effective_skills = agent_dna.effective_skills
+        all_skills = ctx.deps.skill_loader.skills
+        filtered_skills = {
+            name: skill for name, skill in all_skills.items() if name in effective_skills
+        }
+        if not filtered_skills:
+            return ""
+
+        skill_metadata = "\n\n## Available Skills\n\n"
+        for name in sorted(filtered_skills):
+            skill = filtered_skills[name]
+            skill_metadata += f"**{skill.name}**: {skill.description}\n"
+        return skill_metadata
+
+    # Register the stable prompt prefix first so it is sent as its own
+    # system part, ahead of anything that changes from turn to turn
     @new_agent.system_prompt
-    async def get_memory_aware_prompt(ctx: RunContext[AgentDependencies]) -> str:
+    async def get_stable_prompt(ctx: RunContext[AgentDependencies]) -> str:
         """
-        Generate memory-aware system prompt using MemoryPromptBuilder if available.
+        Generate the stable system prompt prefix (identity, rules, skills).
 
-        Falls back to MAIN_SYSTEM_PROMPT if memory services not configured.
+        Uses MemoryPromptBuilder.build_stable_prefix if a builder is
+        configured, which applies the builder's cache breakpoint hook.
+        Falls back to MAIN_SYSTEM_PROMPT otherwise.
 
         Args:
             ctx: Agent runtime context with dependencies
 
         Returns:
-            Complete system prompt with memory context
+            Stable system prompt prefix
         """
         await ctx.deps.initialize()
+        skill_metadata = _effective_skill_metadata(ctx)
 
-        # Build skill metadata for effective skills from DNA
-        skill_metadata = ""
-        if ctx.deps.skill_loader:
-            # Filter to only effective skills from DNA
-            effective_skills = agent_dna.effective_skills
-            all_skills = ctx.deps.skill_loader.skills
-            filtered_skills = {
-                name: skill for name, skill in all_skills.items() if name in effective_skills
-            }
-            # Generate metadata for filtered skills
-            if filtered_skills:
-                skill_metadata = "\n\n## Available Skills\n\n"
-                for skill in filtered_skills.values():
-                    skill_metadata += f"**{skill.name}**: {skill.description}\n"
-
-        # Use MemoryPromptBuilder if available
-        if ctx.deps.prompt_builder and ctx.deps.memory_retriever:
+        if ctx.deps.prompt_builder:
             try:
-                # Retrieve memories (empty query gets relevant context)
-                retrieval_result = await ctx.deps.memory_retriever.retrieve(
-                    query="", team_id=agent_dna.team_id, agent_id=agent_dna.id
-                )
-
-                # Build prompt with 7-layer structure
-                return ctx.deps.prompt_builder.build(
-                    agent_dna=agent_dna,
-                    skill_metadata=skill_metadata,
-                    retrieval_result=retrieval_result,
-                    conversation_summary="",
+                return ctx.deps.prompt_builder.build_stable_prefix(
+                    agent_dna=agent_dna, skill_metadata=skill_metadata
                 )
             except Exception as e:
                 logger.warning(
-                    f"memory_prompt_build_failed: agent={agent_dna.name}, error={str(e)}"
+                    f"stable_prompt_build_failed: agent={agent_dna.name}, error={str(e)}"
                 )
                 # Fall through to default prompt
 
         # Fallback to standard prompt
         return MAIN_SYSTEM_PROMPT.format(skill_metadata=skill_metadata)
 
+    # Register memory-aware system prompt
+    @new_agent.system_prompt
+    async def get_memory_aware_prompt(ctx: RunContext[AgentDependencies]) -> str:
+        """
+        Generate the per-turn memory context using MemoryPromptBuilder.
+
+        Memories come from ``ctx.deps.retrieval_result``, set by the caller
+        after its per-turn retrieval. Only the volatile part of the prompt
+        is returned; the stable prefix comes from get_stable_prompt. Returns
+        an empty string if no prompt builder is configured.
+
+        Args:
+            ctx: Agent runtime context with dependencies
+
+        Returns:
+            Memory context to follow the stable prefix
+        """
+        if not ctx.deps.prompt_builder:
+            return ""
+
+        await ctx.deps.initialize()
+        try:
+            retrieval_result = ctx.deps.retrieval_result or RetrievalResult(
+                stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0)
+            )
+
+            # Trim against the full 7-layer prompt, but only emit the memory
+            # context (no separate retrieval here)
+            parts = ctx.deps.prompt_builder.build_parts(
+                agent_dna=agent_dna,
+                skill_metadata=_effective_skill_metadata(ctx),
+                retrieval_result=retrieval_result,
+                conversation_summary="",
+            )
+            return parts.volatile_context
+        except Exception as e:
+            logger.warning(f"memory_prompt_build_failed: agent={agent_dna.name}, error={str(e)}")
+            return ""
+
     # Register HTTP tools on new agent
     @new_agent.tool
     async def http_get_tool_dna(ctx: RunContext[AgentDependencies], url: str) -> str:
@@ -313,6 +426,10 @@ def create_skill_agent(agent_dna: Optional["AgentDNA"] = None) -> Agent[AgentDep
         """Make an HTTP POST request to send data to a URL."""
         return await http_post(ctx, url, body)
 
+    _agent_cache[cache_key] = new_agent
+    if len(_agent_cache) > _AGENT_CACHE_SIZE:
+        _agent_cache.popitem(last=False)
+
     logger.info(
         f"create_skill_agent: created agent with dna, name={agent_dna.name}, "
         f"model={agent_dna.model.model_name}, skills={len(agent_dna.effective_skills)}"
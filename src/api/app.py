@@ -4,14 +4,26 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
 from src.cache.client import RedisManager
+from src.cache.embedding_cache import EmbeddingCache
 from src.cache.rate_limiter import RateLimiter
 from src.db.engine import get_engine
+from src.db.repositories.memory_repo import TeamVectorIndexRegistry
+from src.memory.access_tracker import AccessTracker, configure_access_tracker
+from src.memory.embedding import EmbeddingService
+from src.memory.retrieval_cache import get_retrieval_cache
+from src.memory.semantic_cache import (
+    SemanticQueryCache,
+    configure_semantic_cache,
+    get_semantic_cache,
+)
 from src.settings import load_settings
+from src.skill_loader import get_skill_loader
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +35,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles initialization and cleanup of:
     - Database engine (if database_url is configured)
     - Redis connection pool (if redis_url is configured)
+    - Memory access write-behind buffer (if enabled and a database is configured)
+    - Per-team vector index registry (if enabled)
+    - Semantic retrieval cache, persisted in Redis when available (if enabled)
+    - Shared embedding service and its HTTP client (if an API key is configured)
+    - Process-wide skill registry (scanned once, reloaded on file changes)
 
     Resources are stored in app.state for access by routes and dependencies.
 
@@ -44,6 +61,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "Generate one with: python -c \"import secrets; print(secrets.token_urlsafe(64))\""
         )
 
+    # Build the process-wide skill registry once, off the request path
+    skill_loader = get_skill_loader(settings.skills_dir, settings.skills_reload_interval_seconds)
+    logger.info("skill_registry_initialized: skills_count=%d", len(skill_loader.skills))
+
     # Initialize database engine (optional)
     engine: Optional[AsyncEngine] = None
     if settings.database_url:
@@ -62,6 +83,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.engine = None
         logger.info("db_engine_skipped: database_url not configured")
 
+    # Initialize memory access write-behind buffer (optional, requires database).
+    # MemoryRetrievers created without an explicit tracker use this one.
+    access_tracker: Optional[AccessTracker] = None
+    if engine is not None and settings.memory_access_write_behind:
+        access_tracker = AccessTracker(
+            session_factory=async_sessionmaker(engine, expire_on_commit=False),
+            flush_interval_ms=settings.memory_access_flush_interval_ms,
+        )
+        access_tracker.start()
+        configure_access_tracker(access_tracker)
+        logger.info(
+            "access_tracker_started: flush_interval_ms=%d",
+            settings.memory_access_flush_interval_ms,
+        )
+    app.state.access_tracker = access_tracker
+
+    # Per-team partial vector index routing (optional)
+    app.state.team_vector_indexes = (
+        TeamVectorIndexRegistry() if settings.memory_team_vector_indexes else None
+    )
+
     # Initialize Redis manager (optional)
     redis_manager: Optional[RedisManager] = None
     if settings.redis_url:
@@ -84,6 +126,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.redis = None
         logger.info("redis_skipped: redis_url not configured")
 
+    # Semantic retrieval cache for paraphrased queries (optional)
+    if settings.memory_semantic_cache_enabled:
+        configure_semantic_cache(
+            SemanticQueryCache(
+                get_retrieval_cache(),
+                redis_manager=app.state.redis,
+                threshold=settings.memory_semantic_cache_threshold,
+                ttl_seconds=settings.memory_semantic_cache_ttl_seconds,
+            )
+        )
+        logger.info(
+            "semantic_cache_initialized: threshold=%.2f redis_backed=%s",
+            settings.memory_semantic_cache_threshold,
+            app.state.redis is not None,
+        )
+
+    # Initialize shared embedding service (optional, requires an API key).
+    # One instance per process keeps the L1 LRU warm, reuses HTTP connections,
+    # and coalesces concurrent identical lookups across requests.
+    embedding_http_client: Optional[httpx.AsyncClient] = None
+    embedding_service: Optional[EmbeddingService] = None
+    embedding_api_key = settings.embedding_api_key or settings.llm_api_key
+    if embedding_api_key:
+        embedding_http_client = httpx.AsyncClient(timeout=30.0)
+        embedding_service = EmbeddingService(
+            api_key=embedding_api_key,
+            model=settings.embedding_model,
+            dimensions=settings.embedding_dimensions,
+            redis_cache=(
+                EmbeddingCache(redis_manager, encoding=settings.embedding_cache_encoding)
+                if redis_manager is not None
+                else None
+            ),
+            http_client=embedding_http_client,
+            batch_window_ms=settings.embedding_batch_window_ms,
+            max_batch_size=settings.embedding_max_batch_size,
+        )
+        logger.info(f"embedding_service_initialized: model={settings.embedding_model}")
+    else:
+        logger.info("embedding_service_skipped: api_key not configured")
+    app.state.embedding_service = embedding_service
+
     # Initialize rate limiter (optional, requires Redis)
     rate_limiter: Optional[RateLimiter] = None
     if redis_manager is not None:
@@ -105,6 +189,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown: clean up resources
     logger.info("app_shutdown: cleaning up resources")
 
+    # The semantic cache holds the Redis manager closed below; finish its
+    # background writes first
+    semantic_cache = get_semantic_cache()
+    if semantic_cache is not None:
+        try:
+            await semantic_cache.flush()
+        except Exception as e:
+            logger.warning(f"semantic_cache_flush_error: error={str(e)}")
+    configure_semantic_cache(None)
+
+    # Flush buffered memory access updates before the engine goes away
+    configure_access_tracker(None)
+    if access_tracker is not None:
+        try:
+            await access_tracker.stop()
+            logger.info("access_tracker_stopped: pending updates flushed")
+        except Exception as e:
+            logger.warning(f"access_tracker_stop_error: error={str(e)}")
+
+    # Close the embedding service's HTTP connection pool
+    if embedding_http_client is not None:
+        try:
+            await embedding_http_client.aclose()
+            logger.info("embedding_http_client_closed")
+        except Exception as e:
+            logger.warning(f"embedding_http_client_close_error: error={str(e)}")
+
     # Close Redis connection pool
     if redis_manager is not None:
         try:
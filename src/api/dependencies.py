@@ -4,12 +4,15 @@ import logging
 from typing import AsyncGenerator, Optional
 
 from fastapi import Depends, Request
+from starlette.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.cache.client import RedisManager
 from src.cache.rate_limiter import RateLimiter
 from src.db.engine import get_session
+from src.db.repositories.memory_repo import TeamVectorIndexRegistry
 from src.dependencies import AgentDependencies
+from src.memory.embedding import EmbeddingService
 from src.settings import Settings, load_settings
 
 logger = logging.getLogger(__name__)
@@ -134,10 +137,50 @@ def get_rate_limiter(request: Request) -> Optional[RateLimiter]:
     return rate_limiter
 
 
+def get_team_vector_indexes(request: Request) -> Optional[TeamVectorIndexRegistry]:
+    """
+    Get the per-team vector index registry from app.state.team_vector_indexes.
+
+    Returns None when per-team partial indexes are disabled, so memory
+    searches use the global vector index.
+
+    Args:
+        request: FastAPI request object with app.state.team_vector_indexes.
+
+    Returns:
+        TeamVectorIndexRegistry instance if enabled, None otherwise.
+    """
+    return getattr(request.app.state, "team_vector_indexes", None)
+
+
+def get_embedding_service(connection: HTTPConnection) -> Optional[EmbeddingService]:
+    """
+    Get the shared embedding service from app.state.embedding_service.
+
+    The service lives for the application lifetime so its L1 cache stays
+    warm and concurrent identical lookups are coalesced. Returns None when
+    no embedding API key is configured (graceful degradation).
+
+    Resolved from the HTTP connection rather than the request so it also
+    works for WebSocket endpoints that depend on get_agent_deps.
+
+    Args:
+        connection: HTTP or WebSocket connection with app.state.embedding_service.
+
+    Returns:
+        EmbeddingService instance if configured, None otherwise.
+    """
+    embedding_service = getattr(connection.app.state, "embedding_service", None)
+    if embedding_service is None:
+        logger.debug("get_embedding_service: embedding service not configured")
+    return embedding_service
+
+
 async def get_agent_deps(
     db: AsyncSession = Depends(get_db),
     settings: Settings = Depends(get_settings),
     redis_manager: Optional[RedisManager] = Depends(get_redis_manager),
+    embedding_service: Optional[EmbeddingService] = Depends(get_embedding_service),
 ) -> AgentDependencies:
     """
     Create and initialize AgentDependencies for skill-based agent usage.
@@ -149,6 +192,7 @@ async def get_agent_deps(
         db: Async database session from get_db dependency.
         settings: Application settings from get_settings dependency.
         redis_manager: Optional Redis manager from get_redis_manager dependency.
+        embedding_service: Shared embedding service from get_embedding_service.
 
     Returns:
         Initialized AgentDependencies instance ready for agent execution.
@@ -165,8 +209,8 @@ async def get_agent_deps(
     deps = AgentDependencies(
         settings=settings,
         redis_manager=redis_manager,
+        embedding_service=embedding_service,
         # Additional Phase 2/3 fields can be initialized here when needed:
-        # embedding_service=...,
         # memory_repo=...,
         # etc.
     )
@@ -9,12 +9,14 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agent import invalidate_agent_cache
 from src.api.dependencies import get_db
 from src.api.schemas.agents import AgentCreate, AgentResponse, AgentUpdate
 from src.api.schemas.common import PaginatedResponse
 from src.auth.dependencies import get_current_user, require_role
 from src.db.models.agent import AgentORM
 from src.db.models.user import UserORM
+from src.memory.prompt_builder import invalidate_static_layers
 
 logger = logging.getLogger(__name__)
 
@@ -360,6 +362,8 @@ async def update_agent(
     try:
         await db.commit()
         await db.refresh(agent)
+        invalidate_agent_cache(agent.id)
+        invalidate_static_layers(agent.id)
         logger.info(
             f"update_agent_success: user_id={user.id}, team_id={team_id}, "
             f"agent_id={agent.id}, slug={slug}, updated_fields={updated_fields}"
@@ -448,6 +452,8 @@ async def delete_agent(
     agent.status = "archived"
 
     await db.commit()
+    invalidate_agent_cache(agent.id)
+    invalidate_static_layers(agent.id)
 
     logger.info(
         f"delete_agent_success: user_id={user.id}, team_id={team_id}, "
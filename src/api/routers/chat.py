@@ -29,6 +29,7 @@ from src.db.models.conversation import (
 )
 from src.db.models.user import UserORM
 from src.dependencies import AgentDependencies
+from src.memory.retrieval_cache import invalidate_memory_scope
 from src.moe.expert_gate import ExpertGate
 from src.settings import Settings
 
@@ -474,8 +475,9 @@ async def chat(
     # ---------------------------------------------------------------
     # Prompt building is handled by the agent's system_prompt decorator
     # when using create_skill_agent(agent_dna). The MemoryPromptBuilder
-    # is invoked inside get_memory_aware_prompt in agent.py.
-    # We just need to wire up the deps correctly.
+    # is invoked inside get_memory_aware_prompt in agent.py, which reuses
+    # this turn's retrieval result instead of retrieving again.
+    agent_deps.retrieval_result = retrieval_result
 
     # ---------------------------------------------------------------
     # Step 5: Create agent instance
@@ -831,6 +833,9 @@ async def _stream_agent_response(
                     str(e),
                 )
 
+        # Reused by the agent's memory-aware system prompt
+        agent_deps.retrieval_result = retrieval_result
+
         # ---------------------------------------------------------------
         # Step 5: Create agent instance
         # ---------------------------------------------------------------
@@ -1496,7 +1501,8 @@ async def _extract_memories(
 ) -> None:
     """Fire-and-forget memory extraction from conversation messages.
 
-    Runs asynchronously after the chat response is returned. Errors are
+    Runs asynchronously after the chat response is returned. Retrieval
+    caches for the scope are invalidated when memories changed. Errors are
     logged but never propagated to the caller.
 
     Args:
@@ -1525,6 +1531,11 @@ async def _extract_memories(
             result.duplicates_skipped,
             result.contradictions_found,
         )
+        if result.memories_created or result.memories_versioned or result.contradictions_found:
+            # Resolved contradictions may supersede team-wide memories
+            await invalidate_memory_scope(
+                team_id, None if result.contradictions_found else agent_id
+            )
     except Exception as e:
         logger.error(
             "chat_extraction_error: request_id=%s, error=%s",
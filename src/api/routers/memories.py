@@ -4,12 +4,19 @@ import logging
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db, get_settings
+from src.api.dependencies import (
+    get_db,
+    get_embedding_service,
+    get_redis_manager,
+    get_settings,
+    get_team_vector_indexes,
+)
 from src.api.schemas.common import PaginatedResponse, SuccessResponse
 from src.api.schemas.memories import (
     MemoryCreateRequest,
@@ -18,6 +25,8 @@ from src.api.schemas.memories import (
     MemorySearchResponse,
 )
 from src.auth.dependencies import get_current_user
+from src.cache.client import RedisManager
+from src.cache.hot_cache import HotMemoryCache
 from src.db.models.memory import (
     MemoryORM,
     MemorySourceEnum,
@@ -26,8 +35,15 @@ from src.db.models.memory import (
     MemoryTypeEnum,
 )
 from src.db.models.user import UserORM
-from src.db.repositories.memory_repo import MemoryRepository
+from src.db.repositories.memory_repo import (
+    AnnSearchParams,
+    MemoryRepository,
+    MemoryRow,
+    TeamVectorIndexRegistry,
+)
 from src.memory.embedding import EmbeddingService
+from src.memory.retrieval import orm_to_record
+from src.memory.retrieval_cache import invalidate_memory_scope
 from src.memory.memory_log import MemoryAuditLog
 from src.settings import Settings
 
@@ -41,12 +57,12 @@ router = APIRouter()
 # -------------------------------------------------------------------------
 
 
-def _orm_to_response(memory: MemoryORM) -> MemoryResponse:
+def _orm_to_response(memory: MemoryORM | MemoryRow) -> MemoryResponse:
     """
-    Convert MemoryORM to MemoryResponse schema.
+    Convert MemoryORM (or a projected MemoryRow) to MemoryResponse schema.
 
     Args:
-        memory: Memory ORM instance from database
+        memory: Memory ORM instance or projected row from database
 
     Returns:
         MemoryResponse schema for API response
@@ -70,31 +86,54 @@ def _orm_to_response(memory: MemoryORM) -> MemoryResponse:
     )
 
 
-def _get_embedding_service(settings: Settings) -> Optional[EmbeddingService]:
-    """
-    Get EmbeddingService if configured, or None for graceful degradation.
+# -------------------------------------------------------------------------
+# Endpoints
+# -------------------------------------------------------------------------
 
-    Args:
-        settings: Application settings
 
-    Returns:
-        EmbeddingService if API key configured, None otherwise
+async def _sync_hot_cache(
+    redis_manager: Optional[RedisManager],
+    team_id: UUID,
+    memory: MemoryORM,
+    removed: bool = False,
+) -> None:
+    """Refresh or drop one changed memory in the team's L1 hot caches.
+
+    Every agent's hot set in the team is updated, since agents also
+    retrieve team-wide and other agents' memories.
+
+    Args:
+        redis_manager: Redis manager (None when Redis is not configured).
+        team_id: Team scope of the memory (the hot cache's user scope).
+        memory: The memory after the change.
+        removed: Whether the memory left the active set (deleted/superseded).
     """
-    if not settings.llm_api_key:
-        logger.warning("get_embedding_service: api_key=not_configured")
-        return None
-
-    return EmbeddingService(
-        api_key=settings.llm_api_key,
-        model="text-embedding-3-small",
-        dimensions=1536,
-        base_url="https://api.openai.com/v1",
-    )
+    if redis_manager is None:
+        return
 
+    hot_cache = HotMemoryCache(redis_manager)
+    if removed:
+        await hot_cache.remove_memory(team_id, memory.id)
+    else:
+        record = orm_to_record(memory).model_dump(mode="json", exclude_defaults=True)
+        await hot_cache.upsert_memory(team_id, record)
 
-# -------------------------------------------------------------------------
-# Endpoints
-# -------------------------------------------------------------------------
+
+async def _drop_hot_caches(redis_manager: Optional[RedisManager], team_id: UUID) -> None:
+    """Clear the team's L1 hot caches after a memory was added.
+
+    Hot sets are ranked snapshots that a new memory cannot be slotted into,
+    so the next retrieval re-ranks from the database instead of serving
+    (and re-caching in L0) a set without it.
+
+    Args:
+        redis_manager: Redis manager (None when Redis is not configured).
+        team_id: Team scope of the new memory (the hot cache's user scope).
+    """
+    if redis_manager is None:
+        return
+
+    await HotMemoryCache(redis_manager).invalidate_user(team_id)
 
 
 @router.get("/v1/memories", response_model=PaginatedResponse[MemoryResponse])
@@ -177,8 +216,8 @@ async def list_memories(
     result = await db.execute(count_stmt)
     total = result.scalar() or 0
 
-    # Get paginated memories
-    memories = await repo.get_by_team(
+    # Get paginated memories (column projection, no embeddings)
+    memories = await repo.get_rows_by_team(
         team_id=team_id,
         memory_types=[memory_type_filter] if memory_type_filter else None,
         status=status_filter,
@@ -210,7 +249,8 @@ async def create_memory(
     request: MemoryCreateRequest,
     current_user: tuple[UserORM, Optional[UUID]] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    embedding_service: Optional[EmbeddingService] = Depends(get_embedding_service),
+    redis_manager: Optional[RedisManager] = Depends(get_redis_manager),
 ) -> MemoryResponse:
     """
     Create a new explicit memory (user-created, importance=8).
@@ -223,7 +263,8 @@ async def create_memory(
         request: Memory creation request with content, type, importance
         current_user: Authenticated user and team_id from dependency
         db: Database session from dependency
-        settings: Application settings from dependency
+        embedding_service: Shared embedding service (None if not configured)
+        redis_manager: Redis manager for the hot cache (None if not configured)
 
     Returns:
         MemoryResponse for the created memory
@@ -254,8 +295,7 @@ async def create_memory(
         )
 
     # Generate embedding if service available
-    embedding: Optional[list[float]] = None
-    embedding_service = _get_embedding_service(settings)
+    embedding: Optional[np.ndarray] = None
     if embedding_service:
         try:
             embedding = await embedding_service.embed_text(request.content)
@@ -294,6 +334,8 @@ async def create_memory(
     )
 
     await db.commit()
+    await invalidate_memory_scope(team_id, memory.agent_id)
+    await _drop_hot_caches(redis_manager, team_id)
 
     logger.info(
         f"create_memory_success: team_id={team_id}, memory_id={memory.id}, "
@@ -309,6 +351,8 @@ async def search_memories(
     current_user: tuple[UserORM, Optional[UUID]] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     settings: Settings = Depends(get_settings),
+    embedding_service: Optional[EmbeddingService] = Depends(get_embedding_service),
+    team_indexes: Optional[TeamVectorIndexRegistry] = Depends(get_team_vector_indexes),
 ) -> MemorySearchResponse:
     """
     Semantic search memories by embedding similarity.
@@ -323,6 +367,8 @@ async def search_memories(
         current_user: Authenticated user and team_id from dependency
         db: Database session from dependency
         settings: Application settings from dependency
+        embedding_service: Shared embedding service (None if not configured)
+        team_indexes: Per-team vector index registry (None when disabled)
 
     Returns:
         MemorySearchResponse with ranked memories
@@ -340,8 +386,6 @@ async def search_memories(
             detail="Team context required",
         )
 
-    # Get embedding service
-    embedding_service = _get_embedding_service(settings)
     if embedding_service is None:
         logger.error(
             f"search_memories_error: team_id={team_id}, reason=embedding_service_unavailable"
@@ -362,10 +406,17 @@ async def search_memories(
         )
 
     # Search by embedding
-    repo = MemoryRepository(db)
+    repo = MemoryRepository(
+        db,
+        ann_params=AnnSearchParams(
+            ef_search=settings.memory_hnsw_ef_search,
+            probes=settings.memory_ivfflat_probes,
+        ),
+        team_indexes=team_indexes,
+    )
     memory_type_filter = [MemoryTypeEnum(request.memory_type)] if request.memory_type else None
 
-    results = await repo.search_by_embedding(
+    results = await repo.search_rows_by_embedding(
         embedding=query_embedding,
         team_id=team_id,
         agent_id=request.agent_id,
@@ -391,6 +442,7 @@ async def delete_memory(
     memory_id: UUID,
     current_user: tuple[UserORM, Optional[UUID]] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis_manager: Optional[RedisManager] = Depends(get_redis_manager),
 ) -> SuccessResponse:
     """
     Soft delete a memory (status=archived, tier=cold).
@@ -402,6 +454,7 @@ async def delete_memory(
         memory_id: UUID of the memory to delete
         current_user: Authenticated user and team_id from dependency
         db: Database session from dependency
+        redis_manager: Redis manager for the hot cache (None if not configured)
 
     Returns:
         SuccessResponse confirming deletion
@@ -452,6 +505,8 @@ async def delete_memory(
     )
 
     await db.commit()
+    await invalidate_memory_scope(team_id, memory.agent_id)
+    await _sync_hot_cache(redis_manager, team_id, memory, removed=True)
 
     logger.info(
         f"delete_memory_success: team_id={team_id}, memory_id={memory_id}, "
@@ -469,6 +524,7 @@ async def toggle_pin_memory(
     memory_id: UUID,
     current_user: tuple[UserORM, Optional[UUID]] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis_manager: Optional[RedisManager] = Depends(get_redis_manager),
 ) -> MemoryResponse:
     """
     Toggle the pin status of a memory.
@@ -480,6 +536,7 @@ async def toggle_pin_memory(
         memory_id: UUID of the memory to pin/unpin
         current_user: Authenticated user and team_id from dependency
         db: Database session from dependency
+        redis_manager: Redis manager for the hot cache (None if not configured)
 
     Returns:
         MemoryResponse with updated pin status
@@ -530,6 +587,8 @@ async def toggle_pin_memory(
 
     await db.commit()
     await db.refresh(memory)
+    await invalidate_memory_scope(team_id, memory.agent_id)
+    await _sync_hot_cache(redis_manager, team_id, memory)
 
     logger.info(
         f"toggle_pin_memory_success: team_id={team_id}, memory_id={memory_id}, "
@@ -549,7 +608,8 @@ async def correct_memory(
     request: MemoryCreateRequest,
     current_user: tuple[UserORM, Optional[UUID]] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    embedding_service: Optional[EmbeddingService] = Depends(get_embedding_service),
+    redis_manager: Optional[RedisManager] = Depends(get_redis_manager),
 ) -> MemoryResponse:
     """
     Create a corrected version of a memory.
@@ -563,7 +623,8 @@ async def correct_memory(
         request: Corrected memory content and attributes
         current_user: Authenticated user and team_id from dependency
         db: Database session from dependency
-        settings: Application settings from dependency
+        embedding_service: Shared embedding service (None if not configured)
+        redis_manager: Redis manager for the hot cache (None if not configured)
 
     Returns:
         MemoryResponse for the new corrected memory
@@ -612,8 +673,7 @@ async def correct_memory(
         )
 
     # Generate embedding if service available
-    embedding: Optional[list[float]] = None
-    embedding_service = _get_embedding_service(settings)
+    embedding: Optional[np.ndarray] = None
     if embedding_service:
         try:
             embedding = await embedding_service.embed_text(request.content)
@@ -667,6 +727,10 @@ async def correct_memory(
 
     await db.commit()
 
+    await invalidate_memory_scope(team_id, original_memory.agent_id)
+    # Hot sets still hold the superseded original and lack the correction
+    await _drop_hot_caches(redis_manager, team_id)
+
     logger.info(
         f"correct_memory_success: team_id={team_id}, original_memory_id={memory_id}, "
         f"corrected_memory_id={corrected_memory.id}, user_id={user.id}, version={corrected_memory.version}"
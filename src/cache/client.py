@@ -8,6 +8,13 @@ import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
+# Connection options shared by the text and binary clients
+_CONNECTION_OPTIONS: dict[str, Any] = {
+    "socket_connect_timeout": 5.0,
+    "socket_timeout": 5.0,
+    "retry_on_timeout": True,
+}
+
 
 class RedisManager:
     """Async Redis connection pool with graceful fallback.
@@ -33,6 +40,8 @@ class RedisManager:
         self._redis_url: Optional[str] = redis_url
         self._key_prefix: str = key_prefix
         self._client: Optional[aioredis.Redis] = None
+        self._binary_client: Optional[aioredis.Redis] = None
+        self._binary_source: Optional[aioredis.Redis] = None
         self._available: bool = False
 
     async def get_client(self) -> Optional[aioredis.Redis]:
@@ -49,11 +58,7 @@ class RedisManager:
 
         try:
             self._client = aioredis.from_url(
-                self._redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5.0,
-                socket_timeout=5.0,
-                retry_on_timeout=True,
+                self._redis_url, decode_responses=True, **_CONNECTION_OPTIONS
             )
             await self._client.ping()  # type: ignore[misc, union-attr]
             self._available = True
@@ -65,6 +70,33 @@ class RedisManager:
             self._client = None
             return None
 
+    async def get_binary_client(self) -> Optional[aioredis.Redis]:
+        """Get an async Redis client that returns raw bytes.
+
+        Built from the same URL and connection options as ``get_client`` but
+        with ``decode_responses=False`` (in its own pool), for values that
+        are not UTF-8 text such as packed embedding vectors. Recreated when
+        the text client reconnects.
+
+        Returns:
+            Async bytes-mode Redis client, or None if Redis is unavailable.
+        """
+        client = await self.get_client()
+        if client is None or self._redis_url is None:
+            return None
+
+        if self._binary_client is None or self._binary_source is not client:
+            if self._binary_client is not None:
+                try:
+                    await self._binary_client.aclose(close_connection_pool=True)
+                except Exception as e:
+                    logger.warning(f"redis_binary_close_error: error={str(e)}")
+            self._binary_client = aioredis.from_url(
+                self._redis_url, decode_responses=False, **_CONNECTION_OPTIONS
+            )
+            self._binary_source = client
+        return self._binary_client
+
     @property
     def available(self) -> bool:
         """Check if Redis is currently available.
@@ -84,7 +116,16 @@ class RedisManager:
         return self._key_prefix
 
     async def close(self) -> None:
-        """Close the Redis connection pool gracefully."""
+        """Close the Redis connection pools gracefully."""
+        if self._binary_client is not None:
+            try:
+                await self._binary_client.aclose(close_connection_pool=True)
+            except Exception as e:
+                logger.warning(f"redis_binary_close_error: error={str(e)}")
+            finally:
+                self._binary_client = None
+                self._binary_source = None
+
         if self._client is not None:
             try:
                 await self._client.aclose()
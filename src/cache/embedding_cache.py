@@ -3,7 +3,10 @@
 import hashlib
 import json
 import logging
-from typing import Optional
+import struct
+from typing import Literal, Optional, Sequence
+
+import numpy as np
 
 from src.cache.client import RedisManager
 
@@ -11,6 +14,77 @@ logger = logging.getLogger(__name__)
 
 _EMBEDDING_CACHE_TTL: int = 86400  # 24 hours
 
+EmbeddingEncoding = Literal["float32", "float16", "int8"]
+
+# Packed value layout: header (magic, version, dtype code, dimensions) + payload.
+# int8 payloads are preceded by a little-endian float32 scale factor.
+_HEADER = struct.Struct("<2sBBI")
+_MAGIC: bytes = b"EV"
+_FORMAT_VERSION: int = 1
+_DTYPE_CODES: dict[str, int] = {"float32": 0, "float16": 1, "int8": 2}
+_CODE_DTYPES: dict[int, str] = {code: name for name, code in _DTYPE_CODES.items()}
+_INT8_SCALE = struct.Struct("<f")
+
+
+def encode_embedding(
+    embedding: Sequence[float] | np.ndarray, encoding: EmbeddingEncoding = "float32"
+) -> bytes:
+    """Pack an embedding into the versioned binary cache format.
+
+    Args:
+        embedding: Embedding vector.
+        encoding: Storage dtype: "float32" (4 B/dim), "float16" (2 B/dim) or
+            "int8" (1 B/dim, symmetric max-abs quantization).
+
+    Returns:
+        Header followed by the little-endian packed vector.
+    """
+    vector = np.asarray(embedding, dtype="<f4")
+    header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _DTYPE_CODES[encoding], vector.size)
+
+    if encoding == "float16":
+        return header + vector.astype("<f2").tobytes()
+    if encoding == "int8":
+        max_abs = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype("i1")
+        return header + _INT8_SCALE.pack(scale) + quantized.tobytes()
+    return header + vector.tobytes()
+
+
+def decode_embedding(value: bytes) -> np.ndarray:
+    """Unpack a cached embedding into a float32 array (no per-element objects).
+
+    Values written before the binary format (JSON lists) are still accepted.
+
+    Args:
+        value: Raw cached bytes.
+
+    Returns:
+        1-D float32 NumPy array.
+
+    Raises:
+        ValueError: If the value is neither a known binary version nor JSON.
+    """
+    if value[:1] == b"[":
+        return np.asarray(json.loads(value), dtype=np.float32)
+
+    if len(value) < _HEADER.size:
+        raise ValueError("embedding cache value too short")
+    magic, version, dtype_code, dimensions = _HEADER.unpack_from(value)
+    if magic != _MAGIC or version != _FORMAT_VERSION or dtype_code not in _CODE_DTYPES:
+        raise ValueError(f"unsupported embedding cache format: version={version}")
+
+    payload = memoryview(value)[_HEADER.size :]
+    dtype = _CODE_DTYPES[dtype_code]
+    if dtype == "float16":
+        return np.frombuffer(payload, dtype="<f2", count=dimensions).astype(np.float32)
+    if dtype == "int8":
+        (scale,) = _INT8_SCALE.unpack_from(payload)
+        quantized = np.frombuffer(payload[_INT8_SCALE.size :], dtype="i1", count=dimensions)
+        return quantized.astype(np.float32) * np.float32(scale)
+    return np.frombuffer(payload, dtype="<f4", count=dimensions)
+
 
 class EmbeddingCache:
     """Redis-backed embedding cache with 24h TTL.
@@ -18,54 +92,103 @@ class EmbeddingCache:
     Supplements Phase 2 in-memory LRU cache with persistent Redis storage.
     Key format: {prefix}embed:{sha256_of_normalized_text}
 
+    Vectors are stored in a compact versioned binary format (see
+    ``encode_embedding``) rather than JSON: float32 is ~6 KB for 1536
+    dimensions instead of ~30 KB, and decoding is a single buffer copy.
+
     Attributes:
         _redis_manager: RedisManager instance for Redis operations.
+        _encoding: Storage dtype for new entries.
     """
 
-    def __init__(self, redis_manager: RedisManager) -> None:
+    def __init__(
+        self,
+        redis_manager: RedisManager,
+        encoding: EmbeddingEncoding = "float32",
+    ) -> None:
         """Initialize the embedding cache.
 
         Args:
             redis_manager: RedisManager instance for Redis operations.
+            encoding: Storage dtype for new entries ("float32", "float16", "int8").
         """
         self._redis_manager: RedisManager = redis_manager
+        self._encoding: EmbeddingEncoding = encoding
 
-    async def get_embedding(self, text: str) -> Optional[list[float]]:
+    async def get_embedding(self, text: str) -> Optional[np.ndarray]:
         """Check Redis for cached embedding.
 
         Args:
             text: The text to look up in cache.
 
         Returns:
-            Cached embedding vector, or None if not found or Redis unavailable.
+            Cached embedding as a float32 array, or None if not found or Redis
+            unavailable.
         """
         if not self._redis_manager.available:
             return None
 
         try:
-            client = await self._redis_manager.get_client()
+            client = await self._redis_manager.get_binary_client()
             if client is None:
                 return None
 
             key: str = self._cache_key(text)
-            value: Optional[str] = await client.get(key)  # type: ignore[misc, union-attr]
+            value: Optional[bytes] = await client.get(key)  # type: ignore[misc, union-attr]
 
             if value is None:
                 logger.info(f"embedding_cache_miss: text_length={len(text)}")
                 return None
 
-            embedding: list[float] = json.loads(value)
+            vector = decode_embedding(value)
             logger.info(f"embedding_cache_hit: text_length={len(text)}")
-            return embedding
+            return vector
 
-        except json.JSONDecodeError as e:
-            logger.warning(f"embedding_cache_json_error: text_length={len(text)}, error={str(e)}")
+        except ValueError as e:
+            logger.warning(f"embedding_cache_decode_error: text_length={len(text)}, error={str(e)}")
             return None
         except Exception as e:
             logger.warning(f"embedding_cache_get_error: text_length={len(text)}, error={str(e)}")
             return None
 
-    async def store_embedding(self, text: str, embedding: list[float]) -> None:
+    async def get_embeddings(self, texts: list[str]) -> list[Optional[np.ndarray]]:
+        """Look up many embeddings with a single MGET.
+
+        Args:
+            texts: Texts to look up.
+
+        Returns:
+            One entry per input text (same order): the cached float32 array,
+            or None on a miss, decode error, or when Redis is unavailable.
+        """
+        results: list[Optional[np.ndarray]] = [None] * len(texts)
+        if not texts or not self._redis_manager.available:
+            return results
+
+        try:
+            client = await self._redis_manager.get_binary_client()
+            if client is None:
+                return results
+
+            keys: list[str] = [self._cache_key(text) for text in texts]
+            values: list[Optional[bytes]] = await client.mget(keys)  # type: ignore[misc, union-attr]
+        except Exception as e:
+            logger.warning(f"embedding_cache_mget_error: count={len(texts)}, error={str(e)}")
+            return results
+
+        for i, value in enumerate(values):
+            if value is None:
+                continue
+            try:
+                results[i] = decode_embedding(value)
+            except ValueError as e:
+                logger.warning(f"embedding_cache_decode_error: index={i}, error={str(e)}")
+
+        hits = sum(1 for result in results if result is not None)
+        logger.info(f"embedding_cache_mget: count={len(texts)}, hits={hits}")
+        return results
+
+    async def store_embedding(self, text: str, embedding: Sequence[float] | np.ndarray) -> None:
         """Store embedding in Redis with 24h TTL.
 
         Args:
@@ -76,22 +199,51 @@ class EmbeddingCache:
             return
 
         try:
-            client = await self._redis_manager.get_client()
+            client = await self._redis_manager.get_binary_client()
             if client is None:
                 return
 
             key: str = self._cache_key(text)
-            value: str = json.dumps(embedding)
+            value: bytes = encode_embedding(embedding, self._encoding)
 
             await client.setex(key, _EMBEDDING_CACHE_TTL, value)  # type: ignore[misc, union-attr]
             logger.info(
                 f"embedding_cache_store: text_length={len(text)}, "
-                f"vector_dimensions={len(embedding)}"
+                f"vector_dimensions={len(embedding)}, encoding={self._encoding}"
             )
 
         except Exception as e:
             logger.warning(f"embedding_cache_store_error: text_length={len(text)}, error={str(e)}")
 
+    async def store_embeddings(self, items: list[tuple[str, Sequence[float] | np.ndarray]]) -> None:
+        """Store many embeddings in one pipelined round trip (24h TTL each).
+
+        Args:
+            items: (text, embedding) pairs to cache.
+        """
+        if not items or not self._redis_manager.available:
+            return
+
+        try:
+            client = await self._redis_manager.get_binary_client()
+            if client is None:
+                return
+
+            pipe = client.pipeline(transaction=False)
+            for text, embedding in items:
+                pipe.setex(
+                    self._cache_key(text),
+                    _EMBEDDING_CACHE_TTL,
+                    encode_embedding(embedding, self._encoding),
+                )
+            await pipe.execute()
+            logger.info(
+                f"embedding_cache_store_many: count={len(items)}, encoding={self._encoding}"
+            )
+
+        except Exception as e:
+            logger.warning(f"embedding_cache_store_many_error: count={len(items)}, error={str(e)}")
+
     def _cache_key(self, text: str) -> str:
         """Build Redis key from normalized text SHA-256.
 
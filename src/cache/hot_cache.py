@@ -1,8 +1,9 @@
 """L1 hot cache for frequently-accessed memories."""
 
+import hashlib
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID
 
 from src.cache.client import RedisManager
@@ -12,13 +13,74 @@ logger = logging.getLogger(__name__)
 # Hot cache TTL: 15 minutes
 _HOT_CACHE_TTL: int = 900
 
+# Keys removed per UNLINK call during bulk invalidation
+_INVALIDATE_BATCH_SIZE: int = 500
+
+# Hash field prefixes for a member's payload and cached version
+_PAYLOAD_FIELD: str = "p:"
+_VERSION_FIELD: str = "v:"
+
+# Record fields in a member's version token: ``version`` only bumps on
+# content edits, while pinning, tier moves and decay change the others
+_VERSION_TOKEN_FIELDS: tuple[str, ...] = (
+    "version",
+    "importance",
+    "confidence",
+    "is_pinned",
+    "tier",
+)
+
+
+def _encode_payload(memory: dict[str, Any]) -> str:
+    """Serialize a cached memory without its score, as compact JSON.
+
+    The score lives in the ZSET, so a payload only changes when the memory
+    itself does.
+
+    Args:
+        memory: Memory dict (e.g. a JSON-mode ``ScoredMemory.model_dump()``).
+
+    Returns:
+        JSON string without whitespace.
+    """
+    payload = {k: v for k, v in memory.items() if k != "final_score"}
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+def _member_identity(memory: dict[str, Any], payload: str) -> tuple[str, str]:
+    """Return the ZSET member and payload version for a cached memory.
+
+    Memories are keyed by their id and versioned by a token built from
+    ``memory.version`` and the record fields that change without a version
+    bump (pin, tier, importance, confidence). Dicts without an id are keyed
+    by a digest of their payload.
+
+    Args:
+        memory: Memory dict.
+        payload: Encoded payload for the memory.
+
+    Returns:
+        Tuple of (member, version).
+    """
+    record = memory.get("memory")
+    if isinstance(record, dict) and record.get("id") is not None:
+        return str(record["id"]), ":".join(str(record.get(f)) for f in _VERSION_TOKEN_FIELDS)
+    return hashlib.sha1(payload.encode()).hexdigest(), "0"
+
 
 class HotMemoryCache:
     """L1 hot cache for frequently-accessed memories using Redis ZSET.
 
-    Uses Redis sorted sets where score = final_score from 5-signal retrieval.
+    Uses Redis sorted sets of memory ids where score = final_score from
+    5-signal retrieval; payloads live in a side hash so unchanged memories
+    are not re-sent on every warm and a single changed memory can be
+    refreshed or dropped in place.
     TTL: 15 minutes, refreshed on warm_cache.
-    Key format: {prefix}hot:{agent_id}:{user_id}
+    Key format: {prefix}hot:{agent_id}:{user_id} (ZSET),
+    {prefix}hot:{agent_id}:{user_id}:data (HASH of p:{id} payloads and
+    v:{id} versions), {prefix}hot:{agent_id}:keys and
+    {prefix}hot:user:{user_id}:keys (SETs of an agent's and a user scope's
+    ZSET keys, so invalidation and updates never scan the keyspace)
 
     Attributes:
         _redis_manager: Redis connection manager.
@@ -59,21 +121,34 @@ class HotMemoryCache:
 
         try:
             # ZREVRANGE returns highest-scored members first
-            members = await client.zrevrange(key, 0, limit - 1)  # type: ignore[union-attr]
+            ranked: list[tuple[str, float]] = await client.zrevrange(  # type: ignore[union-attr]
+                key, 0, limit - 1, withscores=True
+            )
 
-            if not members:
+            if not ranked:
                 logger.info(f"hot_cache_miss: agent_id={agent_id}, user_id={user_id}, key={key}")
                 return None
 
-            # Deserialize JSON members to dict objects
+            payloads: list[Optional[str]] = await client.hmget(  # type: ignore[union-attr, misc]
+                self._data_key(key), [_PAYLOAD_FIELD + member for member, _ in ranked]
+            )
+
+            # Deserialize payloads and attach the current ZSET score
             memories: list[dict[str, Any]] = []
-            for member in members:
+            for (member, score), payload in zip(ranked, payloads):
+                if payload is None:
+                    continue
                 try:
-                    memory_dict = json.loads(member)
-                    memories.append(memory_dict)
+                    memory_dict = json.loads(payload)
                 except json.JSONDecodeError as e:
                     logger.warning(f"hot_cache_deserialize_error: key={key}, error={str(e)}")
                     continue
+                memory_dict["final_score"] = score
+                memories.append(memory_dict)
+
+            if not memories:
+                logger.info(f"hot_cache_miss: agent_id={agent_id}, user_id={user_id}, key={key}")
+                return None
 
             logger.info(
                 f"hot_cache_hit: agent_id={agent_id}, user_id={user_id}, "
@@ -92,8 +167,10 @@ class HotMemoryCache:
     ) -> None:
         """Populate hot cache after a PostgreSQL retrieval.
 
-        Stores each memory as a JSON member in a ZSET with score = final_score.
-        Sets TTL to 15 minutes. Previous cache content is overwritten.
+        Replaces the cached set with ``memories`` (score = final_score).
+        Payloads are only written for memories that are new or whose
+        version changed; members no longer present are removed. Sets TTL
+        to 15 minutes.
 
         Args:
             agent_id: Agent UUID for key scoping.
@@ -115,28 +192,55 @@ class HotMemoryCache:
             return
 
         key = self._key(agent_id, user_id)
+        data_key = self._data_key(key)
+
+        scores: dict[str, float] = {}
+        entries: dict[str, tuple[str, str]] = {}
+        for memory_dict in memories:
+            payload = _encode_payload(memory_dict)
+            member, version = _member_identity(memory_dict, payload)
+            scores[member] = float(memory_dict.get("final_score", 0.0))
+            entries[member] = (payload, version)
 
         try:
-            # Use pipeline for atomic operation: DEL + ZADD + EXPIRE
+            # Round trip 1: current members and cached versions of incoming ones
+            members = list(entries)
+            async with client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                pipe.zrange(key, 0, -1)
+                pipe.hmget(data_key, [_VERSION_FIELD + m for m in members])
+                existing, cached_versions = await pipe.execute()
+
+            stale = [m for m in existing if m not in entries]
+            changed: dict[str, str] = {}
+            for member, cached_version in zip(members, cached_versions):
+                payload, version = entries[member]
+                if cached_version != version:
+                    changed[_PAYLOAD_FIELD + member] = payload
+                    changed[_VERSION_FIELD + member] = version
+
+            # Round trip 2: apply the diff atomically
             async with client.pipeline(transaction=True) as pipe:  # type: ignore[union-attr]
-                # Clear existing cache
-                await pipe.delete(key)
-
-                # Add each memory with its final_score as the ZSET score
-                for memory_dict in memories:
-                    score = memory_dict.get("final_score", 0.0)
-                    member = json.dumps(memory_dict)
-                    await pipe.zadd(key, {member: score})  # type: ignore[arg-type]
-
-                # Set TTL
-                await pipe.expire(key, _HOT_CACHE_TTL)
-
-                # Execute pipeline
+                if stale:
+                    pipe.zrem(key, *stale)
+                    pipe.hdel(
+                        data_key,
+                        *[prefix + m for m in stale for prefix in (_PAYLOAD_FIELD, _VERSION_FIELD)],
+                    )
+                pipe.zadd(key, scores)  # type: ignore[arg-type]
+                if changed:
+                    pipe.hset(data_key, mapping=changed)  # type: ignore[arg-type]
+                pipe.expire(key, _HOT_CACHE_TTL)
+                pipe.expire(data_key, _HOT_CACHE_TTL)
+                pipe.sadd(self._index_key(agent_id), key)
+                pipe.expire(self._index_key(agent_id), _HOT_CACHE_TTL)
+                pipe.sadd(self._user_index_key(user_id), key)
+                pipe.expire(self._user_index_key(user_id), _HOT_CACHE_TTL)
                 await pipe.execute()
 
             logger.info(
                 f"hot_cache_warmed: agent_id={agent_id}, user_id={user_id}, "
-                f"count={len(memories)}, ttl={_HOT_CACHE_TTL}s, key={key}"
+                f"count={len(memories)}, written={len(changed) // 2}, removed={len(stale)}, "
+                f"ttl={_HOT_CACHE_TTL}s, key={key}"
             )
 
         except Exception as e:
@@ -144,17 +248,88 @@ class HotMemoryCache:
                 f"hot_cache_warm_error: agent_id={agent_id}, user_id={user_id}, error={str(e)}"
             )
 
+    async def upsert_memory(self, user_id: UUID, record: dict[str, Any]) -> int:
+        """Refresh one cached memory after it changed (e.g. pinned or re-tiered).
+
+        Every agent's hot set in the user scope is checked, since an agent's
+        retrieval also surfaces team-wide and other agents' memories. Only
+        sets already holding the memory are updated: the cached payload's
+        ``memory`` is replaced with ``record`` while its score and signal
+        scores are kept. Each read and write runs under WATCH, so a
+        concurrent warm wins instead of being overwritten.
+
+        Args:
+            user_id: User UUID for key scoping.
+            record: JSON-mode memory record dict (the ``memory`` entry of a
+                ``warm_cache`` dict), including its ``id``.
+
+        Returns:
+            Number of hot sets that held the memory and were updated.
+        """
+        if not self._redis_manager.available:
+            return 0
+
+        client = await self._redis_manager.get_client()
+        if client is None:
+            return 0
+
+        member = str(record["id"])
+        updated = 0
+        try:
+            keys: set[str] = await client.smembers(self._user_index_key(user_id))  # type: ignore[misc, union-attr]
+            for key in keys:
+                if await self._upsert_member(client, self._data_key(key), member, record):
+                    updated += 1
+        except Exception as e:
+            logger.warning(
+                f"hot_cache_upsert_error: user_id={user_id}, member={member}, error={str(e)}"
+            )
+        return updated
+
+    async def remove_memory(self, user_id: UUID, memory_id: UUID | str) -> None:
+        """Drop one memory from every hot set of a user scope (e.g. after deletion).
+
+        Args:
+            user_id: User UUID for key scoping.
+            memory_id: Id of the memory to drop.
+        """
+        if not self._redis_manager.available:
+            return
+
+        client = await self._redis_manager.get_client()
+        if client is None:
+            return
+
+        member = str(memory_id)
+        try:
+            keys: set[str] = await client.smembers(self._user_index_key(user_id))  # type: ignore[misc, union-attr]
+            if not keys:
+                return
+            async with client.pipeline(transaction=True) as pipe:  # type: ignore[union-attr]
+                for key in keys:
+                    pipe.zrem(key, member)
+                    pipe.hdel(self._data_key(key), _PAYLOAD_FIELD + member, _VERSION_FIELD + member)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                f"hot_cache_remove_error: user_id={user_id}, member={member}, error={str(e)}"
+            )
+
     async def invalidate(self, agent_id: UUID, user_id: Optional[UUID] = None) -> None:
         """Clear hot cache for an agent.
 
         When user_id is provided, clears only that user's cache.
         When user_id is None, clears cache for all users of the agent
-        using pattern-based key scan (SCAN + DELETE).
+        using the agent's key index (see ``invalidate_agents``).
 
         Args:
             agent_id: Agent UUID whose cache to clear.
             user_id: Optional user UUID. None clears all users.
         """
+        if user_id is None:
+            await self.invalidate_agents([agent_id])
+            return
+
         if not self._redis_manager.available:
             return
 
@@ -163,34 +338,17 @@ class HotMemoryCache:
             return
 
         try:
-            if user_id is not None:
-                # Clear single user's cache
-                key = self._key(agent_id, user_id)
-                deleted = await client.delete(key)  # type: ignore[union-attr]
-                logger.info(
-                    f"hot_cache_invalidated: agent_id={agent_id}, user_id={user_id}, "
-                    f"deleted={deleted}, key={key}"
-                )
-            else:
-                # Clear all users for this agent using SCAN + DELETE
-                pattern = f"{self._redis_manager.key_prefix}hot:{agent_id}:*"
-                deleted_count = 0
-
-                # Use SCAN to find matching keys
-                cursor = 0
-                while True:
-                    cursor, keys = await client.scan(  # type: ignore[union-attr, misc]
-                        cursor, match=pattern, count=100
-                    )
-                    if keys:
-                        deleted_count += await client.delete(*keys)  # type: ignore[union-attr]
-                    if cursor == 0:
-                        break
-
-                logger.info(
-                    f"hot_cache_invalidated_all: agent_id={agent_id}, "
-                    f"deleted={deleted_count}, pattern={pattern}"
-                )
+            # Clear single user's cache and drop it from the agent's index
+            key = self._key(agent_id, user_id)
+            async with client.pipeline(transaction=True) as pipe:  # type: ignore[union-attr]
+                pipe.delete(key, self._data_key(key))
+                pipe.srem(self._index_key(agent_id), key)
+                pipe.srem(self._user_index_key(user_id), key)
+                deleted, *_ = await pipe.execute()
+            logger.info(
+                f"hot_cache_invalidated: agent_id={agent_id}, user_id={user_id}, "
+                f"deleted={deleted}, key={key}"
+            )
 
         except Exception as e:
             logger.warning(
@@ -198,6 +356,124 @@ class HotMemoryCache:
                 f"user_id={user_id}, error={str(e)}"
             )
 
+    async def invalidate_agents(self, agent_ids: Iterable[UUID]) -> int:
+        """Clear hot cache for every user of several agents.
+
+        Reads all agents' key indexes in one pipelined round trip, then
+        unlinks the listed ZSETs, their payload hashes and the indexes.
+        Cost is proportional to the agents' cached keys, not the keyspace.
+
+        Args:
+            agent_ids: Agents whose caches to clear.
+
+        Returns:
+            Number of agents invalidated (0 when Redis is unavailable or on error).
+        """
+        unique_ids = list(dict.fromkeys(agent_ids))
+        if not unique_ids or not self._redis_manager.available:
+            return 0
+
+        client = await self._redis_manager.get_client()
+        if client is None:
+            return 0
+
+        index_keys = [self._index_key(agent_id) for agent_id in unique_ids]
+        try:
+            async with client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                for index_key in index_keys:
+                    pipe.smembers(index_key)
+                indexed: list[set[str]] = await pipe.execute()
+
+            keys: list[str] = list(index_keys)
+            for members in indexed:
+                for key in members:
+                    keys.extend((key, self._data_key(key)))
+
+            deleted_count = 0
+            for start in range(0, len(keys), _INVALIDATE_BATCH_SIZE):
+                batch = keys[start : start + _INVALIDATE_BATCH_SIZE]
+                deleted_count += await client.unlink(*batch)  # type: ignore[union-attr]
+
+            logger.info(
+                f"hot_cache_invalidated_all: agents={len(unique_ids)}, deleted={deleted_count}"
+            )
+            return len(unique_ids)
+
+        except Exception as e:
+            logger.warning(
+                f"hot_cache_invalidate_agents_error: agents={len(unique_ids)}, error={str(e)}"
+            )
+            return 0
+
+    async def invalidate_user(self, user_id: UUID) -> int:
+        """Clear the hot sets of every agent in a user scope.
+
+        Used when a memory is added to the scope: hot sets are ranked
+        snapshots, so a new memory cannot be slotted in place.
+
+        Args:
+            user_id: User UUID whose agents' caches to clear.
+
+        Returns:
+            Number of hot sets cleared (0 when Redis is unavailable or on error).
+        """
+        if not self._redis_manager.available:
+            return 0
+
+        client = await self._redis_manager.get_client()
+        if client is None:
+            return 0
+
+        index_key = self._user_index_key(user_id)
+        try:
+            members: set[str] = await client.smembers(index_key)  # type: ignore[misc, union-attr]
+            keys: list[str] = [index_key]
+            for key in members:
+                keys.extend((key, self._data_key(key)))
+            for start in range(0, len(keys), _INVALIDATE_BATCH_SIZE):
+                await client.unlink(*keys[start : start + _INVALIDATE_BATCH_SIZE])  # type: ignore[union-attr]
+
+            logger.info(f"hot_cache_invalidated_user: user_id={user_id}, sets={len(members)}")
+            return len(members)
+
+        except Exception as e:
+            logger.warning(f"hot_cache_invalidate_user_error: user_id={user_id}, error={str(e)}")
+            return 0
+
+    @staticmethod
+    async def _upsert_member(
+        client: Any, data_key: str, member: str, record: dict[str, Any]
+    ) -> bool:
+        """Swap ``record`` into one hot set's cached payload under WATCH.
+
+        Args:
+            client: Redis client.
+            data_key: Payload hash of the hot set.
+            member: Memory id.
+            record: JSON-mode memory record dict.
+
+        Returns:
+            True if the hot set held the memory and it was updated.
+        """
+        async with client.pipeline(transaction=True) as pipe:
+            await pipe.watch(data_key)
+            cached: Optional[str] = await pipe.hget(data_key, _PAYLOAD_FIELD + member)
+            if cached is None:
+                return False
+
+            memory_dict = json.loads(cached)
+            memory_dict["memory"] = record
+            payload = _encode_payload(memory_dict)
+            _, version = _member_identity(memory_dict, payload)
+
+            pipe.multi()
+            pipe.hset(
+                data_key,
+                mapping={_PAYLOAD_FIELD + member: payload, _VERSION_FIELD + member: version},
+            )
+            await pipe.execute()
+        return True
+
     def _key(self, agent_id: UUID, user_id: UUID) -> str:
         """Build Redis key for hot cache.
 
@@ -209,3 +485,37 @@ class HotMemoryCache:
             Redis key string like "ska:hot:{agent_id}:{user_id}".
         """
         return f"{self._redis_manager.key_prefix}hot:{agent_id}:{user_id}"
+
+    @staticmethod
+    def _data_key(key: str) -> str:
+        """Build the payload hash key for a hot cache ZSET key.
+
+        Args:
+            key: ZSET key from ``_key``.
+
+        Returns:
+            Redis key string like "ska:hot:{agent_id}:{user_id}:data".
+        """
+        return f"{key}:data"
+
+    def _index_key(self, agent_id: UUID) -> str:
+        """Build the key of the SET indexing an agent's hot cache keys.
+
+        Args:
+            agent_id: Agent UUID.
+
+        Returns:
+            Redis key string like "ska:hot:{agent_id}:keys".
+        """
+        return f"{self._redis_manager.key_prefix}hot:{agent_id}:keys"
+
+    def _user_index_key(self, user_id: UUID) -> str:
+        """Build the key of the SET indexing a user scope's hot cache keys.
+
+        Args:
+            user_id: User UUID.
+
+        Returns:
+            Redis key string like "ska:hot:user:{user_id}:keys".
+        """
+        return f"{self._redis_manager.key_prefix}hot:user:{user_id}:keys"
@@ -5,31 +5,48 @@ import logging
 from typing import Any, Optional
 from uuid import UUID
 
+from redis.exceptions import WatchError
+
 from src.cache.client import RedisManager
 
 logger = logging.getLogger(__name__)
 
 _WORKING_MEMORY_TTL: int = 7200  # 2 hours
 
+# Turns kept per conversation; older turns are trimmed on append
+_MAX_TURNS: int = 200
+
+# Legacy layout field holding all turns as one JSON list
+_LEGACY_TURNS_FIELD: str = "turns"
+
 
 class WorkingMemoryCache:
     """Manage active conversation state in Redis HASH.
 
-    Stores conversation context, turns, and arbitrary fields in a Redis HASH.
+    Stores conversation context and arbitrary fields in a Redis HASH, and
+    turns in a capped Redis LIST so appends are O(1) and atomic.
     TTL: 2 hours, refreshed on writes.
-    Key format: {prefix}working:{conversation_id}
+    Key format: {prefix}working:{conversation_id} (HASH),
+    {prefix}working:{conversation_id}:turns (LIST of JSON turns)
+
+    Conversations written before turns moved to the LIST keep them in the
+    hash field "turns"; they are migrated on first access, or in bulk with
+    ``migrate_legacy_turns`` (see scripts/migrate_working_memory_turns.py).
 
     Attributes:
         _redis_manager: RedisManager instance for Redis operations.
+        _max_turns: Turns kept per conversation.
     """
 
-    def __init__(self, redis_manager: RedisManager) -> None:
+    def __init__(self, redis_manager: RedisManager, max_turns: int = _MAX_TURNS) -> None:
         """Initialize WorkingMemoryCache.
 
         Args:
             redis_manager: RedisManager instance for Redis operations.
+            max_turns: Turns kept per conversation (oldest are trimmed).
         """
         self._redis_manager: RedisManager = redis_manager
+        self._max_turns: int = max_turns
 
     async def set_context(self, conversation_id: UUID, context: dict[str, Any]) -> None:
         """Store full context as JSON in HASH field 'context'. TTL 2h.
@@ -87,7 +104,10 @@ class WorkingMemoryCache:
             return None
 
     async def append_turn(self, conversation_id: UUID, role: str, content: str) -> None:
-        """Append turn to HASH field 'turns' (JSON list). Refresh TTL.
+        """Append turn to the turns LIST, trim to max_turns, and refresh TTL.
+
+        RPUSH + LTRIM + EXPIRE run in one transaction, so concurrent writers
+        never lose turns and the cost does not grow with the conversation.
 
         Args:
             conversation_id: Unique identifier for the conversation.
@@ -102,36 +122,43 @@ class WorkingMemoryCache:
             return
 
         key = self._key(conversation_id)
+        turns_key = self._turns_key(conversation_id)
         try:
-            # Read existing turns
-            turns_json = await client.hget(key, "turns")  # type: ignore[misc, union-attr]
-            if turns_json is None:
-                turns: list[dict[str, str]] = []
-            else:
-                turns = json.loads(turns_json)
-
-            # Append new turn
-            turns.append({"role": role, "content": content})
-            new_turns_json = json.dumps(turns, default=str)
-
-            # Write back and refresh TTL
-            await client.hset(key, "turns", new_turns_json)  # type: ignore[misc, union-attr]
-            await client.expire(key, _WORKING_MEMORY_TTL)  # type: ignore[misc, union-attr]
+            turn_json = json.dumps({"role": role, "content": content}, separators=(",", ":"))
+            async with client.pipeline(transaction=True) as pipe:  # type: ignore[union-attr]
+                pipe.rpush(turns_key, turn_json)
+                pipe.ltrim(turns_key, -self._max_turns, -1)
+                pipe.expire(turns_key, _WORKING_MEMORY_TTL)
+                pipe.expire(key, _WORKING_MEMORY_TTL)
+                pipe.hexists(key, _LEGACY_TURNS_FIELD)
+                turn_count, _, _, _, has_legacy = await pipe.execute()
+
+            if has_legacy:
+                turn_count += await self._migrate_turns(client, key)
+
             logger.info(
-                f"append_turn_success: conversation_id={conversation_id}, role={role}, turn_count={len(turns)}, ttl={_WORKING_MEMORY_TTL}"
+                f"append_turn_success: conversation_id={conversation_id}, role={role}, "
+                f"turn_count={min(turn_count, self._max_turns)}, ttl={_WORKING_MEMORY_TTL}"
             )
         except Exception as e:
             logger.warning(f"append_turn_error: conversation_id={conversation_id}, error={str(e)}")
 
-    async def get_turns(self, conversation_id: UUID) -> list[dict[str, str]]:
-        """Get list of turns from HASH field 'turns'. Empty list on miss.
+    async def get_turns(
+        self, conversation_id: UUID, last_n: Optional[int] = None
+    ) -> list[dict[str, str]]:
+        """Get turns from the turns LIST, oldest first. Empty list on miss.
 
         Args:
             conversation_id: Unique identifier for the conversation.
+            last_n: Return only the most recent ``last_n`` turns (LRANGE
+                -last_n -1). None returns all stored turns.
 
         Returns:
             List of {"role": ..., "content": ...} dicts. Empty list on miss.
         """
+        if last_n is not None and last_n <= 0:
+            return []
+
         client = await self._redis_manager.get_client()
         if client is None:
             logger.warning(
@@ -140,19 +167,61 @@ class WorkingMemoryCache:
             return []
 
         key = self._key(conversation_id)
+        turns_key = self._turns_key(conversation_id)
+        start = -last_n if last_n is not None else 0
         try:
-            turns_json = await client.hget(key, "turns")  # type: ignore[misc, union-attr]
-            if turns_json is None:
+            async with client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                pipe.lrange(turns_key, start, -1)
+                pipe.hexists(key, _LEGACY_TURNS_FIELD)
+                raw_turns, has_legacy = await pipe.execute()
+
+            if has_legacy:
+                await self._migrate_turns(client, key)
+                raw_turns = await client.lrange(turns_key, start, -1)  # type: ignore[misc, union-attr]
+
+            if not raw_turns:
                 logger.info(f"get_turns_miss: conversation_id={conversation_id}")
                 return []
 
-            turns: list[dict[str, str]] = json.loads(turns_json)
+            turns: list[dict[str, str]] = [json.loads(raw) for raw in raw_turns]
             logger.info(f"get_turns_hit: conversation_id={conversation_id}, count={len(turns)}")
             return turns
         except Exception as e:
             logger.warning(f"get_turns_error: conversation_id={conversation_id}, error={str(e)}")
             return []
 
+    async def migrate_legacy_turns(self) -> int:
+        """Move turns of every hash-backed conversation into turns LISTs.
+
+        One-time sweep for conversations written before turns moved to a
+        LIST (they would otherwise migrate on first access). Each
+        conversation is migrated atomically, so this is safe to run while
+        the API is serving traffic, and re-running it is a no-op.
+
+        Returns:
+            Number of conversations migrated (0 when Redis is unavailable).
+        """
+        client = await self._redis_manager.get_client()
+        if client is None:
+            logger.warning("migrate_legacy_turns_skipped: redis_unavailable=True")
+            return 0
+
+        prefix = f"{self._redis_manager.key_prefix}working:"
+        migrated = 0
+        try:
+            async for key in client.scan_iter(  # type: ignore[union-attr]
+                match=f"{prefix}*", count=500, _type="HASH"
+            ):
+                if await client.hexists(key, _LEGACY_TURNS_FIELD):  # type: ignore[misc, union-attr]
+                    await self._migrate_turns(client, key)
+                    migrated += 1
+        except Exception as e:
+            logger.warning(f"migrate_legacy_turns_error: migrated={migrated}, error={str(e)}")
+            return migrated
+
+        logger.info(f"migrate_legacy_turns_success: migrated={migrated}")
+        return migrated
+
     async def set_field(self, conversation_id: UUID, field: str, value: Any) -> None:
         """Set arbitrary HASH field. Refresh TTL.
 
@@ -229,7 +298,7 @@ class WorkingMemoryCache:
 
         key = self._key(conversation_id)
         try:
-            deleted = await client.delete(key)  # type: ignore[misc, union-attr]
+            deleted = await client.delete(key, self._turns_key(conversation_id))  # type: ignore[misc, union-attr]
             logger.info(f"delete_success: conversation_id={conversation_id}, deleted={deleted}")
         except Exception as e:
             logger.warning(f"delete_error: conversation_id={conversation_id}, error={str(e)}")
@@ -244,3 +313,56 @@ class WorkingMemoryCache:
             Redis key string in format {prefix}working:{conversation_id}.
         """
         return f"{self._redis_manager.key_prefix}working:{conversation_id}"
+
+    def _turns_key(self, conversation_id: UUID) -> str:
+        """Generate Redis key for a conversation's turns LIST.
+
+        Args:
+            conversation_id: Unique identifier for the conversation.
+
+        Returns:
+            Redis key string in format {prefix}working:{conversation_id}:turns.
+        """
+        return f"{self._key(conversation_id)}:turns"
+
+    async def _migrate_turns(self, client: Any, key: str) -> int:
+        """Move one conversation's legacy "turns" hash field into its LIST.
+
+        Runs as a WATCH/MULTI transaction on the hash: legacy turns are
+        pushed in front of any turns appended since, the field is removed,
+        and the LIST is trimmed and expired. Retries if the hash changes
+        concurrently; a second caller finds no field and moves nothing.
+
+        Args:
+            client: Async Redis client.
+            key: The conversation's working memory HASH key.
+
+        Returns:
+            Number of turns moved.
+        """
+        turns_key = f"{key}:turns"
+        async with client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    legacy_json = await pipe.hget(key, _LEGACY_TURNS_FIELD)
+                    if legacy_json is None:
+                        await pipe.unwatch()
+                        return 0
+
+                    legacy_turns: list[Any] = json.loads(legacy_json)
+                    encoded = [json.dumps(turn, separators=(",", ":")) for turn in legacy_turns]
+                    pipe.multi()
+                    if encoded:
+                        # LPUSH prepends one by one, so push newest first
+                        pipe.lpush(turns_key, *reversed(encoded))
+                        pipe.ltrim(turns_key, -self._max_turns, -1)
+                        pipe.expire(turns_key, _WORKING_MEMORY_TTL)
+                    pipe.hdel(key, _LEGACY_TURNS_FIELD)
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        logger.info(f"migrate_turns_success: key={key}, turns={len(encoded)}")
+        return len(encoded)
@@ -209,8 +209,8 @@ class TeamMemoryBus:
         """
         logger.info(f"retrieve_team_context: team_id={team_id}, limit={limit}")
 
-        # Fetch SHARED memories for team
-        memories = await self._memory_repo.get_by_team(
+        # Fetch SHARED memories for team (column projection, no embeddings)
+        memories = await self._memory_repo.get_rows_by_team(
             team_id=team_id,
             memory_types=[MemoryTypeEnum.SHARED],
             status=MemoryStatusEnum.ACTIVE,
@@ -0,0 +1,54 @@
+"""Replace the IVFFlat memory embedding index with HNSW.
+
+IVFFlat recall degrades as rows are added after the lists are trained;
+HNSW keeps recall stable as the table grows and supports per-query
+``hnsw.ef_search`` tuning. The index is rebuilt concurrently so the
+memory table stays writable during the migration.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# HNSW build parameters (pgvector defaults; re-tuned by maintain_memory_vector_index)
+HNSW_M: int = 16
+HNSW_EF_CONSTRUCTION: int = 64
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_memory_embedding_hnsw ON memory "
+            "USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_memory_embedding")
+        op.execute("ALTER INDEX idx_memory_embedding_hnsw RENAME TO idx_memory_embedding")
+
+    # Record the embedded row count at build time (the same 'rows=N' comment
+    # maintain_memory_vector_index writes) so growth-based re-tuning has a baseline
+    op.execute(
+        "DO $$ BEGIN EXECUTE format('COMMENT ON INDEX idx_memory_embedding IS %L', "
+        "'rows=' || (SELECT count(*) FROM memory WHERE embedding IS NOT NULL)); END $$"
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_memory_embedding_ivfflat ON memory "
+            "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_memory_embedding")
+        op.execute("ALTER INDEX idx_memory_embedding_ivfflat RENAME TO idx_memory_embedding")
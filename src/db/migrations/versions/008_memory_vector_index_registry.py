@@ -0,0 +1,59 @@
+"""Add memory_vector_index registry for per-team partial HNSW indexes.
+
+The registry lists teams whose memories have a dedicated partial HNSW
+index (``WHERE team_id = '<uuid>'``). The indexes themselves are built and
+dropped concurrently by the maintain_memory_vector_index task as teams
+grow or shrink; dropping the registry also drops any remaining indexes.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_vector_index",
+        sa.Column(
+            "team_id",
+            sa.Uuid(),
+            sa.ForeignKey("team.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("index_name", sa.Text(), nullable=False, unique=True),
+        sa.Column("row_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    # Drop per-team partial indexes before forgetting which ones exist
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            idx record;
+        BEGIN
+            FOR idx IN SELECT index_name FROM memory_vector_index LOOP
+                EXECUTE format('DROP INDEX IF EXISTS %I', idx.index_name);
+            END LOOP;
+        END $$;
+        """
+    )
+    op.drop_table("memory_vector_index")
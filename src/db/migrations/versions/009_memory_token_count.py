@@ -0,0 +1,32 @@
+"""Persist per-memory token counts for prompt budget allocation.
+
+``token_count`` caches the token length of ``content`` as produced by the
+tokenizer named in ``token_encoding``; readers ignore counts from a
+different tokenizer and recount. Both columns are nullable so existing
+rows need no backfill.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("memory", sa.Column("token_count", sa.Integer(), nullable=True))
+    op.add_column("memory", sa.Column("token_encoding", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("memory", "token_encoding")
+    op.drop_column("memory", "token_count")
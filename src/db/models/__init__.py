@@ -32,6 +32,7 @@ from src.db.models.memory import (
     MemoryTagORM,
     MemoryTierEnum,
     MemoryTypeEnum,
+    MemoryVectorIndexORM,
 )
 from src.db.models.scheduled_job import ScheduledJobORM
 from src.db.models.tracking import AuditLogORM, UsageLogORM
@@ -57,6 +58,7 @@ __all__ = [
     "MemoryTagORM",
     "MemoryTierEnum",
     "MemoryTypeEnum",
+    "MemoryVectorIndexORM",
     "MessageORM",
     "MessageRoleEnum",
     "ParticipantRoleEnum",
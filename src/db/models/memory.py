@@ -1,4 +1,4 @@
-"""Memory, MemoryLog, and MemoryTag ORM models."""
+"""Memory, MemoryLog, MemoryTag, and MemoryVectorIndex ORM models."""
 
 import enum
 from datetime import datetime
@@ -108,6 +108,9 @@ class MemoryORM(Base, UUIDMixin, TimestampMixin):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     subject: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     embedding: Mapped[Optional[list]] = mapped_column(Vector(1536), nullable=True)
+    # Cached token length of ``content`` and the tokenizer that produced it
+    token_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    token_encoding: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Scoring
     importance: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("5"))
@@ -220,3 +223,24 @@ class MemoryTagORM(Base, UUIDMixin):
 
     # Relationships
     memory: Mapped["MemoryORM"] = relationship("MemoryORM", back_populates="tags")
+
+
+class MemoryVectorIndexORM(Base):
+    """Registry of per-team partial HNSW indexes on ``memory.embedding``.
+
+    Large teams get a dedicated partial index (``WHERE team_id = ...``) so
+    their vector searches no longer walk a graph shared with every other
+    tenant. Rows are written by the vector index maintenance task and read
+    by MemoryRepository to route searches to the team's index.
+
+    Maps to the ``memory_vector_index`` table.
+    """
+
+    __tablename__ = "memory_vector_index"
+
+    team_id: Mapped[UUID] = mapped_column(
+        ForeignKey("team.id", ondelete="CASCADE"), primary_key=True
+    )
+    index_name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,9 +1,17 @@
 """Repository layer for database access."""
 
 from src.db.repositories.base import BaseRepository
-from src.db.repositories.memory_repo import MemoryRepository
+from src.db.repositories.memory_repo import (
+    AnnSearchParams,
+    MemoryRepository,
+    MemoryRow,
+    TeamVectorIndexRegistry,
+)
 
 __all__ = [
+    "AnnSearchParams",
     "BaseRepository",
     "MemoryRepository",
+    "MemoryRow",
+    "TeamVectorIndexRegistry",
 ]
@@ -1,13 +1,236 @@
 """Memory repository with vector similarity search."""
 
-from typing import Optional
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, select
+import numpy as np
+from sqlalchemy import (
+    Float,
+    Row,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement, Label
 
-from src.db.models.memory import MemoryORM, MemoryStatusEnum, MemoryTypeEnum
+from src.db.models.memory import (
+    MemoryORM,
+    MemoryStatusEnum,
+    MemoryTypeEnum,
+    MemoryVectorIndexORM,
+)
 from src.db.repositories.base import BaseRepository
+from src.models.agent_models import RetrievalWeights
+
+logger = logging.getLogger(__name__)
+
+# Seconds a loaded per-team vector index snapshot is trusted before reloading
+_DEFAULT_TEAM_INDEX_TTL_SECONDS: float = 300.0
+
+
+@dataclass(frozen=True)
+class AnnSearchParams:
+    """Per-query approximate-nearest-neighbour tuning for vector search.
+
+    Values are applied with ``set_config(..., is_local => true)`` so they only
+    affect the current transaction. ``None`` leaves the server default.
+
+    Attributes:
+        ef_search: HNSW candidate list size (higher = better recall, slower).
+        probes: IVFFlat lists probed per query (higher = better recall, slower).
+    """
+
+    ef_search: Optional[int] = None
+    probes: Optional[int] = None
+
+    @property
+    def is_default(self) -> bool:
+        """Whether no parameter overrides the server default.
+
+        Returns:
+            True if both ef_search and probes are None.
+        """
+        return self.ef_search is None and self.probes is None
+
+
+class TeamVectorIndexRegistry:
+    """Cached set of teams that have a dedicated partial HNSW index.
+
+    Searches for these teams inline ``team_id`` as a SQL literal so the
+    planner can match the partial index predicate even for prepared
+    statements; every other team keeps a bound parameter and the shared
+    global index. One instance is shared for the application lifetime.
+
+    Args:
+        ttl_seconds: How long a loaded snapshot is used before reloading
+            from the ``memory_vector_index`` table.
+    """
+
+    def __init__(self, ttl_seconds: float = _DEFAULT_TEAM_INDEX_TTL_SECONDS) -> None:
+        self._ttl_seconds: float = ttl_seconds
+        self._team_ids: frozenset[UUID] = frozenset()
+        self._loaded_at: Optional[float] = None
+
+    async def has_dedicated_index(self, session: AsyncSession, team_id: UUID) -> bool:
+        """Check whether a team's searches should use its partial index.
+
+        Args:
+            session: Session used to reload the snapshot when it is stale.
+            team_id: Team being searched.
+
+        Returns:
+            True if the team has a registered partial index.
+        """
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self._ttl_seconds:
+            await self.refresh(session)
+        return team_id in self._team_ids
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """Reload the registered team IDs from the database.
+
+        Args:
+            session: Session to query ``memory_vector_index`` with.
+        """
+        result = await session.execute(select(MemoryVectorIndexORM.team_id))
+        self._team_ids = frozenset(result.scalars().all())
+        self._loaded_at = time.monotonic()
+        logger.debug("team_vector_index_registry_refreshed: teams=%d", len(self._team_ids))
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup."""
+        self._loaded_at = None
+
+
+class MemoryRow:
+    """Lightweight read-only projection of a memory row.
+
+    Carries every MemoryORM column except the 1536-float ``embedding``,
+    using the same attribute names as MemoryORM so it can be used wherever
+    code only reads memory fields. ``__slots__`` avoids a per-row ``__dict__``
+    and none of the ORM identity-map or change-tracking overhead applies.
+    """
+
+    __slots__ = (
+        "id",
+        "team_id",
+        "agent_id",
+        "user_id",
+        "memory_type",
+        "content",
+        "subject",
+        "token_count",
+        "token_encoding",
+        "importance",
+        "confidence",
+        "access_count",
+        "is_pinned",
+        "source_type",
+        "source_conversation_id",
+        "source_message_ids",
+        "extraction_model",
+        "version",
+        "superseded_by",
+        "contradicts",
+        "related_to",
+        "metadata_json",
+        "tier",
+        "status",
+        "last_accessed_at",
+        "expires_at",
+        "created_at",
+        "updated_at",
+    )
+
+    id: UUID
+    team_id: UUID
+    agent_id: Optional[UUID]
+    user_id: Optional[UUID]
+    memory_type: str
+    content: str
+    subject: Optional[str]
+    token_count: Optional[int]
+    token_encoding: Optional[str]
+    importance: int
+    confidence: float
+    access_count: int
+    is_pinned: bool
+    source_type: str
+    source_conversation_id: Optional[UUID]
+    source_message_ids: Optional[list[str]]
+    extraction_model: Optional[str]
+    version: int
+    superseded_by: Optional[UUID]
+    contradicts: Optional[list[str]]
+    related_to: Optional[list[str]]
+    metadata_json: dict[str, Any]
+    tier: str
+    status: str
+    last_accessed_at: datetime
+    expires_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> "MemoryRow":
+        """Build a MemoryRow from a result row selected with ``_projection_columns``.
+
+        Args:
+            row: Result row whose mapping contains every slot name.
+
+        Returns:
+            A populated MemoryRow.
+        """
+        mapping = row._mapping
+        instance = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(instance, name, mapping[name])
+        return instance
+
+    def __repr__(self) -> str:
+        return f"MemoryRow(id={self.id!r}, memory_type={self.memory_type!r})"
+
+
+def _projection_columns() -> list[Label[Any]]:
+    """Return every MemoryRow column, labelled by ORM attribute name.
+
+    Labels match MemoryORM attribute names (e.g. ``metadata_json`` rather
+    than the ``metadata`` column name) so projected rows map directly onto
+    MemoryRow slots.
+
+    Returns:
+        List of labelled column expressions (no ``embedding``).
+    """
+    return [getattr(MemoryORM, name).label(name) for name in MemoryRow.__slots__]
+
+
+def _clamp_unit(expr: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Clamp a SQL numeric expression to [0.0, 1.0].
+
+    Args:
+        expr: Numeric SQL expression.
+
+    Returns:
+        ``GREATEST(0.0, LEAST(1.0, expr))``.
+    """
+    return func.greatest(0.0, func.least(1.0, expr))
 
 
 class MemoryRepository(BaseRepository[MemoryORM]):
@@ -17,23 +240,80 @@ class MemoryRepository(BaseRepository[MemoryORM]):
     - Vector similarity search via pgvector cosine distance
     - Filtered retrieval by team, agent, memory type
     - Duplicate/similar memory detection for deduplication
+    - Bulk access-metadata updates ("touch") in a single round trip
+    - In-database five-signal scoring for retrieval (single CTE query)
+    - Columnar projection queries returning MemoryRow (no embedding column)
+    - Per-query HNSW/IVFFlat recall tuning via AnnSearchParams
+    - Routing of large teams' vector searches to per-team partial indexes
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        ann_params: Optional[AnnSearchParams] = None,
+        team_indexes: Optional[TeamVectorIndexRegistry] = None,
+    ) -> None:
         """Initialize the memory repository.
 
         Args:
             session: AsyncSession for database operations.
+            ann_params: Default ANN tuning applied before every vector search.
+            team_indexes: Registry of per-team partial indexes (None = always
+                use the global index).
         """
         super().__init__(session, MemoryORM)
+        self._ann_params: Optional[AnnSearchParams] = ann_params
+        self._team_indexes: Optional[TeamVectorIndexRegistry] = team_indexes
+
+    async def _vector_team_filter(self, team_id: UUID) -> ColumnElement[bool]:
+        """Build the team predicate for a vector search.
+
+        Teams with a dedicated partial index get ``team_id`` inlined as a
+        literal so the partial index predicate ``team_id = '<uuid>'`` is
+        provably implied; otherwise a bound parameter is used.
+
+        Args:
+            team_id: Team scope for the search.
+
+        Returns:
+            SQL boolean expression restricting rows to the team.
+        """
+        if self._team_indexes is not None and await self._team_indexes.has_dedicated_index(
+            self._session, team_id
+        ):
+            # UUID round-trip guarantees the literal is a well-formed UUID
+            team_literal = literal_column(f"'{UUID(str(team_id))}'::uuid", type_=Uuid)
+            return MemoryORM.team_id == team_literal
+        return MemoryORM.team_id == team_id
+
+    async def _apply_ann_params(self, ann_params: Optional[AnnSearchParams]) -> None:
+        """Set transaction-local ANN search parameters before a vector query.
+
+        Args:
+            ann_params: Per-call override, falling back to the repository default.
+        """
+        params = ann_params or self._ann_params
+        if params is None or params.is_default:
+            return
+
+        assignments: list[str] = []
+        values: dict[str, str] = {}
+        if params.ef_search is not None:
+            assignments.append("set_config('hnsw.ef_search', :ef_search, true)")
+            values["ef_search"] = str(params.ef_search)
+        if params.probes is not None:
+            assignments.append("set_config('ivfflat.probes', :probes, true)")
+            values["probes"] = str(params.probes)
+        await self._session.execute(text(f"SELECT {', '.join(assignments)}"), values)
 
     async def search_by_embedding(
         self,
-        embedding: list[float],
+        embedding: Sequence[float] | np.ndarray,
         team_id: UUID,
         agent_id: Optional[UUID] = None,
         memory_types: Optional[list[MemoryTypeEnum]] = None,
         limit: int = 20,
+        ann_params: Optional[AnnSearchParams] = None,
     ) -> list[tuple[MemoryORM, float]]:
         """Search memories by vector similarity.
 
@@ -43,12 +323,13 @@ class MemoryRepository(BaseRepository[MemoryORM]):
             agent_id: Optional agent scope (None = team-wide).
             memory_types: Optional filter by memory types.
             limit: Max results to return.
+            ann_params: Optional ANN tuning override for this query.
 
         Returns:
             List of (memory, similarity_score) tuples sorted by similarity DESC.
         """
         filters = [
-            MemoryORM.team_id == team_id,
+            await self._vector_team_filter(team_id),
             MemoryORM.status.in_([MemoryStatusEnum.ACTIVE, MemoryStatusEnum.DISPUTED]),
             MemoryORM.embedding.isnot(None),
         ]
@@ -67,14 +348,136 @@ class MemoryRepository(BaseRepository[MemoryORM]):
             .limit(limit)
         )
 
+        await self._apply_ann_params(ann_params)
         result = await self._session.execute(stmt)
         return [(row[0], row[1]) for row in result.all()]
 
+    async def search_rows_by_embedding(
+        self,
+        embedding: Sequence[float] | np.ndarray,
+        team_id: UUID,
+        agent_id: Optional[UUID] = None,
+        memory_types: Optional[list[MemoryTypeEnum]] = None,
+        limit: int = 20,
+        ann_params: Optional[AnnSearchParams] = None,
+    ) -> list[tuple[MemoryRow, float]]:
+        """Search memories by vector similarity, returning projected rows.
+
+        Same filters and ordering as ``search_by_embedding`` but selects an
+        explicit column list without ``embedding`` and skips ORM hydration.
+
+        Args:
+            embedding: Query embedding vector (1536 dimensions).
+            team_id: Team scope for search.
+            agent_id: Optional agent scope (None = team-wide).
+            memory_types: Optional filter by memory types.
+            limit: Max results to return.
+            ann_params: Optional ANN tuning override for this query.
+
+        Returns:
+            List of (MemoryRow, similarity_score) tuples sorted by similarity DESC.
+        """
+        filters = [
+            await self._vector_team_filter(team_id),
+            MemoryORM.status.in_([MemoryStatusEnum.ACTIVE, MemoryStatusEnum.DISPUTED]),
+            MemoryORM.embedding.isnot(None),
+        ]
+        if agent_id is not None:
+            filters.append(MemoryORM.agent_id == agent_id)
+        if memory_types:
+            filters.append(MemoryORM.memory_type.in_(memory_types))
+
+        distance = MemoryORM.embedding.cosine_distance(embedding)
+
+        stmt = (
+            select(*_projection_columns(), (1 - distance).label("similarity"))
+            .where(and_(*filters))
+            .order_by(distance)
+            .limit(limit)
+        )
+
+        await self._apply_ann_params(ann_params)
+        result = await self._session.execute(stmt)
+        return [(MemoryRow.from_row(row), row.similarity) for row in result.all()]
+
+    async def search_by_embeddings(
+        self,
+        embeddings: list[Sequence[float] | np.ndarray],
+        team_id: UUID,
+        agent_id: Optional[UUID] = None,
+        limit: int = 20,
+        ann_params: Optional[AnnSearchParams] = None,
+    ) -> list[list[tuple[MemoryORM, float]]]:
+        """Run ``search_by_embedding`` for many query vectors in one statement.
+
+        Each query vector drives a LATERAL nearest-neighbour subquery, so the
+        vector index is probed once per vector in a single round trip.
+
+        Args:
+            embeddings: Query embedding vectors (1536 dimensions each).
+            team_id: Team scope for search.
+            agent_id: Optional agent scope (None = team-wide).
+            limit: Max results per query vector.
+            ann_params: Optional ANN tuning override for this query.
+
+        Returns:
+            One list of (memory, similarity_score) tuples per input vector (same
+            order), each sorted by similarity DESC.
+        """
+        if not embeddings:
+            return []
+
+        vector_type = MemoryORM.embedding.type
+        queries = union_all(
+            *(
+                select(
+                    literal(index).label("ord"),
+                    cast(literal(embedding, vector_type), vector_type).label("query_embedding"),
+                )
+                for index, embedding in enumerate(embeddings)
+            )
+        ).subquery("queries")
+
+        filters = [
+            await self._vector_team_filter(team_id),
+            MemoryORM.status.in_([MemoryStatusEnum.ACTIVE, MemoryStatusEnum.DISPUTED]),
+            MemoryORM.embedding.isnot(None),
+        ]
+        if agent_id is not None:
+            filters.append(MemoryORM.agent_id == agent_id)
+
+        distance = MemoryORM.embedding.cosine_distance(queries.c.query_embedding)
+        neighbors = (
+            select(MemoryORM.id.label("memory_id"), (1 - distance).label("similarity"))
+            .where(and_(*filters))
+            .order_by(distance)
+            .limit(limit)
+            .correlate(queries)
+            .lateral("neighbors")
+        )
+
+        stmt = (
+            select(queries.c.ord, MemoryORM, neighbors.c.similarity)
+            .select_from(queries)
+            .join(neighbors, true())
+            .join(MemoryORM, MemoryORM.id == neighbors.c.memory_id)
+            .order_by(queries.c.ord, neighbors.c.similarity.desc())
+        )
+
+        await self._apply_ann_params(ann_params)
+        result = await self._session.execute(stmt)
+
+        grouped: list[list[tuple[MemoryORM, float]]] = [[] for _ in embeddings]
+        for row in result.all():
+            grouped[row[0]].append((row[1], row[2]))
+        return grouped
+
     async def find_similar(
         self,
-        embedding: list[float],
+        embedding: Sequence[float] | np.ndarray,
         team_id: UUID,
         threshold: float = 0.92,
+        ann_params: Optional[AnnSearchParams] = None,
     ) -> list[MemoryORM]:
         """Find memories similar to a given embedding (for deduplication).
 
@@ -82,6 +485,7 @@ class MemoryRepository(BaseRepository[MemoryORM]):
             embedding: Embedding to compare against.
             team_id: Team scope.
             threshold: Minimum similarity score (0-1).
+            ann_params: Optional ANN tuning override for this query.
 
         Returns:
             List of memories above the similarity threshold.
@@ -92,7 +496,7 @@ class MemoryRepository(BaseRepository[MemoryORM]):
             select(MemoryORM)
             .where(
                 and_(
-                    MemoryORM.team_id == team_id,
+                    await self._vector_team_filter(team_id),
                     MemoryORM.status == MemoryStatusEnum.ACTIVE,
                     MemoryORM.embedding.isnot(None),
                     (1 - distance) >= threshold,
@@ -101,6 +505,7 @@ class MemoryRepository(BaseRepository[MemoryORM]):
             .order_by(distance)
         )
 
+        await self._apply_ann_params(ann_params)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -141,3 +546,216 @@ class MemoryRepository(BaseRepository[MemoryORM]):
 
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+    async def touch_many(
+        self,
+        memory_ids: list[UUID],
+        increment: int = 1,
+        accessed_at: Optional[datetime] = None,
+    ) -> int:
+        """Bump access metadata for many memories in one UPDATE statement.
+
+        Issues ``UPDATE memory SET access_count = access_count + :increment,
+        last_accessed_at = :accessed_at WHERE id = ANY(:ids)`` instead of
+        loading and mutating each row individually.
+
+        Args:
+            memory_ids: UUIDs of the memories to touch.
+            increment: Amount to add to access_count for every memory.
+            accessed_at: Timestamp to record (defaults to now, UTC).
+
+        Returns:
+            Number of rows updated.
+        """
+        if not memory_ids:
+            return 0
+
+        ids_param = bindparam("touch_ids", value=list(memory_ids), type_=ARRAY(Uuid))
+        stmt = (
+            update(MemoryORM)
+            .where(MemoryORM.id == any_(ids_param))
+            .values(
+                access_count=MemoryORM.access_count + increment,
+                last_accessed_at=accessed_at or datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self._session.execute(stmt)
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    async def search_scored(
+        self,
+        embedding: Sequence[float] | np.ndarray,
+        team_id: UUID,
+        weights: RetrievalWeights,
+        agent_id: Optional[UUID] = None,
+        conversation_id: Optional[UUID] = None,
+        semantic_limit: int = 20,
+        recency_limit: int = 50,
+        limit: int = 40,
+        ann_params: Optional[AnnSearchParams] = None,
+    ) -> list[tuple[MemoryRow, dict[str, float]]]:
+        """Gather retrieval candidates and score them in one CTE query.
+
+        Candidates are the top semantic matches (agent-scoped and team-wide
+        when agent_id is given) plus the most recently accessed active
+        memories. Postgres computes the semantic, recency, importance and
+        continuity signals and the weighted score, and only the top ``limit``
+        rows are returned, without the embedding column. The relationship
+        signal depends on the other returned rows and is left at 0.0.
+
+        Args:
+            embedding: Query embedding vector (1536 dimensions).
+            team_id: Team scope for search.
+            weights: Per-signal weights for the composite score.
+            agent_id: Optional agent scope for the agent-specific search.
+            conversation_id: Current conversation for the continuity signal.
+            semantic_limit: Max candidates per semantic search.
+            recency_limit: Max candidates from the recency fetch.
+            limit: Max scored rows to return.
+            ann_params: Optional ANN tuning override for this query.
+
+        Returns:
+            List of (MemoryRow, signal scores) tuples ordered by weighted
+            score DESC.
+        """
+        distance = MemoryORM.embedding.cosine_distance(embedding)
+        semantic_filters = [
+            await self._vector_team_filter(team_id),
+            MemoryORM.status.in_([MemoryStatusEnum.ACTIVE, MemoryStatusEnum.DISPUTED]),
+            MemoryORM.embedding.isnot(None),
+        ]
+
+        candidate_selects = []
+        scopes: list[Optional[UUID]] = [agent_id, None] if agent_id is not None else [None]
+        for index, scope in enumerate(scopes):
+            filters = list(semantic_filters)
+            if scope is not None:
+                filters.append(MemoryORM.agent_id == scope)
+            semantic = (
+                select(MemoryORM.id.label("id"), (1 - distance).label("similarity"))
+                .where(and_(*filters))
+                .order_by(distance)
+                .limit(semantic_limit)
+                .cte(f"semantic_{index}")
+            )
+            candidate_selects.append(select(semantic.c.id, semantic.c.similarity))
+
+        recent = (
+            select(MemoryORM.id.label("id"), cast(literal(0.0), Float).label("similarity"))
+            .where(
+                MemoryORM.team_id == team_id,
+                MemoryORM.status == MemoryStatusEnum.ACTIVE,
+            )
+            .order_by(MemoryORM.last_accessed_at.desc())
+            .limit(recency_limit)
+            .cte("recent")
+        )
+        candidate_selects.append(select(recent.c.id, recent.c.similarity))
+
+        pooled = union_all(*candidate_selects).subquery("pooled")
+        candidates = (
+            select(pooled.c.id, func.max(pooled.c.similarity).label("similarity"))
+            .group_by(pooled.c.id)
+            .cte("candidates")
+        )
+
+        hours = func.greatest(
+            0.0, func.extract("epoch", func.now() - MemoryORM.last_accessed_at) / 3600.0
+        )
+        semantic_score = _clamp_unit(candidates.c.similarity)
+        recency_score = func.exp(-0.01 * hours)
+        importance_score = case(
+            (
+                or_(
+                    MemoryORM.memory_type == MemoryTypeEnum.IDENTITY,
+                    MemoryORM.is_pinned.is_(True),
+                ),
+                1.0,
+            ),
+            (MemoryORM.status == MemoryStatusEnum.DISPUTED, MemoryORM.importance / 10.0 * 0.5),
+            else_=MemoryORM.importance / 10.0,
+        )
+        continuity_score: ColumnElement[Any] = literal(0.0)
+        if conversation_id is not None:
+            continuity_score = case(
+                (MemoryORM.source_conversation_id == conversation_id, 1.0), else_=0.0
+            )
+        final_score = _clamp_unit(
+            semantic_score * weights.semantic
+            + recency_score * weights.recency
+            + importance_score * weights.importance
+            + continuity_score * weights.continuity
+        ).label("final_score")
+
+        stmt = (
+            select(
+                *_projection_columns(),
+                semantic_score.label("signal_semantic"),
+                recency_score.label("signal_recency"),
+                importance_score.label("signal_importance"),
+                continuity_score.label("signal_continuity"),
+                final_score,
+            )
+            .join(candidates, candidates.c.id == MemoryORM.id)
+            .order_by(final_score.desc())
+            .limit(limit)
+        )
+
+        await self._apply_ann_params(ann_params)
+        result = await self._session.execute(stmt)
+        return [
+            (
+                MemoryRow.from_row(row),
+                {
+                    "semantic": float(row.signal_semantic),
+                    "recency": float(row.signal_recency),
+                    "importance": float(row.signal_importance),
+                    "continuity": float(row.signal_continuity),
+                    "relationship": 0.0,
+                },
+            )
+            for row in result.all()
+        ]
+
+    async def get_rows_by_team(
+        self,
+        team_id: UUID,
+        memory_types: Optional[list[MemoryTypeEnum]] = None,
+        status: MemoryStatusEnum = MemoryStatusEnum.ACTIVE,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[MemoryRow]:
+        """Get memories for a team as projected rows.
+
+        Same filters and ordering as ``get_by_team`` but selects an explicit
+        column list without ``embedding`` and skips ORM hydration.
+
+        Args:
+            team_id: Team to get memories for.
+            memory_types: Optional filter by types.
+            status: Filter by status (default: active).
+            limit: Max results.
+            offset: Pagination offset.
+
+        Returns:
+            List of MemoryRow ordered by last_accessed_at DESC.
+        """
+        filters = [
+            MemoryORM.team_id == team_id,
+            MemoryORM.status == status,
+        ]
+        if memory_types:
+            filters.append(MemoryORM.memory_type.in_(memory_types))
+
+        stmt = (
+            select(*_projection_columns())
+            .where(and_(*filters))
+            .order_by(MemoryORM.last_accessed_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+        result = await self._session.execute(stmt)
+        return [MemoryRow.from_row(row) for row in result.all()]
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 import logging
 from pathlib import Path
 
-from src.skill_loader import SkillLoader
+from src.skill_loader import SkillLoader, get_skill_loader
 from src.settings import load_settings
 
 if TYPE_CHECKING:
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from src.memory.storage import MemoryExtractor
     from src.memory.compaction_shield import CompactionShield
     from src.memory.prompt_builder import MemoryPromptBuilder
+    from src.memory.types import RetrievalResult
 
     # Phase 2: MoE routing imports
     from src.moe.complexity_scorer import QueryComplexityScorer
@@ -72,6 +73,8 @@ class AgentDependencies:
     memory_extractor: Optional["MemoryExtractor"] = None
     compaction_shield: Optional["CompactionShield"] = None
     prompt_builder: Optional["MemoryPromptBuilder"] = None
+    # Memories retrieved for the current turn, reused by the system prompt
+    retrieval_result: Optional["RetrievalResult"] = None
 
     # MoE routing (Phase 2 - initialized externally)
     complexity_scorer: Optional["QueryComplexityScorer"] = None
@@ -106,15 +109,13 @@ class AgentDependencies:
             logger.info(f"settings_loaded: skills_dir={self.settings.skills_dir}")
 
         if not self.skill_loader:
+            # Process-wide registry: scanned once, reloaded only on file changes
             skills_dir = Path(self.settings.skills_dir)
-            self.skill_loader = SkillLoader(skills_dir)
-            skills = self.skill_loader.discover_skills()
+            self.skill_loader = get_skill_loader(
+                skills_dir, reload_interval=self.settings.skills_reload_interval_seconds
+            )
 
-            logger.info(f"skill_loader_initialized: skills_count={len(skills)}")
-
-            # Log discovered skills
-            for skill in skills:
-                logger.debug(f"skill_available: name={skill.name}, description={skill.description}")
+            logger.info(f"skill_loader_initialized: skills_count={len(self.skill_loader.skills)}")
 
     def set_user_preference(self, key: str, value: Any) -> None:
         """
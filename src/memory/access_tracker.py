@@ -0,0 +1,153 @@
+"""Write-behind buffer for memory access metadata updates."""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.repositories.memory_repo import MemoryRepository
+
+logger = logging.getLogger(__name__)
+
+# Default interval between background flushes, in milliseconds
+_DEFAULT_FLUSH_INTERVAL_MS: int = 500
+
+
+class AccessTracker:
+    """In-process write-behind buffer for memory access "touches".
+
+    Retrieval records which memories were included in a result; the tracker
+    accumulates per-memory access counts and flushes them periodically with
+    one bulk UPDATE per distinct increment, using its own session so the
+    chat request's transaction is never involved.
+
+    Args:
+        session_factory: Factory producing independent AsyncSessions for flushes.
+        flush_interval_ms: Milliseconds between background flushes.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval_ms: int = _DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
+        self._session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self._flush_interval: float = flush_interval_ms / 1000.0
+        self._pending: Counter[UUID] = Counter()
+        self._last_accessed_at: Optional[datetime] = None
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct memories waiting to be flushed.
+
+        Returns:
+            Count of buffered memory IDs.
+        """
+        return len(self._pending)
+
+    def record(self, memory_ids: list[UUID]) -> None:
+        """Buffer an access for each memory ID (non-blocking).
+
+        Args:
+            memory_ids: UUIDs of memories that were retrieved and included.
+        """
+        if not memory_ids:
+            return
+        self._pending.update(memory_ids)
+        self._last_accessed_at = datetime.now(timezone.utc)
+
+    async def flush(self) -> int:
+        """Write all buffered touches to the database.
+
+        Memories are grouped by their buffered access count so each group is
+        a single ``UPDATE ... WHERE id = ANY(...)``. On failure the buffered
+        counts are merged back so they are retried on the next flush.
+
+        Returns:
+            Number of rows updated.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, Counter()
+            accessed_at = self._last_accessed_at or datetime.now(timezone.utc)
+
+            by_increment: dict[int, list[UUID]] = {}
+            for memory_id, count in pending.items():
+                by_increment.setdefault(count, []).append(memory_id)
+
+            try:
+                updated = 0
+                async with self._session_factory() as session:
+                    repo = MemoryRepository(session)
+                    for increment, memory_ids in by_increment.items():
+                        updated += await repo.touch_many(
+                            memory_ids, increment=increment, accessed_at=accessed_at
+                        )
+                    await session.commit()
+            except Exception as e:
+                self._pending.update(pending)
+                logger.error(
+                    "access_tracker_flush: error=%s memory_count=%d",
+                    str(e),
+                    len(pending),
+                )
+                return 0
+
+            logger.info(
+                "access_tracker_flush: updated=%d batches=%d",
+                updated,
+                len(by_increment),
+            )
+            return updated
+
+    def start(self) -> None:
+        """Start the periodic background flush loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background loop and flush any remaining touches."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush buffered touches every flush interval until cancelled."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+
+_shared_access_tracker: Optional[AccessTracker] = None
+
+
+def configure_access_tracker(tracker: Optional[AccessTracker]) -> None:
+    """Install (or remove, with None) the process-wide access tracker.
+
+    Args:
+        tracker: Tracker used by MemoryRetrievers created without an explicit one.
+    """
+    global _shared_access_tracker
+    _shared_access_tracker = tracker
+
+
+def get_access_tracker() -> Optional[AccessTracker]:
+    """Return the process-wide access tracker, or None when write-behind is off.
+
+    Returns:
+        The configured AccessTracker, or None.
+    """
+    return _shared_access_tracker
@@ -2,15 +2,17 @@
 
 import logging
 from itertools import combinations
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.memory import MemoryORM, MemoryStatusEnum
 from src.db.repositories.memory_repo import MemoryRepository
 from src.memory.embedding import EmbeddingService
+from src.memory.similarity import similarity_matrix
 from src.memory.types import (
     Contradiction,
     ContradictionResult,
@@ -30,11 +32,13 @@ _DEDUP_THRESHOLD: float = 0.92
 class ContradictionDetector:
     """Detects contradictions between memories during storage and retrieval.
 
-    Provides two entry points:
+    Provides three entry points:
 
     - ``check_on_store``: Pre-persistence check that compares a new memory
       against existing memories with the same subject, returning an action
       (supersede, dispute, or coexist).
+    - ``check_batch_on_store``: The same check for many new memories using
+      one subject query and one batched vector query.
     - ``check_on_retrieve``: Post-retrieval scan that identifies contradictions
       among a batch of returned memories so the caller can surface warnings.
 
@@ -63,6 +67,7 @@ class ContradictionDetector:
         new_memory: ExtractedMemory,
         team_id: UUID,
         agent_id: Optional[UUID] = None,
+        embedding: Optional[np.ndarray] = None,
     ) -> ContradictionResult:
         """Check a new memory against existing memories before persistence.
 
@@ -84,6 +89,8 @@ class ContradictionDetector:
             new_memory: The extracted memory to check before storing.
             team_id: Team scope for the search.
             agent_id: Optional agent scope (None = team-wide).
+            embedding: Pre-computed embedding of ``new_memory.content``.
+                Embedded on demand when omitted.
 
         Returns:
             ContradictionResult with contradicting memory UUIDs and resolution action.
@@ -104,65 +111,121 @@ class ContradictionDetector:
             agent_id=agent_id,
         )
 
-        contradicting_ids: list[UUID] = []
-        action: str = "coexist"
-        reasons: list[str] = []
+        # Phase 2: Semantic similarity search
+        if embedding is None:
+            embedding = await self._embedding_service.embed_text(new_memory.content)
+        semantic_results: list[tuple[MemoryORM, float]] = await self._repo.search_by_embedding(
+            embedding=embedding,
+            team_id=team_id,
+            limit=20,
+        )
 
-        for existing in subject_matches:
-            comparison: str = self._compare_content(
-                new_content=new_memory.content,
-                existing_content=existing.content,
-            )
+        result: ContradictionResult = self._resolve_on_store(
+            new_memory=new_memory,
+            subject_matches=subject_matches,
+            semantic_results=semantic_results,
+        )
 
-            if comparison == "same":
-                # Content is effectively identical -- coexist / duplicate
-                continue
-            elif comparison == "different":
-                contradicting_ids.append(existing.id)
-                if new_memory.importance > existing.importance:
-                    action = "supersede"
-                    reasons.append(
-                        f"New memory (importance={new_memory.importance}) supersedes "
-                        f"existing memory {existing.id} (importance={existing.importance}) "
-                        f"on subject '{new_memory.subject}'."
-                    )
-                else:
-                    action = "dispute"
-                    reasons.append(
-                        f"Conflicting content with memory {existing.id} on subject "
-                        f"'{new_memory.subject}'; importance is equal or lower."
-                    )
+        logger.info(
+            "check_on_store: subject=%s contradictions=%d action=%s",
+            new_memory.subject,
+            len(result.contradicts),
+            result.action,
+        )
 
-        # Phase 2: Semantic similarity check
-        semantic_contradictions: list[UUID] = await self._check_semantic_similarity(
-            new_memory=new_memory,
+        return result
+
+    async def check_batch_on_store(
+        self,
+        new_memories: list[ExtractedMemory],
+        team_id: UUID,
+        agent_id: Optional[UUID] = None,
+        embeddings: Optional[list[np.ndarray]] = None,
+    ) -> list[ContradictionResult]:
+        """Check many new memories against existing memories in two queries.
+
+        Applies the same rules as ``check_on_store`` to every memory, but
+        resolves all subjects with one ``IN (...)`` query and all semantic
+        neighbours with one batched vector query instead of two queries per
+        memory. Conflicts between new memories are resolved in memory, in
+        batch order, as if each earlier memory had already been stored: same
+        subject with different content, or (using the batch's own embeddings)
+        semantic similarity in the contradiction range with different
+        content, whatever the earlier memory's subject. They are reported as
+        ``batch_contradicts`` indices.
+
+        Args:
+            new_memories: Extracted memories to check before storing.
+            team_id: Team scope for the search.
+            agent_id: Optional agent scope for subject matches (None = team-wide).
+            embeddings: Pre-computed embeddings aligned with ``new_memories``.
+                Embedded in one batch when omitted.
+
+        Returns:
+            One ContradictionResult per input memory, in the same order.
+        """
+        results: list[ContradictionResult] = [
+            ContradictionResult(
+                contradicts=[],
+                action="coexist",
+                reason="No subject specified; cannot check for contradictions.",
+            )
+            for _ in new_memories
+        ]
+
+        # Memories without a subject have nothing to contradict on
+        subjects: dict[int, str] = {
+            i: memory.subject.strip().lower()
+            for i, memory in enumerate(new_memories)
+            if memory.subject
+        }
+        checked: list[int] = list(subjects)
+        if not checked:
+            return results
+
+        subject_matches: dict[str, list[MemoryORM]] = await self._query_by_subjects(
+            subjects=set(subjects.values()),
             team_id=team_id,
-            already_flagged=set(contradicting_ids),
+            agent_id=agent_id,
         )
 
-        for sem_id in semantic_contradictions:
-            contradicting_ids.append(sem_id)
-            if action == "coexist":
-                action = "dispute"
-            reasons.append(
-                f"Semantic similarity above {_SEMANTIC_CONTRADICTION_THRESHOLD} "
-                f"with memory {sem_id} but content differs."
+        if embeddings is None:
+            embeddings = await self._embedding_service.embed_batch(
+                [memory.content for memory in new_memories]
             )
-
-        reason: str = " ".join(reasons) if reasons else "No contradictions detected."
+        semantic_results: list[
+            list[tuple[MemoryORM, float]]
+        ] = await self._repo.search_by_embeddings(
+            embeddings=[embeddings[i] for i in checked],
+            team_id=team_id,
+            limit=20,
+        )
+        # Every new memory against every other, for in-batch semantic conflicts
+        batch_similarity: np.ndarray = similarity_matrix(embeddings)
+
+        # Earlier memories in the batch with the same subject, newest first
+        batch_matches: dict[str, list[tuple[int, ExtractedMemory]]] = {}
+        for index, neighbours in zip(checked, semantic_results):
+            earlier = batch_matches.setdefault(subjects[index], [])
+            results[index] = self._resolve_on_store(
+                new_memory=new_memories[index],
+                subject_matches=subject_matches.get(subjects[index], []),
+                semantic_results=neighbours,
+                batch_matches=earlier,
+                batch_semantic=[
+                    (j, new_memories[j], float(batch_similarity[index, j])) for j in range(index)
+                ],
+            )
+            earlier.insert(0, (index, new_memories[index]))
 
         logger.info(
-            "check_on_store: subject=%s contradictions=%d action=%s",
-            new_memory.subject,
-            len(contradicting_ids),
-            action,
+            "check_batch_on_store: memories=%d checked=%d contradictions=%d",
+            len(new_memories),
+            len(checked),
+            sum(len(result.contradicts) + len(result.batch_contradicts) for result in results),
         )
 
-        return ContradictionResult(
-            contradicts=contradicting_ids,
-            action=action,
-            reason=reason,
-        )
+        return results
 
     def check_on_retrieve(
         self,
@@ -258,35 +321,174 @@ class ContradictionDetector:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def _check_semantic_similarity(
+    async def _query_by_subjects(
         self,
-        new_memory: ExtractedMemory,
+        subjects: set[str],
         team_id: UUID,
+        agent_id: Optional[UUID] = None,
+    ) -> dict[str, list[MemoryORM]]:
+        """Query active memories matching any of several subjects.
+
+        Args:
+            subjects: Normalized (stripped, lowercased) subject strings.
+            team_id: Team scope.
+            agent_id: Optional agent scope.
+
+        Returns:
+            Mapping of normalized subject to its active MemoryORM records,
+            newest first.
+        """
+        filters = [
+            MemoryORM.team_id == team_id,
+            MemoryORM.status == MemoryStatusEnum.ACTIVE,
+            MemoryORM.subject.isnot(None),
+            func_lower(MemoryORM.subject).in_(sorted(subjects)),
+        ]
+        if agent_id is not None:
+            filters.append(MemoryORM.agent_id == agent_id)
+
+        stmt = select(MemoryORM).where(and_(*filters)).order_by(MemoryORM.created_at.desc())
+
+        result = await self._session.execute(stmt)
+        grouped: dict[str, list[MemoryORM]] = {}
+        for existing in result.scalars().all():
+            grouped.setdefault(existing.subject.strip().lower(), []).append(existing)
+        return grouped
+
+    def _resolve_on_store(
+        self,
+        new_memory: ExtractedMemory,
+        subject_matches: list[MemoryORM],
+        semantic_results: list[tuple[MemoryORM, float]],
+        batch_matches: Sequence[tuple[int, ExtractedMemory]] = (),
+        batch_semantic: Sequence[tuple[int, ExtractedMemory, float]] = (),
+    ) -> ContradictionResult:
+        """Apply the store-time resolution rules to pre-fetched candidates.
+
+        Args:
+            new_memory: The memory being checked.
+            subject_matches: Active memories with the same subject.
+            semantic_results: (memory, similarity) nearest neighbours of the
+                new memory's embedding.
+            batch_matches: (batch index, memory) pairs for earlier memories in
+                the same batch with the same subject, newest first.
+            batch_semantic: (batch index, memory, similarity) for every earlier
+                memory in the same batch.
+
+        Returns:
+            ContradictionResult with contradicting memory UUIDs and resolution action.
+        """
+        contradicting_ids: list[UUID] = []
+        batch_ids: list[int] = []
+        action: str = "coexist"
+        reasons: list[str] = []
+
+        # Phase 1a: Same subject as an earlier memory in this batch (the most
+        # recent matches, so they are compared before stored memories)
+        for batch_index, earlier in batch_matches:
+            if self._compare_content(new_memory.content, earlier.content) == "same":
+                continue
+            batch_ids.append(batch_index)
+            if new_memory.importance > earlier.importance:
+                action = "supersede"
+                reasons.append(
+                    f"New memory (importance={new_memory.importance}) supersedes "
+                    f"batch memory #{batch_index} (importance={earlier.importance}) "
+                    f"on subject '{new_memory.subject}'."
+                )
+            else:
+                action = "dispute"
+                reasons.append(
+                    f"Conflicting content with batch memory #{batch_index} on subject "
+                    f"'{new_memory.subject}'; importance is equal or lower."
+                )
+
+        # Phase 1b: Same subject, different content
+        for existing in subject_matches:
+            comparison: str = self._compare_content(
+                new_content=new_memory.content,
+                existing_content=existing.content,
+            )
+
+            if comparison == "same":
+                # Content is effectively identical -- coexist / duplicate
+                continue
+            elif comparison == "different":
+                contradicting_ids.append(existing.id)
+                if new_memory.importance > existing.importance:
+                    action = "supersede"
+                    reasons.append(
+                        f"New memory (importance={new_memory.importance}) supersedes "
+                        f"existing memory {existing.id} (importance={existing.importance}) "
+                        f"on subject '{new_memory.subject}'."
+                    )
+                else:
+                    action = "dispute"
+                    reasons.append(
+                        f"Conflicting content with memory {existing.id} on subject "
+                        f"'{new_memory.subject}'; importance is equal or lower."
+                    )
+
+        # Phase 2: Semantically similar but content-different
+        semantic_contradictions: list[UUID] = self._filter_semantic_contradictions(
+            new_memory=new_memory,
+            results=semantic_results,
+            already_flagged=set(contradicting_ids),
+        )
+
+        for sem_id in semantic_contradictions:
+            contradicting_ids.append(sem_id)
+            if action == "coexist":
+                action = "dispute"
+            reasons.append(
+                f"Semantic similarity above {_SEMANTIC_CONTRADICTION_THRESHOLD} "
+                f"with memory {sem_id} but content differs."
+            )
+
+        # Phase 2b: Semantically similar earlier memories in this batch
+        for batch_index, earlier, similarity in batch_semantic:
+            if batch_index in batch_ids:
+                continue
+            if not _SEMANTIC_CONTRADICTION_THRESHOLD <= similarity < _DEDUP_THRESHOLD:
+                continue
+            if self._compare_content(new_memory.content, earlier.content) == "same":
+                continue
+            batch_ids.append(batch_index)
+            if action == "coexist":
+                action = "dispute"
+            reasons.append(
+                f"Semantic similarity above {_SEMANTIC_CONTRADICTION_THRESHOLD} "
+                f"with batch memory #{batch_index} but content differs."
+            )
+
+        reason: str = " ".join(reasons) if reasons else "No contradictions detected."
+
+        return ContradictionResult(
+            contradicts=contradicting_ids,
+            batch_contradicts=batch_ids,
+            action=action,
+            reason=reason,
+        )
+
+    def _filter_semantic_contradictions(
+        self,
+        new_memory: ExtractedMemory,
+        results: list[tuple[MemoryORM, float]],
         already_flagged: set[UUID],
     ) -> list[UUID]:
         """Find semantically similar memories that have different content.
 
-        Embeds the new memory's content, searches for similar memories,
-        and filters to those above the contradiction threshold but below
-        the dedup threshold whose content actually differs.
+        Filters vector search results to those above the contradiction
+        threshold but below the dedup threshold whose content actually differs.
 
         Args:
             new_memory: The memory being checked.
-            team_id: Team scope for the search.
+            results: (memory, similarity) search results for the new memory.
             already_flagged: Memory IDs already identified as contradicting.
 
         Returns:
             List of memory UUIDs that are semantically similar but content-different.
         """
-        embedding: list[float] = await self._embedding_service.embed_text(new_memory.content)
-
-        # Use search_by_embedding to get memories with similarity scores
-        results: list[tuple[MemoryORM, float]] = await self._repo.search_by_embedding(
-            embedding=embedding,
-            team_id=team_id,
-            limit=20,
-        )
-
         semantic_contradictions: list[UUID] = []
 
         for existing, similarity in results:
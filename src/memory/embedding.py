@@ -6,9 +6,11 @@ import asyncio
 import hashlib
 import logging
 from collections import OrderedDict
-from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
 
 import httpx
+import numpy as np
 
 if TYPE_CHECKING:
     from src.cache.embedding_cache import EmbeddingCache
@@ -22,6 +24,9 @@ RETRY_BASE_DELAY: float = 1.0  # seconds
 # Cache configuration
 MAX_CACHE_SIZE: int = 1000
 
+# Micro-batching configuration (window 0 = disabled, one API call per text)
+DEFAULT_MAX_MICRO_BATCH: int = 64
+
 
 class EmbeddingService:
     """Async embedding service with L1 LRU + optional L2 Redis caching and exponential backoff.
@@ -32,6 +37,20 @@ class EmbeddingService:
     - L2: Optional Redis cache (24h TTL, milliseconds)
     - L3: API call (seconds, costs money)
 
+    Concurrent ``embed_text`` calls for the same (normalized) text are
+    coalesced: the first caller performs the L2/L3 lookup and the others
+    await its result, so a burst of identical queries costs one API call.
+
+    With a non-zero ``batch_window_ms``, single-text API calls are
+    micro-batched: texts that miss L1/L2 wait up to the window (or until
+    ``max_batch_size`` texts are pending) and are sent as one batched API
+    request, with each vector fanned back to its caller.
+
+    Vectors are float32 NumPy arrays at every tier (API responses are
+    converted once, Redis hits are decoded without per-element objects), so
+    callers can stack and compare them without list conversions. Cached
+    vectors are shared between callers and must not be modified in place.
+
     Attributes:
         _api_key: API key for the embeddings provider (never logged).
         _model: Embedding model name.
@@ -39,6 +58,9 @@ class EmbeddingService:
         _base_url: Base URL for the embeddings API.
         _cache: OrderedDict acting as L1 LRU cache.
         _redis_cache: Optional EmbeddingCache for L2 persistent cache.
+        _http_client: Optional shared HTTP client reused across API calls.
+        _inflight: In-flight L2/L3 lookups keyed by cache key.
+        _pending_batch: Texts (and their result futures) awaiting the next micro-batch.
     """
 
     def __init__(
@@ -48,6 +70,9 @@ class EmbeddingService:
         dimensions: int = 1536,
         base_url: str = "https://api.openai.com/v1",
         redis_cache: EmbeddingCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        batch_window_ms: float = 0.0,
+        max_batch_size: int = DEFAULT_MAX_MICRO_BATCH,
     ) -> None:
         """Initialize the embedding service.
 
@@ -57,13 +82,26 @@ class EmbeddingService:
             dimensions: Output vector dimensionality.
             base_url: Base URL for the embeddings API.
             redis_cache: Optional Redis cache for L2 persistent caching.
+            http_client: Optional long-lived HTTP client (connection reuse).
+                When None, a short-lived client is created per API call.
+                The caller owns the client and is responsible for closing it.
+            batch_window_ms: How long single-text API calls wait to be
+                micro-batched together (0 disables micro-batching).
+            max_batch_size: Pending texts that trigger an immediate flush.
         """
         self._api_key: str = api_key
         self._model: str = model
         self._dimensions: int = dimensions
         self._base_url: str = base_url.rstrip("/")
-        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
         self._redis_cache: EmbeddingCache | None = redis_cache
+        self._http_client: httpx.AsyncClient | None = http_client
+        self._inflight: dict[str, asyncio.Future[np.ndarray]] = {}
+        self._batch_window: float = batch_window_ms / 1000.0
+        self._max_batch_size: int = max_batch_size
+        self._pending_batch: list[tuple[str, asyncio.Future[np.ndarray]]] = []
+        self._batch_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
 
     def _cache_key(self, text: str) -> str:
         """Compute a cache key from normalized text.
@@ -77,7 +115,7 @@ class EmbeddingService:
         normalized: str = text.lower().strip()
         return hashlib.sha256(normalized.encode()).hexdigest()
 
-    def _cache_get(self, key: str) -> list[float] | None:
+    def _cache_get(self, key: str) -> np.ndarray | None:
         """Retrieve a cached embedding, promoting it to most-recent.
 
         Args:
@@ -91,7 +129,7 @@ class EmbeddingService:
             return self._cache[key]
         return None
 
-    def _cache_put(self, key: str, embedding: list[float]) -> None:
+    def _cache_put(self, key: str, embedding: np.ndarray) -> None:
         """Store an embedding in the LRU cache, evicting if full.
 
         Args:
@@ -108,17 +146,30 @@ class EmbeddingService:
 
         self._cache[key] = embedding
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client, or a short-lived one if none was given.
+
+        Yields:
+            An httpx.AsyncClient for a single API call.
+        """
+        if self._http_client is not None:
+            yield self._http_client
+            return
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            yield client
+
     async def _call_api(
         self,
         input_data: str | list[str],
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Call the embeddings API with exponential backoff on 429.
 
         Args:
             input_data: A single text string or list of strings to embed.
 
         Returns:
-            List of embedding vectors, one per input text.
+            Read-only float32 matrix with one embedding row per input text.
 
         Raises:
             RuntimeError: On non-429 HTTP errors or exhausted retries.
@@ -127,7 +178,7 @@ class EmbeddingService:
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with self._client() as client:
                     response = await client.post(
                         f"{self._base_url}/embeddings",
                         headers={
@@ -166,7 +217,12 @@ class EmbeddingService:
 
                 # Parse successful response
                 data = response.json()
-                embeddings: list[list[float]] = [item["embedding"] for item in data["data"]]
+                # One float32 matrix for the whole response; its rows are
+                # shared with the L1 cache, so they are made read-only
+                embeddings: np.ndarray = np.asarray(
+                    [item["embedding"] for item in data["data"]], dtype=np.float32
+                )
+                embeddings.flags.writeable = False
                 return embeddings
 
             except httpx.TimeoutException:
@@ -187,14 +243,14 @@ class EmbeddingService:
 
         raise RuntimeError(last_error or "Embedding API failed after retries")
 
-    async def embed_text(self, text: str) -> list[float]:
+    async def embed_text(self, text: str) -> np.ndarray:
         """Embed a single text string, using L1 LRU → L2 Redis → L3 API tiers.
 
         Args:
             text: The text to embed.
 
         Returns:
-            Embedding vector as a list of floats.
+            Embedding vector as a float32 array.
 
         Raises:
             RuntimeError: If the API call fails after retries.
@@ -202,23 +258,60 @@ class EmbeddingService:
         key: str = self._cache_key(text)
 
         # L1: Check in-memory LRU cache
-        cached: list[float] | None = self._cache_get(key)
+        cached: np.ndarray | None = self._cache_get(key)
         if cached is not None:
             logger.info(f"embedding_generated: text_length={len(text)}, source=l1_lru")
             return cached
 
+        # Coalesce with an identical lookup that is already in flight
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"embedding_generated: text_length={len(text)}, source=coalesced")
+        else:
+            inflight = asyncio.ensure_future(self._embed_uncached(text, key))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda done: self._finish_inflight(key, done))
+
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(inflight)
+
+    def _finish_inflight(self, key: str, done: asyncio.Future[np.ndarray]) -> None:
+        """Forget a completed in-flight lookup.
+
+        Args:
+            key: Cache key of the lookup.
+            done: The completed lookup future.
+        """
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not done.cancelled():
+            done.exception()
+
+    async def _embed_uncached(self, text: str, key: str) -> np.ndarray:
+        """Embed a text that missed L1, via L2 Redis then L3 API.
+
+        Args:
+            text: The text to embed.
+            key: Precomputed cache key for ``text``.
+
+        Returns:
+            Embedding vector as a float32 array.
+
+        Raises:
+            RuntimeError: If the API call fails after retries.
+        """
         # L2: Check Redis cache
         if self._redis_cache is not None:
-            redis_cached: list[float] | None = await self._redis_cache.get_embedding(text)
+            redis_cached: np.ndarray | None = await self._redis_cache.get_embedding(text)
             if redis_cached is not None:
                 # Promote to L1
                 self._cache_put(key, redis_cached)
                 logger.info(f"embedding_generated: text_length={len(text)}, source=l2_redis")
                 return redis_cached
 
-        # L3: Call API
-        embeddings: list[list[float]] = await self._call_api(text)
-        embedding: list[float] = embeddings[0]
+        # L3: Call API (micro-batched with concurrent callers when enabled)
+        embedding: np.ndarray = await self._request_embedding(text)
 
         # Store in L1 + L2
         self._cache_put(key, embedding)
@@ -229,11 +322,77 @@ class EmbeddingService:
 
         return embedding
 
+    async def _request_embedding(self, text: str) -> np.ndarray:
+        """Fetch one embedding from the API, joining a micro-batch if enabled.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            Embedding vector as a float32 array.
+
+        Raises:
+            RuntimeError: If the (batched) API call fails after retries.
+        """
+        if self._batch_window <= 0:
+            embeddings: np.ndarray = await self._call_api(text)
+            embedding: np.ndarray = embeddings[0]
+            return embedding
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        self._pending_batch.append((text, future))
+        if len(self._pending_batch) >= self._max_batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self._batch_window, self._flush_batch)
+        return await future
+
+    def _flush_batch(self) -> None:
+        """Send all pending micro-batch texts as one background API call."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._pending_batch = self._pending_batch, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: list[tuple[str, asyncio.Future[np.ndarray]]]) -> None:
+        """Embed a micro-batch and resolve each caller's future.
+
+        Args:
+            batch: Pending (text, future) pairs, in arrival order.
+        """
+        try:
+            embeddings: np.ndarray = await self._call_api([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(embeddings) != len(batch):
+            error = RuntimeError(
+                f"Embedding API returned {len(embeddings)} vectors for {len(batch)} inputs"
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+        logger.info(f"embedding_micro_batch: batch_size={len(batch)}")
+
     async def embed_batch(
         self,
         texts: list[str],
         batch_size: int = 100,
-    ) -> list[list[float] | None]:
+    ) -> list[np.ndarray | None]:
         """Embed a list of texts in batches, using L1 → L2 → L3 cache tiers.
 
         Splits the input into batches of ``batch_size``. Each batch is
@@ -259,22 +418,24 @@ class EmbeddingService:
             return []
 
         # L1: Build results array; fill from LRU cache where possible
-        results: list[list[float] | None] = [None] * len(texts)
+        results: list[np.ndarray | None] = [None] * len(texts)
         uncached_indices: list[int] = []
 
         for i, text in enumerate(texts):
             key: str = self._cache_key(text)
-            cached: list[float] | None = self._cache_get(key)
+            cached: np.ndarray | None = self._cache_get(key)
             if cached is not None:
                 results[i] = cached
             else:
                 uncached_indices.append(i)
 
-        # L2: Check Redis for remaining uncached texts
+        # L2: Check Redis for remaining uncached texts (one MGET)
         still_uncached_indices: list[int] = []
-        if self._redis_cache is not None:
-            for i in uncached_indices:
-                redis_cached: list[float] | None = await self._redis_cache.get_embedding(texts[i])
+        if self._redis_cache is not None and uncached_indices:
+            redis_results: list[np.ndarray | None] = await self._redis_cache.get_embeddings(
+                [texts[i] for i in uncached_indices]
+            )
+            for i, redis_cached in zip(uncached_indices, redis_results):
                 if redis_cached is not None:
                     results[i] = redis_cached
                     # Promote to L1
@@ -293,16 +454,19 @@ class EmbeddingService:
             ]
             batch_texts: list[str] = [texts[i] for i in batch_indices]
 
-            embeddings: list[list[float]] = await self._call_api(batch_texts)
+            embeddings: np.ndarray = await self._call_api(batch_texts)
             batch_count += 1
 
             for idx, embedding in zip(batch_indices, embeddings):
                 results[idx] = embedding
                 cache_key = self._cache_key(texts[idx])
                 self._cache_put(cache_key, embedding)
-                # Store in L2 Redis
-                if self._redis_cache is not None:
-                    await self._redis_cache.store_embedding(texts[idx], embedding)
+
+            # Store the whole batch in L2 Redis (one pipelined round trip)
+            if self._redis_cache is not None:
+                await self._redis_cache.store_embeddings(
+                    [(texts[idx], embedding) for idx, embedding in zip(batch_indices, embeddings)]
+                )
 
         logger.info(f"embedding_batch: batch_count={batch_count}, total_texts={len(texts)}")
 
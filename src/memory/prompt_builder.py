@@ -1,15 +1,54 @@
 """Seven-layer memory-aware prompt builder."""
 
 import logging
-import math
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Optional
+from uuid import UUID
 
-from src.memory.types import Contradiction, RetrievalResult, ScoredMemory
+from src.memory.tokenizer import TokenCounter, get_token_counter
+from src.memory.types import Contradiction, PromptParts, RetrievalResult, ScoredMemory
 from src.models.agent_models import AgentDNA, VoiceExample
 from src.models.memory_models import MemoryType
 from src.prompts import PERSONALITY_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# Agents whose identity layer (L1) is memoized per process
+_STATIC_LAYER_CACHE_SIZE: int = 256
+
+# Process-wide L1 memo shared by every builder, keyed by
+# (agent id, DNA version, token encoding) -> (layer text, token count).
+# Builders are created per request, so an instance-level memo would never
+# survive from one turn to the next.
+_static_layer_cache: OrderedDict[tuple[UUID, datetime, str], tuple[str, int]] = OrderedDict()
+
+# Layers that only change when the agent or its skills change. They are
+# emitted first so the prompt prefix is byte-stable across turns.
+_STABLE_LAYERS: frozenset[str] = frozenset({"L1_identity", "L3_skill_metadata"})
+
+# Receives the stable prefix and returns it with a provider-specific cache
+# breakpoint applied. Must be deterministic to keep the prefix cacheable.
+CacheBreakpointHook = Callable[[str], str]
+
+
+def invalidate_static_layers(agent_id: UUID) -> int:
+    """Drop memoized identity layers for an agent (e.g. after it is edited).
+
+    Stale entries would never be hit again since ``updated_at`` changes on
+    edit; this frees them immediately.
+
+    Args:
+        agent_id: Agent whose cached layers should be rebuilt.
+
+    Returns:
+        Number of cached layers removed.
+    """
+    stale = [key for key in _static_layer_cache if key[0] == agent_id]
+    for key in stale:
+        del _static_layer_cache[key]
+    return len(stale)
+
 
 class MemoryPromptBuilder:
     """Builds a 7-layer system prompt respecting a token budget.
@@ -27,25 +66,44 @@ class MemoryPromptBuilder:
         L6 - Team/Shared Knowledge (trim before L5)
         L7 - Conversation Summary (trimmed FIRST)
 
+    Layers are emitted as a stable prefix (L1 identity and rules, L3 skills)
+    followed by the volatile memory context (L2, L4-L7), so providers that
+    cache prompt prefixes can reuse everything up to the first memory.
+
+    Layer sizes are summed from per-memory token counts (cached by memory
+    id/version) rather than re-tokenizing each assembled layer. The identity
+    layer and its token count are memoized process-wide per agent id + DNA
+    version (``updated_at``), so only the memory and conversation layers
+    are rebuilt on each turn, even though builders are created per request.
+
     Args:
         token_budget: Maximum tokens for the assembled prompt.
+        token_counter: Token counter to use. Defaults to the shared
+            process-wide counter (BPE tokenizer, heuristic fallback).
+        cache_breakpoint: Optional hook that marks the end of the stable
+            prefix for providers supporting explicit cache breakpoints.
     """
 
-    def __init__(self, token_budget: int = 4000) -> None:
+    def __init__(
+        self,
+        token_budget: int = 4000,
+        token_counter: Optional[TokenCounter] = None,
+        cache_breakpoint: Optional[CacheBreakpointHook] = None,
+    ) -> None:
         self._token_budget = token_budget
+        self._token_counter: TokenCounter = token_counter or get_token_counter()
+        self._cache_breakpoint: Optional[CacheBreakpointHook] = cache_breakpoint
 
     def estimate_tokens(self, text: str) -> int:
-        """Estimate token count using len/3.5 heuristic.
+        """Count tokens in a text string (memoized by content).
 
         Args:
-            text: The text to estimate tokens for.
+            text: The text to count tokens for.
 
         Returns:
-            Estimated token count (>= 1 for non-empty text, 0 for empty).
+            Token count (>= 1 for non-empty text, 0 for empty).
         """
-        if not text:
-            return 0
-        return math.ceil(len(text) / 3.5)
+        return self._token_counter.count(text)
 
     def build(
         self,
@@ -69,6 +127,32 @@ class MemoryPromptBuilder:
         Returns:
             Assembled prompt string trimmed to fit the token budget.
         """
+        return self.build_parts(
+            agent_dna, skill_metadata, retrieval_result, conversation_summary
+        ).render()
+
+    def build_parts(
+        self,
+        agent_dna: AgentDNA,
+        skill_metadata: str,
+        retrieval_result: RetrievalResult,
+        conversation_summary: str = "",
+    ) -> PromptParts:
+        """Construct the 7-layer prompt as a stable prefix and volatile context.
+
+        Same layers and trimming as ``build``, but returned separately so the
+        caller can send the prefix as its own system prompt block.
+
+        Args:
+            agent_dna: Agent identity and personality configuration.
+            skill_metadata: Level-1 skill metadata string.
+            retrieval_result: Retrieved memories with scores and contradictions.
+            conversation_summary: Optional conversation summary text.
+
+        Returns:
+            PromptParts with the stable prefix (cache breakpoint applied)
+            and the trimmed volatile context.
+        """
         # Partition memories by type
         identity_memories: list[ScoredMemory] = []
         user_profile_memories: list[ScoredMemory] = []
@@ -88,8 +172,8 @@ class MemoryPromptBuilder:
         # Build contradiction markers
         contradiction_text = self._format_contradictions(retrieval_result.contradictions)
 
-        # L1 - Identity + Personality (PROTECTED)
-        layer1 = self._build_identity_layer(agent_dna)
+        # L1 - Identity + Personality (PROTECTED, memoized per DNA version)
+        layer1, layer1_tokens = self._static_identity_layer(agent_dna)
 
         # L2 - Identity Memories (PROTECTED)
         layer2 = self._format_memories_section(identity_memories, "Identity Memories")
@@ -101,7 +185,7 @@ class MemoryPromptBuilder:
         layer4 = self._format_memories_section(user_profile_memories, "About This User")
 
         # L5 - Retrieved Memories by type (trimmed by score)
-        layer5 = self._build_retrieved_layer(other_memories, contradiction_text)
+        layer5, layer5_tokens = self._build_retrieved_layer(other_memories, contradiction_text)
 
         # L6 - Team/Shared Knowledge (trim before L5)
         layer6 = self._format_memories_section(shared_memories, "Team Knowledge")
@@ -109,28 +193,110 @@ class MemoryPromptBuilder:
         # L7 - Conversation Summary (trimmed FIRST)
         layer7 = conversation_summary
 
-        # Assemble with trimming
-        layers: list[tuple[str, str, bool]] = [
-            ("L1_identity", layer1, True),
-            ("L2_identity_memories", layer2, True),
-            ("L3_skill_metadata", layer3, True),
-            ("L4_user_profile", layer4, False),
-            ("L5_retrieved", layer5, False),
-            ("L6_team_knowledge", layer6, False),
-            ("L7_conversation", layer7, False),
+        # Assemble with trimming, stable layers first (emission order)
+        layers: list[tuple[str, str, bool, int]] = [
+            ("L1_identity", layer1, True, layer1_tokens),
+            ("L3_skill_metadata", layer3, True, self.estimate_tokens(layer3)),
+            (
+                "L2_identity_memories",
+                layer2,
+                True,
+                self._section_tokens(identity_memories, "Identity Memories"),
+            ),
+            (
+                "L4_user_profile",
+                layer4,
+                False,
+                self._section_tokens(user_profile_memories, "About This User"),
+            ),
+            ("L5_retrieved", layer5, False, layer5_tokens),
+            (
+                "L6_team_knowledge",
+                layer6,
+                False,
+                self._section_tokens(shared_memories, "Team Knowledge"),
+            ),
+            ("L7_conversation", layer7, False, self.estimate_tokens(layer7)),
         ]
+        layer_tokens = {name: tokens for name, _, _, tokens in layers}
 
-        trimmed_prompt = self._trim_to_budget(layers, self._token_budget)
+        kept_layers, result_tokens = self._trim_to_budget(layers, self._token_budget)
+
+        volatile = [content for name, content in kept_layers if name not in _STABLE_LAYERS]
+        stable_tokens = sum(layer_tokens[name] for name in _STABLE_LAYERS)
 
         logger.info(
-            "build: layers=7 budget=%d result_tokens=%d memories=%d contradictions=%d",
+            "build: layers=7 budget=%d result_tokens=%d stable_tokens=%d "
+            "memories=%d contradictions=%d",
             self._token_budget,
-            self.estimate_tokens(trimmed_prompt),
+            result_tokens,
+            stable_tokens,
             len(retrieval_result.memories),
             len(retrieval_result.contradictions),
         )
 
-        return trimmed_prompt
+        return PromptParts(
+            stable_prefix=self._join_stable_prefix(layer1, layer3),
+            volatile_context="\n\n".join(volatile),
+            stable_tokens=stable_tokens,
+            volatile_tokens=result_tokens - stable_tokens,
+        )
+
+    def build_stable_prefix(self, agent_dna: AgentDNA, skill_metadata: str) -> str:
+        """Return only the stable prefix (identity, rules, skills).
+
+        Identical across turns for the same DNA version and skill metadata,
+        and identical to ``build_parts(...).stable_prefix``.
+
+        Args:
+            agent_dna: Agent identity and personality configuration.
+            skill_metadata: Level-1 skill metadata string.
+
+        Returns:
+            Stable prefix with the cache breakpoint hook applied.
+        """
+        layer1, _ = self._static_identity_layer(agent_dna)
+        return self._join_stable_prefix(layer1, skill_metadata)
+
+    def _join_stable_prefix(self, identity_layer: str, skill_metadata: str) -> str:
+        """Join L1 and L3 and apply the cache breakpoint hook.
+
+        Args:
+            identity_layer: L1 identity layer text.
+            skill_metadata: L3 skill metadata text.
+
+        Returns:
+            Stable prefix string.
+        """
+        prefix = "\n\n".join(part for part in (identity_layer, skill_metadata) if part)
+        if self._cache_breakpoint is not None and prefix:
+            prefix = self._cache_breakpoint(prefix)
+        return prefix
+
+    def _static_identity_layer(self, agent_dna: AgentDNA) -> tuple[str, int]:
+        """Return the L1 identity layer and its token count, memoized.
+
+        Args:
+            agent_dna: Agent identity and personality configuration.
+
+        Returns:
+            Tuple of (identity layer text, token count).
+        """
+        key = (agent_dna.id, agent_dna.updated_at, self._token_counter.encoding)
+        cached = _static_layer_cache.get(key)
+        if cached is not None:
+            _static_layer_cache.move_to_end(key)
+            return cached
+
+        # A new DNA version replaces any older entry for the same agent
+        for stale in [k for k in _static_layer_cache if k[0] == key[0] and k[1] != key[1]]:
+            del _static_layer_cache[stale]
+        layer = self._build_identity_layer(agent_dna)
+        entry = (layer, self.estimate_tokens(layer))
+        _static_layer_cache[key] = entry
+        if len(_static_layer_cache) > _STATIC_LAYER_CACHE_SIZE:
+            _static_layer_cache.popitem(last=False)
+        return entry
 
     def _build_identity_layer(self, agent_dna: AgentDNA) -> str:
         """Build L1 identity layer from AgentDNA personality.
@@ -167,7 +333,7 @@ class MemoryPromptBuilder:
         self,
         memories: list[ScoredMemory],
         contradiction_text: str,
-    ) -> str:
+    ) -> tuple[str, int]:
         """Build L5 retrieved memories layer grouped by type.
 
         Groups non-identity, non-profile, non-shared memories by their
@@ -178,10 +344,10 @@ class MemoryPromptBuilder:
             contradiction_text: Pre-formatted contradiction markers.
 
         Returns:
-            Formatted retrieved memories section.
+            Tuple of (formatted retrieved memories section, token count).
         """
         if not memories and not contradiction_text:
-            return ""
+            return "", 0
 
         # Group by memory type
         grouped: dict[MemoryType, list[ScoredMemory]] = {}
@@ -189,6 +355,7 @@ class MemoryPromptBuilder:
             grouped.setdefault(sm.memory.memory_type, []).append(sm)
 
         sections: list[str] = []
+        tokens = 0
 
         # Sort groups by type name for deterministic output
         for mem_type in sorted(grouped.keys(), key=lambda t: t.value):
@@ -199,11 +366,13 @@ class MemoryPromptBuilder:
             section = self._format_memories_section(type_memories, header)
             if section:
                 sections.append(section)
+                tokens += self._section_tokens(type_memories, header)
 
         if contradiction_text:
             sections.append(contradiction_text)
+            tokens += self.estimate_tokens(contradiction_text)
 
-        return "\n\n".join(sections)
+        return "\n\n".join(sections), tokens
 
     def _format_memories_section(self, memories: list[ScoredMemory], header: str) -> str:
         """Format a list of scored memories as a markdown section.
@@ -222,6 +391,25 @@ class MemoryPromptBuilder:
             lines.append(f"- {sm.memory.content}")
         return "\n".join(lines)
 
+    def _section_tokens(self, memories: list[ScoredMemory], header: str) -> int:
+        """Token count of a ``_format_memories_section`` section.
+
+        Sums the header and each memory's cached content count plus one
+        token for its ``- `` bullet, instead of tokenizing the joined text.
+
+        Args:
+            memories: Scored memories in the section.
+            header: Section header text.
+
+        Returns:
+            Token count, or 0 if there are no memories.
+        """
+        if not memories:
+            return 0
+        return self.estimate_tokens(f"### {header}") + sum(
+            self._token_counter.count_memory(sm.memory) + 1 for sm in memories
+        )
+
     def _format_contradictions(self, contradictions: list[Contradiction]) -> str:
         """Format contradiction markers for prompt injection.
 
@@ -238,30 +426,33 @@ class MemoryPromptBuilder:
             lines.append(f"[FACT DISPUTED]: {c.reason}")
         return "\n".join(lines)
 
-    def _trim_to_budget(self, layers: list[tuple[str, str, bool]], budget: int) -> str:
+    def _trim_to_budget(
+        self, layers: list[tuple[str, str, bool, int]], budget: int
+    ) -> tuple[list[tuple[str, str]], int]:
         """Trim layers to fit within token budget.
 
         Protected layers (L1, L2, L3) are never trimmed.
         Trim order: L7 first, then L6, then L5, then L4.
 
         Args:
-            layers: List of (name, content, is_protected) tuples.
+            layers: List of (name, content, is_protected, token_count) tuples.
             budget: Token budget.
 
         Returns:
-            Combined prompt string trimmed to fit the budget.
+            Tuple of (non-empty surviving (name, content) layers in order,
+            their token count).
         """
         # Separate protected and trimmable layers
-        protected_parts: list[tuple[str, str]] = []
-        trimmable_parts: list[tuple[str, str]] = []
+        protected_parts: list[tuple[str, str, int]] = []
+        trimmable_parts: list[tuple[str, str, int]] = []
 
-        for name, content, is_protected in layers:
+        for name, content, is_protected, layer_tokens in layers:
             if is_protected:
-                protected_parts.append((name, content))
+                protected_parts.append((name, content, layer_tokens))
             else:
-                trimmable_parts.append((name, content))
+                trimmable_parts.append((name, content, layer_tokens))
 
-        protected_tokens = sum(self.estimate_tokens(content) for _, content in protected_parts)
+        protected_tokens = sum(layer_tokens for _, _, layer_tokens in protected_parts)
 
         if protected_tokens > budget:
             logger.warning(
@@ -282,10 +473,9 @@ class MemoryPromptBuilder:
         tokens_used = 0
 
         for idx in range(len(trimmable_parts)):
-            _name, content = trimmable_parts[idx]
+            _name, content, layer_tokens = trimmable_parts[idx]
             if not content:
                 continue
-            layer_tokens = self.estimate_tokens(content)
             included_trimmable[idx] = content
             tokens_used += layer_tokens
 
@@ -294,8 +484,8 @@ class MemoryPromptBuilder:
             if tokens_used <= remaining_budget:
                 break
             if trim_idx in included_trimmable:
-                removed_content = included_trimmable.pop(trim_idx)
-                removed_tokens = self.estimate_tokens(removed_content)
+                included_trimmable.pop(trim_idx)
+                removed_tokens = trimmable_parts[trim_idx][2]
                 tokens_used -= removed_tokens
                 layer_name = trimmable_parts[trim_idx][0]
                 logger.info(
@@ -304,22 +494,16 @@ class MemoryPromptBuilder:
                     removed_tokens,
                 )
 
-        # Assemble final prompt: protected layers + surviving trimmable layers
-        parts: list[str] = []
-
-        for _, content in protected_parts:
-            if content:
-                parts.append(content)
+        # Keep protected layers + surviving trimmable layers, in order
+        kept: list[tuple[str, str]] = [
+            (name, content) for name, content, _ in protected_parts if content
+        ]
 
         # Add trimmable layers in original order (L4, L5, L6, L7)
         for idx in sorted(included_trimmable.keys()):
-            content = included_trimmable[idx]
-            if content:
-                parts.append(content)
-
-        result = "\n\n".join(parts)
+            kept.append((trimmable_parts[idx][0], included_trimmable[idx]))
 
-        total_tokens = self.estimate_tokens(result)
+        total_tokens = protected_tokens + tokens_used
         logger.info(
             "trim_to_budget: final_tokens=%d budget=%d protected=%d",
             total_tokens,
@@ -327,7 +511,7 @@ class MemoryPromptBuilder:
             protected_tokens,
         )
 
-        return result
+        return kept, total_tokens
 
 
 def _format_voice_examples(examples: list[VoiceExample]) -> str:
@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import math
 import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.db.models.memory import MemoryORM, MemoryStatusEnum
-from src.db.repositories.memory_repo import MemoryRepository
+from src.db.repositories.memory_repo import (
+    AnnSearchParams,
+    MemoryRepository,
+    MemoryRow,
+    TeamVectorIndexRegistry,
+)
+from src.memory.access_tracker import AccessTracker, get_access_tracker
 from src.memory.embedding import EmbeddingService
+from src.memory.retrieval_cache import RetrievalCache, get_retrieval_cache
+from src.memory.semantic_cache import SemanticQueryCache, get_semantic_cache
 from src.memory.token_budget import TokenBudgetManager
 from src.memory.types import (
     Contradiction,
@@ -31,41 +39,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Hot cache TTL in seconds
-_CACHE_TTL: float = 60.0
-
-# Maximum L0 cache entries to prevent unbounded memory growth
-_CACHE_MAX_SIZE: int = 500
-
-
-class _CacheEntry:
-    """In-memory cache entry with TTL tracking.
-
-    Attributes:
-        result: The cached RetrievalResult.
-        created_at: Monotonic timestamp when the entry was created.
-    """
-
-    __slots__ = ("result", "created_at")
-
-    def __init__(self, result: RetrievalResult) -> None:
-        self.result: RetrievalResult = result
-        self.created_at: float = time.monotonic()
-
-    def is_expired(self) -> bool:
-        """Check whether this cache entry has exceeded its TTL.
+# Default cap on concurrent retrieval queries when a session factory is used
+_DEFAULT_MAX_CONCURRENT_QUERIES: int = 3
 
-        Returns:
-            True if the entry is older than _CACHE_TTL seconds.
-        """
-        return (time.monotonic() - self.created_at) > _CACHE_TTL
+# A deferred repository query, bound to a session only when executed
+_RepoQuery = Callable[[MemoryRepository], Awaitable[Any]]
 
 
-def _orm_to_record(orm: MemoryORM) -> MemoryRecord:
-    """Convert a MemoryORM instance to a MemoryRecord Pydantic model.
+def orm_to_record(orm: MemoryORM | MemoryRow) -> MemoryRecord:
+    """Convert a MemoryORM instance or projected MemoryRow to a MemoryRecord.
 
     Args:
-        orm: The SQLAlchemy ORM memory object.
+        orm: The SQLAlchemy ORM memory object or projected memory row.
 
     Returns:
         A MemoryRecord with all fields mapped from the ORM row.
@@ -78,6 +63,8 @@ def _orm_to_record(orm: MemoryORM) -> MemoryRecord:
         memory_type=orm.memory_type,
         content=orm.content,
         subject=orm.subject,
+        token_count=orm.token_count,
+        token_encoding=orm.token_encoding,
         importance=orm.importance,
         confidence=orm.confidence,
         access_count=orm.access_count,
@@ -100,19 +87,6 @@ def _orm_to_record(orm: MemoryORM) -> MemoryRecord:
     )
 
 
-def _cache_key(query: str) -> str:
-    """Compute a cache key from a query string via SHA-256.
-
-    Args:
-        query: The raw query text.
-
-    Returns:
-        SHA-256 hex digest of the lowercased, stripped query.
-    """
-    normalized: str = query.lower().strip()
-    return hashlib.sha256(normalized.encode()).hexdigest()
-
-
 def _compute_semantic_score(similarity: float) -> float:
     """Return the semantic signal score from cosine similarity.
 
@@ -286,8 +260,9 @@ class MemoryRetriever:
     """Five-signal memory retrieval pipeline with caching and budget management.
 
     Implements a 7-step retrieval process:
-    1. Generate query embedding
-    2. Check L0 in-memory cache, then L1 Redis hot cache
+    1. Check L0 in-memory cache, then L1 Redis hot cache
+    2. Generate query embedding (cache misses only), then check the
+       semantic cache for a near-duplicate query
     3. Run 5-signal parallel search (semantic, recency, importance,
        continuity, relationship)
     4. Merge, deduplicate, and score results
@@ -301,6 +276,25 @@ class MemoryRetriever:
         retrieval_weights: Per-signal weights for composite scoring.
         token_budget_manager: Manager for token budget allocation.
         hot_cache: Optional L1 Redis cache for frequently-accessed memories.
+        access_tracker: Optional write-behind buffer. When provided, access
+            metadata updates are deferred to it instead of hitting the DB
+            on the retrieval path. Defaults to the process-wide one (None
+            unless write-behind is enabled).
+        session_factory: Optional factory for independent sessions. When
+            provided, the semantic and recency queries run concurrently on
+            separate pooled connections instead of serially on ``session``.
+        max_concurrent_queries: Cap on simultaneously running queries when
+            a session factory is used.
+        in_database_scoring: When True, candidates are gathered and scored
+            by a single CTE query in Postgres that returns only the top rows,
+            instead of hydrating every candidate and scoring in Python.
+        ann_params: Optional HNSW/IVFFlat recall tuning for vector searches.
+        team_indexes: Optional registry routing large teams to their partial
+            vector index.
+        result_cache: L0 cache of retrieval results. Defaults to the shared
+            process-wide cache, which memory write endpoints invalidate.
+        semantic_cache: Optional cache reusing results for paraphrased
+            queries. Defaults to the process-wide one (None unless enabled).
     """
 
     def __init__(
@@ -310,34 +304,35 @@ class MemoryRetriever:
         retrieval_weights: RetrievalWeights,
         token_budget_manager: TokenBudgetManager,
         hot_cache: Optional[HotMemoryCache] = None,
+        access_tracker: Optional[AccessTracker] = None,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        max_concurrent_queries: int = _DEFAULT_MAX_CONCURRENT_QUERIES,
+        in_database_scoring: bool = False,
+        ann_params: Optional[AnnSearchParams] = None,
+        team_indexes: Optional[TeamVectorIndexRegistry] = None,
+        result_cache: Optional[RetrievalCache] = None,
+        semantic_cache: Optional[SemanticQueryCache] = None,
     ) -> None:
         self._session: AsyncSession = session
         self._embedding_service: EmbeddingService = embedding_service
         self._weights: RetrievalWeights = retrieval_weights
         self._budget_manager: TokenBudgetManager = token_budget_manager
-        self._repo: MemoryRepository = MemoryRepository(session)
-        self._cache: dict[str, _CacheEntry] = {}
+        self._ann_params: Optional[AnnSearchParams] = ann_params
+        self._team_indexes: Optional[TeamVectorIndexRegistry] = team_indexes
+        self._repo: MemoryRepository = self._make_repo(session)
+        self._cache: RetrievalCache = (
+            result_cache if result_cache is not None else get_retrieval_cache()
+        )
+        self._semantic_cache: Optional[SemanticQueryCache] = (
+            semantic_cache if semantic_cache is not None else get_semantic_cache()
+        )
         self._hot_cache: Optional[HotMemoryCache] = hot_cache
-
-    def _evict_cache(self) -> None:
-        """Evict expired and oldest entries when cache exceeds max size.
-
-        First removes all expired entries. If still over _CACHE_MAX_SIZE,
-        removes oldest entries (by creation time) until at max size.
-        """
-        # Phase 1: Remove expired entries
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
-
-        # Phase 2: If still over limit, evict oldest entries
-        if len(self._cache) >= _CACHE_MAX_SIZE:
-            sorted_keys = sorted(
-                self._cache.keys(), key=lambda k: self._cache[k].created_at
-            )
-            evict_count = len(self._cache) - _CACHE_MAX_SIZE + 1
-            for key in sorted_keys[:evict_count]:
-                del self._cache[key]
+        self._access_tracker: Optional[AccessTracker] = (
+            access_tracker if access_tracker is not None else get_access_tracker()
+        )
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = session_factory
+        self._query_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_queries)
+        self._in_database_scoring: bool = in_database_scoring
 
     async def retrieve(
         self,
@@ -363,13 +358,12 @@ class MemoryRetriever:
         """
         start_time: float = time.monotonic()
 
-        # Step 1: Generate query embedding
-        query_embedding: list[float] = await self._embedding_service.embed_text(query)
-
-        # Step 2: Check L1 hot cache
-        cache_key: str = _cache_key(query)
-        cached_entry: _CacheEntry | None = self._cache.get(cache_key)
-        if cached_entry is not None and not cached_entry.is_expired():
+        # Step 1: Check L0 in-process cache (scoped by team/agent/conversation)
+        cache_key = RetrievalCache.make_key(query, team_id, agent_id, conversation_id, budget)
+        # Results computed after an invalidation of this team are not cached
+        generation = self._cache.scope_generation(team_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             elapsed_ms: float = (time.monotonic() - start_time) * 1000.0
             logger.info(
                 "retrieve: cache_hit=True query_length=%d elapsed_ms=%.1f",
@@ -377,15 +371,11 @@ class MemoryRetriever:
                 elapsed_ms,
             )
             # Update stats to reflect cache hit timing
-            cached_result = cached_entry.result.model_copy(deep=True)
+            cached_result = cached.model_copy(deep=True)
             cached_result.stats.cache_hit = True
             cached_result.stats.total_ms = elapsed_ms
             return cached_result
 
-        # Evict expired entry if present
-        if cached_entry is not None:
-            del self._cache[cache_key]
-
         # Step 2b: Check L1 Redis hot cache
         if self._hot_cache is not None and agent_id is not None:
             user_id_for_cache = team_id  # Use team_id as user scope
@@ -426,24 +416,45 @@ class MemoryRetriever:
                         stats=stats,
                         contradictions=contradictions,
                     )
-                    # Also populate L0 (with eviction)
-                    self._evict_cache()
-                    self._cache[cache_key] = _CacheEntry(result)
+                    # Also populate L0
+                    self._cache.put(cache_key, result, generation)
                     return result
 
-        # Step 3: 5-signal parallel search
-        # Run semantic search and team-wide recency fetch concurrently
-        semantic_task = self._search_semantic(query_embedding, team_id, agent_id)
-        recency_task = self._fetch_for_recency(team_id, agent_id)
-
-        semantic_results, recency_results = await asyncio.gather(semantic_task, recency_task)
+        # Step 2c: Generate query embedding (only needed on a cache miss)
+        query_embedding: np.ndarray = await self._embedding_service.embed_text(query)
 
-        # Step 4: Merge, deduplicate, and score
-        scored_memories: list[ScoredMemory] = self._merge_and_score(
-            semantic_results=semantic_results,
-            recency_results=recency_results,
-            conversation_id=conversation_id,
-        )
+        # Step 2d: Reuse the result of a semantically equivalent recent query
+        if self._semantic_cache is not None:
+            similar = await self._semantic_cache.lookup(cache_key, query_embedding)
+            if similar is not None:
+                elapsed_ms = (time.monotonic() - start_time) * 1000.0
+                logger.info(
+                    "retrieve: semantic_cache_hit=True query_length=%d elapsed_ms=%.1f",
+                    len(query),
+                    elapsed_ms,
+                )
+                self._cache.put(cache_key, similar, generation)
+                similar_result = similar.model_copy(deep=True)
+                similar_result.stats.cache_hit = True
+                similar_result.stats.total_ms = elapsed_ms
+                return similar_result
+
+        # Steps 3-4: 5-signal search, merge, deduplicate, and score
+        scored_memories: list[ScoredMemory]
+        if self._in_database_scoring:
+            scored_memories = await self._score_in_database(
+                query_embedding, team_id, agent_id, conversation_id
+            )
+        else:
+            # Semantic searches and team-wide recency fetch (concurrent with a session factory)
+            semantic_results, recency_results = await self._fetch_candidates(
+                query_embedding, team_id, agent_id
+            )
+            scored_memories = self._merge_and_score(
+                semantic_results=semantic_results,
+                recency_results=recency_results,
+                conversation_id=conversation_id,
+            )
 
         # Apply relationship bonus after initial scoring
         scored_memories = self._apply_relationship_bonus(scored_memories)
@@ -481,20 +492,28 @@ class MemoryRetriever:
             contradictions=contradictions,
         )
 
-        # Cache the result (with eviction)
-        self._evict_cache()
-        self._cache[cache_key] = _CacheEntry(result)
+        # Cache the result (LRU eviction handled by the cache)
+        self._cache.put(cache_key, result, generation)
+        if self._semantic_cache is not None:
+            self._semantic_cache.store(cache_key, query_embedding, result, generation)
 
         # Step 7: Update access metadata (awaited to avoid shared session race)
         memory_ids: list[UUID] = [sm.memory.id for sm in included_memories]
         if memory_ids:
             await self._update_access_metadata(memory_ids)
 
-        # Warm L1 Redis hot cache (fire-and-forget is safe here -- no shared session)
-        if self._hot_cache is not None and agent_id is not None:
+        # Warm L1 Redis hot cache (fire-and-forget is safe here -- no shared session),
+        # unless a memory write invalidated the team while this result was computed
+        if (
+            self._hot_cache is not None
+            and agent_id is not None
+            and self._cache.scope_generation(team_id) == generation
+        ):
             user_id_for_cache = team_id
-            # Serialize ScoredMemory objects to dicts for Redis storage
-            memory_dicts = [sm.model_dump() for sm in included_memories]
+            # Slim JSON-safe dicts: fields at their defaults are restored on validate
+            memory_dicts = [
+                sm.model_dump(mode="json", exclude_defaults=True) for sm in included_memories
+            ]
             asyncio.create_task(
                 self._hot_cache.warm_cache(agent_id, user_id_for_cache, memory_dicts)
             )
@@ -509,16 +528,21 @@ class MemoryRetriever:
 
         return result
 
-    async def _search_semantic(
+    async def _fetch_candidates(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         team_id: UUID,
         agent_id: UUID | None,
-    ) -> list[tuple[MemoryORM, float]]:
-        """Run semantic vector search via the repository.
+    ) -> tuple[list[tuple[MemoryRow, float]], list[MemoryRow]]:
+        """Run the semantic and recency candidate queries.
 
-        When agent_id is provided, performs two searches: one for agent-specific
-        memories and one for team-wide (agent_id IS NULL) memories, then merges.
+        When agent_id is provided, performs two semantic searches: one for
+        agent-specific memories and one for team-wide (agent_id IS NULL)
+        memories, merged by memory ID keeping the highest similarity. The
+        recency fetch returns team-wide memories ordered by last_accessed_at
+        DESC. All queries are column projections without the embedding. With
+        a session factory configured all queries run concurrently on
+        independent pooled connections.
 
         Args:
             embedding: Query embedding vector.
@@ -526,74 +550,141 @@ class MemoryRetriever:
             agent_id: Optional agent scope.
 
         Returns:
-            List of (MemoryORM, similarity) tuples.
+            Tuple of (semantic (MemoryRow, similarity) tuples, recency MemoryRows).
         """
-        if agent_id is not None:
-            # Search agent-specific and team-wide in parallel
-            agent_task = self._repo.search_by_embedding(
+        queries: list[_RepoQuery] = [
+            lambda repo: repo.search_rows_by_embedding(
                 embedding=embedding,
                 team_id=team_id,
                 agent_id=agent_id,
                 limit=20,
+            ),
+        ]
+        if agent_id is not None:
+            queries.append(
+                lambda repo: repo.search_rows_by_embedding(
+                    embedding=embedding,
+                    team_id=team_id,
+                    agent_id=None,
+                    limit=20,
+                )
             )
-            team_task = self._repo.search_by_embedding(
-                embedding=embedding,
+        # get_rows_by_team doesn't filter by agent_id directly;
+        # we fetch broadly and let merge handle dedup
+        queries.append(
+            lambda repo: repo.get_rows_by_team(
                 team_id=team_id,
-                agent_id=None,
-                limit=20,
+                status=MemoryStatusEnum.ACTIVE,
+                limit=50,
             )
-            agent_results, team_results = await asyncio.gather(agent_task, team_task)
-            # Merge, dedup by memory ID keeping highest similarity
-            merged: dict[UUID, tuple[MemoryORM, float]] = {}
-            for orm, sim in agent_results + team_results:
+        )
+
+        results = await self._run_queries(queries)
+        recency_results: list[MemoryRow] = results[-1]
+        semantic_batches: list[list[tuple[MemoryRow, float]]] = results[:-1]
+
+        if len(semantic_batches) == 1:
+            return semantic_batches[0], recency_results
+
+        # Merge, dedup by memory ID keeping highest similarity
+        merged: dict[UUID, tuple[MemoryRow, float]] = {}
+        for batch in semantic_batches:
+            for orm, sim in batch:
                 if orm.id not in merged or sim > merged[orm.id][1]:
                     merged[orm.id] = (orm, sim)
-            return list(merged.values())
-        else:
-            return await self._repo.search_by_embedding(
-                embedding=embedding,
-                team_id=team_id,
-                limit=20,
-            )
+        return list(merged.values()), recency_results
 
-    async def _fetch_for_recency(
+    async def _score_in_database(
         self,
+        embedding: np.ndarray,
         team_id: UUID,
         agent_id: UUID | None,
-    ) -> list[MemoryORM]:
-        """Fetch recent memories for the recency signal.
+        conversation_id: UUID | None,
+    ) -> list[ScoredMemory]:
+        """Gather and score candidates with one in-database query.
 
-        Fetches team-wide memories ordered by last_accessed_at DESC.
-        When agent_id is provided, also fetches agent-specific memories.
+        Computes the same 4 of 5 signals as ``_merge_and_score`` in Postgres
+        and hydrates only the top-scoring rows. The relationship signal is
+        applied separately after this step.
 
         Args:
+            embedding: Query embedding vector.
             team_id: Team scope.
             agent_id: Optional agent scope.
+            conversation_id: Current conversation for continuity scoring.
 
         Returns:
-            List of MemoryORM objects ordered by recency.
+            List of ScoredMemory with 4-signal scores computed.
         """
-        if agent_id is not None:
-            agent_task = self._repo.get_by_team(
-                team_id=team_id,
-                status=MemoryStatusEnum.ACTIVE,
-                limit=50,
-            )
-            # get_by_team doesn't filter by agent_id directly;
-            # we fetch broadly and let merge handle dedup
-            results = await agent_task
-            return results
-        else:
-            return await self._repo.get_by_team(
-                team_id=team_id,
-                status=MemoryStatusEnum.ACTIVE,
-                limit=50,
+        results = await self._run_queries(
+            [
+                lambda repo: repo.search_scored(
+                    embedding=embedding,
+                    team_id=team_id,
+                    weights=self._weights,
+                    agent_id=agent_id,
+                    conversation_id=conversation_id,
+                )
+            ]
+        )
+        return [
+            ScoredMemory(
+                memory=orm_to_record(row),
+                final_score=_compute_weighted_score(signals, self._weights),
+                signal_scores=signals,
             )
+            for row, signals in results[0]
+        ]
+
+    async def _run_queries(self, queries: list[_RepoQuery]) -> list[Any]:
+        """Execute repository queries, concurrently when a factory is available.
+
+        A single AsyncSession cannot run statements concurrently, so without
+        a session factory the queries run one after another on the shared
+        session. With a factory each query gets its own session (and pooled
+        connection), bounded by the concurrency cap.
+
+        Args:
+            queries: Callables that take a MemoryRepository and return an awaitable.
+
+        Returns:
+            Query results in the same order as ``queries``.
+        """
+        if self._session_factory is None:
+            return [await query(self._repo) for query in queries]
+        return list(await asyncio.gather(*(self._run_isolated(query) for query in queries)))
+
+    async def _run_isolated(self, query: _RepoQuery) -> Any:
+        """Run one repository query on a dedicated session.
+
+        Args:
+            query: Callable that takes a MemoryRepository and returns an awaitable.
+
+        Returns:
+            The query result.
+        """
+        assert self._session_factory is not None
+        async with self._query_semaphore:
+            async with self._session_factory() as session:
+                return await query(self._make_repo(session))
+
+    def _make_repo(self, session: AsyncSession) -> MemoryRepository:
+        """Create a MemoryRepository carrying this retriever's vector search tuning.
+
+        Args:
+            session: Session the repository will use.
+
+        Returns:
+            Configured MemoryRepository.
+        """
+        return MemoryRepository(
+            session, ann_params=self._ann_params, team_indexes=self._team_indexes
+        )
 
     def _merge_and_score(
         self,
-        semantic_results: list[tuple[MemoryORM, float]],
-        recency_results: list[MemoryORM],
+        semantic_results: list[tuple[MemoryRow, float]],
+        recency_results: list[MemoryRow],
         conversation_id: UUID | None,
     ) -> list[ScoredMemory]:
         """Merge semantic and recency results, compute 4 of 5 signal scores.
@@ -601,8 +692,8 @@ class MemoryRetriever:
         Relationship signal is applied separately after this step.
 
         Args:
-            semantic_results: (MemoryORM, similarity) tuples from vector search.
-            recency_results: MemoryORM objects from recency fetch.
+            semantic_results: (MemoryRow, similarity) tuples from vector search.
+            recency_results: MemoryRow objects from recency fetch.
             conversation_id: Current conversation for continuity scoring.
 
         Returns:
@@ -612,7 +703,7 @@ class MemoryRetriever:
         memory_data: dict[UUID, tuple[MemoryRecord, float]] = {}
 
         for orm, similarity in semantic_results:
-            record = _orm_to_record(orm)
+            record = orm_to_record(orm)
             if record.id not in memory_data:
                 memory_data[record.id] = (record, similarity)
             else:
@@ -622,7 +713,7 @@ class MemoryRetriever:
                     memory_data[record.id] = (record, similarity)
 
         for orm in recency_results:
-            record = _orm_to_record(orm)
+            record = orm_to_record(orm)
             if record.id not in memory_data:
                 # No semantic similarity for recency-only memories
                 memory_data[record.id] = (record, 0.0)
@@ -712,23 +803,22 @@ class MemoryRetriever:
     async def _update_access_metadata(self, memory_ids: list[UUID]) -> None:
         """Increment access_count and update last_accessed_at for memories.
 
-        Runs as a fire-and-forget task. Errors are logged but do not
+        Uses a single bulk UPDATE, or buffers the touches in the access
+        tracker when one is configured. Errors are logged but do not
         propagate to the caller.
 
         Args:
             memory_ids: UUIDs of memories that were retrieved and included.
         """
+        if self._access_tracker is not None:
+            self._access_tracker.record(memory_ids)
+            return
+
         try:
-            now = datetime.now(timezone.utc)
-            for memory_id in memory_ids:
-                orm: Optional[MemoryORM] = await self._repo.get(memory_id)
-                if orm is not None:
-                    orm.access_count += 1
-                    orm.last_accessed_at = now
-            await self._session.flush()
+            updated: int = await self._repo.touch_many(memory_ids)
             logger.info(
                 "update_access_metadata: updated=%d memory_ids",
-                len(memory_ids),
+                updated,
             )
         except Exception as e:
             logger.error(
@@ -0,0 +1,202 @@
+"""Process-wide L0 cache of retrieval results with scoped invalidation."""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from src.memory.semantic_cache import get_semantic_cache
+from src.memory.types import RetrievalResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached retrieval result stays valid
+DEFAULT_RETRIEVAL_CACHE_TTL: float = 60.0
+
+# Maximum cached results before least-recently-used eviction
+DEFAULT_RETRIEVAL_CACHE_SIZE: int = 500
+
+# (team_id, agent_id, conversation_id, budget, query digest)
+RetrievalCacheKey = tuple[UUID, Optional[UUID], Optional[UUID], Optional[int], str]
+
+
+class _Entry:
+    """Cached result plus the team generation it was computed under.
+
+    Attributes:
+        result: The cached RetrievalResult.
+        created_at: Monotonic timestamp when the entry was stored.
+        generation: Team generation at store time.
+    """
+
+    __slots__ = ("result", "created_at", "generation")
+
+    def __init__(self, result: RetrievalResult, generation: int) -> None:
+        self.result: RetrievalResult = result
+        self.created_at: float = time.monotonic()
+        self.generation: int = generation
+
+
+class RetrievalCache:
+    """Bounded LRU of retrieval results with TTL and O(1) scoped invalidation.
+
+    Keys include team, agent and conversation scope, so results never leak
+    across tenants. Invalidation bumps a per-team generation counter instead
+    of scanning entries; entries computed under an older generation are
+    treated as misses and dropped when next looked up (or evicted as least
+    recently used).
+
+    Invalidation is team-wide even when the changed memory belongs to one
+    agent: an agent's retrieval also includes team-wide semantic matches and
+    recently accessed memories of every agent in the team, so any memory
+    change can alter any agent's result.
+
+    Args:
+        ttl_seconds: Seconds a cached result stays valid.
+        max_size: Maximum number of cached results.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_RETRIEVAL_CACHE_TTL,
+        max_size: int = DEFAULT_RETRIEVAL_CACHE_SIZE,
+    ) -> None:
+        self._ttl: float = ttl_seconds
+        self._max_size: int = max_size
+        self._entries: OrderedDict[RetrievalCacheKey, _Entry] = OrderedDict()
+        self._generations: dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        query: str,
+        team_id: UUID,
+        agent_id: Optional[UUID] = None,
+        conversation_id: Optional[UUID] = None,
+        budget: Optional[int] = None,
+    ) -> RetrievalCacheKey:
+        """Build a scoped cache key for a retrieval.
+
+        Args:
+            query: The raw query text (lowercased and stripped before hashing).
+            team_id: Team scope.
+            agent_id: Optional agent scope.
+            conversation_id: Optional conversation (affects continuity scoring).
+            budget: Optional token budget override.
+
+        Returns:
+            Hashable cache key.
+        """
+        digest = hashlib.sha256(query.lower().strip().encode()).hexdigest()
+        return (team_id, agent_id, conversation_id, budget, digest)
+
+    def scope_generation(self, team_id: UUID) -> int:
+        """Current generation of a team, for tiers sharing invalidation.
+
+        Args:
+            team_id: Team scope.
+
+        Returns:
+            Counter that changes whenever the team is invalidated.
+        """
+        return self._generations.get(team_id, 0)
+
+    def get(self, key: RetrievalCacheKey) -> Optional[RetrievalResult]:
+        """Return a live cached result, or None on miss/expiry/invalidation.
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            The cached RetrievalResult (shared; copy before mutating), or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if (
+            time.monotonic() - entry.created_at > self._ttl
+            or entry.generation != self.scope_generation(key[0])
+        ):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def put(
+        self,
+        key: RetrievalCacheKey,
+        result: RetrievalResult,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Key from ``make_key``.
+            result: Retrieval result to cache.
+            generation: Team generation read when the retrieval started. The
+                result is dropped if the team was invalidated since, because
+                it may have been computed from memories that have changed.
+        """
+        current = self.scope_generation(key[0])
+        if generation is not None and generation != current:
+            return
+        self._entries[key] = _Entry(result, generation=current)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, team_id: UUID, agent_id: Optional[UUID] = None) -> None:
+        """Invalidate cached results affected by a memory change.
+
+        Every retrieval in the team is invalidated, whichever agent owns the
+        memory (see the class docstring).
+
+        Args:
+            team_id: Team that owns the changed memory.
+            agent_id: Agent that owns the changed memory, or None for a
+                team-wide memory (used for logging).
+        """
+        self._generations[team_id] = self._generations.get(team_id, 0) + 1
+        logger.debug("retrieval_cache_invalidated: team_id=%s agent_id=%s", team_id, agent_id)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+
+
+_shared_cache: Optional[RetrievalCache] = None
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    """Return the process-wide retrieval cache.
+
+    Shared by every MemoryRetriever in the process so that memory write
+    endpoints can invalidate it.
+
+    Returns:
+        The shared RetrievalCache.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = RetrievalCache()
+    return _shared_cache
+
+
+async def invalidate_memory_scope(team_id: UUID, agent_id: Optional[UUID] = None) -> None:
+    """Invalidate every retrieval cache tier after a memory change.
+
+    Args:
+        team_id: Team that owns the changed memory.
+        agent_id: Agent that owns the changed memory, or None for a
+            team-wide memory.
+    """
+    get_retrieval_cache().invalidate(team_id, agent_id)
+    semantic_cache = get_semantic_cache()
+    if semantic_cache is not None:
+        await semantic_cache.invalidate(team_id, agent_id)
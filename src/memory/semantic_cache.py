@@ -0,0 +1,436 @@
+"""Semantic retrieval cache: reuse results for near-duplicate query embeddings."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+import numpy as np
+
+from src.cache.client import RedisManager
+from src.cache.embedding_cache import decode_embedding, encode_embedding
+from src.memory.similarity import normalize_rows
+from src.memory.types import RetrievalResult
+
+if TYPE_CHECKING:
+    from src.memory.retrieval_cache import RetrievalCache, RetrievalCacheKey
+
+logger = logging.getLogger(__name__)
+
+# Minimum cosine similarity between query embeddings to reuse a result
+DEFAULT_SEMANTIC_CACHE_THRESHOLD: float = 0.95
+
+# Seconds a cached result stays valid (in process and in Redis). Matches the
+# L0 TTL, which also bounds how long another process can serve a result
+# after a memory write, since generations are not shared across processes.
+DEFAULT_SEMANTIC_CACHE_TTL: float = 60.0
+
+# Cached queries kept per scope before the oldest is replaced
+DEFAULT_MAX_ENTRIES_PER_SCOPE: int = 64
+
+# Scopes kept in process before least-recently-used eviction
+DEFAULT_MAX_SCOPES: int = 1024
+
+# (team_id, agent_id, conversation_id, budget)
+SemanticScope = tuple[UUID, Optional[UUID], Optional[UUID], Optional[int]]
+
+# Redis value layout: created-at epoch seconds + embedding length, then the
+# packed float16 embedding, then the result JSON.
+_VALUE_HEADER = struct.Struct("<dI")
+
+
+class _ScopeIndex:
+    """Cached query embeddings and results for one scope.
+
+    Embeddings are kept as unit rows of one float32 matrix so a lookup is a
+    single matrix-vector product. Scopes hold at most a few dozen queries,
+    so an exact flat search is faster than any graph or tree index.
+
+    Attributes:
+        generation: RetrievalCache team generation the entries belong to.
+        hydrated: Whether entries persisted in Redis have been loaded.
+        digests: Query digest per row.
+        created_at: Wall-clock creation time per row.
+        results: Cached result per row.
+        matrix: Unit-length query embeddings, one row per entry.
+    """
+
+    __slots__ = ("generation", "hydrated", "digests", "created_at", "results", "matrix")
+
+    def __init__(self, generation: int) -> None:
+        self.generation: int = generation
+        self.hydrated: bool = False
+        self.digests: list[str] = []
+        self.created_at: list[float] = []
+        self.results: list[RetrievalResult] = []
+        self.matrix: Optional[np.ndarray] = None
+
+    def add(
+        self,
+        digest: str,
+        unit: np.ndarray,
+        result: RetrievalResult,
+        created_at: float,
+        max_entries: int,
+    ) -> None:
+        """Insert or replace an entry, dropping the oldest beyond ``max_entries``."""
+        if self.matrix is not None and self.matrix.shape[1] != unit.shape[0]:
+            self.clear()  # embedding model changed dimensions
+
+        if digest in self.digests:
+            row = self.digests.index(digest)
+            self.created_at[row] = created_at
+            self.results[row] = result
+            assert self.matrix is not None
+            self.matrix[row] = unit
+            return
+
+        self.digests.append(digest)
+        self.created_at.append(created_at)
+        self.results.append(result)
+        row_vector = unit.reshape(1, -1)
+        self.matrix = row_vector if self.matrix is None else np.vstack((self.matrix, row_vector))
+
+        if len(self.digests) > max_entries:
+            self._drop(0)
+
+    def nearest(self, unit: np.ndarray) -> tuple[int, float]:
+        """Return the row most similar to ``unit`` and its cosine similarity."""
+        if self.matrix is None or self.matrix.shape[1] != unit.shape[0]:
+            return -1, -1.0
+        similarities = self.matrix @ unit
+        row = int(np.argmax(similarities))
+        return row, float(similarities[row])
+
+    def expire(self, cutoff: float) -> None:
+        """Drop entries created before ``cutoff``."""
+        # Replaced entries are refreshed in place, so rows are not time-ordered
+        for row in range(len(self.created_at) - 1, -1, -1):
+            if self.created_at[row] < cutoff:
+                self._drop(row)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.digests.clear()
+        self.created_at.clear()
+        self.results.clear()
+        self.matrix = None
+
+    def _drop(self, row: int) -> None:
+        del self.digests[row]
+        del self.created_at[row]
+        del self.results[row]
+        assert self.matrix is not None
+        self.matrix = np.delete(self.matrix, row, axis=0) if self.digests else None
+
+
+class SemanticQueryCache:
+    """Retrieval results keyed by query embedding similarity.
+
+    The exact-match L0 cache only hits when the normalized query text is
+    identical. This tier compares the query embedding (already computed for
+    vector search) against recent queries in the same team/agent/conversation
+    scope and reuses a result when the cosine similarity is at least
+    ``threshold``, skipping the database search for paraphrases.
+
+    Scopes share the team invalidation generations of the L0
+    ``RetrievalCache``, so a memory write that invalidates L0 also
+    invalidates this tier in process. With a RedisManager, entries are persisted per scope (one hash
+    of float16 embedding + result JSON) and hydrated the first time a
+    process sees the scope; ``invalidate`` deletes the affected hashes.
+    Entries already hydrated into other processes stay until they expire,
+    so keep ``ttl_seconds`` as short as the L0 TTL.
+
+    Key format: {prefix}semcache:{team_id}:{agent_id|-}:{conversation_id|-}:{budget|-}
+
+    Args:
+        generations: L0 cache whose scope generations gate entries.
+        redis_manager: Optional Redis connection for cross-process persistence.
+        threshold: Minimum cosine similarity to reuse a result.
+        ttl_seconds: Seconds an entry stays valid.
+        max_entries_per_scope: Queries kept per scope.
+        max_scopes: Scopes kept in process.
+    """
+
+    def __init__(
+        self,
+        generations: RetrievalCache,
+        redis_manager: Optional[RedisManager] = None,
+        threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: float = DEFAULT_SEMANTIC_CACHE_TTL,
+        max_entries_per_scope: int = DEFAULT_MAX_ENTRIES_PER_SCOPE,
+        max_scopes: int = DEFAULT_MAX_SCOPES,
+    ) -> None:
+        self._generations: RetrievalCache = generations
+        self._redis_manager: Optional[RedisManager] = redis_manager
+        self._threshold: float = threshold
+        self._ttl: float = ttl_seconds
+        self._max_entries: int = max_entries_per_scope
+        self._max_scopes: int = max_scopes
+        self._scopes: OrderedDict[SemanticScope, _ScopeIndex] = OrderedDict()
+        self._pending_writes: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return sum(len(index.digests) for index in self._scopes.values())
+
+    async def lookup(
+        self, key: RetrievalCacheKey, embedding: np.ndarray
+    ) -> Optional[RetrievalResult]:
+        """Find a cached result for a semantically equivalent query.
+
+        Args:
+            key: L0 cache key of the query (provides scope and digest).
+            embedding: Query embedding.
+
+        Returns:
+            The cached RetrievalResult (shared; copy before mutating), or None.
+        """
+        scope: SemanticScope = (key[0], key[1], key[2], key[3])
+        index = self._index(scope)
+        if not index.hydrated:
+            index.hydrated = True
+            await self._hydrate(scope, index)
+
+        index.expire(time.time() - self._ttl)
+        if not index.digests:
+            return None
+
+        row, similarity = index.nearest(normalize_rows(embedding)[0])
+        if similarity < self._threshold:
+            return None
+
+        logger.info(
+            "semantic_cache_hit: team_id=%s agent_id=%s similarity=%.4f",
+            scope[0],
+            scope[1],
+            similarity,
+        )
+        return index.results[row]
+
+    def store(
+        self,
+        key: RetrievalCacheKey,
+        embedding: np.ndarray,
+        result: RetrievalResult,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a freshly computed result under its query embedding.
+
+        The Redis write runs in the background.
+
+        Args:
+            key: L0 cache key of the query.
+            embedding: Query embedding.
+            result: Retrieval result to cache.
+            generation: Team generation read when the retrieval started. The
+                result is dropped if the team was invalidated since.
+        """
+        if generation is None:
+            generation = self._generations.scope_generation(key[0])
+        elif generation != self._generations.scope_generation(key[0]):
+            return
+
+        scope: SemanticScope = (key[0], key[1], key[2], key[3])
+        unit = normalize_rows(embedding)[0]
+        created_at = time.time()
+        self._index(scope).add(key[4], unit, result, created_at, self._max_entries)
+
+        if self._redis_manager is not None and self._redis_manager.available:
+            task = asyncio.create_task(
+                self._persist(scope, key[4], embedding, result, created_at, generation)
+            )
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+
+    async def invalidate(self, team_id: UUID, agent_id: Optional[UUID] = None) -> None:
+        """Delete persisted entries affected by a memory change.
+
+        In-process entries are invalidated through the shared L0 generations;
+        this removes the team's Redis copies so other processes cannot
+        hydrate them. Like L0, every scope in the team is affected.
+
+        Args:
+            team_id: Team that owns the changed memory.
+            agent_id: Agent that owns the changed memory, or None for a
+                team-wide memory (used for logging).
+        """
+        if self._redis_manager is None or not self._redis_manager.available:
+            return
+
+        client = await self._redis_manager.get_client()
+        if client is None:
+            return
+
+        scopes_key = self._scopes_key(team_id)
+        try:
+            stale: set[str] = await client.smembers(scopes_key)  # type: ignore[misc, union-attr]
+            await client.delete(*stale, scopes_key)  # type: ignore[union-attr]
+            logger.info(
+                "semantic_cache_invalidated: team_id=%s agent_id=%s keys=%d",
+                team_id,
+                agent_id,
+                len(stale),
+            )
+        except Exception as e:
+            logger.warning(
+                "semantic_cache_invalidate_error: team_id=%s agent_id=%s error=%s",
+                team_id,
+                agent_id,
+                str(e),
+            )
+
+    async def flush(self) -> None:
+        """Wait for background Redis writes to finish (call before shutdown)."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+    def clear(self) -> None:
+        """Drop every in-process entry (Redis copies are left to expire)."""
+        self._scopes.clear()
+
+    def _index(self, scope: SemanticScope) -> _ScopeIndex:
+        """Return the live index for a scope, resetting it if invalidated."""
+        generation = self._generations.scope_generation(scope[0])
+        index = self._scopes.get(scope)
+        if index is None or index.generation != generation:
+            index = _ScopeIndex(generation)
+            self._scopes[scope] = index
+        self._scopes.move_to_end(scope)
+        if len(self._scopes) > self._max_scopes:
+            self._scopes.popitem(last=False)
+        return index
+
+    async def _hydrate(self, scope: SemanticScope, index: _ScopeIndex) -> None:
+        """Load entries persisted in Redis by any process into ``index``."""
+        if self._redis_manager is None or not self._redis_manager.available:
+            return
+
+        try:
+            client = await self._redis_manager.get_binary_client()
+            if client is None:
+                return
+            fields: dict[bytes, bytes] = await client.hgetall(self._scope_key(scope))  # type: ignore[misc, union-attr]
+        except Exception as e:
+            logger.warning("semantic_cache_hydrate_error: team_id=%s error=%s", scope[0], str(e))
+            return
+
+        cutoff = time.time() - self._ttl
+        entries: list[tuple[float, str, np.ndarray, RetrievalResult]] = []
+        for field, value in fields.items():
+            try:
+                created_at, vector_length = _VALUE_HEADER.unpack_from(value)
+                if created_at < cutoff:
+                    continue
+                start = _VALUE_HEADER.size
+                vector = decode_embedding(value[start : start + vector_length])
+                result = RetrievalResult.model_validate_json(value[start + vector_length :])
+            except Exception as e:
+                logger.warning("semantic_cache_decode_error: field=%s error=%s", field, str(e))
+                continue
+            entries.append((created_at, field.decode(), vector, result))
+
+        # Oldest first so FIFO replacement keeps the newest entries
+        for created_at, digest, vector, result in sorted(entries, key=lambda entry: entry[0]):
+            if digest not in index.digests:
+                unit = normalize_rows(vector)[0]
+                index.add(digest, unit, result, created_at, self._max_entries)
+
+        if entries:
+            logger.info(
+                "semantic_cache_hydrated: team_id=%s agent_id=%s entries=%d",
+                scope[0],
+                scope[1],
+                len(entries),
+            )
+
+    async def _persist(
+        self,
+        scope: SemanticScope,
+        digest: str,
+        embedding: np.ndarray,
+        result: RetrievalResult,
+        created_at: float,
+        generation: int,
+    ) -> None:
+        """Write one entry to the scope's Redis hash.
+
+        If the team is invalidated while the write is in flight, the entry
+        is removed again so it cannot outlive the invalidation.
+        """
+        assert self._redis_manager is not None
+        try:
+            client = await self._redis_manager.get_binary_client()
+            if client is None:
+                return
+
+            vector = encode_embedding(embedding, "float16")
+            value = (
+                _VALUE_HEADER.pack(created_at, len(vector))
+                + vector
+                + result.model_dump_json().encode()
+            )
+            scope_key = self._scope_key(scope)
+            scopes_key = self._scopes_key(scope[0])
+            ttl = max(int(self._ttl), 1)
+
+            pipe = client.pipeline()  # type: ignore[union-attr]
+            pipe.hset(scope_key, digest, value)  # type: ignore[arg-type]
+            pipe.expire(scope_key, ttl)
+            pipe.sadd(scopes_key, scope_key)
+            pipe.expire(scopes_key, ttl)
+            pipe.hlen(scope_key)
+            *_, size = await pipe.execute()
+
+            if self._generations.scope_generation(scope[0]) != generation:
+                await client.hdel(scope_key, digest)  # type: ignore[misc, union-attr]
+                return
+
+            # Keep the persisted scope bounded like the in-process index
+            if size > self._max_entries:
+                victim = await client.hrandfield(scope_key)  # type: ignore[misc, union-attr]
+                if victim is not None and victim != digest.encode():
+                    await client.hdel(scope_key, victim)  # type: ignore[misc, union-attr]
+        except Exception as e:
+            logger.warning("semantic_cache_store_error: team_id=%s error=%s", scope[0], str(e))
+
+    def _scopes_key(self, team_id: UUID) -> str:
+        """Set of persisted scope keys for a team."""
+        assert self._redis_manager is not None
+        return f"{self._redis_manager.key_prefix}semcache:{team_id}:scopes"
+
+    def _scope_key(self, scope: SemanticScope) -> str:
+        """Redis hash holding one scope's entries."""
+        assert self._redis_manager is not None
+        team_id, agent_id, conversation_id, budget = scope
+        budget_part = "-" if budget is None else str(budget)
+        return (
+            f"{self._redis_manager.key_prefix}semcache:{team_id}:{agent_id or '-'}:"
+            f"{conversation_id or '-'}:{budget_part}"
+        )
+
+
+_shared_semantic_cache: Optional[SemanticQueryCache] = None
+
+
+def configure_semantic_cache(cache: Optional[SemanticQueryCache]) -> None:
+    """Install (or remove, with None) the process-wide semantic cache.
+
+    Args:
+        cache: Cache used by MemoryRetrievers created without an explicit one.
+    """
+    global _shared_semantic_cache
+    _shared_semantic_cache = cache
+
+
+def get_semantic_cache() -> Optional[SemanticQueryCache]:
+    """Return the process-wide semantic cache, or None when disabled.
+
+    Returns:
+        The configured SemanticQueryCache, or None.
+    """
+    return _shared_semantic_cache
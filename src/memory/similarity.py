@@ -0,0 +1,82 @@
+"""Vectorized cosine similarity helpers for embedding comparison."""
+
+from typing import Sequence
+
+import numpy as np
+
+# Vectors are compared in float32: embeddings are float32 at the source
+# and the lower precision halves memory bandwidth for large matrices.
+_DTYPE = np.float32
+
+
+def normalize_rows(vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """Stack vectors into a matrix of unit-length rows.
+
+    Zero-magnitude rows are left as zeros so they have similarity 0.0 with
+    everything instead of producing NaNs.
+
+    Args:
+        vectors: Embedding vectors of equal dimension (or a 2-D array).
+
+    Returns:
+        float32 array of shape (len(vectors), dimensions).
+    """
+    matrix = np.asarray(vectors, dtype=_DTYPE)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    unit: np.ndarray = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return unit
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Compute cosine similarity between two embedding vectors.
+
+    Args:
+        a: First embedding vector.
+        b: Second embedding vector.
+
+    Returns:
+        Cosine similarity in [-1.0, 1.0]. Returns 0.0 if either vector has
+        zero magnitude.
+    """
+    unit = normalize_rows([a, b])
+    return float(unit[0] @ unit[1])
+
+
+def similarity_matrix(
+    queries: Sequence[Sequence[float]] | np.ndarray,
+    corpus: Sequence[Sequence[float]] | np.ndarray | None = None,
+) -> np.ndarray:
+    """Compute all pairwise cosine similarities in one matrix product.
+
+    Args:
+        queries: Query vectors (rows).
+        corpus: Vectors to compare against (columns). Defaults to ``queries``.
+
+    Returns:
+        Array of shape (len(queries), len(corpus)) of cosine similarities.
+    """
+    query_unit = normalize_rows(queries)
+    corpus_unit = query_unit if corpus is None else normalize_rows(corpus)
+    matrix: np.ndarray = query_unit @ corpus_unit.T
+    return matrix
+
+
+def max_similarity(
+    queries: Sequence[Sequence[float]] | np.ndarray,
+    corpus: Sequence[Sequence[float]] | np.ndarray,
+) -> np.ndarray:
+    """Best cosine similarity of each query against a corpus.
+
+    Args:
+        queries: Query vectors.
+        corpus: Vectors to compare against.
+
+    Returns:
+        Array of length len(queries); all zeros when either side is empty.
+    """
+    if len(queries) == 0 or len(corpus) == 0:
+        return np.zeros(len(queries), dtype=_DTYPE)
+    best: np.ndarray = similarity_matrix(queries, corpus).max(axis=1)
+    return best
@@ -8,6 +8,7 @@ from typing import Optional
 from uuid import UUID
 
 import httpx
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.memory import (
@@ -20,6 +21,8 @@ from src.db.repositories.memory_repo import MemoryRepository
 from src.memory.contradiction import ContradictionDetector
 from src.memory.embedding import EmbeddingService
 from src.memory.memory_log import MemoryAuditLog
+from src.memory.similarity import cosine_similarity, max_similarity
+from src.memory.tokenizer import TokenCounter, get_token_counter
 from src.memory.types import (
     ContradictionResult,
     ExtractionResult,
@@ -46,6 +49,8 @@ class MemoryExtractor:
         api_key: API key for the LLM provider (never logged).
         base_url: Base URL for the LLM chat completions API.
         extraction_model: Model identifier used for extraction calls.
+        token_counter: Counter whose token counts are persisted with each
+            memory. Defaults to the shared process-wide counter.
     """
 
     def __init__(
@@ -57,6 +62,7 @@ class MemoryExtractor:
         api_key: str,
         base_url: str = "https://openrouter.ai/api/v1",
         extraction_model: str = "anthropic/claude-sonnet-4.5",
+        token_counter: Optional[TokenCounter] = None,
     ) -> None:
         """Initialize the memory extractor.
 
@@ -68,6 +74,8 @@ class MemoryExtractor:
             api_key: API key for the LLM provider (never logged).
             base_url: Base URL for the LLM chat completions API.
             extraction_model: Model identifier used for extraction calls.
+            token_counter: Counter whose token counts are persisted with each
+                memory. Defaults to the shared process-wide counter.
         """
         self._session: AsyncSession = session
         self._embedding_service: EmbeddingService = embedding_service
@@ -76,6 +84,7 @@ class MemoryExtractor:
         self._api_key: str = api_key
         self._base_url: str = base_url.rstrip("/")
         self._extraction_model: str = extraction_model
+        self._token_counter: TokenCounter = token_counter or get_token_counter()
         self._repo: MemoryRepository = MemoryRepository(session)
 
     # ------------------------------------------------------------------
@@ -93,9 +102,10 @@ class MemoryExtractor:
         """Extract and persist memories from a conversation using double-pass extraction.
 
         Pass 1 extracts high-confidence memories.  Pass 2 reviews the
-        conversation with Pass 1 results to fill gaps.  Results are merged
-        (deduplicated by cosine > 0.95), then each memory is checked for
-        contradictions and duplicates before persistence.
+        conversation with Pass 1 results to fill gaps.  Both passes are
+        embedded in one batch and merged (deduplicated by cosine > 0.95),
+        then each memory is checked for contradictions and duplicates before
+        persistence, reusing its batch embedding.
 
         Args:
             messages: Conversation messages as ``[{"role": ..., "content": ...}]``.
@@ -120,7 +130,7 @@ class MemoryExtractor:
         logger.info("extract_pass2: count=%d", len(pass2_memories))
 
         # --- Merge and deduplicate ---
-        merged: list[ExtractedMemory] = await self._deduplicate_extractions(
+        merged: list[tuple[ExtractedMemory, list[float]]] = await self._deduplicate_extractions(
             pass1_memories, pass2_memories
         )
         logger.info(
@@ -136,19 +146,28 @@ class MemoryExtractor:
         duplicates_skipped: int = 0
         contradictions_found: int = 0
 
-        for extracted in merged:
-            # Step a: Generate embedding
-            embedding: list[float] = await self._embedding_service.embed_text(extracted.content)
-
-            # Step b: Check contradictions
-            contradiction: ContradictionResult = await self._contradiction_detector.check_on_store(
-                new_memory=extracted,
+        # Steps a-b: Embeddings come from deduplication; contradictions for
+        # every merged memory are resolved in one batched check
+        contradictions: list[ContradictionResult] = (
+            await self._contradiction_detector.check_batch_on_store(
+                new_memories=[extracted for extracted, _ in merged],
                 team_id=team_id,
                 agent_id=agent_id,
+                embeddings=[embedding for _, embedding in merged],
             )
+            if merged
+            else []
+        )
 
-            if contradiction.contradicts:
-                contradictions_found += len(contradiction.contradicts)
+        # Batch index -> id of each memory inserted so far, for in-batch supersedes
+        inserted_ids: dict[int, UUID] = {}
+
+        for index, ((extracted, embedding), contradiction) in enumerate(
+            zip(merged, contradictions)
+        ):
+            contradictions_found += len(contradiction.contradicts) + len(
+                contradiction.batch_contradicts
+            )
 
             # Step c: Check duplicates in the database
             duplicates: list[MemoryORM] = await self._repo.find_similar(
@@ -173,6 +192,13 @@ class MemoryExtractor:
                     await self._supersede_memory(old_id)
                 memories_versioned += len(contradiction.contradicts)
 
+            # Earlier memories from this batch it supersedes (if they were stored)
+            if contradiction.action == "supersede":
+                for batch_index in contradiction.batch_contradicts:
+                    if batch_index in inserted_ids:
+                        await self._supersede_memory(inserted_ids[batch_index])
+                        memories_versioned += 1
+
             # Step f: Insert new memory
             new_orm: MemoryORM = self._build_memory_orm(
                 extracted=extracted,
@@ -185,6 +211,7 @@ class MemoryExtractor:
             self._session.add(new_orm)
             await self._session.flush()
             await self._session.refresh(new_orm)
+            inserted_ids[index] = new_orm.id
 
             # Log creation
             await self._audit_log.log_created(
@@ -429,39 +456,38 @@ class MemoryExtractor:
         self,
         pass1: list[ExtractedMemory],
         pass2: list[ExtractedMemory],
-    ) -> list[ExtractedMemory]:
+    ) -> list[tuple[ExtractedMemory, np.ndarray]]:
         """Merge pass1 and pass2, removing near-duplicates by cosine > 0.95.
 
+        Both passes are embedded in a single ``embed_batch`` call and the
+        vectors are returned alongside the memories so later steps never
+        re-embed the same content.
+
         Args:
             pass1: Memories from the first extraction pass.
             pass2: Memories from the second extraction pass.
 
         Returns:
-            Merged list with pass2 duplicates removed.
+            Merged ``(memory, embedding)`` pairs with pass2 duplicates removed.
         """
-        if not pass2:
-            return list(pass1)
-
-        # Embed all pass1 memories
-        pass1_texts: list[str] = [m.content for m in pass1]
-        pass1_embeddings: list[list[float]] = (
-            await self._embedding_service.embed_batch(pass1_texts) if pass1_texts else []
-        )
+        if not pass1 and not pass2:
+            return []
 
-        merged: list[ExtractedMemory] = list(pass1)
+        texts: list[str] = [m.content for m in pass1] + [m.content for m in pass2]
+        embeddings: list[np.ndarray] = await self._embedding_service.embed_batch(texts)
+        pass1_embeddings: list[np.ndarray] = embeddings[: len(pass1)]
+        pass2_embeddings: list[np.ndarray] = embeddings[len(pass1) :]
 
-        for p2_mem in pass2:
-            p2_embedding: list[float] = await self._embedding_service.embed_text(p2_mem.content)
-            is_duplicate: bool = False
+        merged: list[tuple[ExtractedMemory, np.ndarray]] = list(zip(pass1, pass1_embeddings))
+        if not pass2:
+            return merged
 
-            for p1_emb in pass1_embeddings:
-                similarity: float = self._cosine_similarity(p2_embedding, p1_emb)
-                if similarity > 0.95:
-                    is_duplicate = True
-                    break
+        # One matrix product scores every pass2 memory against every pass1 memory
+        best: list[float] = max_similarity(pass2_embeddings, pass1_embeddings).tolist()
 
-            if not is_duplicate:
-                merged.append(p2_mem)
+        for p2_mem, p2_embedding, similarity in zip(pass2, pass2_embeddings, best):
+            if similarity <= 0.95:
+                merged.append((p2_mem, p2_embedding))
 
         return merged
 
@@ -477,14 +503,7 @@ class MemoryExtractor:
             Cosine similarity in [-1.0, 1.0]. Returns 0.0 if either vector
             has zero magnitude.
         """
-        dot: float = sum(x * y for x, y in zip(a, b))
-        norm_a: float = sum(x * x for x in a) ** 0.5
-        norm_b: float = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot / (norm_a * norm_b)
+        return cosine_similarity(a, b)
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -510,7 +529,7 @@ class MemoryExtractor:
     def _build_memory_orm(
         self,
         extracted: ExtractedMemory,
-        embedding: list[float],
+        embedding: np.ndarray,
         team_id: UUID,
         agent_id: Optional[UUID],
         user_id: Optional[UUID],
@@ -541,6 +560,8 @@ class MemoryExtractor:
             content=extracted.content,
             subject=extracted.subject,
             embedding=embedding,
+            token_count=self._token_counter.count(extracted.content),
+            token_encoding=self._token_counter.encoding,
             importance=extracted.importance,
             confidence=extracted.confidence,
             source_type=MemorySourceEnum.EXTRACTION.value,
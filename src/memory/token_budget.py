@@ -2,12 +2,21 @@
 
 import logging
 import math
+from typing import Literal, Optional
 
+import numpy as np
+
+from src.memory.tokenizer import TokenCounter, get_token_counter
 from src.memory.types import BudgetAllocation, ScoredMemory
 from src.models.memory_models import MemoryType
 
 logger = logging.getLogger(__name__)
 
+BudgetPacking = Literal["greedy", "knapsack"]
+
+# Largest knapsack table width; bigger budgets are packed in coarser token units
+_KNAPSACK_MAX_CAPACITY: int = 2048
+
 
 class TokenBudgetManager:
     """Manages token budget allocation for memory injection.
@@ -15,32 +24,54 @@ class TokenBudgetManager:
     Prioritizes memories by category (identity > pinned > profile > scored)
     and greedily fills the budget. Identity memories are NEVER trimmed.
 
+    With ``packing="knapsack"`` the scored category is packed to maximize
+    total ``final_score`` in the budget left after the priority categories,
+    so one long memory cannot crowd out several shorter, more valuable ones.
+
     Args:
         total_budget: Maximum tokens available for memory injection.
+        token_counter: Token counter to use. Defaults to the shared
+            process-wide counter (BPE tokenizer, heuristic fallback).
+        packing: "greedy" (score order) or "knapsack" for scored memories.
     """
 
-    def __init__(self, total_budget: int = 2000) -> None:
+    def __init__(
+        self,
+        total_budget: int = 2000,
+        token_counter: Optional[TokenCounter] = None,
+        packing: BudgetPacking = "greedy",
+    ) -> None:
         self._total_budget = total_budget
+        self._packing: BudgetPacking = packing
+        self._token_counter: TokenCounter = token_counter or get_token_counter()
 
     def estimate_tokens(self, text: str) -> int:
-        """Estimate the token count for a text string.
+        """Count the tokens in a text string.
+
+        Args:
+            text: The text to count tokens for.
+
+        Returns:
+            Token count (always >= 1 for non-empty text).
+        """
+        return self._token_counter.count(text)
 
-        Uses a len(text) / 3.5 heuristic, rounded up.
+    def memory_tokens(self, memory: ScoredMemory) -> int:
+        """Count the tokens in a memory's content, reusing cached counts.
 
         Args:
-            text: The text to estimate tokens for.
+            memory: Scored memory to count.
 
         Returns:
-            Estimated token count (always >= 1 for non-empty text).
+            Token count for the memory content.
         """
-        if not text:
-            return 0
-        return math.ceil(len(text) / 3.5)
+        return self._token_counter.count_memory(memory.memory)
 
     def allocate(
         self,
         memories: list[ScoredMemory],
         budget: int | None = None,
+        packing: Optional[BudgetPacking] = None,
     ) -> tuple[list[ScoredMemory], BudgetAllocation]:
         """Allocate token budget across memories by priority category.
 
@@ -48,11 +79,13 @@ class TokenBudgetManager:
         1. Identity memories (NEVER trimmed, always included)
         2. Pinned memories
         3. User profile memories
-        4. Remaining memories sorted by final_score descending
+        4. Remaining memories sorted by final_score descending (greedy), or
+           the subset with the highest total final_score (knapsack)
 
         Args:
             memories: Scored memories to allocate budget for.
             budget: Token budget override. Uses total_budget if None.
+            packing: Packing mode override. Uses the manager's mode if None.
 
         Returns:
             Tuple of (included_memories, allocation) where included_memories
@@ -90,7 +123,7 @@ class TokenBudgetManager:
 
         # Step 1: Identity memories -- ALWAYS included, never trimmed
         for mem in identity:
-            tokens = self.estimate_tokens(mem.memory.content)
+            tokens = self.memory_tokens(mem)
             identity_tokens += tokens
             tokens_used += tokens
             included.append(mem)
@@ -104,7 +137,7 @@ class TokenBudgetManager:
 
         # Step 2: Pinned memories -- high priority, fill greedily
         for mem in pinned:
-            tokens = self.estimate_tokens(mem.memory.content)
+            tokens = self.memory_tokens(mem)
             if tokens_used + tokens <= effective_budget:
                 pinned_tokens += tokens
                 tokens_used += tokens
@@ -114,7 +147,7 @@ class TokenBudgetManager:
 
         # Step 3: User profile memories
         for mem in profile:
-            tokens = self.estimate_tokens(mem.memory.content)
+            tokens = self.memory_tokens(mem)
             if tokens_used + tokens <= effective_budget:
                 profile_tokens += tokens
                 tokens_used += tokens
@@ -123,14 +156,29 @@ class TokenBudgetManager:
                 trimmed_count += 1
 
         # Step 4: Remaining memories by score descending
-        for mem in remaining:
-            tokens = self.estimate_tokens(mem.memory.content)
-            if tokens_used + tokens <= effective_budget:
-                remaining_tokens += tokens
-                tokens_used += tokens
-                included.append(mem)
-            else:
-                trimmed_count += 1
+        if (packing or self._packing) == "knapsack":
+            weights = [self.memory_tokens(mem) for mem in remaining]
+            chosen = _knapsack(
+                weights,
+                [mem.final_score for mem in remaining],
+                max(0, effective_budget - tokens_used),
+            )
+            for index, mem in enumerate(remaining):
+                if index in chosen:
+                    remaining_tokens += weights[index]
+                    tokens_used += weights[index]
+                    included.append(mem)
+                else:
+                    trimmed_count += 1
+        else:
+            for mem in remaining:
+                tokens = self.memory_tokens(mem)
+                if tokens_used + tokens <= effective_budget:
+                    remaining_tokens += tokens
+                    tokens_used += tokens
+                    included.append(mem)
+                else:
+                    trimmed_count += 1
 
         allocation = BudgetAllocation(
             identity_tokens=identity_tokens,
@@ -151,3 +199,44 @@ class TokenBudgetManager:
         )
 
         return included, allocation
+
+
+def _knapsack(weights: list[int], values: list[float], capacity: int) -> set[int]:
+    """Choose the items with the highest total value that fit in ``capacity``.
+
+    Solves the 0/1 knapsack with a dynamic-programming table of width
+    ``capacity + 1``, one vectorized row update per item. Capacities above
+    ``_KNAPSACK_MAX_CAPACITY`` are solved in coarser units with weights
+    rounded up, so the result always fits and runtime stays bounded at
+    O(len(weights) * _KNAPSACK_MAX_CAPACITY).
+
+    Args:
+        weights: Token cost of each item.
+        values: Value of each item (e.g. final_score).
+        capacity: Token budget available.
+
+    Returns:
+        Indices of the chosen items.
+    """
+    scale = max(1, math.ceil(capacity / _KNAPSACK_MAX_CAPACITY))
+    width = capacity // scale
+    scaled = [math.ceil(weight / scale) for weight in weights]
+
+    # best[c] = highest value achievable with total scaled weight <= c
+    best = np.zeros(width + 1)
+    take = np.zeros((len(weights), width + 1), dtype=bool)
+    for index, (weight, value) in enumerate(zip(scaled, values)):
+        if weight > width or value <= 0:
+            continue
+        candidate = best[: width + 1 - weight] + value
+        improved = candidate > best[weight:]
+        take[index, weight:] = improved
+        best[weight:] = np.where(improved, candidate, best[weight:])
+
+    chosen: set[int] = set()
+    remaining = width
+    for index in range(len(weights) - 1, -1, -1):
+        if take[index, remaining]:
+            chosen.add(index)
+            remaining -= scaled[index]
+    return chosen
@@ -0,0 +1,210 @@
+"""Pluggable token counting for memory budget allocation."""
+
+import logging
+import math
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Literal, Optional, Protocol
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+TokenizerBackend = Literal["tiktoken", "heuristic"]
+
+DEFAULT_TOKENIZER_ENCODING: str = "cl100k_base"
+
+# Entries kept by a TokenCounter across text and per-memory lookups
+_DEFAULT_MAX_CACHE_ENTRIES: int = 8192
+
+
+class Tokenizer(Protocol):
+    """Counts tokens in a string.
+
+    Attributes:
+        name: Identifier persisted next to cached counts (e.g. "cl100k_base").
+    """
+
+    name: str
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in ``text``."""
+        ...
+
+
+class HeuristicTokenizer:
+    """Character-based estimate: ``ceil(len(text) / 3.5)``.
+
+    Used when no BPE tokenizer is installed.
+    """
+
+    name: str = "heuristic"
+
+    def count_tokens(self, text: str) -> int:
+        """Estimate the token count for a text string.
+
+        Args:
+            text: The text to estimate tokens for.
+
+        Returns:
+            Estimated token count (always >= 1 for non-empty text).
+        """
+        if not text:
+            return 0
+        return math.ceil(len(text) / 3.5)
+
+
+class TiktokenTokenizer:
+    """Exact BPE token counts via the optional ``tiktoken`` package.
+
+    Args:
+        encoding_name: tiktoken encoding to load (e.g. "cl100k_base").
+
+    Raises:
+        ImportError: If ``tiktoken`` is not installed.
+    """
+
+    def __init__(self, encoding_name: str = DEFAULT_TOKENIZER_ENCODING) -> None:
+        import tiktoken
+
+        self._encoding: Any = tiktoken.get_encoding(encoding_name)
+        self.name: str = encoding_name
+
+    def count_tokens(self, text: str) -> int:
+        """Count BPE tokens in a text string.
+
+        Args:
+            text: The text to tokenize.
+
+        Returns:
+            Number of tokens.
+        """
+        if not text:
+            return 0
+        return len(self._encoding.encode_ordinary(text))
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(
+    backend: TokenizerBackend = "tiktoken",
+    encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+) -> Tokenizer:
+    """Return a shared tokenizer, falling back to the heuristic.
+
+    Loading a BPE vocabulary is expensive, so one instance is kept per
+    (backend, encoding) for the process lifetime.
+
+    Args:
+        backend: "tiktoken" for a local BPE tokenizer, "heuristic" for len/3.5.
+        encoding_name: BPE encoding used by the tiktoken backend.
+
+    Returns:
+        The requested tokenizer, or HeuristicTokenizer if it cannot be loaded.
+    """
+    if backend == "tiktoken":
+        try:
+            return TiktokenTokenizer(encoding_name)
+        except Exception as e:
+            logger.warning(
+                "tokenizer_fallback: backend=%s encoding=%s error=%s",
+                backend,
+                encoding_name,
+                str(e),
+            )
+    return HeuristicTokenizer()
+
+
+class TokenCounter:
+    """Memoizing token counter shared by budget allocation and prompt trimming.
+
+    Memory content only changes with a new ``version``, so per-memory counts
+    are cached by ``(id, version)``. Counts persisted on the memory row are
+    used directly when they were produced by the same tokenizer.
+
+    Args:
+        tokenizer: Backend that performs the actual counting.
+        max_entries: Cached counts kept before least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        max_entries: int = _DEFAULT_MAX_CACHE_ENTRIES,
+    ) -> None:
+        self._tokenizer: Tokenizer = tokenizer
+        self._max_entries: int = max_entries
+        self._cache: OrderedDict[str | tuple[UUID, int], int] = OrderedDict()
+
+    @property
+    def encoding(self) -> str:
+        """Name of the tokenizer producing the counts.
+
+        Returns:
+            Tokenizer name, stored as ``memory.token_encoding``.
+        """
+        return self._tokenizer.name
+
+    def count(self, text: str) -> int:
+        """Count tokens in a text string, memoized by content.
+
+        Args:
+            text: The text to count tokens for.
+
+        Returns:
+            Token count (0 for empty text).
+        """
+        if not text:
+            return 0
+        return self._cached(text, text)
+
+    def count_memory(self, memory: Any) -> int:
+        """Count tokens in a memory's content using persisted or cached counts.
+
+        Args:
+            memory: MemoryRecord-like object with ``id``, ``version``,
+                ``content`` and optionally ``token_count`` / ``token_encoding``.
+
+        Returns:
+            Token count for ``memory.content``.
+        """
+        persisted: Optional[int] = getattr(memory, "token_count", None)
+        if persisted is not None and getattr(memory, "token_encoding", None) == self.encoding:
+            return persisted
+        return self._cached((memory.id, memory.version), memory.content)
+
+    def _cached(self, key: str | tuple[UUID, int], text: str) -> int:
+        """Look up ``key`` in the LRU cache, counting ``text`` on a miss.
+
+        Args:
+            key: Cache key (content string or memory id/version).
+            text: Text to count on a miss.
+
+        Returns:
+            Token count.
+        """
+        cached: Optional[int] = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        tokens: int = self._tokenizer.count_tokens(text)
+        self._cache[key] = tokens
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return tokens
+
+
+@lru_cache(maxsize=8)
+def get_token_counter(
+    backend: TokenizerBackend = "tiktoken",
+    encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+) -> TokenCounter:
+    """Return the process-wide TokenCounter for a tokenizer configuration.
+
+    Args:
+        backend: Tokenizer backend (see ``get_tokenizer``).
+        encoding_name: BPE encoding used by the tiktoken backend.
+
+    Returns:
+        Shared TokenCounter, so cached counts survive across requests.
+    """
+    return TokenCounter(get_tokenizer(backend, encoding_name))
@@ -87,11 +87,15 @@ class ContradictionResult(BaseModel):
 
     Attributes:
         contradicts: UUIDs of existing memories that conflict with the new memory.
+        batch_contradicts: Indices of earlier memories in the same
+            ``check_batch_on_store`` batch that conflict with the new memory
+            (not yet persisted, so they have no UUID).
         action: Resolution strategy chosen for the contradiction.
         reason: Explanation of why this action was selected.
     """
 
     contradicts: list[UUID] = Field(default_factory=list)
+    batch_contradicts: list[int] = Field(default_factory=list)
     action: Literal["supersede", "dispute", "coexist"]
     reason: str
 
@@ -196,3 +200,31 @@ class BudgetAllocation(BaseModel):
     total_tokens: int = Field(ge=0)
     memories_included: int = Field(ge=0)
     memories_trimmed: int = Field(ge=0)
+
+
+class PromptParts(BaseModel):
+    """System prompt split into a cacheable prefix and per-turn context.
+
+    The stable prefix (identity, rules, skills) is byte-identical across
+    turns for the same agent version, so providers with prefix caching can
+    reuse it. Memory and conversation layers go in the volatile context.
+
+    Attributes:
+        stable_prefix: Identity + personality rules + skill metadata.
+        volatile_context: Memory layers and conversation summary for this turn.
+        stable_tokens: Token count of the stable prefix.
+        volatile_tokens: Token count of the volatile context.
+    """
+
+    stable_prefix: str
+    volatile_context: str = ""
+    stable_tokens: int = Field(ge=0, default=0)
+    volatile_tokens: int = Field(ge=0, default=0)
+
+    def render(self) -> str:
+        """Join both parts into a single prompt string.
+
+        Returns:
+            Stable prefix followed by the volatile context.
+        """
+        return "\n\n".join(part for part in (self.stable_prefix, self.volatile_context) if part)
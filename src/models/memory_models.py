@@ -84,6 +84,8 @@ class MemoryRecord(BaseModel):
     memory_type: MemoryType
     content: str
     subject: Optional[str] = None
+    token_count: Optional[int] = None
+    token_encoding: Optional[str] = None
 
     # Scoring
     importance: int
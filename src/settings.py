@@ -51,6 +51,11 @@ class Settings(BaseSettings):
     skills_dir: Path = Field(
         default=Path("skills"), description="Directory containing skill definitions"
     )
+    skills_reload_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Minimum seconds between checks of skills_dir for changed SKILL.md files",
+    )
 
     # LLM Configuration (OpenAI-compatible)
     llm_provider: Literal["openrouter", "openai", "ollama"] = Field(
@@ -97,12 +102,62 @@ class Settings(BaseSettings):
     database_pool_size: int = Field(default=5, ge=1, le=50)
     database_pool_overflow: int = Field(default=10, ge=0, le=100)
 
+    # Memory retrieval tuning
+    memory_access_write_behind: bool = Field(
+        default=False,
+        description="Buffer memory access-metadata updates in-process instead of per request",
+    )
+    memory_access_flush_interval_ms: int = Field(
+        default=500, ge=10, le=60000, description="Write-behind flush interval in milliseconds"
+    )
+    memory_semantic_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse retrieval results for queries with near-identical embeddings",
+    )
+    memory_semantic_cache_threshold: float = Field(
+        default=0.95, ge=0.5, le=1.0, description="Minimum query cosine similarity for a hit"
+    )
+    memory_semantic_cache_ttl_seconds: int = Field(
+        default=60, ge=1, le=86400, description="Seconds a semantic cache entry stays valid"
+    )
+
+    # Memory vector index (pgvector ANN search)
+    memory_hnsw_ef_search: Optional[int] = Field(
+        default=None, ge=1, le=1000, description="hnsw.ef_search per query (None = server default)"
+    )
+    memory_ivfflat_probes: Optional[int] = Field(
+        default=None, ge=1, le=1000, description="ivfflat.probes per query (None = server default)"
+    )
+    memory_hnsw_m: int = Field(default=16, ge=2, le=100, description="HNSW index build param m")
+    memory_hnsw_ef_construction: int = Field(
+        default=64, ge=4, le=1000, description="HNSW index build param ef_construction"
+    )
+    memory_team_vector_indexes: bool = Field(
+        default=False,
+        description="Build per-team partial HNSW indexes for large teams and route searches",
+    )
+    memory_team_index_min_rows: int = Field(
+        default=50000, ge=1000, description="Embedded rows before a team gets its own index"
+    )
+
     # Embeddings (Optional - enables semantic search)
     embedding_model: str = Field(default="text-embedding-3-small")
     embedding_api_key: Optional[str] = Field(
         default=None, description="OpenAI API key for embeddings (defaults to llm_api_key)"
     )
     embedding_dimensions: int = Field(default=1536)
+    embedding_batch_window_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1000.0,
+        description="Micro-batch window for concurrent embed_text calls (0 = disabled)",
+    )
+    embedding_max_batch_size: int = Field(
+        default=64, ge=1, le=2048, description="Pending texts that flush a micro-batch early"
+    )
+    embedding_cache_encoding: Literal["float32", "float16", "int8"] = Field(
+        default="float32", description="Binary dtype for embeddings in the Redis L2 cache"
+    )
 
     # Redis (Optional - enables caching layer)
     redis_url: Optional[str] = Field(
@@ -1,14 +1,24 @@
 """Skill loader for discovering and managing skills with progressive disclosure."""
 
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Default minimum seconds between filesystem checks of a shared loader
+DEFAULT_RELOAD_INTERVAL_SECONDS: float = 2.0
+
+# Process-wide loaders keyed by resolved skills directory
+_shared_loaders: Dict[Path, "SkillLoader"] = {}
+_shared_loaders_lock = threading.Lock()
+
 
 class SkillMetadata(BaseModel):
     """Skill metadata from YAML frontmatter."""
@@ -21,7 +31,11 @@ class SkillMetadata(BaseModel):
 
 
 class SkillLoader:
-    """Loads and manages skills from filesystem."""
+    """Loads and manages skills from filesystem.
+
+    ``skills`` is a read-only snapshot. Reloads build a new snapshot and swap
+    it in atomically, so readers never see a partially updated registry.
+    """
 
     def __init__(self, skills_dir: Path) -> None:
         """
@@ -31,37 +45,122 @@ class SkillLoader:
             skills_dir: Directory containing skill folders
         """
         self.skills_dir = skills_dir
-        self.skills: Dict[str, SkillMetadata] = {}
+        self.skills: Mapping[str, SkillMetadata] = MappingProxyType({})
+        # SKILL.md path -> (mtime_ns, parsed metadata or None if invalid)
+        self._file_state: Dict[Path, Tuple[int, Optional[SkillMetadata]]] = {}
+        self._lock = threading.Lock()
+        self._last_checked: float = 0.0
 
     def discover_skills(self) -> List[SkillMetadata]:
         """
         Scan skills directory and extract metadata from all SKILL.md files.
 
+        Only SKILL.md files that are new or whose mtime changed since the
+        last scan are re-read and parsed.
+
         Returns:
             List of discovered skill metadata
         """
-        discovered: List[SkillMetadata] = []
+        with self._lock:
+            self._last_checked = time.monotonic()
+            return self._scan()
+
+    def refresh(self, min_interval: float = DEFAULT_RELOAD_INTERVAL_SECONDS) -> bool:
+        """
+        Reload skills if any SKILL.md was added, removed or modified.
+
+        Args:
+            min_interval: Skip the filesystem check if the last one was
+                less than this many seconds ago.
+
+        Returns:
+            True if the skill snapshot was replaced
+        """
+        if time.monotonic() - self._last_checked < min_interval:
+            return False
+
+        with self._lock:
+            if time.monotonic() - self._last_checked < min_interval:
+                return False
+            self._last_checked = time.monotonic()
+
+            current = self._stat_skill_files()
+            previous = {path: mtime for path, (mtime, _) in self._file_state.items()}
+            if current == previous:
+                return False
 
+            self._scan(current)
+            logger.info(
+                f"skill_registry_reloaded: path={self.skills_dir}, count={len(self.skills)}"
+            )
+            return True
+
+    def _stat_skill_files(self) -> Dict[Path, int]:
+        """
+        Collect the mtime of every SKILL.md under the skills directory.
+
+        Returns:
+            Mapping of SKILL.md path to mtime in nanoseconds
+        """
+        mtimes: Dict[Path, int] = {}
         if not self.skills_dir.exists():
-            logger.warning(f"skills_directory_missing: path={self.skills_dir}")
-            return discovered
+            return mtimes
 
-        # Scan for skill directories
         for skill_dir in self.skills_dir.iterdir():
             if not skill_dir.is_dir():
                 continue
-
             skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
+            try:
+                mtimes[skill_md] = skill_md.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.debug(f"skill_md_missing: dir={skill_dir.name}")
-                continue
+        return mtimes
+
+    def _scan(self, mtimes: Optional[Dict[Path, int]] = None) -> List[SkillMetadata]:
+        """
+        Rebuild the skill snapshot, reparsing only changed SKILL.md files.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            mtimes: Pre-collected SKILL.md mtimes (collected if omitted)
+
+        Returns:
+            List of discovered skill metadata
+        """
+        if not self.skills_dir.exists():
+            logger.warning(f"skills_directory_missing: path={self.skills_dir}")
+            self._file_state = {}
+            self.skills = MappingProxyType({})
+            return []
+
+        if mtimes is None:
+            mtimes = self._stat_skill_files()
+
+        discovered: List[SkillMetadata] = []
+        file_state: Dict[Path, Tuple[int, Optional[SkillMetadata]]] = {}
+        skills: Dict[str, SkillMetadata] = {}
 
-            # Parse skill metadata
-            metadata = self._parse_skill_metadata(skill_md, skill_dir)
+        for skill_md in sorted(mtimes):
+            mtime = mtimes[skill_md]
+            cached = self._file_state.get(skill_md)
+            if cached is not None and cached[0] == mtime:
+                metadata = cached[1]
+            else:
+                # Parse skill metadata
+                metadata = self._parse_skill_metadata(skill_md, skill_md.parent)
+                if metadata:
+                    logger.info(
+                        f"skill_discovered: name={metadata.name}, version={metadata.version}"
+                    )
+            file_state[skill_md] = (mtime, metadata)
             if metadata:
-                self.skills[metadata.name] = metadata
+                skills[metadata.name] = metadata
                 discovered.append(metadata)
-                logger.info(f"skill_discovered: name={metadata.name}, version={metadata.version}")
+
+        # Atomic swap: readers see either the old or the new snapshot
+        self._file_state = file_state
+        self.skills = MappingProxyType(skills)
 
         logger.info(f"skill_discovery_completed: count={len(discovered)}")
         return discovered
@@ -76,8 +175,9 @@ class SkillLoader:
         if not self.skills:
             return "No skills currently available."
 
+        # Sorted so the system prompt is identical across runs and hosts
         lines: List[str] = []
-        for skill in self.skills.values():
+        for skill in sorted(self.skills.values(), key=lambda skill: skill.name):
             lines.append(f"- **{skill.name}**: {skill.description}")
 
         return "\n".join(lines)
@@ -138,3 +238,36 @@ class SkillLoader:
         except Exception as e:
             logger.exception(f"skill_parse_error: file={skill_md}, error={str(e)}")
             return None
+
+
+def get_skill_loader(
+    skills_dir: Path, reload_interval: float = DEFAULT_RELOAD_INTERVAL_SECONDS
+) -> SkillLoader:
+    """
+    Return the process-wide skill loader for a directory.
+
+    The first call scans the directory. Later calls reuse the loader and
+    reload it only when SKILL.md files changed, checking the filesystem at
+    most once per ``reload_interval`` seconds. Shared by API workers, the
+    CLI and Celery tasks via ``AgentDependencies.initialize``.
+
+    Args:
+        skills_dir: Directory containing skill folders
+        reload_interval: Minimum seconds between filesystem checks
+
+    Returns:
+        Shared SkillLoader for ``skills_dir``
+    """
+    key = skills_dir.resolve()
+    loader = _shared_loaders.get(key)
+    if loader is None:
+        with _shared_loaders_lock:
+            loader = _shared_loaders.get(key)
+            if loader is None:
+                loader = SkillLoader(skills_dir)
+                loader.discover_skills()
+                _shared_loaders[key] = loader
+                return loader
+
+    loader.refresh(reload_interval)
+    return loader
@@ -1,7 +1,12 @@
 """Progressive disclosure tools for skill-based agent."""
 
 import logging
-from typing import TYPE_CHECKING
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Tuple
 
 from pydantic_ai import RunContext
 
@@ -10,6 +15,175 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Total characters of skill file content kept in memory
+_CONTENT_CACHE_MAX_CHARS: int = 8 * 1024 * 1024
+
+
+def _strip_frontmatter(content: str) -> Optional[str]:
+    """
+    Return the body of a SKILL.md without its YAML frontmatter.
+
+    Args:
+        content: Full SKILL.md text
+
+    Returns:
+        Stripped body, or None if the text has no complete frontmatter block
+    """
+    if content.startswith("---"):
+        parts = content.split("---", 2)
+        if len(parts) >= 3:
+            return parts[2].strip()
+    return None
+
+
+@dataclass(frozen=True)
+class _SkillFileIndex:
+    """Files and directories under a skill directory, with change detection."""
+
+    files: Tuple[str, ...]
+    file_set: FrozenSet[str]
+    dirs: FrozenSet[str]
+    dir_mtimes: Tuple[Tuple[str, int], ...]
+
+    def is_current(self) -> bool:
+        """
+        Check that no directory in the tree changed since the index was built.
+
+        Adding, removing or renaming a file updates its parent directory's
+        mtime, so stat-ing the (few) directories is enough.
+
+        Returns:
+            True if the index still reflects the filesystem
+        """
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in self.dir_mtimes)
+        except OSError:
+            return False
+
+
+class _SkillContentCache:
+    """
+    In-memory cache of skill file contents and per-skill file indexes.
+
+    Content is keyed by path and validated against the file's mtime and size
+    on every hit (one ``stat``), so edits are picked up without a restart.
+    Entries are evicted least-recently-used once the total cached characters
+    exceed the cap.
+    """
+
+    def __init__(self, max_chars: int = _CONTENT_CACHE_MAX_CHARS) -> None:
+        self._max_chars = max_chars
+        self._chars = 0
+        self._content: OrderedDict[Tuple[str, bool], Tuple[int, int, str]] = OrderedDict()
+        self._indexes: Dict[Path, _SkillFileIndex] = {}
+        self._lock = threading.Lock()
+
+    def read_text(self, path: Path, strip_frontmatter: bool = False) -> str:
+        """
+        Read a file, serving unchanged files from memory.
+
+        Args:
+            path: File to read
+            strip_frontmatter: Return the SKILL.md body without frontmatter
+                (files without frontmatter are returned as-is)
+
+        Returns:
+            File content
+        """
+        stat = path.stat()
+        key = (str(path), strip_frontmatter)
+        with self._lock:
+            cached = self._content.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._content.move_to_end(key)
+                return cached[2]
+
+        text = path.read_text(encoding="utf-8")
+        if strip_frontmatter:
+            body = _strip_frontmatter(text)
+            if body is not None:
+                text = body
+
+        if len(text) <= self._max_chars:
+            with self._lock:
+                previous = self._content.pop(key, None)
+                if previous is not None:
+                    self._chars -= len(previous[2])
+                self._content[key] = (stat.st_mtime_ns, stat.st_size, text)
+                self._chars += len(text)
+                while self._chars > self._max_chars:
+                    _, (_, _, evicted) = self._content.popitem(last=False)
+                    self._chars -= len(evicted)
+        return text
+
+    def file_index(self, skill_path: Path) -> _SkillFileIndex:
+        """
+        Return the file index for a skill directory, rebuilding it if stale.
+
+        Args:
+            skill_path: Skill directory
+
+        Returns:
+            Index of files (relative POSIX paths) within the skill directory
+        """
+        index = self._indexes.get(skill_path)
+        if index is not None and index.is_current():
+            return index
+
+        index = _build_file_index(skill_path)
+        with self._lock:
+            self._indexes[skill_path] = index
+        return index
+
+    def clear(self) -> None:
+        """Drop all cached content and file indexes."""
+        with self._lock:
+            self._content.clear()
+            self._indexes.clear()
+            self._chars = 0
+
+
+def _build_file_index(skill_path: Path) -> _SkillFileIndex:
+    """
+    Walk a skill directory once and index every file within it.
+
+    Files whose resolved path escapes the skill directory (e.g. symlinks)
+    are left out, so an index hit is already a validated path.
+
+    Args:
+        skill_path: Skill directory
+
+    Returns:
+        Fresh file index
+    """
+    root = skill_path.resolve()
+    files: list[str] = []
+    # A missing skill directory indexes nothing, not even the root
+    dirs: set[str] = {""} if root.is_dir() else set()
+    dir_mtimes: list[Tuple[str, int]] = []
+
+    for dirpath, _dirnames, filenames in os.walk(root):
+        dir_mtimes.append((dirpath, os.stat(dirpath).st_mtime_ns))
+        rel_dir = Path(dirpath).relative_to(root)
+        if rel_dir != Path("."):
+            dirs.add(rel_dir.as_posix())
+        for filename in filenames:
+            full_path = Path(dirpath) / filename
+            if not full_path.is_file() or not full_path.resolve().is_relative_to(root):
+                continue
+            files.append((rel_dir / filename).as_posix())
+
+    files.sort()
+    return _SkillFileIndex(
+        files=tuple(files),
+        file_set=frozenset(files),
+        dirs=frozenset(dirs),
+        dir_mtimes=tuple(dir_mtimes),
+    )
+
+
+_content_cache = _SkillContentCache()
+
 
 async def load_skill(
     ctx: RunContext["AgentDependencies"],
@@ -44,19 +218,10 @@ async def load_skill(
     skill_md = skill.skill_path / "SKILL.md"
 
     try:
-        content = skill_md.read_text(encoding="utf-8")
-
-        # Strip YAML frontmatter - return only body
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                body = parts[2].strip()
-                logger.info(f"load_skill_success: skill_name={skill_name}, body_length={len(body)}")
-                return body
-
-        # No frontmatter, return as-is
-        logger.info(f"load_skill_success: skill_name={skill_name}, content_length={len(content)}")
-        return content
+        # Body is cached with frontmatter already stripped
+        body = _content_cache.read_text(skill_md, strip_frontmatter=True)
+        logger.info(f"load_skill_success: skill_name={skill_name}, body_length={len(body)}")
+        return body
 
     except Exception as e:
         logger.exception(f"load_skill_error: skill_name={skill_name}, error={str(e)}")
@@ -100,6 +265,10 @@ async def read_skill_file(
     skill = skill_loader.skills[skill_name]
     target_file = skill.skill_path / file_path
 
+    # Fast path: indexed files are known to exist inside the skill directory
+    if Path(file_path).as_posix() in _content_cache.file_index(skill.skill_path).file_set:
+        return _read_indexed_file(skill_name, file_path, target_file)
+
     # Security: Ensure file is within skill directory (prevent directory traversal)
     try:
         resolved_target = target_file.resolve()
@@ -128,8 +297,23 @@ async def read_skill_file(
         )
         return f"Error: Path is not a file: {file_path}"
 
+    return _read_indexed_file(skill_name, file_path, target_file)
+
+
+def _read_indexed_file(skill_name: str, file_path: str, target_file: Path) -> str:
+    """
+    Read a validated skill file through the content cache.
+
+    Args:
+        skill_name: Name of the skill containing the file
+        file_path: Relative path as requested (for logging and errors)
+        target_file: Path of the file to read
+
+    Returns:
+        File contents, or an error message if reading fails
+    """
     try:
-        content = target_file.read_text(encoding="utf-8")
+        content = _content_cache.read_text(target_file)
         logger.info(
             f"read_skill_file_success: skill_name={skill_name}, "
             f"file_path={file_path}, content_length={len(content)}"
@@ -178,9 +362,11 @@ async def list_skill_files(
 
     skill = skill_loader.skills[skill_name]
     target_dir = skill.skill_path / directory if directory else skill.skill_path
+    prefix = Path(directory).as_posix() if directory else ""
+    index = _content_cache.file_index(skill.skill_path)
 
-    # Security check for directory parameter
-    if directory:
+    # Security check for directory parameter (indexed directories are known-safe)
+    if directory and prefix not in index.dirs:
         try:
             resolved_target = target_dir.resolve()
             resolved_skill = skill.skill_path.resolve()
@@ -197,32 +383,29 @@ async def list_skill_files(
             )
             return "Error: Invalid directory path"
 
-    if not target_dir.exists():
-        logger.warning(
-            f"list_skill_files_dir_not_found: skill_name={skill_name}, directory={directory}"
-        )
-        return f"Error: Directory not found: {directory or 'skill root'}"
+    if prefix not in index.dirs:
+        if not target_dir.exists():
+            logger.warning(
+                f"list_skill_files_dir_not_found: skill_name={skill_name}, directory={directory}"
+            )
+            return f"Error: Directory not found: {directory or 'skill root'}"
 
-    if not target_dir.is_dir():
-        logger.warning(
-            f"list_skill_files_not_a_dir: skill_name={skill_name}, directory={directory}"
-        )
-        return f"Error: Path is not a directory: {directory}"
+        if not target_dir.is_dir():
+            logger.warning(
+                f"list_skill_files_not_a_dir: skill_name={skill_name}, directory={directory}"
+            )
+            return f"Error: Path is not a directory: {directory}"
 
     try:
-        files = []
-        for item in target_dir.rglob("*"):
-            if item.is_file():
-                # Get path relative to skill directory
-                rel_path = item.relative_to(skill.skill_path)
-                files.append(str(rel_path))
+        # Files are relative to the skill directory, from the precomputed index
+        files = [f for f in index.files if not prefix or f.startswith(f"{prefix}/")]
 
         if not files:
             return f"No files found in skill '{skill_name}'" + (
                 f" directory '{directory}'" if directory else ""
             )
 
-        file_list = "\n".join(f"- {f}" for f in sorted(files))
+        file_list = "\n".join(f"- {f}" for f in files)
         logger.info(
             f"list_skill_files_success: skill_name={skill_name}, "
             f"directory={directory or 'root'}, file_count={len(files)}"
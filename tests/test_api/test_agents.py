@@ -442,6 +442,37 @@ class TestUpdateAgent:
         assert data["name"] == "Updated Name"
         assert data["status"] == "active"
 
+    @pytest.mark.asyncio
+    @patch("src.auth.dependencies.check_team_permission", new_callable=AsyncMock, return_value=True)
+    async def test_update_agent_invalidates_agent_cache(
+        self, mock_perm, auth_client, app, db_session, test_team_id
+    ) -> None:
+        """Updating an agent drops its cached agent instances."""
+        _setup_require_role_override(app, db_session)
+
+        agent_id = UUID("11111111-1111-1111-1111-111111111111")
+        agent = MockAgentORM(agent_id=agent_id, team_id=test_team_id, status="draft")
+
+        query_mock = MagicMock()
+        query_mock.scalar_one_or_none = MagicMock(return_value=agent)
+
+        db_session.execute = AsyncMock(return_value=query_mock)
+        db_session.commit = AsyncMock()
+        db_session.refresh = AsyncMock()
+
+        with (
+            patch("src.api.routers.agents.invalidate_agent_cache") as mock_invalidate,
+            patch("src.api.routers.agents.invalidate_static_layers") as mock_layers,
+        ):
+            response = await auth_client.patch(
+                "/v1/agents/test-agent",
+                json={"tagline": "Updated tagline"},
+            )
+
+        assert response.status_code == 200
+        mock_invalidate.assert_called_once_with(agent_id)
+        mock_layers.assert_called_once_with(agent_id)
+
     @pytest.mark.asyncio
     @patch("src.auth.dependencies.check_team_permission", new_callable=AsyncMock, return_value=True)
     async def test_update_agent_partial_update_only_provided_fields(
@@ -16,6 +16,7 @@ from src.db.models.agent import AgentORM, AgentStatusEnum
 from src.db.models.conversation import ConversationORM, MessageRoleEnum
 from src.db.models.user import UserORM
 from src.dependencies import AgentDependencies
+from src.memory.types import ExtractionResult
 
 # Extract functions from module
 chat = chat_module.chat
@@ -562,8 +563,9 @@ class TestChatMemoryRetrieval:
                 agent_deps=mock_agent_deps,
             )
 
-        # Verify memory retrieval was attempted
+        # Verify memory retrieval was attempted and handed to the prompt hook
         mock_retriever.retrieve.assert_called_once()
+        assert mock_agent_deps.retrieval_result is mock_retrieval_result
 
     @pytest.mark.asyncio
     async def test_chat_without_memory_retrieval(
@@ -686,6 +688,63 @@ class TestChatMemoryRetrieval:
         assert result.response == "Response despite memory failure"
 
 
+class TestExtractMemories:
+    """Tests for the fire-and-forget extraction helper."""
+
+    @staticmethod
+    def _extraction(created: int = 0, contradictions: int = 0) -> ExtractionResult:
+        return ExtractionResult(
+            memories_created=created,
+            memories_versioned=0,
+            duplicates_skipped=0,
+            contradictions_found=contradictions,
+            pass1_count=created,
+            pass2_additions=0,
+        )
+
+    async def _run(self, extraction: ExtractionResult, team_id: UUID, agent_id: UUID) -> AsyncMock:
+        extractor = MagicMock()
+        extractor.extract_from_conversation = AsyncMock(return_value=extraction)
+        with patch(
+            "src.api.routers.chat.invalidate_memory_scope", new_callable=AsyncMock
+        ) as mock_invalidate:
+            await chat_module._extract_memories(
+                extractor=extractor,
+                messages=[{"role": "user", "content": "I prefer tea"}],
+                team_id=team_id,
+                agent_id=agent_id,
+                user_id=uuid4(),
+                conversation_id=uuid4(),
+                request_id="req",
+            )
+        return mock_invalidate
+
+    @pytest.mark.asyncio
+    async def test_new_memories_invalidate_agent_scope(self) -> None:
+        """Retrieval caches for the agent are invalidated after extraction."""
+        team_id, agent_id = uuid4(), uuid4()
+
+        mock_invalidate = await self._run(self._extraction(created=2), team_id, agent_id)
+
+        mock_invalidate.assert_awaited_once_with(team_id, agent_id)
+
+    @pytest.mark.asyncio
+    async def test_contradictions_invalidate_team_scope(self) -> None:
+        """Resolved contradictions invalidate the whole team."""
+        team_id = uuid4()
+
+        mock_invalidate = await self._run(self._extraction(contradictions=1), team_id, uuid4())
+
+        mock_invalidate.assert_awaited_once_with(team_id, None)
+
+    @pytest.mark.asyncio
+    async def test_no_changes_keep_caches(self) -> None:
+        """Nothing is invalidated when extraction stored nothing."""
+        mock_invalidate = await self._run(self._extraction(), uuid4(), uuid4())
+
+        mock_invalidate.assert_not_awaited()
+
+
 class TestChatAgentExecution:
     """Tests for Steps 5-6: Create agent instance and run."""
 
@@ -1,9 +1,44 @@
 """Comprehensive tests for memory CRUD and search endpoints."""
 
 import pytest
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import UUID
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI
+
+from src.api.dependencies import get_embedding_service, get_redis_manager
+
+
+@contextmanager
+def _override_embedding_service(app: FastAPI) -> Iterator[MagicMock]:
+    """Override the shared embedding service dependency.
+
+    Yields a MagicMock whose ``return_value`` is served as the embedding
+    service, so tests can set it after entering the context.
+    """
+    provider = MagicMock(return_value=None)
+    app.dependency_overrides[get_embedding_service] = lambda: provider.return_value
+    try:
+        yield provider
+    finally:
+        app.dependency_overrides.pop(get_embedding_service, None)
+
+
+async def _populate_new_memory(obj: object) -> None:
+    """db.refresh side effect filling the server defaults of a new MemoryORM."""
+    now = datetime.now(timezone.utc)
+    for name, value in (
+        ("id", uuid4()),
+        ("created_at", now),
+        ("updated_at", now),
+        ("access_count", 0),
+        ("is_pinned", False),
+    ):
+        if getattr(obj, name, None) is None:
+            setattr(obj, name, value)
 
 
 class MockMemoryORM:
@@ -59,10 +94,10 @@ class TestListMemories:
         count_mock = MagicMock()
         count_mock.scalar.return_value = 0
 
-        # Mock MemoryRepository.get_by_team (empty)
+        # Mock MemoryRepository.get_rows_by_team (empty)
         with patch("src.api.routers.memories.MemoryRepository") as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_by_team = AsyncMock(return_value=[])
+            mock_repo.get_rows_by_team = AsyncMock(return_value=[])
             mock_repo_class.return_value = mock_repo
 
             db_session.execute = AsyncMock(return_value=count_mock)
@@ -92,10 +127,10 @@ class TestListMemories:
         count_mock = MagicMock()
         count_mock.scalar.return_value = 5
 
-        # Mock MemoryRepository.get_by_team (with one memory)
+        # Mock MemoryRepository.get_rows_by_team (with one memory)
         with patch("src.api.routers.memories.MemoryRepository") as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_by_team = AsyncMock(return_value=[memory1])
+            mock_repo.get_rows_by_team = AsyncMock(return_value=[memory1])
             mock_repo_class.return_value = mock_repo
 
             db_session.execute = AsyncMock(return_value=count_mock)
@@ -125,10 +160,10 @@ class TestListMemories:
         count_mock = MagicMock()
         count_mock.scalar.return_value = 1
 
-        # Mock MemoryRepository.get_by_team
+        # Mock MemoryRepository.get_rows_by_team
         with patch("src.api.routers.memories.MemoryRepository") as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_by_team = AsyncMock(return_value=[memory])
+            mock_repo.get_rows_by_team = AsyncMock(return_value=[memory])
             mock_repo_class.return_value = mock_repo
 
             db_session.execute = AsyncMock(return_value=count_mock)
@@ -155,11 +190,11 @@ class TestCreateMemory:
 
     @pytest.mark.asyncio
     async def test_create_memory_success(
-        self, auth_client, db_session, test_team_id, test_user_id
+        self, app, auth_client, db_session, test_team_id, test_user_id
     ) -> None:
         """Create memory returns 201 with created memory."""
         # Mock EmbeddingService
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embedding_service = AsyncMock()
             mock_embedding_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
             mock_embed_fn.return_value = mock_embedding_service
@@ -206,6 +241,30 @@ class TestCreateMemory:
                 assert data["status"] == "active"
                 assert data["tier"] == "warm"
 
+    @pytest.mark.asyncio
+    async def test_create_memory_drops_team_hot_caches(
+        self, app, auth_client, db_session, test_team_id
+    ) -> None:
+        """A new memory clears the team's hot sets so retrieval cannot serve them without it."""
+        db_session.flush = AsyncMock()
+        db_session.commit = AsyncMock()
+        db_session.refresh = AsyncMock(side_effect=_populate_new_memory)
+        app.dependency_overrides[get_redis_manager] = lambda: MagicMock()
+
+        with (
+            patch("src.api.routers.memories.MemoryAuditLog", return_value=AsyncMock()),
+            patch("src.api.routers.memories.invalidate_memory_scope", new_callable=AsyncMock),
+            patch("src.api.routers.memories.HotMemoryCache") as mock_hot_cache,
+        ):
+            hot_cache = mock_hot_cache.return_value
+            hot_cache.invalidate_user = AsyncMock()
+            response = await auth_client.post(
+                "/v1/memories", json={"content": "New fact", "memory_type": "semantic"}
+            )
+
+        assert response.status_code == 201
+        hot_cache.invalidate_user.assert_awaited_once_with(test_team_id)
+
     @pytest.mark.asyncio
     async def test_create_memory_invalid_memory_type_400(self, auth_client, db_session) -> None:
         """Create memory returns 400 for invalid memory_type."""
@@ -222,11 +281,11 @@ class TestCreateMemory:
 
     @pytest.mark.asyncio
     async def test_create_memory_embedding_service_unavailable_continues(
-        self, auth_client, db_session, test_team_id, test_user_id
+        self, app, auth_client, db_session, test_team_id, test_user_id
     ) -> None:
         """Create memory continues without embedding if service fails."""
         # Mock EmbeddingService to raise exception
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embedding_service = AsyncMock()
             mock_embedding_service.embed_single = AsyncMock(
                 side_effect=Exception("Embedding service down")
@@ -272,7 +331,9 @@ class TestSearchMemories:
     """Tests for POST /v1/memories/search endpoint."""
 
     @pytest.mark.asyncio
-    async def test_search_memories_success(self, auth_client, db_session, test_team_id) -> None:
+    async def test_search_memories_success(
+        self, app, auth_client, db_session, test_team_id
+    ) -> None:
         """Search memories returns results ranked by relevance."""
         memory1 = MockMemoryORM(
             memory_id=UUID("11111111-1111-1111-1111-111111111111"),
@@ -281,16 +342,16 @@ class TestSearchMemories:
         )
 
         # Mock EmbeddingService
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embedding_service = AsyncMock()
             mock_embedding_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
             mock_embed_fn.return_value = mock_embedding_service
 
-            # Mock MemoryRepository.search_by_embedding
+            # Mock MemoryRepository.search_rows_by_embedding
             with patch("src.api.routers.memories.MemoryRepository") as mock_repo_class:
                 mock_repo = AsyncMock()
                 # Returns list of (memory, score) tuples
-                mock_repo.search_by_embedding = AsyncMock(return_value=[(memory1, 0.95)])
+                mock_repo.search_rows_by_embedding = AsyncMock(return_value=[(memory1, 0.95)])
                 mock_repo_class.return_value = mock_repo
 
                 request_body = {
@@ -309,19 +370,19 @@ class TestSearchMemories:
 
     @pytest.mark.asyncio
     async def test_search_memories_empty_results(
-        self, auth_client, db_session, test_team_id
+        self, app, auth_client, db_session, test_team_id
     ) -> None:
         """Search memories returns empty list when no matches."""
         # Mock EmbeddingService
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embedding_service = AsyncMock()
             mock_embedding_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
             mock_embed_fn.return_value = mock_embedding_service
 
-            # Mock MemoryRepository.search_by_embedding (empty results)
+            # Mock MemoryRepository.search_rows_by_embedding (empty results)
             with patch("src.api.routers.memories.MemoryRepository") as mock_repo_class:
                 mock_repo = AsyncMock()
-                mock_repo.search_by_embedding = AsyncMock(return_value=[])
+                mock_repo.search_rows_by_embedding = AsyncMock(return_value=[])
                 mock_repo_class.return_value = mock_repo
 
                 request_body = {
@@ -337,11 +398,11 @@ class TestSearchMemories:
 
     @pytest.mark.asyncio
     async def test_search_memories_embedding_service_unavailable_503(
-        self, auth_client, db_session
+        self, app, auth_client, db_session
     ) -> None:
         """Search memories returns 503 when embedding service unavailable."""
         # Mock EmbeddingService to return None
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embed_fn.return_value = None
 
             request_body = {
@@ -394,6 +455,35 @@ class TestDeleteMemory:
             assert memory.status == "archived"
             assert memory.tier == "cold"
 
+    @pytest.mark.asyncio
+    async def test_delete_memory_drops_it_from_hot_cache(
+        self, app, auth_client, db_session, test_team_id
+    ) -> None:
+        """Deleting a memory removes it from the team's hot caches."""
+        agent_id = UUID("22222222-2222-2222-2222-222222222222")
+        memory = MockMemoryORM(
+            memory_id=UUID("11111111-1111-1111-1111-111111111111"),
+            team_id=test_team_id,
+            agent_id=agent_id,
+        )
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = memory
+        db_session.execute = AsyncMock(return_value=result_mock)
+        db_session.commit = AsyncMock()
+        app.dependency_overrides[get_redis_manager] = lambda: MagicMock()
+
+        with (
+            patch("src.api.routers.memories.MemoryAuditLog", return_value=AsyncMock()),
+            patch("src.api.routers.memories.invalidate_memory_scope", new_callable=AsyncMock),
+            patch("src.api.routers.memories.HotMemoryCache") as mock_hot_cache,
+        ):
+            hot_cache = mock_hot_cache.return_value
+            hot_cache.remove_memory = AsyncMock()
+            response = await auth_client.delete("/v1/memories/11111111-1111-1111-1111-111111111111")
+
+        assert response.status_code == 200
+        hot_cache.remove_memory.assert_awaited_once_with(test_team_id, memory.id)
+
     @pytest.mark.asyncio
     async def test_delete_memory_not_found_404(self, auth_client, db_session, test_team_id) -> None:
         """Delete memory returns 404 if memory not found."""
@@ -445,6 +535,77 @@ class TestTogglePinMemory:
             data = response.json()
             assert data["is_pinned"] is True
 
+    @pytest.mark.asyncio
+    async def test_toggle_pin_memory_invalidates_retrieval_cache(
+        self, auth_client, db_session, test_team_id
+    ) -> None:
+        """Pinning a memory invalidates cached retrievals for its scope."""
+        agent_id = UUID("22222222-2222-2222-2222-222222222222")
+        memory = MockMemoryORM(
+            memory_id=UUID("11111111-1111-1111-1111-111111111111"),
+            team_id=test_team_id,
+            agent_id=agent_id,
+            is_pinned=False,
+        )
+
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = memory
+        db_session.execute = AsyncMock(return_value=result_mock)
+        db_session.commit = AsyncMock()
+        db_session.refresh = AsyncMock()
+
+        with (
+            patch("src.api.routers.memories.MemoryAuditLog", return_value=AsyncMock()),
+            patch(
+                "src.api.routers.memories.invalidate_memory_scope", new_callable=AsyncMock
+            ) as mock_invalidate,
+        ):
+            response = await auth_client.post(
+                "/v1/memories/11111111-1111-1111-1111-111111111111/pin"
+            )
+
+        assert response.status_code == 200
+        mock_invalidate.assert_awaited_once_with(test_team_id, agent_id)
+
+    @pytest.mark.asyncio
+    async def test_toggle_pin_memory_refreshes_hot_cache(
+        self, app, auth_client, db_session, test_team_id
+    ) -> None:
+        """Pinning a memory updates its record in the team's hot caches."""
+        agent_id = UUID("22222222-2222-2222-2222-222222222222")
+        memory = MockMemoryORM(
+            memory_id=UUID("11111111-1111-1111-1111-111111111111"),
+            team_id=test_team_id,
+            agent_id=agent_id,
+            is_pinned=False,
+        )
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = memory
+        db_session.execute = AsyncMock(return_value=result_mock)
+        db_session.commit = AsyncMock()
+        db_session.refresh = AsyncMock()
+        app.dependency_overrides[get_redis_manager] = lambda: MagicMock()
+        record = MagicMock()
+        record.model_dump.return_value = {"id": str(memory.id), "is_pinned": True}
+
+        with (
+            patch("src.api.routers.memories.MemoryAuditLog", return_value=AsyncMock()),
+            patch("src.api.routers.memories.invalidate_memory_scope", new_callable=AsyncMock),
+            patch("src.api.routers.memories.orm_to_record", return_value=record) as mock_record,
+            patch("src.api.routers.memories.HotMemoryCache") as mock_hot_cache,
+        ):
+            hot_cache = mock_hot_cache.return_value
+            hot_cache.upsert_memory = AsyncMock()
+            response = await auth_client.post(
+                "/v1/memories/11111111-1111-1111-1111-111111111111/pin"
+            )
+
+        assert response.status_code == 200
+        mock_record.assert_called_once_with(memory)
+        hot_cache.upsert_memory.assert_awaited_once_with(
+            test_team_id, {"id": str(memory.id), "is_pinned": True}
+        )
+
     @pytest.mark.asyncio
     async def test_toggle_pin_memory_not_found_404(
         self, auth_client, db_session, test_team_id
@@ -467,7 +628,7 @@ class TestCorrectMemory:
 
     @pytest.mark.asyncio
     async def test_correct_memory_creates_correction(
-        self, auth_client, db_session, test_team_id, test_user_id
+        self, app, auth_client, db_session, test_team_id, test_user_id
     ) -> None:
         """Correct memory creates new version and supersedes original."""
         original_memory = MockMemoryORM(
@@ -485,7 +646,7 @@ class TestCorrectMemory:
         db_session.execute = AsyncMock(return_value=result_mock)
 
         # Mock EmbeddingService
-        with patch("src.api.routers.memories._get_embedding_service") as mock_embed_fn:
+        with _override_embedding_service(app) as mock_embed_fn:
             mock_embedding_service = AsyncMock()
             mock_embedding_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
             mock_embed_fn.return_value = mock_embedding_service
@@ -534,6 +695,37 @@ class TestCorrectMemory:
                 assert original_memory.status == "superseded"
                 assert original_memory.tier == "cold"
 
+    @pytest.mark.asyncio
+    async def test_correct_memory_drops_team_hot_caches(
+        self, app, auth_client, db_session, test_team_id
+    ) -> None:
+        """A correction clears the team's hot sets, which hold the superseded original."""
+        original = MockMemoryORM(
+            memory_id=UUID("11111111-1111-1111-1111-111111111111"), team_id=test_team_id
+        )
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = original
+        db_session.execute = AsyncMock(return_value=result_mock)
+        db_session.flush = AsyncMock()
+        db_session.commit = AsyncMock()
+        db_session.refresh = AsyncMock(side_effect=_populate_new_memory)
+        app.dependency_overrides[get_redis_manager] = lambda: MagicMock()
+
+        with (
+            patch("src.api.routers.memories.MemoryAuditLog", return_value=AsyncMock()),
+            patch("src.api.routers.memories.invalidate_memory_scope", new_callable=AsyncMock),
+            patch("src.api.routers.memories.HotMemoryCache") as mock_hot_cache,
+        ):
+            hot_cache = mock_hot_cache.return_value
+            hot_cache.invalidate_user = AsyncMock()
+            response = await auth_client.post(
+                "/v1/memories/11111111-1111-1111-1111-111111111111/correct",
+                json={"content": "Corrected", "memory_type": "semantic", "importance": 8},
+            )
+
+        assert response.status_code == 201
+        hot_cache.invalidate_user.assert_awaited_once_with(test_team_id)
+
     @pytest.mark.asyncio
     async def test_correct_memory_not_found_404(
         self, auth_client, db_session, test_team_id
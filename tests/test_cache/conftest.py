@@ -3,18 +3,24 @@
 import pytest
 from typing import AsyncGenerator
 
-from fakeredis import FakeAsyncRedis
+from fakeredis import FakeAsyncRedis, FakeServer
 
 
 @pytest.fixture
-async def fake_redis() -> AsyncGenerator[FakeAsyncRedis, None]:
+def fake_server() -> FakeServer:
+    """In-memory fakeredis server shared by text and bytes-mode clients."""
+    return FakeServer()
+
+
+@pytest.fixture
+async def fake_redis(fake_server: FakeServer) -> AsyncGenerator[FakeAsyncRedis, None]:
     """Async fakeredis client for isolated testing.
 
     Yields:
         A fresh FakeAsyncRedis instance with decode_responses=True.
         Automatically flushed and closed after each test.
     """
-    client = FakeAsyncRedis(decode_responses=True)
+    client = FakeAsyncRedis(server=fake_server, decode_responses=True)
     yield client
     await client.flushall()
     pool = getattr(client, "connection_pool", None)
@@ -24,7 +30,7 @@ async def fake_redis() -> AsyncGenerator[FakeAsyncRedis, None]:
 
 
 @pytest.fixture
-async def redis_manager(fake_redis: FakeAsyncRedis) -> AsyncGenerator:
+async def redis_manager(fake_redis: FakeAsyncRedis, fake_server: FakeServer) -> AsyncGenerator:
     """RedisManager with injected fakeredis client (bypasses pool creation).
 
     Creates a RedisManager configured with a fake URL, then patches its
@@ -32,6 +38,7 @@ async def redis_manager(fake_redis: FakeAsyncRedis) -> AsyncGenerator:
 
     Args:
         fake_redis: The fakeredis client fixture.
+        fake_server: The fakeredis server behind ``fake_redis``.
 
     Returns:
         A RedisManager that uses fakeredis internally.
@@ -40,6 +47,9 @@ async def redis_manager(fake_redis: FakeAsyncRedis) -> AsyncGenerator:
 
     manager = RedisManager(redis_url="redis://fake:6379/0", key_prefix="test:")
     manager._client = fake_redis
+    # Bytes-mode client on the same fake server, as get_binary_client would build
+    manager._binary_client = FakeAsyncRedis(server=fake_server, decode_responses=False)
+    manager._binary_source = fake_redis
     manager._available = True
     yield manager
     await manager.close()
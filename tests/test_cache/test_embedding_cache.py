@@ -1,12 +1,14 @@
 """Unit tests for EmbeddingCache Redis-backed embedding storage."""
 
 import hashlib
+import json
 
+import numpy as np
 import pytest
 from fakeredis import FakeAsyncRedis
 
 from src.cache.client import RedisManager
-from src.cache.embedding_cache import EmbeddingCache
+from src.cache.embedding_cache import EmbeddingCache, decode_embedding, encode_embedding
 
 
 class TestEmbeddingCache:
@@ -23,7 +25,7 @@ class TestEmbeddingCache:
         result = await cache.get_embedding(text)
 
         assert result is not None
-        assert result == embedding
+        assert result == pytest.approx(embedding, rel=1e-6)
 
     @pytest.mark.asyncio
     async def test_get_embedding_returns_none_on_cache_miss(
@@ -81,9 +83,9 @@ class TestEmbeddingCache:
         result2 = await cache.get_embedding("HELLO WORLD")
         result3 = await cache.get_embedding("HeLLo WoRLd")
 
-        assert result1 == embedding
-        assert result2 == embedding
-        assert result3 == embedding
+        assert result1 is not None and result1.tolist() == embedding
+        assert result2 is not None and result2.tolist() == embedding
+        assert result3 is not None and result3.tolist() == embedding
 
     @pytest.mark.asyncio
     async def test_ttl_is_set_to_86400_seconds(
@@ -120,10 +122,10 @@ class TestEmbeddingCache:
         assert key2 != key3
 
     @pytest.mark.asyncio
-    async def test_1536_dimensional_vector_round_trips_without_precision_loss(
+    async def test_1536_dimensional_vector_round_trips_at_float32_precision(
         self, redis_manager: RedisManager
     ) -> None:
-        """Large embedding (1536 dimensions) round-trips exactly."""
+        """Large embedding (1536 dimensions) round-trips at float32 precision."""
         cache = EmbeddingCache(redis_manager)
         text = "large embedding test"
         # Generate 1536-dimensional vector
@@ -134,8 +136,8 @@ class TestEmbeddingCache:
 
         assert result is not None
         assert len(result) == 1536
-        # Check exact equality (JSON round-trip should preserve floats)
-        assert result == embedding
+        # Packed float32 storage keeps ~7 significant digits
+        assert result == pytest.approx(embedding, rel=1e-6)
 
     @pytest.mark.asyncio
     async def test_store_embedding_overwrites_existing_embedding(
@@ -150,12 +152,12 @@ class TestEmbeddingCache:
         # Store first embedding
         await cache.store_embedding(text, embedding1)
         result1 = await cache.get_embedding(text)
-        assert result1 == embedding1
+        assert result1 is not None and result1.tolist() == embedding1
 
         # Overwrite with second embedding
         await cache.store_embedding(text, embedding2)
         result2 = await cache.get_embedding(text)
-        assert result2 == embedding2
+        assert result2 is not None and result2.tolist() == embedding2
 
     @pytest.mark.asyncio
     async def test_empty_text_produces_valid_cache_key(
@@ -218,7 +220,7 @@ class TestEmbeddingCache:
         result = await cache.get_embedding(text)
 
         assert result is not None
-        assert result == embedding
+        assert result == pytest.approx(embedding, rel=1e-6)
 
     @pytest.mark.asyncio
     async def test_cache_key_includes_prefix_and_embed_namespace(
@@ -236,3 +238,96 @@ class TestEmbeddingCache:
         assert "embed:" in key
         # Key format: {prefix}embed:{hash}
         assert key.count("embed:") == 1
+
+
+class TestBinaryEncoding:
+    """Tests for the packed binary embedding format."""
+
+    def test_float32_is_header_plus_four_bytes_per_dimension(self) -> None:
+        """float32 packing stores 4 bytes per dimension after an 8-byte header."""
+        packed = encode_embedding([0.5] * 1536, "float32")
+
+        assert len(packed) == 8 + 1536 * 4
+        assert packed[:2] == b"EV"
+
+    def test_float16_round_trip(self) -> None:
+        """float16 packing halves the payload and keeps ~3 significant digits."""
+        embedding = [0.001 * i - 0.5 for i in range(1536)]
+        packed = encode_embedding(embedding, "float16")
+
+        assert len(packed) == 8 + 1536 * 2
+        assert decode_embedding(packed).tolist() == pytest.approx(embedding, abs=1e-3)
+
+    def test_int8_round_trip_preserves_direction(self) -> None:
+        """int8 quantization keeps cosine similarity to the original near 1."""
+        rng = np.random.default_rng(0)
+        embedding = rng.normal(size=1536).astype(np.float32)
+        packed = encode_embedding(embedding.tolist(), "int8")
+        decoded = decode_embedding(packed)
+
+        assert len(packed) == 8 + 4 + 1536
+        cosine = float(
+            np.dot(embedding, decoded) / (np.linalg.norm(embedding) * np.linalg.norm(decoded))
+        )
+        assert cosine > 0.999
+
+    def test_decode_returns_float32_array(self) -> None:
+        """Decoding yields a NumPy float32 array, not a list of Python floats."""
+        decoded = decode_embedding(encode_embedding([1.0, 2.0, 3.0]))
+
+        assert isinstance(decoded, np.ndarray)
+        assert decoded.dtype == np.float32
+        assert decoded.tolist() == [1.0, 2.0, 3.0]
+
+    def test_decode_accepts_legacy_json(self) -> None:
+        """Entries written as JSON lists before the binary format still decode."""
+        decoded = decode_embedding(json.dumps([0.25, 0.5]).encode())
+
+        assert decoded.tolist() == [0.25, 0.5]
+
+    def test_decode_rejects_unknown_version(self) -> None:
+        """An unknown format version raises ValueError."""
+        packed = bytearray(encode_embedding([1.0]))
+        packed[2] = 99
+
+        with pytest.raises(ValueError):
+            decode_embedding(bytes(packed))
+
+
+class TestBulkOperations:
+    """Tests for MGET lookups and pipelined writes."""
+
+    @pytest.mark.asyncio
+    async def test_store_embeddings_then_get_embeddings(self, redis_manager: RedisManager) -> None:
+        """Pipelined stores are returned by a single MGET in input order."""
+        cache = EmbeddingCache(redis_manager)
+        await cache.store_embeddings([("first", [1.0, 2.0]), ("second", [3.0, 4.0])])
+
+        results = await cache.get_embeddings(["second", "missing", "first"])
+
+        assert [None if r is None else r.tolist() for r in results] == [
+            [3.0, 4.0],
+            None,
+            [1.0, 2.0],
+        ]
+        assert all(isinstance(r, np.ndarray) for r in results if r is not None)
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_when_redis_unavailable(
+        self, unavailable_redis_manager: RedisManager
+    ) -> None:
+        """Bulk lookups return all-None when Redis is unavailable."""
+        cache = EmbeddingCache(unavailable_redis_manager)
+
+        assert await cache.get_embeddings(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_get_embedding_skips_python_floats(self, redis_manager: RedisManager) -> None:
+        """get_embedding returns the decoded NumPy array."""
+        cache = EmbeddingCache(redis_manager, encoding="float16")
+        await cache.store_embedding("text", [0.5, -0.25])
+
+        result = await cache.get_embedding("text")
+
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [0.5, -0.25]
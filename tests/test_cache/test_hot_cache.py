@@ -1,6 +1,7 @@
 """Unit tests for HotMemoryCache in src/cache/hot_cache.py."""
 
 import json
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -29,15 +30,16 @@ class TestWarmCache:
 
         await cache.warm_cache(agent_id, user_id, memories)
 
-        # Verify ZSET exists
+        # Verify ZSET exists with the scores
         key = f"test:hot:{agent_id}:{user_id}"
-        members = await fake_redis.zrevrange(key, 0, -1)
-        assert len(members) == 2
+        members = await fake_redis.zrevrange(key, 0, -1, withscores=True)
+        assert [score for _, score in members] == [0.9, 0.8]
 
-        # Verify scores are correct
-        deserialized = [json.loads(m) for m in members]
-        assert deserialized[0]["final_score"] == 0.9
-        assert deserialized[1]["final_score"] == 0.8
+        # Payloads live in the side hash, without the score
+        payloads = await fake_redis.hmget(f"{key}:data", [f"p:{m}" for m, _ in members])
+        deserialized = [json.loads(p) for p in payloads]
+        assert deserialized[0] == {"memory": "User prefers dark mode"}
+        assert deserialized[1] == {"memory": "User lives in SF"}
 
     @pytest.mark.asyncio
     async def test_warm_cache_sets_ttl(
@@ -78,11 +80,11 @@ class TestWarmCache:
 
         # Verify only v2 data exists
         key = f"test:hot:{agent_id}:{user_id}"
-        members = await fake_redis.zrevrange(key, 0, -1)
-        assert len(members) == 2
-        deserialized = [json.loads(m) for m in members]
-        assert deserialized[0]["memory"] == "new data 1"
-        assert deserialized[1]["memory"] == "new data 2"
+        assert await fake_redis.zcard(key) == 2
+        assert await fake_redis.hlen(f"{key}:data") == 4  # payload + version per member
+        result = await cache.get_memories(agent_id, user_id)
+        assert result is not None
+        assert [m["memory"] for m in result] == ["new data 1", "new data 2"]
 
     @pytest.mark.asyncio
     async def test_warm_cache_empty_list_is_noop(
@@ -134,13 +136,13 @@ class TestWarmCache:
         key_1 = f"test:hot:{agent_id}:{user_id_1}"
         key_2 = f"test:hot:{agent_id}:{user_id_2}"
 
-        members_1 = await fake_redis.zrevrange(key_1, 0, -1)
-        members_2 = await fake_redis.zrevrange(key_2, 0, -1)
+        assert await fake_redis.zcard(key_1) == 1
+        assert await fake_redis.zcard(key_2) == 1
 
-        assert len(members_1) == 1
-        assert len(members_2) == 1
-        assert json.loads(members_1[0])["memory"] == "user1 data"
-        assert json.loads(members_2[0])["memory"] == "user2 data"
+        result_1 = await cache.get_memories(agent_id, user_id_1)
+        result_2 = await cache.get_memories(agent_id, user_id_2)
+        assert result_1 is not None and result_1[0]["memory"] == "user1 data"
+        assert result_2 is not None and result_2[0]["memory"] == "user2 data"
 
 
 class TestGetMemories:
@@ -276,6 +278,157 @@ class TestGetMemories:
         assert result[0]["metadata"] == {"key": "value"}
 
 
+def _scored(memory_id: str, score: float, content: str, version: int = 1) -> dict:
+    """Build a JSON-mode ScoredMemory-like dict."""
+    return {
+        "memory": {"id": memory_id, "content": content, "version": version},
+        "final_score": score,
+    }
+
+
+class TestIncrementalUpdates:
+    """Tests for id-keyed members and incremental hot cache updates."""
+
+    @pytest.mark.asyncio
+    async def test_members_are_memory_ids(
+        self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """ZSET members are memory ids, not serialized payloads."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id, memory_id = uuid4(), uuid4(), str(uuid4())
+
+        await cache.warm_cache(agent_id, user_id, [_scored(memory_id, 0.7, "a")])
+
+        assert await fake_redis.zrange(f"test:hot:{agent_id}:{user_id}", 0, -1) == [memory_id]
+
+    @pytest.mark.asyncio
+    async def test_warm_skips_unchanged_payloads_and_removes_stale(
+        self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """Re-warming rewrites only new versions and drops members not in the new set."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id = uuid4(), uuid4()
+        kept, changed, dropped = str(uuid4()), str(uuid4()), str(uuid4())
+        data_key = f"test:hot:{agent_id}:{user_id}:data"
+
+        await cache.warm_cache(
+            agent_id,
+            user_id,
+            [_scored(kept, 0.5, "kept"), _scored(changed, 0.4, "old"), _scored(dropped, 0.3, "x")],
+        )
+        # Marker proves the unchanged payload is not re-sent
+        await fake_redis.hset(data_key, f"p:{kept}", json.dumps({"memory": {"marker": True}}))
+
+        await cache.warm_cache(
+            agent_id,
+            user_id,
+            [_scored(kept, 0.9, "kept"), _scored(changed, 0.8, "new", version=2)],
+        )
+
+        result = await cache.get_memories(agent_id, user_id)
+        assert result is not None
+        assert result[0] == {"memory": {"marker": True}, "final_score": 0.9}
+        assert result[1]["memory"]["content"] == "new"
+        assert await fake_redis.hexists(data_key, f"p:{dropped}") == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_rewrites_payload_when_pin_changes(
+        self, redis_manager: RedisManager
+    ) -> None:
+        """Pinning (no version bump) still counts as a changed payload."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id, memory_id = uuid4(), uuid4(), str(uuid4())
+        pinned = _scored(memory_id, 0.6, "same")
+        pinned["memory"]["is_pinned"] = True
+
+        await cache.warm_cache(agent_id, user_id, [_scored(memory_id, 0.6, "same")])
+        await cache.warm_cache(agent_id, user_id, [pinned])
+
+        result = await cache.get_memories(agent_id, user_id)
+        assert result is not None
+        assert result[0]["memory"]["is_pinned"] is True
+
+    @pytest.mark.asyncio
+    async def test_upsert_memory_refreshes_cached_record(
+        self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """upsert_memory swaps in the new record, keeps signals and ignores uncached ids."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id, memory_id = uuid4(), uuid4(), str(uuid4())
+        cached = _scored(memory_id, 0.6, "before")
+        cached["signal_scores"] = {"semantic": 0.8}
+        await cache.warm_cache(agent_id, user_id, [cached])
+
+        record = {"id": memory_id, "content": "before", "version": 1, "is_pinned": True}
+        updated = await cache.upsert_memory(user_id, record)
+        ignored = await cache.upsert_memory(user_id, {"id": str(uuid4())})
+
+        assert updated == 1
+        assert ignored == 0
+        result = await cache.get_memories(agent_id, user_id)
+        assert result == [
+            {"memory": record, "signal_scores": {"semantic": 0.8}, "final_score": 0.6}
+        ]
+        # The version token follows the record, so the next warm sees no change
+        data_key = f"test:hot:{agent_id}:{user_id}:data"
+        assert await fake_redis.hget(data_key, f"v:{memory_id}") == "1:None:None:True:None"
+
+    @pytest.mark.asyncio
+    async def test_remove_memory(self, redis_manager: RedisManager) -> None:
+        """remove_memory drops one member and its payload."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id = uuid4(), uuid4()
+        kept, removed = str(uuid4()), str(uuid4())
+        await cache.warm_cache(
+            agent_id, user_id, [_scored(kept, 0.6, "kept"), _scored(removed, 0.7, "gone")]
+        )
+
+        await cache.remove_memory(user_id, removed)
+
+        result = await cache.get_memories(agent_id, user_id)
+        assert result is not None
+        assert [m["memory"]["content"] for m in result] == ["kept"]
+
+    @pytest.mark.asyncio
+    async def test_memory_changes_reach_every_agent_in_scope(
+        self, redis_manager: RedisManager
+    ) -> None:
+        """Another agent's hot set holding the memory is updated too; other scopes are not."""
+        cache = HotMemoryCache(redis_manager)
+        agent_x, agent_y, user_id, other_user = uuid4(), uuid4(), uuid4(), uuid4()
+        shared, removed = str(uuid4()), str(uuid4())
+        for agent_id in (agent_x, agent_y):
+            await cache.warm_cache(
+                agent_id, user_id, [_scored(shared, 0.6, "shared"), _scored(removed, 0.7, "gone")]
+            )
+        await cache.warm_cache(agent_x, other_user, [_scored(removed, 0.7, "gone")])
+
+        updated = await cache.upsert_memory(user_id, {"id": shared, "content": "edited"})
+        await cache.remove_memory(user_id, removed)
+
+        assert updated == 2
+        for agent_id in (agent_x, agent_y):
+            result = await cache.get_memories(agent_id, user_id)
+            assert result is not None
+            assert [m["memory"]["content"] for m in result] == ["edited"]
+        assert await cache.get_memories(agent_x, other_user) is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_clears_every_agent(self, redis_manager: RedisManager) -> None:
+        """invalidate_user drops all hot sets of the scope and nothing else."""
+        cache = HotMemoryCache(redis_manager)
+        agent_x, agent_y, user_id, other_user = uuid4(), uuid4(), uuid4(), uuid4()
+        for agent_id, user in ((agent_x, user_id), (agent_y, user_id), (agent_x, other_user)):
+            await cache.warm_cache(agent_id, user, [_scored(str(uuid4()), 0.5, "m")])
+
+        cleared = await cache.invalidate_user(user_id)
+
+        assert cleared == 2
+        assert await cache.get_memories(agent_x, user_id) is None
+        assert await cache.get_memories(agent_y, user_id) is None
+        assert await cache.get_memories(agent_x, other_user) is not None
+
+
 class TestInvalidate:
     """Tests for HotMemoryCache.invalidate."""
 
@@ -291,23 +444,23 @@ class TestInvalidate:
         memories = [{"memory": "test", "final_score": 0.7}]
         await cache.warm_cache(agent_id, user_id, memories)
 
-        # Verify key exists
+        # Verify keys exist
         key = f"test:hot:{agent_id}:{user_id}"
-        exists_before = await fake_redis.exists(key)
-        assert exists_before == 1
+        exists_before = await fake_redis.exists(key, f"{key}:data")
+        assert exists_before == 2
 
         # Invalidate
         await cache.invalidate(agent_id, user_id)
 
-        # Verify key is deleted
-        exists_after = await fake_redis.exists(key)
+        # Verify both keys are deleted
+        exists_after = await fake_redis.exists(key, f"{key}:data")
         assert exists_after == 0
 
     @pytest.mark.asyncio
     async def test_invalidate_with_none_user_id_clears_all_users(
         self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
     ) -> None:
-        """Test that invalidate with user_id=None clears all users for agent (uses SCAN pattern)."""
+        """Test that invalidate with user_id=None clears all users for agent via its key index."""
         cache = HotMemoryCache(redis_manager)
         agent_id = uuid4()
         user_id_1 = uuid4()
@@ -331,6 +484,69 @@ class TestInvalidate:
         assert await fake_redis.exists(key_2) == 0
         assert await fake_redis.exists(key_3) == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_uses_key_index_not_scan(
+        self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """Agent-wide invalidation reads the agent's key SET instead of scanning."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_id = uuid4(), uuid4()
+        await cache.warm_cache(agent_id, user_id, [{"memory": "m", "final_score": 0.5}])
+
+        index_key = f"test:hot:{agent_id}:keys"
+        assert await fake_redis.smembers(index_key) == {f"test:hot:{agent_id}:{user_id}"}
+
+        with patch.object(fake_redis, "scan", side_effect=AssertionError("SCAN used")):
+            await cache.invalidate(agent_id)
+
+        assert await fake_redis.exists(index_key) == 0
+        assert await cache.get_memories(agent_id, user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_single_user_invalidate_updates_index(
+        self, redis_manager: RedisManager, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """Clearing one user removes that key from the agent's index."""
+        cache = HotMemoryCache(redis_manager)
+        agent_id, user_1, user_2 = uuid4(), uuid4(), uuid4()
+        await cache.warm_cache(agent_id, user_1, [{"memory": "a", "final_score": 0.5}])
+        await cache.warm_cache(agent_id, user_2, [{"memory": "b", "final_score": 0.5}])
+
+        await cache.invalidate(agent_id, user_1)
+
+        assert await fake_redis.smembers(f"test:hot:{agent_id}:keys") == {
+            f"test:hot:{agent_id}:{user_2}"
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalidate_agents_clears_only_listed_agents(
+        self, redis_manager: RedisManager
+    ) -> None:
+        """Bulk invalidation clears every user of each listed agent only."""
+        cache = HotMemoryCache(redis_manager)
+        agent_1, agent_2, other = uuid4(), uuid4(), uuid4()
+        user_1, user_2 = uuid4(), uuid4()
+        for agent_id in (agent_1, agent_2, other):
+            for user_id in (user_1, user_2):
+                await cache.warm_cache(agent_id, user_id, [{"memory": "m", "final_score": 0.5}])
+
+        invalidated = await cache.invalidate_agents([agent_1, agent_2, agent_1])
+
+        assert invalidated == 2
+        for agent_id in (agent_1, agent_2):
+            for user_id in (user_1, user_2):
+                assert await cache.get_memories(agent_id, user_id) is None
+        assert await cache.get_memories(other, user_1) is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_agents_with_unavailable_redis_returns_zero(
+        self, unavailable_redis_manager: RedisManager
+    ) -> None:
+        """Bulk invalidation is a no-op without Redis."""
+        cache = HotMemoryCache(unavailable_redis_manager)
+
+        assert await cache.invalidate_agents([uuid4()]) == 0
+
     @pytest.mark.asyncio
     async def test_invalidate_with_unavailable_redis_returns_gracefully(
         self, unavailable_redis_manager: RedisManager
@@ -1,6 +1,7 @@
 """Integration tests for the Redis cache layer modules."""
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from src.cache.client import RedisManager
@@ -40,6 +41,27 @@ class TestRedisManagerIntegration:
         assert result["status"] == "ok"
         assert "latency_ms" in result
 
+    @pytest.mark.asyncio
+    async def test_binary_client_uses_same_url_and_options(self) -> None:
+        """get_binary_client builds a bytes-mode client from the manager's URL."""
+        manager = RedisManager(redis_url="redis://cache:6379/2", key_prefix="test:")
+        text_client, binary_client = MagicMock(), MagicMock()
+        text_client.ping = AsyncMock(return_value=True)
+
+        with patch(
+            "src.cache.client.aioredis.from_url", side_effect=[text_client, binary_client]
+        ) as mock_from_url:
+            assert await manager.get_binary_client() is binary_client
+            assert await manager.get_binary_client() is binary_client
+
+        (text_call, binary_call) = mock_from_url.call_args_list
+        assert binary_call.args == text_call.args == ("redis://cache:6379/2",)
+        assert text_call.kwargs["decode_responses"] is True
+        assert binary_call.kwargs["decode_responses"] is False
+        text_options = {k: v for k, v in text_call.kwargs.items() if k != "decode_responses"}
+        binary_options = {k: v for k, v in binary_call.kwargs.items() if k != "decode_responses"}
+        assert binary_options == text_options
+
 
 class TestHotMemoryCacheLifecycle:
     """Full lifecycle test for HotMemoryCache."""
@@ -123,7 +145,7 @@ class TestEmbeddingCacheLifecycle:
 
         # Hit
         result = await cache.get_embedding("hello world")
-        assert result == [0.1, 0.2, 0.3]
+        assert result == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
 
         # Miss for different text
         result_miss = await cache.get_embedding("goodbye world")
@@ -182,7 +204,8 @@ class TestCrossModuleIntegration:
         assert working_result["key"] == "value"
 
         embed_result = await embed.get_embedding("test text")
-        assert embed_result == [1.0, 2.0]
+        assert embed_result is not None
+        assert embed_result.tolist() == [1.0, 2.0]
 
         assert result.allowed is True
 
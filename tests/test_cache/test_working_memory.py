@@ -1,5 +1,7 @@
 """Unit tests for WorkingMemoryCache."""
 
+import json
+
 import pytest
 from uuid import uuid4
 
@@ -306,3 +308,99 @@ class TestWorkingMemoryCache:
         await cache.set_field(conversation_id, "summary", "Test summary")
         ttl_after = await fake_redis.ttl(key)
         assert ttl_after == 7200
+
+
+class TestWorkingMemoryTurnsList:
+    """Tests for list-backed turns and the legacy hash migration."""
+
+    @pytest.mark.asyncio
+    async def test_turns_are_stored_in_a_list(
+        self, redis_manager, fake_redis, key_prefix: str
+    ) -> None:
+        """Turns live in {prefix}working:{id}:turns, not in the hash."""
+        cache = WorkingMemoryCache(redis_manager)
+        conversation_id = uuid4()
+
+        await cache.append_turn(conversation_id, "user", "Hello!")
+
+        turns_key = f"{key_prefix}working:{conversation_id}:turns"
+        assert await fake_redis.type(turns_key) == "list"
+        assert await fake_redis.ttl(turns_key) == 7200
+        assert await fake_redis.hexists(f"{key_prefix}working:{conversation_id}", "turns") == 0
+
+    @pytest.mark.asyncio
+    async def test_get_turns_last_n(self, redis_manager) -> None:
+        """last_n returns only the most recent turns, oldest first."""
+        cache = WorkingMemoryCache(redis_manager)
+        conversation_id = uuid4()
+        for i in range(5):
+            await cache.append_turn(conversation_id, "user", f"turn {i}")
+
+        turns = await cache.get_turns(conversation_id, last_n=2)
+
+        assert [t["content"] for t in turns] == ["turn 3", "turn 4"]
+        assert await cache.get_turns(conversation_id, last_n=0) == []
+
+    @pytest.mark.asyncio
+    async def test_turns_are_capped(self, redis_manager) -> None:
+        """Appends beyond max_turns trim the oldest turns."""
+        cache = WorkingMemoryCache(redis_manager, max_turns=3)
+        conversation_id = uuid4()
+        for i in range(5):
+            await cache.append_turn(conversation_id, "user", f"turn {i}")
+
+        turns = await cache.get_turns(conversation_id)
+
+        assert [t["content"] for t in turns] == ["turn 2", "turn 3", "turn 4"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_turns_migrate_on_append(
+        self, redis_manager, fake_redis, key_prefix: str
+    ) -> None:
+        """Hash-backed turns move in front of newly appended turns."""
+        cache = WorkingMemoryCache(redis_manager)
+        conversation_id = uuid4()
+        key = f"{key_prefix}working:{conversation_id}"
+        legacy = [{"role": "user", "content": "old 1"}, {"role": "assistant", "content": "old 2"}]
+        await fake_redis.hset(key, "turns", json.dumps(legacy))
+
+        await cache.append_turn(conversation_id, "user", "new")
+
+        turns = await cache.get_turns(conversation_id)
+        assert [t["content"] for t in turns] == ["old 1", "old 2", "new"]
+        assert turns[1] == {"role": "assistant", "content": "old 2"}
+        assert await fake_redis.hexists(key, "turns") == 0
+
+    @pytest.mark.asyncio
+    async def test_legacy_turns_migrate_on_read(
+        self, redis_manager, fake_redis, key_prefix: str
+    ) -> None:
+        """Reading a hash-backed conversation migrates it first."""
+        cache = WorkingMemoryCache(redis_manager)
+        conversation_id = uuid4()
+        key = f"{key_prefix}working:{conversation_id}"
+        await fake_redis.hset(key, "turns", json.dumps([{"role": "user", "content": "old"}]))
+
+        assert await cache.get_turns(conversation_id) == [{"role": "user", "content": "old"}]
+        assert await fake_redis.hexists(key, "turns") == 0
+
+    @pytest.mark.asyncio
+    async def test_migrate_legacy_turns_bulk(
+        self, redis_manager, fake_redis, key_prefix: str
+    ) -> None:
+        """The one-time sweep migrates every hash-backed conversation once."""
+        cache = WorkingMemoryCache(redis_manager)
+        legacy_ids = [uuid4(), uuid4()]
+        for conversation_id in legacy_ids:
+            await fake_redis.hset(
+                f"{key_prefix}working:{conversation_id}",
+                "turns",
+                json.dumps([{"role": "user", "content": str(conversation_id)}]),
+            )
+        await cache.set_context(uuid4(), {"topic": "already migrated"})
+
+        assert await cache.migrate_legacy_turns() == 2
+        assert await cache.migrate_legacy_turns() == 0
+        for conversation_id in legacy_ids:
+            turns = await cache.get_turns(conversation_id)
+            assert turns == [{"role": "user", "content": str(conversation_id)}]
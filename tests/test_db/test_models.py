@@ -77,8 +77,11 @@ class TestTableRegistration:
         assert not missing, f"Missing tables: {missing}"
 
     def test_table_count(self, all_tables: set[str]) -> None:
-        """Exactly 23 tables should be registered (10 core + 4 auth + 7 collaboration + 2 platform)."""
-        assert len(all_tables) == 23
+        """Exactly 24 tables should be registered.
+
+        10 core + 4 auth + 7 collaboration + 2 platform + 1 vector index registry.
+        """
+        assert len(all_tables) == 24
 
 
 # ---------------------------------------------------------------------------
@@ -238,6 +241,8 @@ class TestMemoryColumns:
         "content",
         "subject",
         "embedding",
+        "token_count",
+        "token_encoding",
         "importance",
         "confidence",
         "access_count",
@@ -14,7 +14,12 @@ import pytest
 from src.db.base import Base
 from src.db.models.memory import MemoryORM, MemoryStatusEnum
 from src.db.repositories.base import BaseRepository
-from src.db.repositories.memory_repo import MemoryRepository
+from src.db.repositories.memory_repo import (
+    AnnSearchParams,
+    MemoryRepository,
+    MemoryRow,
+    TeamVectorIndexRegistry,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -206,3 +211,314 @@ class TestBaseRepositoryMockBehavior:
         assert result is False
         mock_session.delete.assert_not_awaited()
         mock_session.flush.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestMemoryRepositoryTouchMany:
+    """Test MemoryRepository.touch_many bulk access updates."""
+
+    @pytest.mark.asyncio
+    async def test_touch_many_issues_single_update(self) -> None:
+        """touch_many must execute exactly one UPDATE ... = ANY(...) statement."""
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(rowcount=3)
+        repo = MemoryRepository(session=mock_session)
+
+        updated = await repo.touch_many([uuid4(), uuid4(), uuid4()])
+
+        assert updated == 3
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.await_args.args[0])
+        assert sql.startswith("UPDATE memory")
+        assert "ANY" in sql
+        assert "access_count" in sql
+        assert "last_accessed_at" in sql
+
+    @pytest.mark.asyncio
+    async def test_touch_many_empty_list_skips_query(self) -> None:
+        """touch_many with no IDs must not hit the database."""
+        mock_session = AsyncMock()
+        repo = MemoryRepository(session=mock_session)
+
+        updated = await repo.touch_many([])
+
+        assert updated == 0
+        mock_session.execute.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestMemoryRepositorySearchScored:
+    """Test MemoryRepository.search_scored in-database scoring query."""
+
+    @pytest.mark.asyncio
+    async def test_search_scored_issues_single_cte_query(self) -> None:
+        """search_scored must score candidates in one statement without the embedding column."""
+        from sqlalchemy.dialects import postgresql
+
+        from src.models.agent_models import RetrievalWeights
+
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session)
+
+        await repo.search_scored(
+            embedding=[0.1] * 1536,
+            team_id=uuid4(),
+            weights=RetrievalWeights(),
+            agent_id=uuid4(),
+            conversation_id=uuid4(),
+            limit=10,
+        )
+
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH semantic_0 AS")
+        assert "semantic_1 AS" in sql
+        assert "recent AS" in sql
+        assert "ORDER BY final_score DESC" in sql
+        assert "memory.embedding AS" not in sql
+        assert "memory.metadata AS metadata_json" in sql
+
+    @pytest.mark.asyncio
+    async def test_search_scored_returns_signals_per_row(self) -> None:
+        """Each returned MemoryRow must be paired with its 5 signal scores."""
+        from src.models.agent_models import RetrievalWeights
+
+        memory_id = uuid4()
+        row = MagicMock(
+            signal_semantic=0.9,
+            signal_recency=0.5,
+            signal_importance=0.7,
+            signal_continuity=1.0,
+        )
+        row._mapping = {name: None for name in MemoryRow.__slots__} | {"id": memory_id}
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[row]))
+        repo = MemoryRepository(session=mock_session)
+
+        results = await repo.search_scored(
+            embedding=[0.1] * 1536, team_id=uuid4(), weights=RetrievalWeights()
+        )
+
+        assert len(results) == 1
+        memory_row, signals = results[0]
+        assert isinstance(memory_row, MemoryRow)
+        assert memory_row.id == memory_id
+        assert signals == {
+            "semantic": 0.9,
+            "recency": 0.5,
+            "importance": 0.7,
+            "continuity": 1.0,
+            "relationship": 0.0,
+        }
+
+
+@pytest.mark.unit
+class TestMemoryRepositorySearchByEmbeddings:
+    """Test MemoryRepository.search_by_embeddings batched vector query."""
+
+    @pytest.mark.asyncio
+    async def test_issues_single_lateral_query(self) -> None:
+        """All query vectors must be searched in one LATERAL statement."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session)
+
+        results = await repo.search_by_embeddings(
+            embeddings=[[0.1] * 1536, [0.2] * 1536, [0.3] * 1536], team_id=uuid4(), limit=5
+        )
+
+        assert results == [[], [], []]
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.count("UNION ALL") == 2
+        assert "CAST(%(param_2)s AS VECTOR(1536))" in sql
+        assert "JOIN LATERAL" in sql
+        assert "memory.embedding <=> queries.query_embedding" in sql
+
+    @pytest.mark.asyncio
+    async def test_groups_rows_by_query_index(self) -> None:
+        """Rows are returned per input vector, preserving input order."""
+        first, second = MagicMock(), MagicMock()
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(
+            all=MagicMock(return_value=[(1, first, 0.9), (1, second, 0.8)])
+        )
+        repo = MemoryRepository(session=mock_session)
+
+        results = await repo.search_by_embeddings(
+            embeddings=[[0.1] * 1536, [0.2] * 1536], team_id=uuid4()
+        )
+
+        assert results == [[], [(first, 0.9), (second, 0.8)]]
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_query(self) -> None:
+        """No query vectors means no database round trip."""
+        mock_session = AsyncMock()
+        repo = MemoryRepository(session=mock_session)
+
+        assert await repo.search_by_embeddings(embeddings=[], team_id=uuid4()) == []
+        mock_session.execute.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestMemoryRepositoryProjection:
+    """Test columnar projection queries returning MemoryRow."""
+
+    def test_memory_row_covers_all_columns_but_embedding(self) -> None:
+        """MemoryRow slots must match MemoryORM columns minus embedding."""
+        orm_keys = {prop.key for prop in MemoryORM.__mapper__.column_attrs}
+        assert set(MemoryRow.__slots__) == orm_keys - {"embedding"}
+
+    def test_memory_row_has_no_instance_dict(self) -> None:
+        """MemoryRow must be slot-based (no per-instance __dict__)."""
+        assert not hasattr(MemoryRow.__new__(MemoryRow), "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_get_rows_by_team_selects_explicit_columns(self) -> None:
+        """get_rows_by_team must not select the embedding column."""
+        row = MagicMock()
+        row._mapping = {name: None for name in MemoryRow.__slots__}
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[row]))
+        repo = MemoryRepository(session=mock_session)
+
+        rows = await repo.get_rows_by_team(team_id=uuid4())
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "memory.embedding" not in sql
+        assert "memory.content" in sql
+        assert len(rows) == 1
+        assert isinstance(rows[0], MemoryRow)
+
+    @pytest.mark.asyncio
+    async def test_search_rows_by_embedding_returns_rows_with_similarity(self) -> None:
+        """search_rows_by_embedding must pair MemoryRows with similarity scores."""
+        memory_id = uuid4()
+        row = MagicMock(similarity=0.87)
+        row._mapping = {name: None for name in MemoryRow.__slots__} | {"id": memory_id}
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[row]))
+        repo = MemoryRepository(session=mock_session)
+
+        results = await repo.search_rows_by_embedding(embedding=[0.1] * 1536, team_id=uuid4())
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "memory.embedding AS" not in sql
+        assert "ORDER BY memory.embedding <=>" in sql
+        assert results[0][0].id == memory_id
+        assert results[0][1] == 0.87
+
+
+@pytest.mark.unit
+class TestMemoryRepositoryAnnParams:
+    """Test per-query HNSW/IVFFlat recall tuning."""
+
+    def test_default_params_are_noop(self) -> None:
+        """AnnSearchParams with no values should be treated as default."""
+        assert AnnSearchParams().is_default
+        assert not AnnSearchParams(ef_search=80).is_default
+
+    @pytest.mark.asyncio
+    async def test_search_sets_ef_search_transaction_local(self) -> None:
+        """Searches must SET LOCAL hnsw.ef_search before the vector query."""
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session, ann_params=AnnSearchParams(ef_search=80))
+
+        await repo.search_rows_by_embedding(embedding=[0.1] * 1536, team_id=uuid4())
+
+        assert mock_session.execute.await_count == 2
+        set_call = mock_session.execute.await_args_list[0]
+        assert "set_config('hnsw.ef_search', :ef_search, true)" in str(set_call.args[0])
+        assert "ivfflat.probes" not in str(set_call.args[0])
+        assert set_call.args[1] == {"ef_search": "80"}
+
+    @pytest.mark.asyncio
+    async def test_per_call_params_override_repository_default(self) -> None:
+        """ann_params passed to a search method take precedence."""
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session, ann_params=AnnSearchParams(ef_search=80))
+
+        await repo.search_by_embedding(
+            embedding=[0.1] * 1536,
+            team_id=uuid4(),
+            ann_params=AnnSearchParams(probes=12),
+        )
+
+        set_call = mock_session.execute.await_args_list[0]
+        assert set_call.args[1] == {"probes": "12"}
+
+    @pytest.mark.asyncio
+    async def test_no_params_skips_set_config(self) -> None:
+        """Without ANN params only the search statement is executed."""
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session)
+
+        await repo.search_rows_by_embedding(embedding=[0.1] * 1536, team_id=uuid4())
+
+        mock_session.execute.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestMemoryRepositoryTeamIndexRouting:
+    """Test routing of vector searches to per-team partial indexes."""
+
+    @staticmethod
+    def _registry(team_ids: list) -> TeamVectorIndexRegistry:
+        """Registry preloaded with the given team IDs."""
+        registry = TeamVectorIndexRegistry()
+        registry._team_ids = frozenset(team_ids)
+        registry._loaded_at = float("inf")
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_indexed_team_id_is_inlined(self) -> None:
+        """Teams with a partial index get team_id as a SQL literal."""
+        team_id = uuid4()
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session, team_indexes=self._registry([team_id]))
+
+        await repo.search_rows_by_embedding(embedding=[0.1] * 1536, team_id=team_id)
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert f"memory.team_id = '{team_id}'::uuid" in sql
+
+    @pytest.mark.asyncio
+    async def test_other_teams_use_bound_parameter(self) -> None:
+        """Teams without a partial index keep a bound team_id parameter."""
+        team_id = uuid4()
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repo = MemoryRepository(session=mock_session, team_indexes=self._registry([uuid4()]))
+
+        await repo.search_rows_by_embedding(embedding=[0.1] * 1536, team_id=team_id)
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "memory.team_id = :team_id_1" in sql
+        assert str(team_id) not in sql
+
+    @pytest.mark.asyncio
+    async def test_registry_reloads_when_stale(self) -> None:
+        """A never-loaded registry queries memory_vector_index once."""
+        team_id = uuid4()
+        mock_session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [team_id]
+        mock_session.execute.return_value = result
+        registry = TeamVectorIndexRegistry(ttl_seconds=60)
+
+        assert await registry.has_dedicated_index(mock_session, team_id)
+        assert not await registry.has_dedicated_index(mock_session, uuid4())
+        mock_session.execute.assert_awaited_once()
+        assert "memory_vector_index" in str(mock_session.execute.await_args.args[0])
+
+        registry.invalidate()
+        await registry.has_dedicated_index(mock_session, team_id)
+        assert mock_session.execute.await_count == 2
@@ -0,0 +1,67 @@
+"""Tests for the HNSW memory embedding index migration structure."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+
+_MODULE = "src.db.migrations.versions.007_memory_hnsw_index"
+
+
+def _get_migration_source() -> str:
+    """Import migration 007 and return its source code."""
+    migration = importlib.import_module(_MODULE)
+    return inspect.getsource(migration)
+
+
+class TestMigration007RevisionChain:
+    """Tests for migration 007 revision identifiers."""
+
+    def test_revision_is_007(self) -> None:
+        """Test migration has correct revision ID."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.revision == "007"
+
+    def test_down_revision_is_006(self) -> None:
+        """Test migration chains from 006."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.down_revision == "006"
+
+
+class TestMigration007Upgrade:
+    """Tests for migration 007 upgrade() content."""
+
+    def test_builds_hnsw_cosine_index(self) -> None:
+        """Test upgrade creates an HNSW index with cosine ops."""
+        source = _get_migration_source()
+        assert "USING hnsw (embedding vector_cosine_ops)" in source
+        assert "ef_construction" in source
+
+    def test_builds_concurrently_outside_transaction(self) -> None:
+        """Test index swap uses CONCURRENTLY inside an autocommit block."""
+        source = _get_migration_source()
+        assert "autocommit_block()" in source
+        assert "CREATE INDEX CONCURRENTLY" in source
+        assert "DROP INDEX CONCURRENTLY IF EXISTS idx_memory_embedding" in source
+
+    def test_keeps_index_name(self) -> None:
+        """Test the new index is renamed to idx_memory_embedding."""
+        source = _get_migration_source()
+        assert "RENAME TO idx_memory_embedding" in source
+
+    def test_records_row_count_comment(self) -> None:
+        """Test upgrade stores the rows= baseline read by index maintenance."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.upgrade)
+        assert "COMMENT ON INDEX idx_memory_embedding" in source
+        assert "'rows=' ||" in source
+
+
+class TestMigration007Downgrade:
+    """Tests for migration 007 downgrade() content."""
+
+    def test_restores_ivfflat(self) -> None:
+        """Test downgrade restores the IVFFlat index."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.downgrade)
+        assert "USING ivfflat (embedding vector_cosine_ops)" in source
@@ -0,0 +1,41 @@
+"""Tests for the per-team memory vector index registry migration structure."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+
+_MODULE = "src.db.migrations.versions.008_memory_vector_index_registry"
+
+
+class TestMigration008RevisionChain:
+    """Tests for migration 008 revision identifiers."""
+
+    def test_revision_is_008(self) -> None:
+        """Test migration has correct revision ID."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.revision == "008"
+
+    def test_down_revision_is_007(self) -> None:
+        """Test migration chains from 007."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.down_revision == "007"
+
+
+class TestMigration008Content:
+    """Tests for migration 008 upgrade() and downgrade() content."""
+
+    def test_creates_registry_table(self) -> None:
+        """Test upgrade creates memory_vector_index keyed by team."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.upgrade)
+        assert '"memory_vector_index"' in source
+        assert "team.id" in source
+        assert "index_name" in source
+
+    def test_downgrade_drops_partial_indexes(self) -> None:
+        """Test downgrade drops registered indexes before the table."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.downgrade)
+        assert "DROP INDEX IF EXISTS" in source
+        assert source.index("DROP INDEX") < source.index("drop_table")
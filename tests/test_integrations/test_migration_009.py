@@ -0,0 +1,41 @@
+"""Tests for the memory token count migration structure."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+
+_MODULE = "src.db.migrations.versions.009_memory_token_count"
+
+
+class TestMigration009RevisionChain:
+    """Tests for migration 009 revision identifiers."""
+
+    def test_revision_is_009(self) -> None:
+        """Test migration has correct revision ID."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.revision == "009"
+
+    def test_down_revision_is_008(self) -> None:
+        """Test migration chains from 008."""
+        migration = importlib.import_module(_MODULE)
+        assert migration.down_revision == "008"
+
+
+class TestMigration009Content:
+    """Tests for migration 009 upgrade() and downgrade() content."""
+
+    def test_adds_nullable_token_columns(self) -> None:
+        """Test upgrade adds nullable token_count and token_encoding to memory."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.upgrade)
+        assert '"token_count"' in source
+        assert '"token_encoding"' in source
+        assert source.count("nullable=True") == 2
+
+    def test_downgrade_drops_token_columns(self) -> None:
+        """Test downgrade removes both columns."""
+        migration = importlib.import_module(_MODULE)
+        source = inspect.getsource(migration.downgrade)
+        assert 'drop_column("memory", "token_count")' in source
+        assert 'drop_column("memory", "token_encoding")' in source
@@ -0,0 +1,100 @@
+"""Unit tests for the write-behind AccessTracker in src/memory/access_tracker.py."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.memory.access_tracker import AccessTracker
+
+
+def _make_session_factory() -> tuple[MagicMock, AsyncMock]:
+    """Build a session factory mock whose sessions support ``async with``.
+
+    Returns:
+        Tuple of (factory, session) mocks.
+    """
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    factory = MagicMock(return_value=session)
+    return factory, session
+
+
+class TestAccessTracker:
+    """Tests for buffering and flushing memory access touches."""
+
+    @pytest.mark.unit
+    async def test_record_buffers_without_db_call(self) -> None:
+        """record() only buffers IDs; no session is opened."""
+        factory, _ = _make_session_factory()
+        tracker = AccessTracker(session_factory=factory)
+
+        tracker.record([uuid4(), uuid4()])
+
+        assert tracker.pending_count == 2
+        factory.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_flush_groups_by_increment(self) -> None:
+        """flush() issues one bulk touch per distinct access count and commits."""
+        factory, session = _make_session_factory()
+        tracker = AccessTracker(session_factory=factory)
+        id_a, id_b, id_c = uuid4(), uuid4(), uuid4()
+
+        tracker.record([id_a, id_b])
+        tracker.record([id_a, id_c])
+
+        with patch(
+            "src.memory.access_tracker.MemoryRepository.touch_many",
+            new_callable=AsyncMock,
+            side_effect=lambda ids, increment, accessed_at: len(ids),
+        ) as mock_touch:
+            updated = await tracker.flush()
+
+        assert updated == 3
+        assert mock_touch.await_count == 2
+        calls = {c.kwargs["increment"]: set(c.args[0]) for c in mock_touch.await_args_list}
+        assert calls == {2: {id_a}, 1: {id_b, id_c}}
+        session.commit.assert_awaited_once()
+        assert tracker.pending_count == 0
+
+    @pytest.mark.unit
+    async def test_flush_failure_requeues_pending(self) -> None:
+        """A failed flush keeps the touches buffered for the next attempt."""
+        factory, _ = _make_session_factory()
+        tracker = AccessTracker(session_factory=factory)
+        tracker.record([uuid4()])
+
+        with patch(
+            "src.memory.access_tracker.MemoryRepository.touch_many",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("db down"),
+        ):
+            updated = await tracker.flush()
+
+        assert updated == 0
+        assert tracker.pending_count == 1
+
+    @pytest.mark.unit
+    async def test_background_loop_flushes_and_stop_drains(self) -> None:
+        """start() flushes periodically and stop() drains the remaining buffer."""
+        factory, _ = _make_session_factory()
+        tracker = AccessTracker(session_factory=factory, flush_interval_ms=10)
+
+        with patch(
+            "src.memory.access_tracker.MemoryRepository.touch_many",
+            new_callable=AsyncMock,
+            return_value=1,
+        ) as mock_touch:
+            tracker.start()
+            tracker.record([uuid4()])
+            await asyncio.sleep(0.05)
+            assert mock_touch.await_count == 1
+
+            tracker.record([uuid4()])
+            await tracker.stop()
+
+        assert mock_touch.await_count == 2
+        assert tracker.pending_count == 0
@@ -469,6 +469,246 @@ class TestCheckOnStore:
         assert "importance=9" in result.reason
         assert "importance=3" in result.reason
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_precomputed_embedding_skips_embed_call(self) -> None:
+        """A caller-supplied embedding is used for the semantic search as-is."""
+        session = _mock_session_with_results([])
+        embedding_svc = _mock_embedding_service()
+        detector = _make_detector(session, embedding_svc)
+        embedding = [0.5] * 1536
+
+        new_memory = ExtractedMemory(
+            type=MemoryType.SEMANTIC,
+            content="User works remotely",
+            subject="user.context",
+            importance=5,
+        )
+
+        with patch.object(
+            detector._repo, "search_by_embedding", new_callable=AsyncMock, return_value=[]
+        ) as mock_search:
+            await detector.check_on_store(
+                new_memory=new_memory, team_id=uuid4(), embedding=embedding
+            )
+
+        embedding_svc.embed_text.assert_not_awaited()
+        assert mock_search.await_args.kwargs["embedding"] is embedding
+
+
+# ---------------------------------------------------------------------------
+# check_batch_on_store tests
+# ---------------------------------------------------------------------------
+
+
+class TestCheckBatchOnStore:
+    """Tests for ContradictionDetector.check_batch_on_store."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_one_subject_query_and_one_vector_query(self) -> None:
+        """All memories are resolved with a single subject and vector query."""
+        existing = _make_mock_memory_orm(
+            content="The sky is blue",
+            subject="sky.color",
+            importance=5,
+        )
+        session = _mock_session_with_results([existing])
+        embedding_svc = _mock_embedding_service()
+        detector = _make_detector(session, embedding_svc)
+
+        new_memories = [
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="The sky is red at sunset",
+                subject="Sky.Color",
+                importance=8,
+            ),
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="The sky is grey",
+                subject="sky.color",
+                importance=3,
+            ),
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="User likes tea",
+                subject="user.drink",
+                importance=5,
+            ),
+        ]
+
+        with patch.object(
+            detector._repo,
+            "search_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[], [], []],
+        ) as mock_search:
+            results = await detector.check_batch_on_store(
+                new_memories=new_memories,
+                team_id=uuid4(),
+                embeddings=[[0.1] * 1536, [0.2] * 1536, [0.3] * 1536],
+            )
+
+        assert session.execute.await_count == 1
+        mock_search.assert_awaited_once()
+        embedding_svc.embed_text.assert_not_awaited()
+        assert [r.action for r in results] == ["supersede", "dispute", "coexist"]
+        assert results[0].contradicts == [existing.id]
+        assert results[1].batch_contradicts == [0]
+        assert results[2].contradicts == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_conflicts_within_batch_are_resolved(self) -> None:
+        """Two new memories on one subject contradict each other, in batch order."""
+        session = _mock_session_with_results([])
+        detector = _make_detector(session, _mock_embedding_service())
+
+        new_memories = [
+            ExtractedMemory(
+                type=MemoryType.USER_PROFILE,
+                content="User lives in Berlin",
+                subject="user.city",
+                importance=5,
+            ),
+            ExtractedMemory(
+                type=MemoryType.USER_PROFILE,
+                content="User lives in Munich",
+                subject="User.City",
+                importance=8,
+            ),
+            ExtractedMemory(
+                type=MemoryType.USER_PROFILE,
+                content="User lives in Hamburg",
+                subject="user.city",
+                importance=2,
+            ),
+        ]
+
+        with patch.object(
+            detector._repo,
+            "search_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[], [], []],
+        ):
+            results = await detector.check_batch_on_store(
+                new_memories=new_memories,
+                team_id=uuid4(),
+                embeddings=[[0.1] * 1536, [0.2] * 1536, [0.3] * 1536],
+            )
+
+        assert session.execute.await_count == 1
+        assert [r.action for r in results] == ["coexist", "supersede", "dispute"]
+        assert results[0].batch_contradicts == []
+        assert results[1].batch_contradicts == [0]
+        assert results[2].batch_contradicts == [1, 0]
+        assert all(r.contradicts == [] for r in results)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_semantic_neighbours_flag_dispute(self) -> None:
+        """Per-memory semantic results use the same thresholds as check_on_store."""
+        similar = _make_mock_memory_orm(content="Team standup is at 9am", subject="other")
+        session = _mock_session_with_results([])
+        embedding_svc = _mock_embedding_service()
+        embedding_svc.embed_batch = AsyncMock(return_value=[[0.1] * 1536])
+        detector = _make_detector(session, embedding_svc)
+
+        new_memory = ExtractedMemory(
+            type=MemoryType.SEMANTIC,
+            content="Team standup is at 10am",
+            subject="team.standup",
+            importance=5,
+        )
+
+        with patch.object(
+            detector._repo,
+            "search_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[(similar, 0.8)]],
+        ):
+            results = await detector.check_batch_on_store(
+                new_memories=[new_memory], team_id=uuid4()
+            )
+
+        embedding_svc.embed_batch.assert_awaited_once_with(["Team standup is at 10am"])
+        assert results[0].action == "dispute"
+        assert results[0].contradicts == [similar.id]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_semantic_conflicts_within_batch_are_resolved(self) -> None:
+        """Similar new memories conflict even with different or missing subjects."""
+        session = _mock_session_with_results([])
+        detector = _make_detector(session, _mock_embedding_service())
+
+        new_memories = [
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="Deploys happen on Fridays",
+                subject=None,
+                importance=5,
+            ),
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="Deploys happen on Mondays",
+                subject="release.day",
+                importance=8,
+            ),
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="Deploys happen on Mondays",
+                subject="deploy.schedule",
+                importance=5,
+            ),
+            ExtractedMemory(
+                type=MemoryType.SEMANTIC,
+                content="User likes tea",
+                subject="user.drink",
+                importance=5,
+            ),
+        ]
+        embeddings = [[1.0, 0.0], [0.8, 0.6], [0.8, 0.6], [0.0, 1.0]]
+
+        with patch.object(
+            detector._repo,
+            "search_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[], [], []],
+        ):
+            results = await detector.check_batch_on_store(
+                new_memories=new_memories, team_id=uuid4(), embeddings=embeddings
+            )
+
+        assert [r.action for r in results] == ["coexist", "dispute", "dispute", "coexist"]
+        assert results[1].batch_contradicts == [0]
+        # Identical content to #1 is not a conflict; #0 still is
+        assert results[2].batch_contradicts == [0]
+        assert results[3].batch_contradicts == []
+        assert all(r.contradicts == [] for r in results)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_memories_without_subject_skip_queries(self) -> None:
+        """Subject-less memories coexist without touching the database."""
+        session = AsyncMock()
+        detector = _make_detector(session, _mock_embedding_service())
+
+        new_memory = ExtractedMemory(
+            type=MemoryType.SEMANTIC,
+            content="Some random fact",
+            subject=None,
+            importance=5,
+        )
+
+        results = await detector.check_batch_on_store(new_memories=[new_memory], team_id=uuid4())
+
+        assert len(results) == 1
+        assert results[0].action == "coexist"
+        assert "No subject" in results[0].reason
+        session.execute.assert_not_awaited()
+
 
 # ---------------------------------------------------------------------------
 # check_on_retrieve tests
@@ -4,6 +4,7 @@ import hashlib
 import math
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from src.memory.embedding import EmbeddingService, MAX_CACHE_SIZE
@@ -76,7 +77,9 @@ class TestEmbedText:
             result = await service.embed_text("hello world")
 
         assert len(result) == 1536
-        assert result == embedding_vec
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result == pytest.approx(embedding_vec)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -91,7 +94,7 @@ class TestEmbedText:
             result1 = await service.embed_text("hello")
             result2 = await service.embed_text("hello")
 
-        assert result1 == result2
+        assert result1 is result2
         # Only 1 API call should have been made
         assert mock_client.post.await_count == 1
 
@@ -113,7 +116,7 @@ class TestEmbedText:
             service = EmbeddingService(api_key="test-key")
             result = await service.embed_text("hello")
 
-        assert result == embedding_vec
+        assert result == pytest.approx(embedding_vec)
         mock_sleep.assert_awaited_once()
 
     @pytest.mark.unit
@@ -240,6 +243,177 @@ class TestEmbedBatch:
             result = await service.embed_batch(["hello", "world"])
 
         assert len(result) == 2
-        assert result[0] == embedding_a  # from cache
-        assert result[1] == embedding_b  # from API
+        assert result[0] == pytest.approx(embedding_a)  # from cache
+        assert result[1] == pytest.approx(embedding_b)  # from API
         assert mock_client_batch.post.await_count == 1
+
+
+class TestEmbedBatchRedisTier:
+    """Tests for embed_batch's bulk L2 Redis lookups and writes."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_mget_and_one_pipelined_store(self) -> None:
+        """Test that L2 hits come from get_embeddings and misses are stored in bulk."""
+        redis_cache = MagicMock()
+        redis_cache.get_embeddings = AsyncMock(
+            return_value=[np.full(4, 0.9, dtype=np.float32), None]
+        )
+        redis_cache.store_embeddings = AsyncMock()
+        redis_cache.get_embedding = AsyncMock()
+        redis_cache.store_embedding = AsyncMock()
+        mock_client = _build_mock_client(_make_success_response([[0.1] * 4]))
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(api_key="test-key", dimensions=4, redis_cache=redis_cache)
+            result = await service.embed_batch(["cached", "fresh"])
+
+        np.testing.assert_allclose(np.vstack(result), [[0.9] * 4, [0.1] * 4], rtol=1e-6)
+        redis_cache.get_embeddings.assert_awaited_once_with(["cached", "fresh"])
+        redis_cache.store_embeddings.assert_awaited_once()
+        ((stored_text, stored_embedding),) = redis_cache.store_embeddings.await_args.args[0]
+        assert stored_text == "fresh"
+        assert stored_embedding == pytest.approx([0.1] * 4)
+        redis_cache.get_embedding.assert_not_awaited()
+        redis_cache.store_embedding.assert_not_awaited()
+        assert mock_client.post.await_args.kwargs["json"]["input"] == ["fresh"]
+
+
+class TestSharedService:
+    """Tests for coalescing and HTTP client reuse in a long-lived service."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_texts_share_one_api_call(self) -> None:
+        """Test that concurrent embed_text calls for the same text coalesce."""
+        import asyncio
+
+        embedding_vec = [0.3] * 1536
+        release = asyncio.Event()
+
+        async def slow_post(*args: object, **kwargs: object) -> MagicMock:
+            await release.wait()
+            return _make_success_response([embedding_vec])
+
+        mock_client = _build_mock_client(_make_success_response([embedding_vec]))
+        mock_client.post = AsyncMock(side_effect=slow_post)
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(api_key="test-key")
+            tasks = [asyncio.create_task(service.embed_text("Same query")) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert all(result is results[0] for result in results)
+        assert results[0] == pytest.approx(embedding_vec)
+        assert mock_client.post.await_count == 1
+        assert service._inflight == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_propagates_to_all_waiters(self) -> None:
+        """Test that a failed shared lookup raises for every waiter and is not cached."""
+        import asyncio
+
+        mock_client = _build_mock_client(_make_error_response(500))
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(api_key="test-key")
+            results = await asyncio.gather(
+                service.embed_text("boom"),
+                service.embed_text("boom"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert mock_client.post.await_count == 1
+        assert service._inflight == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_shared_http_client_is_reused(self) -> None:
+        """Test that a provided http_client is used directly and not closed."""
+        mock_client = _build_mock_client(
+            [_make_success_response([[0.1] * 1536]), _make_success_response([[0.2] * 1536])]
+        )
+
+        with patch("src.memory.embedding.httpx.AsyncClient") as client_cls:
+            service = EmbeddingService(api_key="test-key", http_client=mock_client)
+            await service.embed_text("first")
+            await service.embed_text("second")
+
+        client_cls.assert_not_called()
+        assert mock_client.post.await_count == 2
+        mock_client.__aexit__.assert_not_called()
+
+
+class TestMicroBatching:
+    """Tests for micro-batching of concurrent embed_text API calls."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_distinct_texts_share_one_batch_call(self) -> None:
+        """Test that texts arriving within the window go out as one API call."""
+        import asyncio
+
+        response = _make_success_response([[0.1] * 4, [0.2] * 4, [0.3] * 4])
+        mock_client = _build_mock_client(response)
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(api_key="test-key", dimensions=4, batch_window_ms=20)
+            results = await asyncio.gather(
+                service.embed_text("alpha"),
+                service.embed_text("beta"),
+                service.embed_text("gamma"),
+            )
+
+        np.testing.assert_allclose(np.vstack(results), [[0.1] * 4, [0.2] * 4, [0.3] * 4], rtol=1e-6)
+        assert mock_client.post.await_count == 1
+        sent = mock_client.post.await_args.kwargs["json"]["input"]
+        assert sent == ["alpha", "beta", "gamma"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self) -> None:
+        """Test that reaching max_batch_size sends without waiting for the window."""
+        import asyncio
+
+        mock_client = _build_mock_client(
+            [
+                _make_success_response([[0.1] * 4, [0.2] * 4]),
+                _make_success_response([[0.3] * 4]),
+            ]
+        )
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(
+                api_key="test-key", dimensions=4, batch_window_ms=10, max_batch_size=2
+            )
+            results = await asyncio.gather(
+                service.embed_text("one"),
+                service.embed_text("two"),
+                service.embed_text("three"),
+            )
+
+        np.testing.assert_allclose(np.vstack(results), [[0.1] * 4, [0.2] * 4, [0.3] * 4], rtol=1e-6)
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_failure_raises_for_every_caller(self) -> None:
+        """Test that a failed batch call propagates to all waiting callers."""
+        import asyncio
+
+        mock_client = _build_mock_client(_make_error_response(500))
+
+        with patch("src.memory.embedding.httpx.AsyncClient", return_value=mock_client):
+            service = EmbeddingService(api_key="test-key", batch_window_ms=5)
+            results = await asyncio.gather(
+                service.embed_text("x"),
+                service.embed_text("y"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert mock_client.post.await_count == 1
@@ -196,3 +196,105 @@ class TestMemoryPipelineIntegration:
         dna = sample_agent_dna()
         agent = create_skill_agent(agent_dna=dna)
         assert agent is not get_skill_agent()
+
+    @pytest.mark.unit
+    def test_create_skill_agent_reuses_cached_instance(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """The same unchanged DNA returns the same Agent instance."""
+        from src.agent import create_skill_agent
+
+        dna = sample_agent_dna()
+        assert create_skill_agent(agent_dna=dna) is create_skill_agent(agent_dna=dna.model_copy())
+
+    @pytest.mark.unit
+    def test_edited_dna_builds_new_agent(self, sample_agent_dna: Callable[..., AgentDNA]) -> None:
+        """Any DNA change produces a different cache key."""
+        from src.agent import create_skill_agent
+
+        dna = sample_agent_dna()
+        first = create_skill_agent(agent_dna=dna)
+        edited = dna.model_copy(update={"tagline": "Now with a new tagline"})
+
+        assert create_skill_agent(agent_dna=edited) is not first
+
+    @pytest.mark.unit
+    def test_invalidate_agent_cache(self, sample_agent_dna: Callable[..., AgentDNA]) -> None:
+        """invalidate_agent_cache drops every cached instance for the agent."""
+        from src.agent import create_skill_agent, invalidate_agent_cache
+
+        dna = sample_agent_dna()
+        first = create_skill_agent(agent_dna=dna)
+
+        assert invalidate_agent_cache(dna.id) == 1
+        assert invalidate_agent_cache(dna.id) == 0
+        assert create_skill_agent(agent_dna=dna) is not first
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_memory_prompt_reuses_turn_retrieval(
+        self,
+        sample_memory_record: Callable[..., MemoryRecord],
+        sample_agent_dna: Callable[..., AgentDNA],
+    ) -> None:
+        """The DNA agent's system prompt uses deps.retrieval_result, not a new retrieval."""
+        from src.agent import create_skill_agent
+
+        dna = sample_agent_dna()
+        memory = sample_memory_record(memory_type=MemoryType.SEMANTIC, content="User owns a cat")
+        retriever = MagicMock()
+        retriever.retrieve = AsyncMock()
+        deps = AgentDependencies(
+            skill_loader=MagicMock(skills={}),
+            settings=MagicMock(),
+            memory_retriever=retriever,
+            prompt_builder=MemoryPromptBuilder(token_budget=4000),
+            retrieval_result=RetrievalResult(
+                memories=[ScoredMemory(memory=memory, final_score=0.9)],
+                stats=RetrievalStats(signals_hit=1, total_ms=1.0, query_tokens=3),
+            ),
+        )
+
+        agent = create_skill_agent(agent_dna=dna)
+        prompt_fn = agent._system_prompt_functions[1].function
+        prompt = await prompt_fn(MagicMock(deps=deps))
+
+        assert "User owns a cat" in prompt
+        retriever.retrieve.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stable_prefix_is_sent_before_memory_context(
+        self,
+        sample_memory_record: Callable[..., MemoryRecord],
+        sample_agent_dna: Callable[..., AgentDNA],
+    ) -> None:
+        """The DNA agent sends the stable prefix (with breakpoint) ahead of memories."""
+        from src.agent import create_skill_agent
+
+        dna = sample_agent_dna()
+        memory = sample_memory_record(memory_type=MemoryType.SEMANTIC, content="User owns a cat")
+        builder = MemoryPromptBuilder(
+            token_budget=4000, cache_breakpoint=lambda prefix: prefix + "\n<cache>"
+        )
+        deps = AgentDependencies(
+            skill_loader=MagicMock(skills={}),
+            settings=MagicMock(),
+            prompt_builder=builder,
+            retrieval_result=RetrievalResult(
+                memories=[ScoredMemory(memory=memory, final_score=0.9)],
+                stats=RetrievalStats(signals_hit=1, total_ms=1.0, query_tokens=3),
+            ),
+        )
+
+        agent = create_skill_agent(agent_dna=dna)
+        ctx = MagicMock(deps=deps)
+        stable_fn, memory_fn = (runner.function for runner in agent._system_prompt_functions)
+        stable = await stable_fn(ctx)
+        volatile = await memory_fn(ctx)
+
+        assert stable == builder.build_stable_prefix(dna, "")
+        assert stable.endswith("<cache>")
+        assert "User owns a cat" not in stable
+        assert "User owns a cat" in volatile
+        assert "<cache>" not in volatile
@@ -1,12 +1,20 @@
 """Unit tests for MemoryPromptBuilder (src/memory/prompt_builder.py)."""
 
 import math
+from datetime import timedelta
 from typing import Callable
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
-from src.memory.prompt_builder import MemoryPromptBuilder, _format_voice_examples
+from src.memory.prompt_builder import (
+    MemoryPromptBuilder,
+    _format_voice_examples,
+    _static_layer_cache,
+    invalidate_static_layers,
+)
+from src.memory.tokenizer import HeuristicTokenizer, TokenCounter
 from src.memory.types import Contradiction, RetrievalResult, RetrievalStats, ScoredMemory
 from src.models.agent_models import AgentDNA, VoiceExample
 from src.models.memory_models import MemoryRecord, MemoryType
@@ -23,13 +31,13 @@ class TestEstimateTokens:
     @pytest.mark.unit
     def test_empty_string_returns_zero(self) -> None:
         """Test that estimating tokens for empty string returns 0."""
-        builder = MemoryPromptBuilder()
+        builder = MemoryPromptBuilder(token_counter=TokenCounter(HeuristicTokenizer()))
         assert builder.estimate_tokens("") == 0
 
     @pytest.mark.unit
     def test_short_text_estimate(self) -> None:
         """Test token estimation for short text."""
-        builder = MemoryPromptBuilder()
+        builder = MemoryPromptBuilder(token_counter=TokenCounter(HeuristicTokenizer()))
         text = "hello"
         expected = math.ceil(len(text) / 3.5)  # ceil(5 / 3.5) = ceil(1.43) = 2
         assert builder.estimate_tokens(text) == expected
@@ -38,7 +46,7 @@ class TestEstimateTokens:
     @pytest.mark.unit
     def test_long_text_estimate(self) -> None:
         """Test token estimation for long text (1000 chars)."""
-        builder = MemoryPromptBuilder()
+        builder = MemoryPromptBuilder(token_counter=TokenCounter(HeuristicTokenizer()))
         text = "x" * 1000
         expected = math.ceil(1000 / 3.5)  # ceil(285.71) = 286
         assert builder.estimate_tokens(text) == expected
@@ -422,6 +430,192 @@ class TestTrimming:
         assert "Discussed weather forecasting." in prompt  # L7
 
 
+# ---------------------------------------------------------------------------
+# TestStaticLayerCache
+# ---------------------------------------------------------------------------
+
+
+class TestStaticLayerCache:
+    """Tests for per-agent memoization of the identity layer."""
+
+    @pytest.mark.unit
+    def test_identity_layer_built_once_per_dna_version(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """Repeated builds for the same agent reuse the identity layer."""
+        builder = MemoryPromptBuilder(token_budget=10000)
+        agent = sample_agent_dna(name="CacheBot")
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+
+        with patch.object(
+            builder, "_build_identity_layer", wraps=builder._build_identity_layer
+        ) as spy:
+            first = builder.build(agent, "", result, "first turn")
+            second = builder.build(agent, "", result, "second turn")
+
+        assert spy.call_count == 1
+        assert "CacheBot" in first and "CacheBot" in second
+        assert "second turn" in second
+
+    @pytest.mark.unit
+    def test_new_dna_version_rebuilds_identity_layer(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """An edited agent (new updated_at) gets a fresh identity layer."""
+        builder = MemoryPromptBuilder(token_budget=10000)
+        agent = sample_agent_dna(name="Before")
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+        builder.build(agent, "", result, "")
+
+        edited = agent.model_copy(
+            update={"name": "After", "updated_at": agent.updated_at + timedelta(seconds=1)}
+        )
+        prompt = builder.build(edited, "", result, "")
+
+        assert "After" in prompt
+        assert "Before" not in prompt
+        assert [key[1] for key in _static_layer_cache if key[0] == agent.id] == [edited.updated_at]
+
+    @pytest.mark.unit
+    def test_identity_layer_is_shared_across_builders(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """A builder created for a later request reuses the memoized layer."""
+        agent = sample_agent_dna()
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+        MemoryPromptBuilder(token_budget=10000).build(agent, "", result, "")
+
+        builder = MemoryPromptBuilder(token_budget=10000)
+        with patch.object(
+            builder, "_build_identity_layer", wraps=builder._build_identity_layer
+        ) as spy:
+            builder.build(agent, "", result, "")
+
+        assert spy.call_count == 0
+
+    @pytest.mark.unit
+    def test_invalidate_static_layers_forces_rebuild(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """invalidate_static_layers drops the memoized layer for that agent only."""
+        builder = MemoryPromptBuilder(token_budget=10000)
+        agent = sample_agent_dna()
+        other = sample_agent_dna()
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+        builder.build(agent, "", result, "")
+        builder.build(other, "", result, "")
+
+        assert invalidate_static_layers(agent.id) == 1
+        assert invalidate_static_layers(agent.id) == 0
+
+        cached_agents = {key[0] for key in _static_layer_cache}
+        assert agent.id not in cached_agents
+        assert other.id in cached_agents
+
+
+# ---------------------------------------------------------------------------
+# TestStablePrefix
+# ---------------------------------------------------------------------------
+
+
+class TestStablePrefix:
+    """Tests for the cache-friendly stable prefix / volatile context split."""
+
+    @pytest.mark.unit
+    def test_prefix_is_identical_across_turns(
+        self,
+        sample_agent_dna: Callable[..., AgentDNA],
+        sample_memory_record: Callable[..., MemoryRecord],
+    ) -> None:
+        """Different memories and summaries leave the prefix byte-identical."""
+        builder = MemoryPromptBuilder(token_budget=10000)
+        agent = sample_agent_dna(name="PrefixBot")
+        stats = RetrievalStats(signals_hit=1, total_ms=1.0, query_tokens=1)
+        first = builder.build_parts(
+            agent,
+            "## Skills\n- weather",
+            RetrievalResult(
+                memories=[
+                    ScoredMemory(
+                        memory=sample_memory_record(
+                            memory_type=MemoryType.IDENTITY, content="I like tea."
+                        ),
+                        final_score=0.9,
+                    )
+                ],
+                stats=stats,
+            ),
+            "turn one",
+        )
+        second = builder.build_parts(
+            agent, "## Skills\n- weather", RetrievalResult(stats=stats), "turn two"
+        )
+
+        assert first.stable_prefix == second.stable_prefix
+        assert "PrefixBot" in first.stable_prefix
+        assert "## Skills" in first.stable_prefix
+        assert "I like tea." in first.volatile_context
+        assert "I like tea." not in first.stable_prefix
+        assert "turn two" in second.volatile_context
+
+    @pytest.mark.unit
+    def test_build_emits_prefix_before_memories(
+        self,
+        sample_agent_dna: Callable[..., AgentDNA],
+        sample_memory_record: Callable[..., MemoryRecord],
+    ) -> None:
+        """build() is the rendered parts, with skills ahead of identity memories."""
+        builder = MemoryPromptBuilder(token_budget=10000)
+        agent = sample_agent_dna()
+        identity = ScoredMemory(
+            memory=sample_memory_record(memory_type=MemoryType.IDENTITY, content="I am Bot."),
+            final_score=0.9,
+        )
+        result = RetrievalResult(
+            memories=[identity],
+            stats=RetrievalStats(signals_hit=1, total_ms=1.0, query_tokens=1),
+        )
+
+        prompt = builder.build(agent, "## Skills\n- weather", result, "")
+
+        assert prompt == builder.build_parts(agent, "## Skills\n- weather", result, "").render()
+        assert prompt.index("## Skills") < prompt.index("I am Bot.")
+
+    @pytest.mark.unit
+    def test_cache_breakpoint_hook_marks_prefix(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """The hook is applied to the stable prefix only."""
+        builder = MemoryPromptBuilder(
+            token_budget=10000, cache_breakpoint=lambda prefix: prefix + "\n<cache>"
+        )
+        agent = sample_agent_dna()
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+
+        parts = builder.build_parts(agent, "## Skills", result, "summary")
+
+        assert parts.stable_prefix.endswith("<cache>")
+        assert parts.stable_prefix == builder.build_stable_prefix(agent, "## Skills")
+        assert "<cache>" not in parts.volatile_context
+        assert parts.render().index("<cache>") < parts.render().index("summary")
+
+    @pytest.mark.unit
+    def test_trimming_only_affects_volatile_context(
+        self, sample_agent_dna: Callable[..., AgentDNA]
+    ) -> None:
+        """A tight budget sheds volatile layers but keeps the full prefix."""
+        builder = MemoryPromptBuilder(token_budget=1)
+        agent = sample_agent_dna(name="TightBot")
+        result = RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+
+        parts = builder.build_parts(agent, "## Skills", result, "x" * 500)
+
+        assert "TightBot" in parts.stable_prefix
+        assert parts.volatile_context == ""
+        assert parts.volatile_tokens == 0
+        assert parts.stable_tokens > 0
+
+
 # ---------------------------------------------------------------------------
 # TestFormatVoiceExamples
 # ---------------------------------------------------------------------------
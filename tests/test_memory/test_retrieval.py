@@ -1,5 +1,6 @@
 """Unit tests for the 5-signal MemoryRetriever pipeline in src/memory/retrieval.py."""
 
+import asyncio
 import math
 import time
 from datetime import datetime, timedelta, timezone
@@ -8,6 +9,8 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from src.memory.access_tracker import configure_access_tracker
+from src.memory.retrieval_cache import invalidate_memory_scope
 from src.memory.retrieval import (
     MemoryRetriever,
     _compute_continuity_score,
@@ -146,6 +149,8 @@ def _make_mock_orm(
     orm.content = content
     orm.subject = subject
     orm.embedding = [0.0] * 1536
+    orm.token_count = None
+    orm.token_encoding = None
     orm.importance = importance
     orm.confidence = 1.0
     orm.access_count = access_count
@@ -216,9 +221,11 @@ class TestSemanticSignal:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [
                 (orm_high, 0.95),
@@ -353,9 +360,11 @@ class TestRelationshipSignal:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [
                 (orm_target, 0.80),
@@ -450,9 +459,11 @@ class TestDeduplication:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [(orm_semantic, 0.85)]
             mock_get_team.return_value = [orm_recency]
@@ -492,9 +503,11 @@ class TestTokenBudget:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [
                 (orm_short, 0.90),
@@ -588,9 +601,11 @@ class TestIdentityAlwaysIncluded:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [(orm_identity, 0.10)]
             mock_get_team.return_value = []
@@ -612,9 +627,11 @@ class TestEmptyQuery:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = []
             mock_get_team.return_value = []
@@ -649,9 +666,11 @@ class TestCacheHit:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [(orm, 0.9)]
             mock_get_team.return_value = []
@@ -685,9 +704,11 @@ class TestCacheHit:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [(orm, 0.9)]
             mock_get_team.return_value = []
@@ -697,7 +718,7 @@ class TestCacheHit:
             first_count = mock_search.call_count
 
             # Manually expire the cache entry
-            for entry in retriever._cache.values():
+            for entry in retriever._cache._entries.values():
                 entry.created_at = time.monotonic() - 120  # 120s ago > 60s TTL
 
             # Second call -- cache expired, should trigger new DB call
@@ -706,6 +727,66 @@ class TestCacheHit:
 
         assert second_count > first_count
 
+    @pytest.mark.unit
+    async def test_other_agent_memory_change_invalidates_cached_result(self) -> None:
+        """Agent X's cached result is recomputed after agent Y's memory changes."""
+        retriever = _build_retriever()
+        team_id, agent_x, agent_y = uuid4(), uuid4(), uuid4()
+        # Team-wide searches surface agent Y's memory in agent X's result
+        orm = _make_mock_orm(content="agent y memory", team_id=team_id)
+        orm.agent_id = agent_y
+
+        with (
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
+            patch.object(retriever._repo, "touch_many", new_callable=AsyncMock),
+        ):
+            mock_search.return_value = [(orm, 0.9)]
+            mock_get_team.return_value = []
+
+            await retriever.retrieve(query="drinks", team_id=team_id, agent_id=agent_x)
+            first_count = mock_search.call_count
+
+            await invalidate_memory_scope(team_id, agent_y)
+            result = await retriever.retrieve(query="drinks", team_id=team_id, agent_id=agent_x)
+
+        assert mock_search.call_count > first_count
+        assert result.stats.cache_hit is False
+
+    @pytest.mark.unit
+    async def test_result_racing_an_invalidation_is_not_cached(self) -> None:
+        """A memory write landing mid-retrieval keeps the stale result out of L0."""
+        retriever = _build_retriever()
+        team_id = uuid4()
+        orm = _make_mock_orm(content="old memory set", team_id=team_id)
+
+        async def search_then_concurrent_write(**kwargs: object) -> list[tuple[MagicMock, float]]:
+            await invalidate_memory_scope(team_id)
+            return [(orm, 0.9)]
+
+        with (
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
+            patch.object(retriever._repo, "touch_many", new_callable=AsyncMock),
+        ):
+            mock_search.side_effect = search_then_concurrent_write
+            mock_get_team.return_value = []
+
+            await retriever.retrieve(query="racy", team_id=team_id)
+            first_count = mock_search.call_count
+            result = await retriever.retrieve(query="racy", team_id=team_id)
+
+        assert mock_search.call_count > first_count
+        assert result.stats.cache_hit is False
+
 
 # ===========================================================================
 # Integration-level pipeline tests
@@ -733,9 +814,11 @@ class TestFullPipeline:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [(orm, 0.85)]
             mock_get_team.return_value = []
@@ -790,9 +873,11 @@ class TestFullPipeline:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [
                 (orm_high, 0.95),
@@ -829,9 +914,11 @@ class TestFullPipeline:
 
         with (
             patch.object(
-                retriever._repo, "search_by_embedding", new_callable=AsyncMock
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
             ) as mock_search,
-            patch.object(retriever._repo, "get_by_team", new_callable=AsyncMock) as mock_get_team,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
         ):
             mock_search.return_value = [
                 (orm_a, 0.80),
@@ -845,3 +932,216 @@ class TestFullPipeline:
         # Check both IDs appear in the contradiction (order-independent)
         contradiction_id_sets = {frozenset({c.memory_a, c.memory_b}) for c in result.contradictions}
         assert frozenset({id_a, id_b}) in contradiction_id_sets
+
+
+class TestAccessMetadataUpdate:
+    """Tests for step 7 access-metadata updates."""
+
+    @pytest.mark.unit
+    async def test_included_memories_touched_in_single_bulk_call(self) -> None:
+        """All included memories are touched with one repository call."""
+        retriever = _build_retriever()
+        team_id = uuid4()
+        orms = [_make_mock_orm(content=f"memory {i}", team_id=team_id) for i in range(5)]
+
+        with (
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
+            patch.object(retriever._repo, "touch_many", new_callable=AsyncMock) as mock_touch,
+        ):
+            mock_search.return_value = [(orm, 0.8) for orm in orms]
+            mock_get_team.return_value = []
+            mock_touch.return_value = 5
+
+            await retriever.retrieve(query="bulk touch", team_id=team_id)
+
+        mock_touch.assert_awaited_once()
+        assert set(mock_touch.await_args.args[0]) == {orm.id for orm in orms}
+
+    @pytest.mark.unit
+    async def test_access_tracker_defers_db_update(self) -> None:
+        """With an access tracker configured, touches are buffered, not written."""
+        retriever = _build_retriever()
+        tracker = MagicMock()
+        retriever._access_tracker = tracker
+        team_id = uuid4()
+        orm = _make_mock_orm(content="deferred", team_id=team_id)
+
+        with (
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
+            patch.object(retriever._repo, "touch_many", new_callable=AsyncMock) as mock_touch,
+        ):
+            mock_search.return_value = [(orm, 0.8)]
+            mock_get_team.return_value = []
+
+            await retriever.retrieve(query="deferred touch", team_id=team_id)
+
+        mock_touch.assert_not_awaited()
+        tracker.record.assert_called_once_with([orm.id])
+
+    @pytest.mark.unit
+    async def test_defaults_to_process_wide_access_tracker(self) -> None:
+        """Retrievers built without a tracker use the one configured at startup."""
+        tracker = MagicMock()
+        configure_access_tracker(tracker)
+        try:
+            retriever = _build_retriever()
+        finally:
+            configure_access_tracker(None)
+
+        assert retriever._access_tracker is tracker
+        assert _build_retriever()._access_tracker is None
+
+
+class TestParallelFetch:
+    """Tests for running candidate queries on independent sessions."""
+
+    @staticmethod
+    def _session_factory() -> tuple[MagicMock, list[AsyncMock]]:
+        """Build a session factory that hands out a fresh session per call.
+
+        Returns:
+            Tuple of (factory, list of sessions created so far).
+        """
+        sessions: list[AsyncMock] = []
+
+        def _new_session() -> AsyncMock:
+            session = AsyncMock()
+            session.__aenter__ = AsyncMock(return_value=session)
+            session.__aexit__ = AsyncMock(return_value=None)
+            sessions.append(session)
+            return session
+
+        return MagicMock(side_effect=_new_session), sessions
+
+    @pytest.mark.unit
+    async def test_queries_run_concurrently_on_separate_sessions(self) -> None:
+        """Agent, team-wide and recency queries each get their own session and overlap."""
+        factory, sessions = self._session_factory()
+        retriever = _build_retriever()
+        retriever._session_factory = factory
+        team_id = uuid4()
+        in_flight = 0
+        peak = 0
+
+        async def _slow(result: list) -> list:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        with (
+            patch(
+                "src.memory.retrieval.MemoryRepository.search_rows_by_embedding",
+                new=lambda self, **kw: _slow([]),
+            ),
+            patch(
+                "src.memory.retrieval.MemoryRepository.get_rows_by_team",
+                new=lambda self, **kw: _slow([]),
+            ),
+            patch(
+                "src.memory.retrieval.MemoryRepository.touch_many",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await retriever.retrieve(query="parallel", team_id=team_id, agent_id=uuid4())
+
+        assert len(sessions) == 3
+        assert peak == 3
+
+    @pytest.mark.unit
+    async def test_concurrency_cap_is_respected(self) -> None:
+        """No more than max_concurrent_queries queries run at once."""
+        factory, _ = self._session_factory()
+        retriever = MemoryRetriever(
+            session=AsyncMock(),
+            embedding_service=AsyncMock(embed_text=AsyncMock(return_value=[0.1] * 1536)),
+            retrieval_weights=RetrievalWeights(),
+            token_budget_manager=TokenBudgetManager(),
+            session_factory=factory,
+            max_concurrent_queries=1,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def _slow(result: list) -> list:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        with (
+            patch(
+                "src.memory.retrieval.MemoryRepository.search_rows_by_embedding",
+                new=lambda self, **kw: _slow([]),
+            ),
+            patch(
+                "src.memory.retrieval.MemoryRepository.get_rows_by_team",
+                new=lambda self, **kw: _slow([]),
+            ),
+        ):
+            await retriever.retrieve(query="capped", team_id=uuid4(), agent_id=uuid4())
+
+        assert peak == 1
+
+
+class TestInDatabaseScoring:
+    """Tests for the single-query in-database scoring mode."""
+
+    @pytest.mark.unit
+    async def test_scores_come_from_single_repository_query(self) -> None:
+        """In-database mode uses search_scored and skips the per-signal queries."""
+        retriever = _build_retriever()
+        retriever._in_database_scoring = True
+        team_id = uuid4()
+        id_a, id_b = uuid4(), uuid4()
+        row_a = _make_mock_orm(content="top", memory_id=id_a, team_id=team_id)
+        row_b = _make_mock_orm(
+            content="related", memory_id=id_b, team_id=team_id, related_to=[str(id_a)]
+        )
+        signals_a = {
+            "semantic": 0.9,
+            "recency": 1.0,
+            "importance": 0.5,
+            "continuity": 0.0,
+            "relationship": 0.0,
+        }
+        signals_b = {**signals_a, "semantic": 0.2}
+
+        with (
+            patch.object(retriever._repo, "search_scored", new_callable=AsyncMock) as mock_scored,
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(
+                retriever._repo, "get_rows_by_team", new_callable=AsyncMock
+            ) as mock_get_team,
+            patch.object(retriever._repo, "touch_many", new_callable=AsyncMock),
+        ):
+            mock_scored.return_value = [(row_a, signals_a), (row_b, signals_b)]
+
+            result = await retriever.retrieve(query="in db", team_id=team_id)
+
+        mock_scored.assert_awaited_once()
+        mock_search.assert_not_awaited()
+        mock_get_team.assert_not_awaited()
+        top = result.memories[0]
+        assert top.memory.id == id_a
+        # Relationship bonus is still applied in Python on top of DB scores
+        assert top.signal_scores["relationship"] == 0.5
+        assert top.final_score == pytest.approx(
+            _compute_weighted_score(top.signal_scores, RetrievalWeights())
+        )
@@ -0,0 +1,125 @@
+"""Unit tests for the scoped L0 retrieval cache (src/memory/retrieval_cache.py)."""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.memory.retrieval_cache import RetrievalCache
+from src.memory.types import RetrievalResult, RetrievalStats
+
+
+def _result() -> RetrievalResult:
+    """Build an empty RetrievalResult."""
+    return RetrievalResult(stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0))
+
+
+@pytest.mark.unit
+class TestRetrievalCacheKeys:
+    """Tests for scoped cache keys."""
+
+    def test_query_is_normalized(self) -> None:
+        """Case and surrounding whitespace do not change the key."""
+        team_id = uuid4()
+        assert RetrievalCache.make_key("  Hello ", team_id) == RetrievalCache.make_key(
+            "hello", team_id
+        )
+
+    def test_scope_is_part_of_key(self) -> None:
+        """The same query in another team, agent or conversation is a miss."""
+        cache = RetrievalCache()
+        team_id, agent_id = uuid4(), uuid4()
+        cache.put(RetrievalCache.make_key("q", team_id, agent_id), _result())
+
+        assert cache.get(RetrievalCache.make_key("q", team_id, agent_id)) is not None
+        assert cache.get(RetrievalCache.make_key("q", uuid4(), agent_id)) is None
+        assert cache.get(RetrievalCache.make_key("q", team_id, uuid4())) is None
+        assert cache.get(RetrievalCache.make_key("q", team_id, agent_id, uuid4())) is None
+        assert cache.get(RetrievalCache.make_key("q", team_id, agent_id, budget=100)) is None
+
+
+@pytest.mark.unit
+class TestRetrievalCacheEviction:
+    """Tests for TTL expiry and LRU bounds."""
+
+    def test_expired_entry_is_dropped(self) -> None:
+        """Entries older than the TTL are misses and are removed."""
+        cache = RetrievalCache(ttl_seconds=60.0)
+        key = RetrievalCache.make_key("q", uuid4())
+        cache.put(key, _result())
+        cache._entries[key].created_at = time.monotonic() - 120
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Reading an entry protects it from eviction."""
+        cache = RetrievalCache(max_size=2)
+        team_id = uuid4()
+        first, second, third = (RetrievalCache.make_key(q, team_id) for q in ("a", "b", "c"))
+        cache.put(first, _result())
+        cache.put(second, _result())
+        cache.get(first)
+        cache.put(third, _result())
+
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+
+
+@pytest.mark.unit
+class TestRetrievalCacheInvalidation:
+    """Tests for generation-based scoped invalidation."""
+
+    def test_agent_change_invalidates_other_agents(self) -> None:
+        """Agent X's result can include agent Y's memories, so Y's edit invalidates it."""
+        cache = RetrievalCache()
+        team_id, agent_x, agent_y = uuid4(), uuid4(), uuid4()
+        key_x = RetrievalCache.make_key("q", team_id, agent_x)
+        key_team = RetrievalCache.make_key("q", team_id)
+        other_team = RetrievalCache.make_key("q", uuid4(), agent_x)
+        for key in (key_x, key_team, other_team):
+            cache.put(key, _result())
+
+        cache.invalidate(team_id, agent_y)
+
+        assert cache.get(key_x) is None
+        assert cache.get(key_team) is None
+        assert cache.get(other_team) is not None
+
+    def test_team_wide_invalidation(self) -> None:
+        """A team-wide memory change invalidates every agent in the team only."""
+        cache = RetrievalCache()
+        team_id, other_team, agent_id = uuid4(), uuid4(), uuid4()
+        key = RetrievalCache.make_key("q", team_id, agent_id)
+        other = RetrievalCache.make_key("q", other_team, agent_id)
+        cache.put(key, _result())
+        cache.put(other, _result())
+
+        cache.invalidate(team_id)
+
+        assert cache.get(key) is None
+        assert cache.get(other) is not None
+
+    def test_results_stored_after_invalidation_are_live(self) -> None:
+        """Entries written after an invalidation are served normally."""
+        cache = RetrievalCache()
+        team_id = uuid4()
+        key = RetrievalCache.make_key("q", team_id)
+        cache.invalidate(team_id)
+        cache.put(key, _result())
+
+        assert cache.get(key) is not None
+
+    def test_put_after_invalidation_race_is_dropped(self) -> None:
+        """A result whose retrieval started before an invalidation is not stored."""
+        cache = RetrievalCache()
+        team_id = uuid4()
+        key = RetrievalCache.make_key("q", team_id)
+        generation = cache.scope_generation(team_id)
+
+        cache.invalidate(team_id)
+        cache.put(key, _result(), generation)
+
+        assert cache.get(key) is None
@@ -0,0 +1,216 @@
+"""Unit tests for the semantic retrieval cache (src/memory/semantic_cache.py)."""
+
+import time
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.cache.client import RedisManager
+from src.memory.retrieval import MemoryRetriever
+from src.memory.retrieval_cache import RetrievalCache
+from src.memory.semantic_cache import SemanticQueryCache
+from src.memory.token_budget import TokenBudgetManager
+from src.memory.types import RetrievalResult, RetrievalStats
+from src.models.agent_models import RetrievalWeights
+
+
+def _result(prompt: str = "cached") -> RetrievalResult:
+    """Build an empty RetrievalResult with a recognizable prompt."""
+    return RetrievalResult(
+        formatted_prompt=prompt,
+        stats=RetrievalStats(signals_hit=0, total_ms=0.0, query_tokens=0),
+    )
+
+
+@pytest.fixture
+async def redis_manager() -> AsyncGenerator[RedisManager, None]:
+    """RedisManager backed by fakeredis text and bytes-mode clients."""
+    server = FakeServer()
+    client = FakeAsyncRedis(server=server, decode_responses=True)
+    manager = RedisManager(redis_url="redis://fake:6379/0", key_prefix="test:")
+    manager._client = client
+    manager._binary_client = FakeAsyncRedis(server=server, decode_responses=False)
+    manager._binary_source = client
+    manager._available = True
+    yield manager
+    await client.flushall()
+    await manager.close()
+
+
+@pytest.mark.unit
+class TestSemanticLookup:
+    """Tests for in-process similarity lookups."""
+
+    async def test_paraphrase_above_threshold_hits(self) -> None:
+        """A query whose embedding is close enough reuses the cached result."""
+        cache = SemanticQueryCache(RetrievalCache(), threshold=0.95)
+        team_id, agent_id = uuid4(), uuid4()
+        cache.store(RetrievalCache.make_key("q1", team_id, agent_id), [1.0, 0.0, 0.1], _result())
+
+        hit = await cache.lookup(RetrievalCache.make_key("q2", team_id, agent_id), [1.0, 0.02, 0.1])
+        miss = await cache.lookup(RetrievalCache.make_key("q3", team_id, agent_id), [0.0, 1.0, 0.0])
+
+        assert hit is not None and hit.formatted_prompt == "cached"
+        assert miss is None
+
+    async def test_scope_is_isolated(self) -> None:
+        """Identical embeddings in another agent or conversation are misses."""
+        cache = SemanticQueryCache(RetrievalCache())
+        team_id, agent_id = uuid4(), uuid4()
+        embedding = [0.3, 0.4, 0.5]
+        cache.store(RetrievalCache.make_key("q", team_id, agent_id), embedding, _result())
+
+        assert await cache.lookup(RetrievalCache.make_key("q", team_id, uuid4()), embedding) is None
+        assert (
+            await cache.lookup(RetrievalCache.make_key("q", team_id, agent_id, uuid4()), embedding)
+            is None
+        )
+
+    async def test_invalidation_follows_retrieval_cache_generations(self) -> None:
+        """Invalidating the L0 scope also invalidates semantic entries."""
+        generations = RetrievalCache()
+        cache = SemanticQueryCache(generations)
+        team_id, agent_id = uuid4(), uuid4()
+        key = RetrievalCache.make_key("q", team_id, agent_id)
+        cache.store(key, [1.0, 0.0], _result())
+
+        generations.invalidate(team_id, agent_id)
+
+        assert await cache.lookup(key, [1.0, 0.0]) is None
+        assert len(cache) == 0
+
+    async def test_store_after_invalidation_race_is_dropped(self) -> None:
+        """A result whose retrieval started before an invalidation is not stored."""
+        generations = RetrievalCache()
+        cache = SemanticQueryCache(generations)
+        team_id = uuid4()
+        generation = generations.scope_generation(team_id)
+
+        generations.invalidate(team_id)
+        cache.store(RetrievalCache.make_key("q", team_id), [1.0, 0.0], _result(), generation)
+
+        assert len(cache) == 0
+
+    async def test_expired_entries_are_dropped(self) -> None:
+        """Entries older than the TTL are not served."""
+        cache = SemanticQueryCache(RetrievalCache(), ttl_seconds=60.0)
+        key = RetrievalCache.make_key("q", uuid4())
+        cache.store(key, [1.0, 0.0], _result())
+        for index in cache._scopes.values():
+            index.created_at = [time.time() - 120]
+
+        assert await cache.lookup(key, [1.0, 0.0]) is None
+
+    async def test_scope_size_is_bounded(self) -> None:
+        """The oldest query is replaced beyond max_entries_per_scope."""
+        cache = SemanticQueryCache(RetrievalCache(), max_entries_per_scope=2)
+        team_id = uuid4()
+        for i, embedding in enumerate(([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0])):
+            cache.store(RetrievalCache.make_key(f"q{i}", team_id), embedding, _result(f"r{i}"))
+
+        assert len(cache) == 2
+        assert await cache.lookup(RetrievalCache.make_key("x", team_id), [1.0, 0.0, 0.0]) is None
+
+
+@pytest.mark.unit
+class TestSemanticPersistence:
+    """Tests for Redis persistence and cross-process hydration."""
+
+    async def test_entries_hydrate_in_another_process(self, redis_manager: RedisManager) -> None:
+        """A fresh cache (another process) loads persisted entries from Redis."""
+        team_id, agent_id = uuid4(), uuid4()
+        writer = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        writer.store(RetrievalCache.make_key("q", team_id, agent_id), [0.6, 0.8], _result("r"))
+        await writer._pending_writes.pop()
+
+        reader = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        hit = await reader.lookup(RetrievalCache.make_key("p", team_id, agent_id), [0.6, 0.79])
+
+        assert hit is not None and hit.formatted_prompt == "r"
+
+    async def test_flush_waits_for_pending_writes(self, redis_manager: RedisManager) -> None:
+        """flush() completes background persistence before shutdown."""
+        team_id = uuid4()
+        writer = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        writer.store(RetrievalCache.make_key("q", team_id), [1.0, 0.0], _result("r"))
+
+        await writer.flush()
+
+        reader = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        assert await reader.lookup(RetrievalCache.make_key("p", team_id), [1.0, 0.0])
+
+    async def test_write_racing_an_invalidation_is_removed(
+        self, redis_manager: RedisManager
+    ) -> None:
+        """An invalidation during the background write leaves nothing to hydrate."""
+        team_id = uuid4()
+        generations = RetrievalCache()
+        writer = SemanticQueryCache(generations, redis_manager=redis_manager)
+        key = RetrievalCache.make_key("q", team_id)
+        writer.store(key, [1.0, 0.0], _result(), generations.scope_generation(team_id))
+
+        generations.invalidate(team_id)
+        await writer.flush()
+
+        reader = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        assert await reader.lookup(key, [1.0, 0.0]) is None
+
+    async def test_invalidate_deletes_persisted_team_scopes(
+        self, redis_manager: RedisManager
+    ) -> None:
+        """Invalidation removes every scope of the team, including other agents'."""
+        team_id, other_team, agent_a, agent_b = uuid4(), uuid4(), uuid4(), uuid4()
+        writer = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        for team, agent_id in ((team_id, agent_a), (team_id, agent_b), (other_team, agent_b)):
+            writer.store(RetrievalCache.make_key("q", team, agent_id), [1.0, 0.0], _result())
+            await writer.flush()
+
+        await writer.invalidate(team_id, agent_a)
+
+        reader = SemanticQueryCache(RetrievalCache(), redis_manager=redis_manager)
+        assert (
+            await reader.lookup(RetrievalCache.make_key("q", team_id, agent_a), [1.0, 0.0]) is None
+        )
+        assert (
+            await reader.lookup(RetrievalCache.make_key("q", team_id, agent_b), [1.0, 0.0]) is None
+        )
+        assert await reader.lookup(RetrievalCache.make_key("q", other_team, agent_b), [1.0, 0.0])
+
+
+@pytest.mark.unit
+class TestRetrieverSemanticTier:
+    """MemoryRetriever should skip the database for near-duplicate queries."""
+
+    async def test_paraphrase_skips_vector_search(self) -> None:
+        """The second, differently worded query is served from the semantic tier."""
+        embedding_svc = AsyncMock()
+        embedding_svc.embed_text = AsyncMock(side_effect=[[1.0, 0.0, 0.1], [1.0, 0.01, 0.1]])
+        generations = RetrievalCache()
+        retriever = MemoryRetriever(
+            session=AsyncMock(),
+            embedding_service=embedding_svc,
+            retrieval_weights=RetrievalWeights(),
+            token_budget_manager=TokenBudgetManager(total_budget=4000),
+            result_cache=generations,
+            semantic_cache=SemanticQueryCache(generations),
+        )
+        team_id = uuid4()
+
+        with (
+            patch.object(
+                retriever._repo, "search_rows_by_embedding", new_callable=AsyncMock
+            ) as mock_search,
+            patch.object(retriever._repo, "get_rows_by_team", new_callable=AsyncMock) as mock_team,
+        ):
+            mock_search.return_value = []
+            mock_team.return_value = []
+
+            await retriever.retrieve(query="what do I like to drink?", team_id=team_id)
+            searches = mock_search.call_count
+            result = await retriever.retrieve(query="which drinks do I like?", team_id=team_id)
+
+        assert mock_search.call_count == searches
+        assert result.stats.cache_hit is True
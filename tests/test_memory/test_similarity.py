@@ -0,0 +1,84 @@
+"""Unit tests for vectorized similarity helpers in src/memory/similarity.py."""
+
+import numpy as np
+import pytest
+
+from src.memory.similarity import (
+    cosine_similarity,
+    max_similarity,
+    normalize_rows,
+    similarity_matrix,
+)
+
+
+@pytest.mark.unit
+class TestNormalizeRows:
+    """Tests for normalize_rows."""
+
+    def test_rows_are_unit_length(self) -> None:
+        """Every non-zero row has L2 norm 1."""
+        unit = normalize_rows([[3.0, 4.0], [1.0, 0.0]])
+        assert unit.dtype == np.float32
+        assert np.allclose(np.linalg.norm(unit, axis=1), 1.0)
+
+    def test_zero_row_stays_zero(self) -> None:
+        """Zero vectors produce zeros rather than NaNs."""
+        unit = normalize_rows([[0.0, 0.0], [1.0, 1.0]])
+        assert np.array_equal(unit[0], [0.0, 0.0])
+        assert not np.isnan(unit).any()
+
+    def test_single_vector_becomes_matrix(self) -> None:
+        """A 1-D input is treated as one row."""
+        assert normalize_rows(np.array([2.0, 0.0])).shape == (1, 2)
+
+
+@pytest.mark.unit
+class TestCosineSimilarity:
+    """Tests for cosine_similarity."""
+
+    def test_identical_vectors(self) -> None:
+        """Identical vectors have similarity 1.0."""
+        assert cosine_similarity([1.0, 2.0, 3.0], [1.0, 2.0, 3.0]) == pytest.approx(1.0)
+
+    def test_orthogonal_vectors(self) -> None:
+        """Orthogonal vectors have similarity 0.0."""
+        assert cosine_similarity([1.0, 0.0], [0.0, 1.0]) == pytest.approx(0.0)
+
+    def test_opposite_vectors(self) -> None:
+        """Opposite vectors have similarity -1.0."""
+        assert cosine_similarity([1.0, 1.0], [-1.0, -1.0]) == pytest.approx(-1.0)
+
+    def test_zero_vector_returns_zero(self) -> None:
+        """A zero-magnitude vector yields 0.0."""
+        assert cosine_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+
+
+@pytest.mark.unit
+class TestSimilarityMatrix:
+    """Tests for similarity_matrix and max_similarity."""
+
+    def test_matches_pairwise_cosine(self) -> None:
+        """Matrix entries equal the scalar cosine of each pair."""
+        queries = [[1.0, 0.0, 0.0], [0.5, 0.5, 0.0]]
+        corpus = [[1.0, 1.0, 0.0], [0.0, 0.0, 1.0], [2.0, 0.0, 0.0]]
+        matrix = similarity_matrix(queries, corpus)
+
+        assert matrix.shape == (2, 3)
+        for i, q in enumerate(queries):
+            for j, c in enumerate(corpus):
+                assert matrix[i, j] == pytest.approx(cosine_similarity(q, c), abs=1e-6)
+
+    def test_self_similarity_defaults_to_queries(self) -> None:
+        """Without a corpus, the diagonal is 1.0."""
+        matrix = similarity_matrix([[1.0, 2.0], [3.0, -1.0]])
+        assert np.allclose(np.diag(matrix), 1.0)
+
+    def test_max_similarity_per_query(self) -> None:
+        """max_similarity returns the best match for each query."""
+        best = max_similarity([[1.0, 0.0], [0.0, 1.0]], [[1.0, 0.0], [1.0, 1.0]])
+        assert best[0] == pytest.approx(1.0)
+        assert best[1] == pytest.approx(2**-0.5)
+
+    def test_max_similarity_empty_corpus(self) -> None:
+        """An empty corpus yields zeros."""
+        assert max_similarity([[1.0, 0.0]], []).tolist() == [0.0]
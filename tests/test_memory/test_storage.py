@@ -81,6 +81,22 @@ def _make_extracted_memory(**overrides: object) -> ExtractedMemory:
     return ExtractedMemory(**defaults)  # type: ignore[arg-type]
 
 
+def _batch_contradiction_mock(result: ContradictionResult) -> AsyncMock:
+    """Build a check_batch_on_store mock returning ``result`` for every memory.
+
+    Args:
+        result: ContradictionResult to return for each new memory.
+
+    Returns:
+        AsyncMock returning one result per memory in ``new_memories``.
+    """
+
+    async def _check(new_memories: list[ExtractedMemory], **_: object) -> list[ContradictionResult]:
+        return [result for _ in new_memories]
+
+    return AsyncMock(side_effect=_check)
+
+
 class TestExtractFromConversation:
     """Tests for MemoryExtractor.extract_from_conversation."""
 
@@ -122,8 +138,8 @@ class TestExtractFromConversation:
         embedding_service.embed_batch = AsyncMock(return_value=[[0.1] * 1536, [0.2] * 1536])
 
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[],
                 action="coexist",
                 reason="No contradictions",
@@ -209,18 +225,11 @@ class TestExtractFromConversation:
         pass1_embedding = [1.0] * 768 + [0.0] * 768
         pass2_embedding = [0.0] * 768 + [1.0] * 768
 
-        embedding_service.embed_text = AsyncMock(
-            side_effect=[
-                pass2_embedding,  # Pass 2 memory dedup check (orthogonal to Pass 1)
-                pass1_embedding,  # Pass 1 memory persistence
-                pass2_embedding,  # Pass 2 memory persistence
-            ]
-        )
-        embedding_service.embed_batch = AsyncMock(return_value=[pass1_embedding])
+        embedding_service.embed_batch = AsyncMock(return_value=[pass1_embedding, pass2_embedding])
 
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[],
                 action="coexist",
                 reason="No contradictions",
@@ -254,6 +263,11 @@ class TestExtractFromConversation:
         assert result.pass2_additions == 1
         assert result.memories_created == 2
         assert mock_add.call_count == 2
+        # Both passes embedded in one batch, reused for persistence
+        embedding_service.embed_batch.assert_awaited_once_with(
+            ["User prefers dark mode", "User works remotely"]
+        )
+        embedding_service.embed_text.assert_not_awaited()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -283,12 +297,11 @@ class TestExtractFromConversation:
 
         # Mock dependencies - return very similar embeddings
         embedding_service = AsyncMock()
-        embedding_service.embed_text = AsyncMock(return_value=[0.9] * 1536)
-        embedding_service.embed_batch = AsyncMock(return_value=[[0.9] * 1536])
+        embedding_service.embed_batch = AsyncMock(return_value=[[0.9] * 1536, [0.9] * 1536])
 
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[],
                 action="coexist",
                 reason="No contradictions",
@@ -352,13 +365,12 @@ class TestExtractFromConversation:
 
         # Mock dependencies
         embedding_service = AsyncMock()
-        embedding_service.embed_text = AsyncMock(return_value=[0.1] * 1536)
-        embedding_service.embed_batch = AsyncMock(return_value=[])
+        embedding_service.embed_batch = AsyncMock(return_value=[[0.1] * 1536])
 
         # Mock contradiction returning supersede action
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[old_memory_id],
                 action="supersede",
                 reason="New preference supersedes old",
@@ -398,6 +410,79 @@ class TestExtractFromConversation:
         assert result.memories_created == 1
         assert mock_add.call_count == 1
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_contradiction_supersedes_earlier_new_memory(
+        self,
+        mock_session: AsyncMock,
+    ) -> None:
+        """A new memory superseding an earlier one from the same batch versions it."""
+        team_id = uuid4()
+
+        memories_json = json.dumps(
+            [
+                {
+                    "type": "user_profile",
+                    "content": "User lives in Berlin",
+                    "subject": "user.city",
+                    "importance": 5,
+                    "confidence": 0.9,
+                },
+                {
+                    "type": "user_profile",
+                    "content": "User moved to Munich",
+                    "subject": "user.city",
+                    "importance": 8,
+                    "confidence": 0.9,
+                },
+            ]
+        )
+        mock_client = _build_mock_client(
+            [_make_success_response(memories_json), _make_success_response("[]")]
+        )
+
+        embedding_service = AsyncMock()
+        embedding_service.embed_batch = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+
+        contradiction_detector = AsyncMock()
+        contradiction_detector.check_batch_on_store = AsyncMock(
+            return_value=[
+                ContradictionResult(action="coexist", reason="No contradictions detected."),
+                ContradictionResult(batch_contradicts=[0], action="supersede", reason="Newer city"),
+            ]
+        )
+
+        inserted: list[MagicMock] = []
+
+        async def _refresh(orm: MagicMock) -> None:
+            orm.id = uuid4()
+            inserted.append(orm)
+
+        with (
+            patch("src.memory.storage.httpx.AsyncClient", return_value=mock_client),
+            patch.object(mock_session, "refresh", new_callable=AsyncMock, side_effect=_refresh),
+            patch.object(mock_session, "get", new_callable=AsyncMock) as mock_get,
+        ):
+            extractor = MemoryExtractor(
+                session=mock_session,
+                embedding_service=embedding_service,
+                contradiction_detector=contradiction_detector,
+                audit_log=AsyncMock(),
+                api_key="test-key",
+            )
+            extractor._repo.find_similar = AsyncMock(return_value=[])
+
+            result = await extractor.extract_from_conversation(
+                messages=[{"role": "user", "content": "I moved from Berlin to Munich"}],
+                team_id=team_id,
+            )
+
+        assert result.memories_created == 2
+        assert result.memories_versioned == 1
+        assert result.contradictions_found == 1
+        mock_get.assert_awaited_once()
+        assert mock_get.await_args.args[1] == inserted[0].id
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_contradiction_dispute_still_stores_memory(
@@ -426,13 +511,12 @@ class TestExtractFromConversation:
 
         # Mock dependencies
         embedding_service = AsyncMock()
-        embedding_service.embed_text = AsyncMock(return_value=[0.1] * 1536)
-        embedding_service.embed_batch = AsyncMock(return_value=[])
+        embedding_service.embed_batch = AsyncMock(return_value=[[0.1] * 1536])
 
         # Mock contradiction returning dispute action
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[existing_memory_id],
                 action="dispute",
                 reason="Conflicting preferences - both stored",
@@ -683,12 +767,11 @@ class TestExtractPersistence:
         mock_client = _build_mock_client([pass1_response, pass2_response])
 
         embedding_service = AsyncMock()
-        embedding_service.embed_text = AsyncMock(return_value=[0.1] * 1536)
-        embedding_service.embed_batch = AsyncMock(return_value=[])
+        embedding_service.embed_batch = AsyncMock(return_value=[[0.1] * 1536])
 
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[],
                 action="coexist",
                 reason="No contradictions",
@@ -731,7 +814,7 @@ class TestExtractPersistence:
         self,
         mock_session: AsyncMock,
     ) -> None:
-        """Test that embedding service is called for each extracted memory."""
+        """Test that each extracted memory is embedded exactly once."""
         team_id = uuid4()
 
         memory_json = json.dumps(
@@ -762,8 +845,8 @@ class TestExtractPersistence:
         embedding_service.embed_batch = AsyncMock(return_value=[[0.1] * 1536, [0.2] * 1536])
 
         contradiction_detector = AsyncMock()
-        contradiction_detector.check_on_store = AsyncMock(
-            return_value=ContradictionResult(
+        contradiction_detector.check_batch_on_store = _batch_contradiction_mock(
+            ContradictionResult(
                 contradicts=[],
                 action="coexist",
                 reason="No contradictions",
@@ -793,5 +876,8 @@ class TestExtractPersistence:
                 team_id=team_id,
             )
 
-        # embed_text should be called once per memory for persistence
-        assert embedding_service.embed_text.await_count == 2
+        # One batch embeds every memory; the vectors are reused downstream
+        embedding_service.embed_batch.assert_awaited_once_with(["First memory", "Second memory"])
+        embedding_service.embed_text.assert_not_awaited()
+        batch_kwargs = contradiction_detector.check_batch_on_store.await_args.kwargs
+        assert batch_kwargs["embeddings"] == [[0.1] * 1536, [0.2] * 1536]
@@ -8,6 +8,7 @@ from uuid import uuid4
 import pytest
 
 from src.memory.token_budget import TokenBudgetManager
+from src.memory.tokenizer import HeuristicTokenizer, TokenCounter
 from src.memory.types import BudgetAllocation, ScoredMemory
 from src.models.memory_models import (
     MemoryRecord,
@@ -63,7 +64,7 @@ class TestEstimateTokens:
     @pytest.mark.unit
     def test_estimate_tokens_accuracy(self) -> None:
         """Test that 'hello world' (11 chars) yields ceil(11/3.5) = 4 tokens."""
-        manager = TokenBudgetManager()
+        manager = TokenBudgetManager(token_counter=TokenCounter(HeuristicTokenizer()))
         result = manager.estimate_tokens("hello world")
         expected = math.ceil(11 / 3.5)  # 4
         assert result == expected
@@ -71,13 +72,13 @@ class TestEstimateTokens:
     @pytest.mark.unit
     def test_estimate_tokens_empty_string_returns_zero(self) -> None:
         """Test that an empty string returns 0 tokens."""
-        manager = TokenBudgetManager()
+        manager = TokenBudgetManager(token_counter=TokenCounter(HeuristicTokenizer()))
         assert manager.estimate_tokens("") == 0
 
     @pytest.mark.unit
     def test_estimate_tokens_single_char(self) -> None:
         """Test that a single character returns 1 token."""
-        manager = TokenBudgetManager()
+        manager = TokenBudgetManager(token_counter=TokenCounter(HeuristicTokenizer()))
         assert manager.estimate_tokens("a") == math.ceil(1 / 3.5)  # 1
 
 
@@ -250,3 +251,77 @@ class TestAllocate:
         included_tiny, alloc_tiny = manager.allocate([mem], budget=1)
         assert len(included_tiny) == 0
         assert alloc_tiny.memories_trimmed == 1
+
+
+class TestKnapsackPacking:
+    """Tests for TokenBudgetManager knapsack packing mode."""
+
+    @staticmethod
+    def _manager(budget: int) -> TokenBudgetManager:
+        """Build a knapsack manager with deterministic heuristic counts."""
+        return TokenBudgetManager(
+            total_budget=budget,
+            token_counter=TokenCounter(HeuristicTokenizer()),
+            packing="knapsack",
+        )
+
+    @pytest.mark.unit
+    def test_short_memories_beat_one_long_memory(self) -> None:
+        """Several shorter memories outscore one long one that greedy would pick."""
+        long_mem = _make_scored_memory(content="x" * 350, score=0.9)  # 100 tokens
+        short_mems = [
+            _make_scored_memory(content="y" * 175, score=0.8)  # 50 tokens each
+            for _ in range(2)
+        ]
+        candidates = [long_mem, *short_mems]
+
+        greedy_included, _ = TokenBudgetManager(
+            total_budget=100, token_counter=TokenCounter(HeuristicTokenizer())
+        ).allocate(candidates)
+        included, allocation = self._manager(100).allocate(candidates)
+
+        assert greedy_included == [long_mem]
+        assert included == short_mems
+        assert allocation.remaining_tokens == 100
+        assert allocation.memories_trimmed == 1
+
+    @pytest.mark.unit
+    def test_identity_still_mandatory(self) -> None:
+        """Identity memories are included before packing, even over budget."""
+        identity = _make_scored_memory(
+            memory_type=MemoryType.IDENTITY, content="i" * 70, score=0.1
+        )  # 20 tokens
+        other = _make_scored_memory(content="z" * 35, score=0.9)  # 10 tokens
+
+        included, allocation = self._manager(25).allocate([identity, other])
+
+        assert included == [identity]
+        assert allocation.identity_tokens == 20
+        assert allocation.memories_trimmed == 1
+
+    @pytest.mark.unit
+    def test_packing_override_per_call(self) -> None:
+        """allocate(packing=...) overrides the manager's default mode."""
+        long_mem = _make_scored_memory(content="x" * 350, score=0.9)
+        short_mems = [_make_scored_memory(content="y" * 175, score=0.8) for _ in range(2)]
+        manager = TokenBudgetManager(
+            total_budget=100, token_counter=TokenCounter(HeuristicTokenizer())
+        )
+
+        included, _ = manager.allocate([long_mem, *short_mems], packing="knapsack")
+
+        assert included == short_mems
+
+    @pytest.mark.unit
+    def test_large_budget_stays_within_budget(self) -> None:
+        """Coarse capacity scaling never overfills a large budget."""
+        memories = [
+            _make_scored_memory(content="w" * (35 * (i % 17 + 1)), score=(i % 7 + 1) / 7)
+            for i in range(300)
+        ]
+
+        included, allocation = self._manager(8000).allocate(memories)
+
+        assert allocation.total_tokens <= 8000
+        assert allocation.memories_included + allocation.memories_trimmed == 300
+        assert len(included) == allocation.memories_included
@@ -0,0 +1,174 @@
+"""Unit tests for token counting in src/memory/tokenizer.py."""
+
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.memory.token_budget import TokenBudgetManager
+from src.memory.tokenizer import (
+    HeuristicTokenizer,
+    TokenCounter,
+    get_tokenizer,
+)
+from src.memory.types import ScoredMemory
+from src.models.memory_models import MemoryRecord, MemorySource, MemoryType
+
+
+class _CountingTokenizer:
+    """Tokenizer that counts words and records how often it was called."""
+
+    name = "words"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+def _make_record(
+    content: str = "one two three",
+    version: int = 1,
+    token_count: Optional[int] = None,
+    token_encoding: Optional[str] = None,
+) -> MemoryRecord:
+    """Build a MemoryRecord with optional persisted token count."""
+    now = datetime.now(tz=timezone.utc)
+    return MemoryRecord(
+        id=uuid4(),
+        team_id=uuid4(),
+        memory_type=MemoryType.SEMANTIC,
+        content=content,
+        token_count=token_count,
+        token_encoding=token_encoding,
+        importance=5,
+        confidence=1.0,
+        source_type=MemorySource.EXTRACTION,
+        version=version,
+        created_at=now,
+        updated_at=now,
+        last_accessed_at=now,
+    )
+
+
+@pytest.mark.unit
+class TestHeuristicTokenizer:
+    """Tests for the len/3.5 fallback."""
+
+    def test_counts_ceil_of_length_over_3_5(self) -> None:
+        """'hello world' (11 chars) is ceil(11 / 3.5) = 4 tokens."""
+        assert HeuristicTokenizer().count_tokens("hello world") == 4
+
+    def test_empty_text_is_zero(self) -> None:
+        """Empty text has no tokens."""
+        assert HeuristicTokenizer().count_tokens("") == 0
+
+
+@pytest.mark.unit
+class TestGetTokenizer:
+    """Tests for tokenizer backend selection."""
+
+    def test_heuristic_backend(self) -> None:
+        """The heuristic backend never needs optional packages."""
+        assert isinstance(get_tokenizer("heuristic"), HeuristicTokenizer)
+
+    def test_tiktoken_falls_back_when_unavailable(self) -> None:
+        """A missing tiktoken package falls back to the heuristic."""
+        get_tokenizer.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"tiktoken": None}):
+                tokenizer = get_tokenizer("tiktoken", "cl100k_base")
+            assert isinstance(tokenizer, HeuristicTokenizer)
+        finally:
+            get_tokenizer.cache_clear()
+
+
+@pytest.mark.unit
+class TestTokenCounter:
+    """Tests for TokenCounter memoization."""
+
+    def test_text_counts_are_memoized(self) -> None:
+        """Counting the same text twice tokenizes it once."""
+        tokenizer = _CountingTokenizer()
+        counter = TokenCounter(tokenizer)
+
+        assert counter.count("a b c") == 3
+        assert counter.count("a b c") == 3
+        assert tokenizer.calls == 1
+
+    def test_memory_counts_cached_by_id_and_version(self) -> None:
+        """A new version of the same memory is recounted."""
+        tokenizer = _CountingTokenizer()
+        counter = TokenCounter(tokenizer)
+        record = _make_record("one two three")
+
+        assert counter.count_memory(record) == 3
+        assert counter.count_memory(record) == 3
+        assert tokenizer.calls == 1
+
+        updated = record.model_copy(update={"content": "one two", "version": 2})
+        assert counter.count_memory(updated) == 2
+        assert tokenizer.calls == 2
+
+    def test_persisted_count_used_for_matching_encoding(self) -> None:
+        """Counts stored by the same tokenizer skip tokenization."""
+        tokenizer = _CountingTokenizer()
+        counter = TokenCounter(tokenizer)
+
+        assert counter.count_memory(_make_record(token_count=42, token_encoding="words")) == 42
+        assert tokenizer.calls == 0
+
+    def test_persisted_count_ignored_for_other_encoding(self) -> None:
+        """Counts from a different tokenizer are recomputed."""
+        tokenizer = _CountingTokenizer()
+        counter = TokenCounter(tokenizer)
+
+        record = _make_record("one two three", token_count=42, token_encoding="cl100k_base")
+        assert counter.count_memory(record) == 3
+        assert tokenizer.calls == 1
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted beyond max_entries."""
+        tokenizer = _CountingTokenizer()
+        counter = TokenCounter(tokenizer, max_entries=2)
+
+        counter.count("a")
+        counter.count("b")
+        counter.count("a")
+        counter.count("c")  # evicts "b"
+        counter.count("a")
+        assert tokenizer.calls == 3
+        counter.count("b")
+        assert tokenizer.calls == 4
+
+
+@pytest.mark.unit
+class TestBudgetUsesCachedCounts:
+    """TokenBudgetManager.allocate should use per-memory cached counts."""
+
+    def test_allocate_uses_persisted_counts(self) -> None:
+        """Persisted counts drive allocation without re-tokenizing content."""
+        tokenizer = _CountingTokenizer()
+        manager = TokenBudgetManager(total_budget=100, token_counter=TokenCounter(tokenizer))
+        memories = [
+            ScoredMemory(
+                memory=_make_record("short", token_count=60, token_encoding="words"),
+                final_score=0.9,
+            ),
+            ScoredMemory(
+                memory=_make_record("short", token_count=60, token_encoding="words"),
+                final_score=0.8,
+            ),
+        ]
+
+        included, allocation = manager.allocate(memories)
+
+        assert len(included) == 1
+        assert allocation.remaining_tokens == 60
+        assert allocation.memories_trimmed == 1
+        assert tokenizer.calls == 0
@@ -1,10 +1,27 @@
 """Unit tests for SkillLoader and SkillMetadata."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from pydantic import ValidationError
 
-from src.skill_loader import SkillLoader, SkillMetadata
+from src.skill_loader import SkillLoader, SkillMetadata, get_skill_loader
+
+
+def _write_skill(root: Path, name: str, description: str = "A skill") -> Path:
+    """Create ``root/<name>/SKILL.md`` with minimal frontmatter."""
+    skill_dir = root / name
+    skill_dir.mkdir(exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n")
+    return skill_md
+
+
+def _bump_mtime(path: Path) -> None:
+    """Advance a file's mtime so the change is visible regardless of clock resolution."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
 
 
 class TestSkillMetadata:
@@ -288,3 +305,78 @@ description: Test skill
         prompt = loader.get_skill_metadata_prompt()
 
         assert "No skills" in prompt or prompt == "No skills currently available."
+
+
+class TestSkillRegistryReload:
+    """Tests for incremental reload and the process-wide loader."""
+
+    def test_refresh_without_changes_does_not_reparse(self, tmp_path: Path) -> None:
+        """Unchanged SKILL.md files are not read again."""
+        _write_skill(tmp_path, "alpha")
+        loader = SkillLoader(tmp_path)
+        loader.discover_skills()
+
+        with patch.object(loader, "_parse_skill_metadata") as mock_parse:
+            assert loader.refresh(min_interval=0) is False
+            mock_parse.assert_not_called()
+
+    def test_refresh_reparses_only_changed_files(self, tmp_path: Path) -> None:
+        """A modified SKILL.md is reparsed; untouched ones are reused."""
+        alpha = _write_skill(tmp_path, "alpha", "Old description")
+        _write_skill(tmp_path, "beta")
+        loader = SkillLoader(tmp_path)
+        loader.discover_skills()
+        beta_before = loader.skills["beta"]
+
+        _write_skill(tmp_path, "alpha", "New description")
+        _bump_mtime(alpha)
+
+        assert loader.refresh(min_interval=0) is True
+        assert loader.skills["alpha"].description == "New description"
+        assert loader.skills["beta"] is beta_before
+
+    def test_refresh_picks_up_added_and_removed_skills(self, tmp_path: Path) -> None:
+        """New skills appear and deleted skills disappear after refresh."""
+        gone = _write_skill(tmp_path, "gone")
+        loader = SkillLoader(tmp_path)
+        loader.discover_skills()
+
+        gone.unlink()
+        _write_skill(tmp_path, "added")
+
+        assert loader.refresh(min_interval=0) is True
+        assert set(loader.skills) == {"added"}
+
+    def test_refresh_swaps_snapshot(self, tmp_path: Path) -> None:
+        """Readers holding the old snapshot are unaffected by a reload."""
+        _write_skill(tmp_path, "alpha")
+        loader = SkillLoader(tmp_path)
+        loader.discover_skills()
+        snapshot = loader.skills
+
+        _write_skill(tmp_path, "beta")
+        loader.refresh(min_interval=0)
+
+        assert set(snapshot) == {"alpha"}
+        assert set(loader.skills) == {"alpha", "beta"}
+        with pytest.raises(TypeError):
+            loader.skills["gamma"] = snapshot["alpha"]  # type: ignore[index]
+
+    def test_refresh_respects_min_interval(self, tmp_path: Path) -> None:
+        """Changes are not checked again within the reload interval."""
+        loader = SkillLoader(tmp_path)
+        loader.discover_skills()
+        _write_skill(tmp_path, "alpha")
+
+        assert loader.refresh(min_interval=3600) is False
+        assert "alpha" not in loader.skills
+
+    def test_get_skill_loader_is_shared(self, tmp_path: Path) -> None:
+        """The same directory always yields the same loader instance."""
+        _write_skill(tmp_path, "alpha")
+
+        first = get_skill_loader(tmp_path)
+        second = get_skill_loader(tmp_path / ".", reload_interval=0)
+
+        assert first is second
+        assert "alpha" in first.skills
@@ -1,11 +1,13 @@
 """Unit tests for progressive disclosure skill tools."""
 
+import os
 import pytest
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
+from unittest.mock import patch
 
-from src.skill_tools import load_skill, read_skill_file, list_skill_files
+from src.skill_tools import _SkillContentCache, load_skill, read_skill_file, list_skill_files
 from src.skill_loader import SkillLoader, SkillMetadata
 
 
@@ -315,3 +317,70 @@ class TestListSkillFiles:
 
         assert "Error" in result
         assert "not initialized" in result
+
+
+class TestSkillContentCache:
+    """Tests for cached skill bodies, reference files and file indexes."""
+
+    @pytest.mark.asyncio
+    async def test_load_skill_reads_file_once(self, tmp_path: Path) -> None:
+        """Repeated load_skill calls serve the stripped body from memory."""
+        skill = create_test_skill(tmp_path, "cached", "Test", "Cached body")
+        loader = SkillLoader(tmp_path)
+        loader.skills = {"cached": skill}
+        ctx = MockContext(deps=MockDependencies(skill_loader=loader))
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as spy:
+            first = await load_skill(ctx, "cached")
+            second = await load_skill(ctx, "cached")
+
+        assert first == second == "Cached body"
+        assert spy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_modified_file_is_reread(self, tmp_path: Path) -> None:
+        """A changed mtime invalidates the cached content."""
+        skill = create_test_skill(tmp_path, "edited", "Test", "Before")
+        loader = SkillLoader(tmp_path)
+        loader.skills = {"edited": skill}
+        ctx = MockContext(deps=MockDependencies(skill_loader=loader))
+        assert await load_skill(ctx, "edited") == "Before"
+
+        skill_md = create_test_skill(tmp_path, "edited", "Test", "After!").skill_path / "SKILL.md"
+        stat = skill_md.stat()
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert await load_skill(ctx, "edited") == "After!"
+
+    @pytest.mark.asyncio
+    async def test_file_index_picks_up_new_files(self, tmp_path: Path) -> None:
+        """Adding a file refreshes the index used by list and read."""
+        skill = create_test_skill(tmp_path, "indexed", "Test", "Body")
+        loader = SkillLoader(tmp_path)
+        loader.skills = {"indexed": skill}
+        ctx = MockContext(deps=MockDependencies(skill_loader=loader))
+        assert "notes.md" not in await list_skill_files(ctx, "indexed")
+
+        (skill.skill_path / "notes.md").write_text("Notes")
+        dir_stat = skill.skill_path.stat()
+        os.utime(skill.skill_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns + 1_000_000_000))
+
+        assert "- notes.md" in await list_skill_files(ctx, "indexed")
+        assert await read_skill_file(ctx, "indexed", "notes.md") == "Notes"
+
+    def test_eviction_respects_size_cap(self, tmp_path: Path) -> None:
+        """Least recently used content is dropped beyond the character cap."""
+        cache = _SkillContentCache(max_chars=10)
+        first = tmp_path / "a.txt"
+        second = tmp_path / "b.txt"
+        first.write_text("123456")
+        second.write_text("abcdef")
+
+        cache.read_text(first)
+        cache.read_text(second)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as spy:
+            cache.read_text(second)
+            cache.read_text(first)
+
+        assert spy.call_count == 1
@@ -9,8 +9,11 @@ from src.db.models.memory import MemoryStatusEnum
 from workers.tasks.memory_tasks import (
     _async_decay_and_expire,
     _async_extract_memories,
+    _async_maintain_vector_index,
     _cosine_similarity,
     _merge_near_duplicates,
+    _plan_team_indexes,
+    _plan_vector_index_rebuild,
     _summarize_old_episodic,
 )
 
@@ -444,7 +447,7 @@ class TestAsyncDecayAndExpire:
         mock_session_factory: MagicMock,
         mock_settings: MagicMock,
     ) -> None:
-        """Should call cache.invalidate for each affected agent_id."""
+        """Should invalidate all affected agent_ids in one bulk call."""
         session = mock_session_factory._mock_session
 
         agent_1, agent_2 = uuid4(), uuid4()
@@ -469,6 +472,8 @@ class TestAsyncDecayAndExpire:
         ]
 
         mock_cache_instance = AsyncMock()
+        mock_cache_instance.invalidate_agents.return_value = 2
+        mock_redis_manager = AsyncMock()
 
         with (
             patch(
@@ -479,13 +484,14 @@ class TestAsyncDecayAndExpire:
                 "workers.tasks.memory_tasks.get_task_settings",
                 return_value=mock_settings,
             ),
-            patch("src.cache.client.RedisManager"),
+            patch("src.cache.client.RedisManager", return_value=mock_redis_manager),
             patch("src.cache.hot_cache.HotMemoryCache", return_value=mock_cache_instance),
         ):
             result = await _async_decay_and_expire()
 
         assert result["cache_invalidated"] == 2
-        assert mock_cache_instance.invalidate.await_count == 2
+        mock_cache_instance.invalidate_agents.assert_awaited_once_with({agent_1, agent_2})
+        mock_redis_manager.close.assert_awaited_once()
 
     async def test_handles_redis_unavailable_gracefully(
         self,
@@ -652,6 +658,7 @@ class TestAsyncDecayAndExpire:
         ]
 
         mock_cache_instance = AsyncMock()
+        mock_cache_instance.invalidate_agents.return_value = 1
 
         with (
             patch(
@@ -662,14 +669,14 @@ class TestAsyncDecayAndExpire:
                 "workers.tasks.memory_tasks.get_task_settings",
                 return_value=mock_settings,
             ),
-            patch("src.cache.client.RedisManager"),
+            patch("src.cache.client.RedisManager", return_value=AsyncMock()),
             patch("src.cache.hot_cache.HotMemoryCache", return_value=mock_cache_instance),
         ):
             result = await _async_decay_and_expire()
 
         # Same agent in both sets: should only invalidate once
         assert result["cache_invalidated"] == 1
-        mock_cache_instance.invalidate.assert_awaited_once_with(shared_agent)
+        mock_cache_instance.invalidate_agents.assert_awaited_once_with({shared_agent})
 
 
 @pytest.mark.unit
@@ -806,6 +813,75 @@ class TestMergeNearDuplicates:
         assert mem_high.content == "Winner content"
         assert mem_low.superseded_by == mem_high.id
 
+    async def test_superseded_memory_is_not_merged_again(self) -> None:
+        """A memory that lost a merge should not be merged into a later one."""
+        mem_low = self._make_memory(importance=3, embedding=[1.0, 0.0, 0.0])
+        mem_high = self._make_memory(importance=9, embedding=[1.0, 0.0, 0.0])
+        mem_other = self._make_memory(importance=5, embedding=[1.0, 0.0, 0.0])
+
+        session = AsyncMock()
+        mock_result = MagicMock()
+        scalars = MagicMock()
+        scalars.all.return_value = [mem_low, mem_high, mem_other]
+        mock_result.scalars.return_value = scalars
+        session.execute.return_value = mock_result
+
+        embedding_service = MagicMock()
+        embedding_service.embed_text = AsyncMock(return_value=[1.0, 0.0, 0.0])
+
+        with patch(
+            "workers.tasks.memory_tasks._call_llm",
+            new_callable=AsyncMock,
+            return_value="Merged content",
+        ):
+            count = await _merge_near_duplicates(
+                session=session,
+                embedding_service=embedding_service,
+                settings=MagicMock(),
+                agent_id=uuid4(),
+                team_id=uuid4(),
+            )
+
+        # mem_low loses to mem_high, then mem_high absorbs mem_other
+        assert count == 2
+        assert mem_low.superseded_by == mem_high.id
+        assert mem_other.superseded_by == mem_high.id
+
+    async def test_merged_embedding_refreshes_candidates(self) -> None:
+        """Later memories are matched against the winner's re-embedded content."""
+        mem_a = self._make_memory(importance=9, embedding=[1.0, 0.0, 0.0])
+        mem_b = self._make_memory(importance=3, embedding=[1.0, 0.0, 0.0])
+        mem_c = self._make_memory(importance=3, embedding=[0.0, 1.0, 0.0])
+
+        session = AsyncMock()
+        mock_result = MagicMock()
+        scalars = MagicMock()
+        scalars.all.return_value = [mem_a, mem_b, mem_c]
+        mock_result.scalars.return_value = scalars
+        session.execute.return_value = mock_result
+
+        # The merged content now matches mem_c, which the original did not
+        embedding_service = MagicMock()
+        embedding_service.embed_text = AsyncMock(return_value=[0.0, 1.0, 0.0])
+
+        with patch(
+            "workers.tasks.memory_tasks._call_llm",
+            new_callable=AsyncMock,
+            return_value="Merged content",
+        ) as mock_llm:
+            count = await _merge_near_duplicates(
+                session=session,
+                embedding_service=embedding_service,
+                settings=MagicMock(),
+                agent_id=uuid4(),
+                team_id=uuid4(),
+            )
+
+        assert count == 2
+        assert mock_llm.await_count == 2
+        assert mem_b.superseded_by == mem_a.id
+        assert mem_c.superseded_by == mem_a.id
+
     async def test_no_merge_below_threshold(self) -> None:
         """Should not merge memories with similarity below 0.92."""
         # Orthogonal embeddings = similarity ~0
@@ -936,3 +1012,165 @@ class TestSummarizeOldEpisodic:
         )
 
         assert count == 0
+
+
+@pytest.mark.unit
+class TestPlanVectorIndexRebuild:
+    """Test _plan_vector_index_rebuild decision logic."""
+
+    HNSW_DEF = (
+        "CREATE INDEX idx_memory_embedding ON public.memory USING hnsw "
+        "(embedding vector_cosine_ops) WITH (m='16', ef_construction='64')"
+    )
+
+    def test_missing_index(self) -> None:
+        """No index definition means the index must be built."""
+        assert _plan_vector_index_rebuild(None, None, 10, m=16, ef_construction=64) == "missing"
+
+    def test_ivfflat_index_is_replaced(self) -> None:
+        """An IVFFlat index is rebuilt as HNSW."""
+        indexdef = (
+            "CREATE INDEX idx_memory_embedding ON public.memory USING ivfflat "
+            "(embedding vector_cosine_ops) WITH (lists='100')"
+        )
+        assert _plan_vector_index_rebuild(indexdef, None, 10, m=16, ef_construction=64) == (
+            "not_hnsw"
+        )
+
+    def test_matching_hnsw_is_kept(self) -> None:
+        """An HNSW index with the configured params needs no rebuild."""
+        assert _plan_vector_index_rebuild(self.HNSW_DEF, "rows=100", 150, 16, 64) is None
+
+    def test_changed_params_trigger_rebuild(self) -> None:
+        """Changing m or ef_construction in settings triggers a rebuild."""
+        assert _plan_vector_index_rebuild(self.HNSW_DEF, None, 10, 24, 64) == "params_changed"
+        assert _plan_vector_index_rebuild(self.HNSW_DEF, None, 10, 16, 128) == "params_changed"
+
+    def test_row_growth_triggers_rebuild(self) -> None:
+        """Doubling the row count since the last build triggers a rebuild."""
+        assert _plan_vector_index_rebuild(self.HNSW_DEF, "rows=100", 200, 16, 64) == "grown"
+
+
+@pytest.mark.unit
+class TestAsyncMaintainVectorIndex:
+    """Test _async_maintain_vector_index DDL execution."""
+
+    @staticmethod
+    def _mock_engine(
+        indexdef: str | None, row_count: int, comment: str | None = None
+    ) -> tuple[MagicMock, AsyncMock]:
+        """Build a mock engine whose AUTOCOMMIT connection records statements."""
+        index_result = MagicMock()
+        index_result.first.return_value = (indexdef, comment) if indexdef else None
+        count_result = MagicMock()
+        count_result.scalar.return_value = row_count
+
+        conn = AsyncMock()
+        conn.execution_options.return_value = conn
+        conn.execute.side_effect = [index_result, count_result] + [MagicMock()] * 10
+
+        connect_cm = MagicMock()
+        connect_cm.__aenter__ = AsyncMock(return_value=conn)
+        connect_cm.__aexit__ = AsyncMock(return_value=False)
+        engine = MagicMock()
+        engine.connect.return_value = connect_cm
+        return engine, conn
+
+    @staticmethod
+    def _settings() -> MagicMock:
+        """Settings with default HNSW build params."""
+        return MagicMock(
+            memory_hnsw_m=16,
+            memory_hnsw_ef_construction=64,
+            memory_team_vector_indexes=False,
+            memory_team_index_min_rows=50000,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_ivfflat_concurrently(self) -> None:
+        """An IVFFlat index is swapped for HNSW with concurrent DDL, then analyzed."""
+        engine, conn = self._mock_engine("CREATE INDEX ... USING ivfflat (embedding)", 500)
+
+        with (
+            patch("workers.tasks.memory_tasks.get_task_engine", return_value=engine),
+            patch("workers.tasks.memory_tasks.get_task_settings", return_value=self._settings()),
+        ):
+            result = await _async_maintain_vector_index()
+
+        assert result == {
+            "rebuilt": True,
+            "reason": "not_hnsw",
+            "row_count": 500,
+            "team_indexes_created": 0,
+            "team_indexes_dropped": 0,
+        }
+        conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+        statements = [str(call.args[0]) for call in conn.execute.await_args_list]
+        assert any(
+            "CREATE INDEX CONCURRENTLY idx_memory_embedding_rebuild" in s for s in statements
+        )
+        assert any("USING hnsw" in s and "m = 16" in s for s in statements)
+        assert any("RENAME TO idx_memory_embedding" in s for s in statements)
+        assert any("rows=500" in s for s in statements)
+        assert statements[-1] == "ANALYZE memory"
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_index_only_analyzes(self) -> None:
+        """A current HNSW index is left alone and only ANALYZE runs."""
+        engine, conn = self._mock_engine(
+            TestPlanVectorIndexRebuild.HNSW_DEF, 500, comment="rows=400"
+        )
+
+        with (
+            patch("workers.tasks.memory_tasks.get_task_engine", return_value=engine),
+            patch("workers.tasks.memory_tasks.get_task_settings", return_value=self._settings()),
+        ):
+            result = await _async_maintain_vector_index()
+
+        assert result["rebuilt"] is False
+        statements = [str(call.args[0]) for call in conn.execute.await_args_list]
+        assert not any("CREATE INDEX" in s for s in statements)
+        assert not any("COMMENT ON INDEX" in s for s in statements)
+        assert statements[-1] == "ANALYZE memory"
+
+    @pytest.mark.asyncio
+    async def test_missing_row_comment_is_recorded(self) -> None:
+        """An index without a rows= comment gets one so growth can be detected."""
+        engine, conn = self._mock_engine(TestPlanVectorIndexRebuild.HNSW_DEF, 500, comment=None)
+
+        with (
+            patch("workers.tasks.memory_tasks.get_task_engine", return_value=engine),
+            patch("workers.tasks.memory_tasks.get_task_settings", return_value=self._settings()),
+        ):
+            result = await _async_maintain_vector_index()
+
+        assert result["rebuilt"] is False
+        statements = [str(call.args[0]) for call in conn.execute.await_args_list]
+        assert "COMMENT ON INDEX idx_memory_embedding IS 'rows=500'" in statements
+        assert not any("CREATE INDEX" in s for s in statements)
+
+
+@pytest.mark.unit
+class TestPlanTeamIndexes:
+    """Test _plan_team_indexes create/drop decisions."""
+
+    def test_large_unindexed_team_is_created(self) -> None:
+        """Teams at or above min_rows without an index get one."""
+        big, small = uuid4(), uuid4()
+        to_create, to_drop = _plan_team_indexes({big: 60000, small: 100}, set(), 50000)
+        assert to_create == [big]
+        assert to_drop == []
+
+    def test_already_indexed_team_is_kept(self) -> None:
+        """Registered teams above the drop floor keep their index."""
+        team = uuid4()
+        to_create, to_drop = _plan_team_indexes({team: 30000}, {team}, 50000)
+        assert to_create == []
+        assert to_drop == []
+
+    def test_shrunk_team_is_dropped(self) -> None:
+        """Registered teams below half the threshold lose their index."""
+        shrunk, gone = uuid4(), uuid4()
+        to_create, to_drop = _plan_team_indexes({shrunk: 20000}, {shrunk, gone}, 50000)
+        assert to_create == []
+        assert set(to_drop) == {shrunk, gone}
@@ -13,9 +13,9 @@ from workers.schedules import BEAT_SCHEDULE, configure_beat_schedule
 class TestBeatSchedule:
     """Test static beat schedule configuration."""
 
-    def test_beat_schedule_has_six_entries(self) -> None:
-        """BEAT_SCHEDULE should contain exactly 6 scheduled tasks."""
-        assert len(BEAT_SCHEDULE) == 6
+    def test_beat_schedule_has_seven_entries(self) -> None:
+        """BEAT_SCHEDULE should contain exactly 7 scheduled tasks."""
+        assert len(BEAT_SCHEDULE) == 7
 
     def test_beat_schedule_entry_keys(self) -> None:
         """Each entry should have task, schedule, and options keys."""
@@ -44,6 +44,7 @@ class TestBeatSchedule:
             "archive-expired-memories",
             "consolidate-memories",
             "decay-and-expire-memories",
+            "maintain-memory-vector-index",
         }
         assert set(BEAT_SCHEDULE.keys()) == expected
 
@@ -65,7 +66,7 @@ class TestConfigureBeatSchedule:
         configure_beat_schedule(mock_app)
 
         assert mock_app.conf.beat_schedule is not None
-        assert len(mock_app.conf.beat_schedule) == 6
+        assert len(mock_app.conf.beat_schedule) == 7
 
     def test_configure_creates_copy(self) -> None:
         """configure_beat_schedule should set a copy, not the original dict."""
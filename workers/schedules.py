@@ -40,6 +40,11 @@ BEAT_SCHEDULE: dict[str, dict[str, Any]] = {
         "schedule": crontab(hour=5, minute=0),  # Daily at 5 AM
         "options": {"queue": "default"},
     },
+    "maintain-memory-vector-index": {
+        "task": "workers.tasks.memory_tasks.maintain_memory_vector_index",
+        "schedule": crontab(hour=6, minute=0, day_of_week=0),  # Weekly, Sunday 6 AM
+        "options": {"queue": "default"},
+    },
 }
 
 
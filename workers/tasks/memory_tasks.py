@@ -1,14 +1,15 @@
 """Celery tasks for memory extraction and management."""
 
 import logging
-import math
+import re
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 import httpx
+import numpy as np
 from celery import shared_task
-from sqlalchemy import and_, select as sa_select, update as sa_update
+from sqlalchemy import and_, select as sa_select, text, update as sa_update
 
 from src.db.models.memory import (
     MemoryORM,
@@ -17,7 +18,14 @@ from src.db.models.memory import (
     MemoryTierEnum,
     MemoryTypeEnum,
 )
-from workers.utils import get_task_session_factory, get_task_settings, run_async
+from src.memory.similarity import cosine_similarity, normalize_rows, similarity_matrix
+from src.memory.tokenizer import get_token_counter
+from workers.utils import (
+    get_task_engine,
+    get_task_session_factory,
+    get_task_settings,
+    run_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -174,12 +182,7 @@ def _cosine_similarity(a: list[float], b: list[float]) -> float:
     Returns:
         Cosine similarity score between -1.0 and 1.0.
     """
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+    return cosine_similarity(a, b)
 
 
 async def _call_llm(settings: Any, prompt: str, system_prompt: str = "") -> str:
@@ -379,7 +382,7 @@ async def _merge_near_duplicates(
     Returns:
         Number of merges performed.
     """
-    from collections import defaultdict
+    from collections import defaultdict, deque
 
     from sqlalchemy import select
 
@@ -414,34 +417,31 @@ async def _merge_near_duplicates(
 
     merge_count = 0
     merged_ids: set[Any] = set()
+    token_counter = get_token_counter()
 
     for memory_type, group_memories in groups.items():
         if len(group_memories) < 2:
             continue
 
-        # Pairwise comparison within each type group
+        # Unit-normalize the group once; each row is then a single mat-vec product
+        unit = normalize_rows([list(m.embedding) for m in group_memories])
+
         for i in range(len(group_memories)):
             if group_memories[i].id in merged_ids:
                 continue
 
-            for j in range(i + 1, len(group_memories)):
+            mem_a = group_memories[i]
+            row = unit[i + 1 :] @ unit[i]
+            # Only visit the columns at or above the threshold
+            candidates = deque((i + 1 + np.flatnonzero(row >= MERGE_SIMILARITY_THRESHOLD)).tolist())
+
+            while candidates:
+                j = candidates.popleft()
                 if group_memories[j].id in merged_ids:
                     continue
 
-                mem_a = group_memories[i]
                 mem_b = group_memories[j]
-
-                # Both must have embeddings (already filtered, but guard)
-                if mem_a.embedding is None or mem_b.embedding is None:
-                    continue
-
-                similarity = _cosine_similarity(
-                    list(mem_a.embedding),
-                    list(mem_b.embedding),
-                )
-
-                if similarity < MERGE_SIMILARITY_THRESHOLD:
-                    continue
+                similarity = float(row[j - i - 1])
 
                 # Determine winner (higher importance, or first if equal)
                 if mem_b.importance > mem_a.importance:
@@ -484,6 +484,8 @@ async def _merge_near_duplicates(
                 # Update winner with merged content
                 winner.content = merged_content.strip()
                 winner.embedding = new_embedding
+                winner.token_count = token_counter.count(winner.content)
+                winner.token_encoding = token_counter.encoding
                 winner.source_type = MemorySourceEnum.CONSOLIDATION
                 winner.version = winner.version + 1
 
@@ -503,6 +505,17 @@ async def _merge_near_duplicates(
                     memory_type,
                 )
 
+                # Keep comparing against the merged content's new embedding
+                if winner is mem_a:
+                    unit[i] = normalize_rows([new_embedding])[0]
+                    row = unit[i + 1 :] @ unit[i]
+                    remaining = np.flatnonzero(row[j - i :] >= MERGE_SIMILARITY_THRESHOLD)
+                    candidates = deque((j + 1 + remaining).tolist())
+                else:
+                    # mem_a is superseded; stop merging into it
+                    unit[j] = normalize_rows([new_embedding])[0]
+                    break
+
     logger.info(
         "merge_near_duplicates_completed: team_id=%s, agent_id=%s, merges=%d",
         team_id,
@@ -568,7 +581,8 @@ async def _summarize_old_episodic(
         )
         return 0
 
-    # Greedy clustering by cosine > 0.8
+    # Greedy clustering by cosine > 0.8 over a single similarity matrix
+    sims = similarity_matrix([list(m.embedding) for m in memories])
     clusters: list[list[MemoryORM]] = []
     used: set[int] = set()
 
@@ -580,15 +594,14 @@ async def _summarize_old_episodic(
         for j in range(i + 1, len(memories)):
             if j in used:
                 continue
-            mem_b = memories[j]
-            sim = _cosine_similarity(list(mem_a.embedding), list(mem_b.embedding))
-            if sim > EPISODIC_CLUSTER_THRESHOLD:
-                cluster.append(mem_b)
+            if sims[i, j] > EPISODIC_CLUSTER_THRESHOLD:
+                cluster.append(memories[j])
                 used.add(j)
         if len(cluster) >= _EPISODIC_MIN_CLUSTER_SIZE:
             clusters.append(cluster)
 
     summaries_created = 0
+    token_counter = get_token_counter()
     for cluster in clusters:
         contents = "\n---\n".join(m.content for m in cluster)
         try:
@@ -634,6 +647,8 @@ async def _summarize_old_episodic(
             status=MemoryStatusEnum.ACTIVE,
             tier=MemoryTierEnum.WARM,
             embedding=new_embedding,
+            token_count=token_counter.count(summary.strip()),
+            token_encoding=token_counter.encoding,
         )
 
         session.add(new_memory)
@@ -713,7 +728,7 @@ async def _async_decay_and_expire() -> dict[str, Any]:
         - Protection: never demote identity memories, pinned, or importance >= 8.
     Phase 4 (cache invalidation):
         - Collect agent_ids affected by Phase 3 changes.
-        - Invalidate HotMemoryCache for each affected agent.
+        - Invalidate HotMemoryCache for all affected agents in one bulk call.
         - Graceful: if Redis unavailable, log warning and continue.
 
     Returns:
@@ -814,18 +829,12 @@ async def _async_decay_and_expire() -> dict[str, Any]:
                     redis_url=settings.redis_url,
                     key_prefix=settings.redis_key_prefix,
                 )
-                cache = HotMemoryCache(redis_manager=redis_mgr)
-
-                for agent_id in affected_agent_ids:
-                    try:
-                        await cache.invalidate(agent_id)
-                        cache_invalidated += 1
-                    except Exception as exc:
-                        logger.warning(
-                            "decay_cache_invalidate_agent_failed: agent_id=%s, error=%s",
-                            agent_id,
-                            str(exc),
-                        )
+                try:
+                    if await redis_mgr.get_client() is not None:
+                        cache = HotMemoryCache(redis_manager=redis_mgr)
+                        cache_invalidated = await cache.invalidate_agents(affected_agent_ids)
+                finally:
+                    await redis_mgr.close()
         except Exception:
             logger.warning(
                 "decay_cache_invalidation_failed: affected_agents=%d",
@@ -844,3 +853,288 @@ async def _async_decay_and_expire() -> dict[str, Any]:
         "demoted": demoted_count,
         "cache_invalidated": cache_invalidated,
     }
+
+
+# ---------------------------------------------------------------------------
+# Vector index maintenance: keep idx_memory_embedding on tuned HNSW
+# ---------------------------------------------------------------------------
+
+_VECTOR_INDEX_NAME: str = "idx_memory_embedding"
+_VECTOR_INDEX_REBUILD_NAME: str = "idx_memory_embedding_rebuild"
+
+# Rebuild once the embedded row count has grown by this factor since the last build
+_VECTOR_INDEX_GROWTH_FACTOR: float = 2.0
+
+# Per-team partial indexes: built at memory_team_index_min_rows, dropped below half
+_TEAM_INDEX_PREFIX: str = "idx_memory_embedding_team_"
+_TEAM_INDEX_DROP_RATIO: float = 0.5
+
+_INDEX_PARAM_PATTERN = re.compile(r"(\w+)\s*=\s*'?(\d+)'?")
+_INDEX_ROWS_PATTERN = re.compile(r"rows=(\d+)")
+
+
+def _plan_vector_index_rebuild(
+    indexdef: Optional[str],
+    index_comment: Optional[str],
+    row_count: int,
+    m: int,
+    ef_construction: int,
+) -> Optional[str]:
+    """Decide whether the memory embedding index needs rebuilding.
+
+    Args:
+        indexdef: Current index definition from pg_indexes (None if missing).
+        index_comment: Index comment recording the row count at last build.
+        row_count: Current number of memories with an embedding.
+        m: Desired HNSW ``m`` build parameter.
+        ef_construction: Desired HNSW ``ef_construction`` build parameter.
+
+    Returns:
+        Rebuild reason ("missing", "not_hnsw", "params_changed", "grown"),
+        or None if the index is up to date.
+    """
+    if indexdef is None:
+        return "missing"
+    if "using hnsw" not in indexdef.lower():
+        return "not_hnsw"
+
+    params = {key.lower(): int(value) for key, value in _INDEX_PARAM_PATTERN.findall(indexdef)}
+    if params.get("m", 16) != m or params.get("ef_construction", 64) != ef_construction:
+        return "params_changed"
+
+    match = _INDEX_ROWS_PATTERN.search(index_comment or "")
+    if match is not None:
+        built_rows = int(match.group(1))
+        if built_rows > 0 and row_count >= built_rows * _VECTOR_INDEX_GROWTH_FACTOR:
+            return "grown"
+    return None
+
+
+def _plan_team_indexes(
+    team_counts: dict[UUID, int],
+    registered: set[UUID],
+    min_rows: int,
+) -> tuple[list[UUID], list[UUID]]:
+    """Decide which teams gain or lose a dedicated partial vector index.
+
+    Indexes are created once a team reaches ``min_rows`` embedded memories
+    and only dropped when it falls below half of that, so teams near the
+    threshold do not flap between index builds.
+
+    Args:
+        team_counts: Embedded memory count per team.
+        registered: Teams that currently have a partial index.
+        min_rows: Row count at which a team gets its own index.
+
+    Returns:
+        Tuple of (teams to index, teams to drop), each sorted for stable DDL order.
+    """
+    drop_below = int(min_rows * _TEAM_INDEX_DROP_RATIO)
+    to_create = sorted(
+        team_id
+        for team_id, count in team_counts.items()
+        if count >= min_rows and team_id not in registered
+    )
+    to_drop = sorted(team_id for team_id in registered if team_counts.get(team_id, 0) < drop_below)
+    return to_create, to_drop
+
+
+@shared_task(
+    name="workers.tasks.memory_tasks.maintain_memory_vector_index",
+    bind=True,
+    max_retries=1,
+    acks_late=True,
+)
+def maintain_memory_vector_index(
+    self,  # type: ignore[no-untyped-def]
+) -> dict[str, Any]:
+    """Rebuild the memory embedding HNSW index when it is stale, then ANALYZE.
+
+    Returns:
+        Dict with keys: rebuilt, reason, row_count.
+    """
+    logger.info("vector_index_maintenance_started")
+
+    try:
+        result: dict[str, Any] = run_async(_async_maintain_vector_index())
+        logger.info("vector_index_maintenance_completed: result=%s", result)
+        return result
+    except Exception as exc:
+        logger.warning(
+            "vector_index_maintenance_failed: error=%s, retry=%d/%d",
+            str(exc),
+            self.request.retries,
+            self.max_retries,
+        )
+        raise self.retry(exc=exc, countdown=600)
+
+
+async def _async_maintain_vector_index() -> dict[str, Any]:
+    """Async implementation of vector index maintenance.
+
+    The index is rebuilt with CREATE INDEX CONCURRENTLY under a temporary
+    name and swapped in, so the memory table stays writable throughout.
+    The embedded row count is stored as the index comment after each
+    rebuild, or whenever the comment is missing, so later runs can detect
+    growth. ANALYZE always runs so planner statistics track
+    the table as it grows.
+
+    Returns:
+        Dict with keys: rebuilt, reason, row_count.
+    """
+    settings = get_task_settings()
+    engine = get_task_engine()
+
+    async with engine.connect() as conn:
+        # CONCURRENTLY DDL cannot run inside a transaction block
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        index_result = await conn.execute(
+            text(
+                "SELECT indexdef, obj_description(to_regclass(:name), 'pg_class') "
+                "FROM pg_indexes WHERE indexname = :name"
+            ),
+            {"name": _VECTOR_INDEX_NAME},
+        )
+        index_row = index_result.first()
+        indexdef = index_row[0] if index_row is not None else None
+        index_comment = index_row[1] if index_row is not None else None
+
+        count_result = await conn.execute(
+            text("SELECT count(*) FROM memory WHERE embedding IS NOT NULL")
+        )
+        row_count = int(count_result.scalar() or 0)
+
+        reason = _plan_vector_index_rebuild(
+            indexdef,
+            index_comment,
+            row_count,
+            m=settings.memory_hnsw_m,
+            ef_construction=settings.memory_hnsw_ef_construction,
+        )
+
+        if reason is not None:
+            logger.info(
+                "vector_index_rebuild_started: reason=%s, row_count=%d, m=%d, ef_construction=%d",
+                reason,
+                row_count,
+                settings.memory_hnsw_m,
+                settings.memory_hnsw_ef_construction,
+            )
+            # Clear any invalid leftover from an interrupted concurrent build
+            await conn.execute(
+                text(f"DROP INDEX CONCURRENTLY IF EXISTS {_VECTOR_INDEX_REBUILD_NAME}")
+            )
+            await conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY {_VECTOR_INDEX_REBUILD_NAME} ON memory "
+                    "USING hnsw (embedding vector_cosine_ops) "
+                    f"WITH (m = {settings.memory_hnsw_m}, "
+                    f"ef_construction = {settings.memory_hnsw_ef_construction})"
+                )
+            )
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {_VECTOR_INDEX_NAME}"))
+            await conn.execute(
+                text(f"ALTER INDEX {_VECTOR_INDEX_REBUILD_NAME} RENAME TO {_VECTOR_INDEX_NAME}")
+            )
+
+        # Record the row count at build time; indexes built elsewhere (or before
+        # this task existed) get a baseline so later runs can detect growth
+        if reason is not None or _INDEX_ROWS_PATTERN.search(index_comment or "") is None:
+            await conn.execute(text(f"COMMENT ON INDEX {_VECTOR_INDEX_NAME} IS 'rows={row_count}'"))
+
+        team_created: list[UUID] = []
+        team_dropped: list[UUID] = []
+        if settings.memory_team_vector_indexes:
+            team_created, team_dropped = await _reconcile_team_indexes(
+                conn,
+                min_rows=settings.memory_team_index_min_rows,
+                m=settings.memory_hnsw_m,
+                ef_construction=settings.memory_hnsw_ef_construction,
+            )
+
+        await conn.execute(text("ANALYZE memory"))
+
+    return {
+        "rebuilt": reason is not None,
+        "reason": reason,
+        "row_count": row_count,
+        "team_indexes_created": len(team_created),
+        "team_indexes_dropped": len(team_dropped),
+    }
+
+
+async def _reconcile_team_indexes(
+    conn: Any,
+    min_rows: int,
+    m: int,
+    ef_construction: int,
+) -> tuple[list[UUID], list[UUID]]:
+    """Build and drop per-team partial HNSW indexes on an AUTOCOMMIT connection.
+
+    New indexes are registered in ``memory_vector_index`` only after the
+    concurrent build finishes, so searches are never routed to a missing
+    index; teams are unregistered before their index is dropped.
+
+    Args:
+        conn: AUTOCOMMIT connection (required for CONCURRENTLY DDL).
+        min_rows: Embedded row count at which a team gets its own index.
+        m: HNSW ``m`` build parameter.
+        ef_construction: HNSW ``ef_construction`` build parameter.
+
+    Returns:
+        Tuple of (teams indexed, teams dropped).
+    """
+    counts_result = await conn.execute(
+        text(
+            "SELECT team_id, count(*) FROM memory WHERE embedding IS NOT NULL "
+            "GROUP BY team_id HAVING count(*) >= :floor"
+        ),
+        {"floor": int(min_rows * _TEAM_INDEX_DROP_RATIO)},
+    )
+    team_counts = {UUID(str(team_id)): int(count) for team_id, count in counts_result.all()}
+
+    registry_result = await conn.execute(
+        text("SELECT team_id, index_name FROM memory_vector_index")
+    )
+    registered = {UUID(str(team_id)): index_name for team_id, index_name in registry_result.all()}
+
+    to_create, to_drop = _plan_team_indexes(team_counts, set(registered), min_rows)
+
+    for team_id in to_create:
+        index_name = f"{_TEAM_INDEX_PREFIX}{team_id.hex}"
+        logger.info(
+            "team_vector_index_create: team_id=%s, rows=%d, index=%s",
+            team_id,
+            team_counts[team_id],
+            index_name,
+        )
+        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+        await conn.execute(
+            text(
+                f"CREATE INDEX CONCURRENTLY {index_name} ON memory "
+                "USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {m}, ef_construction = {ef_construction}) "
+                f"WHERE team_id = '{team_id}'"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO memory_vector_index (team_id, index_name, row_count) "
+                "VALUES (:team_id, :index_name, :row_count) "
+                "ON CONFLICT (team_id) DO UPDATE SET index_name = EXCLUDED.index_name, "
+                "row_count = EXCLUDED.row_count"
+            ),
+            {"team_id": team_id, "index_name": index_name, "row_count": team_counts[team_id]},
+        )
+
+    for team_id in to_drop:
+        index_name = registered[team_id]
+        logger.info("team_vector_index_drop: team_id=%s, index=%s", team_id, index_name)
+        await conn.execute(
+            text("DELETE FROM memory_vector_index WHERE team_id = :team_id"),
+            {"team_id": team_id},
+        )
+        await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"'))
+
+    return to_create, to_drop